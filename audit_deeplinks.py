@@ -11,8 +11,14 @@ This script scans all *.html pages in the repo root and checks:
 - cardKeys are unique within a page
 - scripts/site.js loads before scripts/deep-link.js (important if ids are auto-generated)
 
+With --map it also writes scripts/deep-link-map.js: every cardKey, title slug (in
+each language, from i18n.js) and Berny ?q= alias -> page + anchor. A key that
+points at two different cards fails the audit (shared titles only warn and are
+left out of the map).
+
 Run
   python audit_deeplinks.py
+  python audit_deeplinks.py --map
 
 Exit code
   0: no errors
@@ -21,11 +27,14 @@ Exit code
 
 from __future__ import annotations
 
+import argparse
 import glob
 import html
+import json
 import os
 import re
 import sys
+import unicodedata
 from dataclasses import dataclass
 
 
@@ -36,6 +45,7 @@ ARTICLE_RE = re.compile(
 ID_RE = re.compile(r"(?:^|\s)id=\"(?P<id>[^\"]+)\"", re.IGNORECASE)
 H3_RE = re.compile(r"<h3\b[^>]*>(?P<title>.*?)</h3>", re.IGNORECASE | re.DOTALL)
 TAG_RE = re.compile(r"<[^>]+>")
+SITE_SCRIPT_RE = re.compile(r"scripts/site(?:\.[a-z0-9-]+)?\.js\b")
 
 
 def slugify(value: str) -> str:
@@ -104,19 +114,245 @@ def extract_cards(page_path: str, content: str) -> list[Card]:
 def check_script_order(page: str, content: str) -> list[str]:
     issues: list[str] = []
 
-    # Only matters if both exist.
-    site_pos = content.find("scripts/site.js")
+    # Only matters if both exist. site.js may be split into scripts/site.<chunk>.js
+    # (build-tools/bundle_site_js.py): every chunk must come before deep-link.js.
+    site_positions = [m.start() for m in SITE_SCRIPT_RE.finditer(content)]
     deep_pos = content.find("scripts/deep-link.js")
 
-    if deep_pos != -1 and site_pos == -1:
+    if deep_pos != -1 and not site_positions:
         issues.append("ERROR: deep-link.js is included but site.js is missing (auto-id + catalog hydration won't run).")
-    elif deep_pos != -1 and site_pos != -1 and deep_pos < site_pos:
+    elif deep_pos != -1 and deep_pos < max(site_positions):
         issues.append("ERROR: deep-link.js appears before site.js (with defer, execution order follows source order).")
 
     return issues
 
 
+# ------------------------------------------------------------
+# Deep-link map (scripts/deep-link-map.js)
+# ------------------------------------------------------------
+# Every way a ?q= can name a card -> (page, anchor id), so deep-link.js and Berny
+# resolve links with one lookup instead of scanning the DOM of (maybe) the wrong page.
+# Lookup keys use the same normalization as deep-link.js (no accents, only [a-z0-9]).
+# Tiers mirror the runtime strategy order: a cardKey beats a title slug, which beats
+# an alias. Two different cards on the same (winning) tier = ambiguous: ERROR for
+# cardKeys and aliases, WARN (key left out of the map) for shared titles.
+
+MAP_FILE = os.path.join("scripts", "deep-link-map.js")
+TIER_KEY, TIER_TITLE, TIER_ALIAS = 0, 1, 2
+TIER_NAMES = ("cardKey", "title", "alias")
+
+# Berny links (page.html?q=...) are the known aliases: whatever they point at must resolve.
+ALIAS_SOURCES = (os.path.join("scripts", "berny-brain-api.js"),)
+ALIAS_HREF_RE = re.compile(r"""['"](?P<page>[a-z0-9_-]+\.html)\?q=(?P<q>[^'"&#]+)['"]""", re.IGNORECASE)
+H3_I18N_RE = re.compile(r"<h3\b[^>]*\bdata-i18n=\"(?P<key>[^\"]+)\"", re.IGNORECASE)
+
+
+def link_norm(value: str) -> str:
+    """Same as normalize() in scripts/deep-link.js."""
+    s = unicodedata.normalize("NFD", str(value or "").lower())
+    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    return re.sub(r"[^a-z0-9]", "", s)
+
+
+@dataclass
+class LinkTarget:
+    page: str
+    anchor: str
+    card_key: str
+    title: str
+
+
+def _card_anchor(c: Card) -> str:
+    # Cards without an id get id="card-<slug(title)>" from site.js at runtime.
+    return c.id_attr or f"card-{c.card_key}"
+
+
+def _title_translations(body: str, i18n: dict[str, dict[str, str]]) -> list[str]:
+    m = H3_I18N_RE.search(body)
+    if not m:
+        return []
+    key = m.group("key")
+    out = []
+    for strings in i18n.values():
+        t = strings.get(key)
+        if t:
+            out.append(html.unescape(TAG_RE.sub("", t)).strip())
+    return out
+
+
+def _resolve_like_runtime(q: str, targets: list[LinkTarget]) -> LinkTarget | None:
+    """Emulate deep-link.js strategies 1-3 on one page (used to pin aliases)."""
+    norm = link_norm(q)
+    if not norm:
+        return None
+    for t in targets:
+        if t.anchor == f"card-{q}" or t.anchor == q:
+            return t
+    for t in targets:
+        anchor = link_norm(t.anchor)
+        if norm in anchor and anchor.endswith(norm):
+            return t
+    for t in targets:
+        if link_norm(t.title) == norm:
+            return t
+    for t in targets:
+        if norm in link_norm(t.title):
+            return t
+    return None
+
+
+def collect_aliases(root: str) -> list[tuple[str, str, str]]:
+    """(source file, page, q) for every page.html?q= link hardcoded in Berny."""
+    found: list[tuple[str, str, str]] = []
+    seen: set[tuple[str, str]] = set()
+    for rel in ALIAS_SOURCES:
+        path = os.path.join(root, rel)
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            text = f.read()
+        for m in ALIAS_HREF_RE.finditer(text):
+            item = (m.group("page"), m.group("q").strip())
+            if item not in seen:
+                seen.add(item)
+                found.append((rel, *item))
+    return found
+
+
+def build_deeplink_map(
+    page_contents: dict[str, str],
+    i18n: dict[str, dict[str, str]],
+    aliases: list[tuple[str, str, str]],
+) -> tuple[dict, list[str]]:
+    """Return (map, issues). The map is {v, pages, cards: [[pageIdx, anchor, cardKey]], keys: {norm: cardIdx}}."""
+    issues: list[str] = []
+    targets: list[LinkTarget] = []
+    by_page: dict[str, list[LinkTarget]] = {}
+    # norm -> tier -> {target index: source description}
+    candidates: dict[str, dict[int, dict[int, str]]] = {}
+
+    def offer(key: str, tier: int, target_idx: int, source: str) -> None:
+        norm = link_norm(key)
+        if norm:
+            candidates.setdefault(norm, {}).setdefault(tier, {}).setdefault(target_idx, source)
+
+    for page, content in page_contents.items():
+        bodies = [m.group("body") or "" for m in ARTICLE_RE.finditer(content)]
+        for c, body in zip(extract_cards(page, content), bodies):
+            if not c.card_key:
+                continue
+            t = LinkTarget(page=page, anchor=_card_anchor(c), card_key=c.card_key, title=c.title or "")
+            idx = len(targets)
+            targets.append(t)
+            by_page.setdefault(page, []).append(t)
+
+            where = f"{page}#{t.anchor}"
+            offer(c.card_key, TIER_KEY, idx, where)
+            if c.title:
+                offer(c.title, TIER_TITLE, idx, where)
+            for translated in _title_translations(body, i18n):
+                offer(translated, TIER_TITLE, idx, where)
+
+    for source, page, q in aliases:
+        page_targets = by_page.get(page)
+        if page_targets is None:
+            issues.append(f"WARN: {source} links {page}?q={q} but {page} has no guide cards.")
+            continue
+        hit = _resolve_like_runtime(q, page_targets)
+        if hit is None:
+            issues.append(f"WARN: {source} links {page}?q={q} which resolves to no card.")
+            continue
+        offer(q, TIER_ALIAS, targets.index(hit), f"{source} -> {page}?q={q}")
+
+    keys: dict[str, int] = {}
+    for norm in sorted(candidates):
+        tiers = candidates[norm]
+        tier = min(tiers)
+        winners = tiers[tier]
+        if len(winners) > 1:
+            where = ", ".join(sorted(winners.values()))
+            # Shared titles (same procedure shown on two pages) are left to the runtime
+            # DOM scan of the current page; ambiguous cardKeys/aliases break links.
+            level = "WARN" if tier == TIER_TITLE else "ERROR"
+            issues.append(f"{level}: ambiguous deep-link key '{norm}' ({TIER_NAMES[tier]}): {where}.")
+            continue
+        (winner,) = winners
+        keys[norm] = winner
+        # Lower tiers that name a card on another page lose the key in the map;
+        # the runtime only falls back to them when the current page has no match.
+        winner_page = targets[winner].page
+        shadowed = sorted(
+            f"{TIER_NAMES[t]} {src}"
+            for t, others in tiers.items() if t != tier
+            for idx, src in others.items() if targets[idx].page != winner_page
+        )
+        if shadowed:
+            issues.append(
+                f"WARN: deep-link key '{norm}' ({TIER_NAMES[tier]} {winners[winner]}) also matches "
+                f"{', '.join(shadowed)}: ?q={norm} redirects to {winner_page} unless the current page has its own match."
+            )
+
+    page_keys = sorted(by_page)
+    page_idx = {p: i for i, p in enumerate(page_keys)}
+    data = {
+        "v": 1,
+        "pages": page_keys,
+        "cards": [[page_idx[t.page], t.anchor, t.card_key] for t in targets],
+        "keys": keys,
+    }
+    return data, issues
+
+
+MAP_JS_TEMPLATE = """// Auto-generated by audit_deeplinks.py --map - do not edit by hand.
+// ?q= lookup table: normalized cardKey / title (all languages) / Berny alias -> card.
+(function(){
+  'use strict';
+  var MAP = __MAP__;
+
+  function normalize(s) {
+    return String(s || '')
+      .toLowerCase()
+      .normalize('NFD')
+      .replace(/[\\u0300-\\u036f]/g, '')
+      .replace(/[^a-z0-9]/g, '');
+  }
+
+  function resolve(q) {
+    var idx = MAP.keys[normalize(q)];
+    if (idx === undefined) return null;
+    var card = MAP.cards[idx];
+    return { page: MAP.pages[card[0]], id: card[1], cardKey: card[2] };
+  }
+
+  try { window.BadianiDeepLinkMap = { data: MAP, normalize: normalize, resolve: resolve }; } catch (e) {}
+})();
+"""
+
+
+def render_map_js(data: dict) -> str:
+    return MAP_JS_TEMPLATE.replace("__MAP__", json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+
+
+def _load_i18n(root: str) -> dict[str, dict[str, str]]:
+    sys.path.insert(0, os.path.join(root, "build-tools", "python"))
+    try:
+        from i18n_dict import load_i18n_dict
+    except ImportError:
+        return {}
+    return load_i18n_dict()
+
+
 def main() -> int:
+    ap = argparse.ArgumentParser(description="Audit guide-card deep links (and emit the deep-link map).")
+    ap.add_argument(
+        "--map",
+        nargs="?",
+        const=MAP_FILE,
+        default=None,
+        help=f"Write the ?q= resolution table (default path: {MAP_FILE})",
+    )
+    args = ap.parse_args()
+
     root = os.path.dirname(os.path.abspath(__file__))
     pages = sorted(glob.glob(os.path.join(root, "*.html")))
 
@@ -133,11 +369,13 @@ def main() -> int:
 
     total_cards = 0
     any_errors = False
+    page_contents: dict[str, str] = {}
 
     for p in pages:
         page = os.path.basename(p)
         with open(p, "r", encoding="utf-8", errors="replace") as f:
             content = f.read()
+        page_contents[page] = content
 
         print(f"\n=== {page} ===")
 
@@ -197,6 +435,22 @@ def main() -> int:
 
     print(f"\nScanned pages: {len(pages)}")
     print(f"Total cards: {total_cards}")
+
+    if args.map:
+        print("\n=== deep-link map ===")
+        data, map_issues = build_deeplink_map(page_contents, _load_i18n(root), collect_aliases(root))
+        for msg in map_issues:
+            print(msg)
+            if msg.startswith("ERROR"):
+                any_errors = True
+        if any_errors:
+            print(f"Not writing {args.map} (fix the errors above first).")
+        else:
+            out_path = os.path.join(root, args.map)
+            with open(out_path, "w", encoding="utf-8") as f:
+                f.write(render_map_js(data))
+            print(f"Wrote {args.map}: {len(data['keys'])} keys -> {len(data['cards'])} cards")
+
     if any_errors:
         print("\nResult: FAIL (errors found)")
         return 1
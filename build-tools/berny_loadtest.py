@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""Load generator for the berny Worker (or its local stand-in).
+
+Drives the chat and OTP flows with N concurrent virtual users and reports
+latency percentiles (p50/p95/p99), throughput and status codes per step.
+Latencies of 2xx responses and of rejected ones (429 rate limits, 4xx/5xx)
+are reported separately: a fast 429 says nothing about chat latency.
+
+Usage (examples):
+  # Spawn the stand-in in-process and hammer it:
+  python build-tools/berny_loadtest.py --spawn --scenario mixed --users 50 --duration 30
+
+  # Size rate limits: 200 users spread over 20 simulated client IPs
+  python build-tools/berny_loadtest.py --spawn --users 200 --clients 20 --rate-limit-max 30
+
+  # Against an already running stand-in (see berny_worker_standin.py):
+  python build-tools/berny_loadtest.py --url http://127.0.0.1:8787 --phones phones.txt --pepper "..."
+
+Scenarios:
+- chat:  POST /berny { messages } (optionally with x-badiani-auth from an OTP login)
+- otp:   POST /auth/request -> GET /__standin/otp -> POST /auth/verify
+- mixed: every user logs in via OTP once, then loops on chat
+
+Notes:
+- The OTP flow needs the stand-in (it reads the faked SMS from /__standin/otp).
+- Simulated client IPs are sent as CF-Connecting-IP, like Cloudflare does.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+from urllib.parse import quote, urlsplit
+
+from berny_worker_standin import BernyWorkerStandin, add_config_arguments, config_from_args
+from hash_employee_phones import normalize_phone, sha256_hex
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "python"))
+from perf_beacon_report import percentile  # noqa: E402  (nearest rank, shared with the field report)
+
+
+SAMPLE_QUESTIONS = [
+    "Come si prepara un cappuccino?",
+    "Quanti grammi per una coppetta media?",
+    "Cosa abbino al Buontalenti?",
+    "Come chiudo la macchina del caffè a fine turno?",
+    "What is the upsell for a crepe?",
+]
+
+
+def latency_summary(values: list[float]) -> dict:
+    lat = sorted(values)
+    if not lat:
+        return {"count": 0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    return {
+        "count": len(lat),
+        "p50_ms": round(percentile(lat, 50), 1),
+        "p95_ms": round(percentile(lat, 95), 1),
+        "p99_ms": round(percentile(lat, 99), 1),
+        "max_ms": round(lat[-1], 1),
+    }
+
+
+@dataclass
+class StepStats:
+    latencies_ms: list[float] = field(default_factory=list)  # 2xx responses
+    rejected_ms: list[float] = field(default_factory=list)  # any other status (429, 4xx, 5xx)
+    statuses: Counter[int] = field(default_factory=Counter)
+    errors: int = 0
+
+    def add(self, status: int, elapsed_ms: float) -> None:
+        self.statuses[status] += 1
+        (self.latencies_ms if 200 <= status < 300 else self.rejected_ms).append(elapsed_ms)
+
+
+class HttpConnection:
+    """Minimal keep-alive HTTP/1.1 client on asyncio streams (one per virtual user)."""
+
+    def __init__(self, host: str, port: int, prefix: str) -> None:
+        self.host = host
+        self.port = port
+        self.prefix = prefix.rstrip("/")
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def _ensure(self) -> None:
+        if self._writer is None or self._writer.is_closing():
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._writer = None
+
+    async def request(self, method: str, path: str, *, body: object = None, headers: Optional[dict[str, str]] = None) -> tuple[int, bytes]:
+        await self._ensure()
+        assert self._reader is not None and self._writer is not None
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        lines = [f"{method} {self.prefix}{path} HTTP/1.1", f"Host: {self.host}:{self.port}", f"Content-Length: {len(payload)}"]
+        if payload:
+            lines.append("Content-Type: application/json")
+        lines.extend(f"{k}: {v}" for k, v in (headers or {}).items())
+        self._writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload)
+        await self._writer.drain()
+
+        status_line = await self._reader.readline()
+        if not status_line:
+            await self.close()
+            raise ConnectionError("connection closed by server")
+        status = int(status_line.split()[1])
+        length = 0
+        close = False
+        while True:
+            raw = await self._reader.readline()
+            if raw in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = raw.decode("latin-1").partition(":")
+            name = name.strip().lower()
+            if name == "content-length":
+                length = int(value.strip())
+            elif name == "connection" and value.strip().lower() == "close":
+                close = True
+        data = await self._reader.readexactly(length) if length else b""
+        if close:
+            await self.close()
+        return status, data
+
+
+class LoadTest:
+    def __init__(self, args: argparse.Namespace, phones: list[str]) -> None:
+        parts = urlsplit(args.url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.prefix = parts.path or ""
+        self.args = args
+        self.phones = phones
+        self.steps: dict[str, StepStats] = defaultdict(StepStats)
+        self._phone_cursor = 0
+        self._rng = random.Random(args.seed)
+
+    def _next_phone(self) -> Optional[str]:
+        if not self.phones:
+            return None
+        phone = self.phones[self._phone_cursor % len(self.phones)]
+        self._phone_cursor += 1
+        return phone
+
+    async def _timed(self, step: str, conn: HttpConnection, method: str, path: str, **kw) -> tuple[int, bytes]:
+        t0 = time.perf_counter()
+        try:
+            status, data = await conn.request(method, path, **kw)
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError, OSError):
+            self.steps[step].errors += 1
+            await conn.close()
+            return 0, b""
+        self.steps[step].add(status, (time.perf_counter() - t0) * 1000.0)
+        return status, data
+
+    async def otp_login(self, conn: HttpConnection, headers: dict[str, str]) -> Optional[str]:
+        phone = self._next_phone()
+        if phone is None:
+            return None
+        t0 = time.perf_counter()
+        status, _ = await self._timed("otp.request", conn, "POST", "/auth/request", body={"phone": phone}, headers=headers)
+        if status != 200:
+            return None
+        status, data = await self._timed("otp.fetch_sms", conn, "GET", f"/__standin/otp?phone={quote(phone)}", headers=headers)
+        if status != 200:
+            return None
+        code = json.loads(data).get("code", "")
+        status, data = await self._timed("otp.verify", conn, "POST", "/auth/verify", body={"phone": phone, "code": code}, headers=headers)
+        if status != 200:
+            return None
+        self.steps["otp.flow"].add(200, (time.perf_counter() - t0) * 1000.0)
+        return json.loads(data).get("token")
+
+    async def chat_once(self, conn: HttpConnection, headers: dict[str, str]) -> None:
+        body = {
+            "messages": [
+                {"role": "system", "content": "Sei Berny, assistente training Badiani."},
+                {"role": "user", "content": self._rng.choice(SAMPLE_QUESTIONS)},
+            ],
+            "intent": "chat",
+        }
+        await self._timed("chat", conn, "POST", "/", body=body, headers=headers)
+
+    async def user(self, idx: int, deadline: float, budget: list[int]) -> None:
+        conn = HttpConnection(self.host, self.port, self.prefix)
+        headers = {"CF-Connecting-IP": f"10.0.{(idx % self.args.clients) // 256}.{(idx % self.args.clients) % 256}"}
+        if self.args.access_code:
+            headers["X-Berny-Access-Code"] = self.args.access_code
+        try:
+            scenario = self.args.scenario
+            if scenario in ("chat", "mixed") and (scenario == "mixed" or self.args.login):
+                token = await self.otp_login(conn, headers)
+                if token:
+                    headers["X-Badiani-Auth"] = token
+            while time.perf_counter() < deadline:
+                if budget[0] <= 0:
+                    break
+                budget[0] -= 1
+                if scenario == "otp":
+                    await self.otp_login(conn, headers)
+                else:
+                    await self.chat_once(conn, headers)
+                if self.args.think_ms:
+                    await asyncio.sleep(self._rng.uniform(0, 2 * self.args.think_ms) / 1000.0)
+        finally:
+            await conn.close()
+
+    async def run(self) -> float:
+        deadline = time.perf_counter() + self.args.duration
+        budget = [self.args.requests if self.args.requests > 0 else 1 << 62]
+        t0 = time.perf_counter()
+        users = []
+        for i in range(self.args.users):
+            users.append(asyncio.create_task(self.user(i, deadline, budget)))
+            if self.args.ramp_up:
+                await asyncio.sleep(self.args.ramp_up / self.args.users)
+        await asyncio.gather(*users)
+        return time.perf_counter() - t0
+
+    def report(self, elapsed: float) -> dict:
+        out: dict[str, dict] = {}
+        for name in sorted(self.steps):
+            st = self.steps[name]
+            ok = latency_summary(st.latencies_ms)
+            n = ok["count"] + len(st.rejected_ms)
+            out[name] = {
+                "count": n,
+                "ok": ok["count"],
+                "errors": st.errors,
+                "statuses": {str(k): v for k, v in sorted(st.statuses.items())},
+                "throughput_rps": round(n / elapsed, 2) if elapsed else 0.0,
+                "ok_throughput_rps": round(ok["count"] / elapsed, 2) if elapsed else 0.0,
+                # Percentiles of successful (2xx) responses only.
+                "p50_ms": ok["p50_ms"],
+                "p95_ms": ok["p95_ms"],
+                "p99_ms": ok["p99_ms"],
+                "max_ms": ok["max_ms"],
+                "rejected": latency_summary(st.rejected_ms),
+            }
+        return {"elapsed_sec": round(elapsed, 3), "users": self.args.users, "clients": self.args.clients, "steps": out}
+
+
+def print_report(report: dict) -> None:
+    print(f"\n# elapsed={report['elapsed_sec']}s users={report['users']} client_ips={report['clients']}")
+    print("(p50..max: 2xx responses only; rej p50/p95: everything else, e.g. 429)")
+    print(f"{'step':<16}{'count':>8}{'ok':>8}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'rej p50':>9}{'rej p95':>9}  statuses")
+    for name, s in report["steps"].items():
+        statuses = " ".join(f"{k}:{v}" for k, v in s["statuses"].items())
+        if s["errors"]:
+            statuses += f" conn_err:{s['errors']}"
+        rej = s["rejected"]
+        rej_cols = f"{rej['p50_ms']:>9}{rej['p95_ms']:>9}" if rej["count"] else f"{'-':>9}{'-':>9}"
+        print(
+            f"{name:<16}{s['count']:>8}{s['ok']:>8}{s['throughput_rps']:>9}"
+            f"{s['p50_ms']:>9}{s['p95_ms']:>9}{s['p99_ms']:>9}{s['max_ms']:>9}{rej_cols}  {statuses}"
+        )
+
+
+def load_phones(path: Optional[Path]) -> list[str]:
+    if path is None:
+        return []
+    phones = []
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            p = normalize_phone(line)
+            if p:
+                phones.append(p)
+    return phones
+
+
+def synthetic_phones(n: int) -> list[str]:
+    # Italian mobile range, deterministic so runs are comparable.
+    return [f"+39333{i:07d}" for i in range(n)]
+
+
+async def _amain(args: argparse.Namespace) -> dict:
+    server = None
+    phones = load_phones(args.phones)
+    if args.spawn:
+        if not phones:
+            phones = synthetic_phones(max(args.users * 4, 100))
+        pepper = args.pepper.strip()
+        registry = {sha256_hex(f"{p}|{pepper}") for p in phones}
+        standin = BernyWorkerStandin(config_from_args(args, registry), seed=args.seed)
+        server = await standin.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        args.url = f"http://127.0.0.1:{port}/berny"
+        print(f"🚀 Spawned stand-in on {args.url} (registry={len(registry)} phones)", flush=True)
+
+    try:
+        test = LoadTest(args, phones)
+        elapsed = await test.run()
+        return test.report(elapsed)
+    finally:
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Load test the berny Worker chat + OTP flows.")
+    ap.add_argument("--url", default="http://127.0.0.1:8787/berny", help="Base URL of the Worker/stand-in")
+    ap.add_argument("--spawn", action="store_true", help="Start the stand-in in-process (stand-in flags below apply)")
+    ap.add_argument("--scenario", choices=("chat", "otp", "mixed"), default="chat")
+    ap.add_argument("--users", type=int, default=20, help="Concurrent virtual users")
+    ap.add_argument("--clients", type=int, default=1, help="Distinct client IPs the users are spread over")
+    ap.add_argument("--duration", type=float, default=15.0, help="Test duration in seconds")
+    ap.add_argument("--requests", type=int, default=0, help="Stop after this many iterations (0 = duration only)")
+    ap.add_argument("--ramp-up", type=float, default=0.0, help="Seconds to spread user start-up over")
+    ap.add_argument("--think-ms", type=float, default=0.0, help="Mean pause between iterations per user")
+    ap.add_argument("--login", action="store_true", help="chat scenario: log in via OTP first (site verification)")
+    ap.add_argument("--access-code", default="", help="Value sent as X-Berny-Access-Code")
+    ap.add_argument("--phones", type=Path, default=None, help="Registered phone numbers, one per line")
+    ap.add_argument("--seed", type=int, default=None, help="Random seed for repeatable runs")
+    ap.add_argument("--json-out", type=Path, default=None, help="Also write the report as JSON")
+    add_config_arguments(ap)
+    args = ap.parse_args()
+    args.users = max(1, args.users)
+    args.clients = max(1, args.clients)
+
+    report = asyncio.run(_amain(args))
+    print_report(report)
+    if args.json_out:
+        args.json_out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\n✅ Report saved to: {args.json_out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
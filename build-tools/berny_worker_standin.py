@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""Local stand-in for proxy/cloudflare-worker/berny-worker.js (load testing only).
+
+Mirrors the Worker routes so the site and build-tools/berny_loadtest.py can be
+pointed at it offline:
+  GET  /health, /models              (also under /berny/*)
+  POST /auth/request  { phone }      -> OTP challenge (SMS is faked)
+  POST /auth/verify   { phone, code } -> { ok, token, exp }
+  POST / (or /berny)  { messages }   -> { text }  from a fake LLM provider
+
+Behaviour kept identical to the Worker:
+- phone normalization + sha256(f"{phone}|{PHONE_HASH_PEPPER}") registry lookup
+- OTP hash, 60s per-phone request cooldown, OTP TTL
+- HMAC-SHA256 auth tokens (same "<payloadB64>.<sigB64>" format)
+- ACCESS_CODES gate, REQUIRE_SITE_VERIFICATION gate
+- per-IP fixed window rate limit (CF-Connecting-IP, then X-Forwarded-For)
+
+Stand-in only:
+- GET /__standin/otp?phone=...  returns the last OTP "sent" to that phone
+- GET /__standin/stats          request counters per route/status
+
+Usage (example):
+  python build-tools/berny_worker_standin.py --port 8787 --registry hashes.txt --pepper "..."
+  python build-tools/berny_worker_standin.py --llm-latency-ms 900 --llm-jitter-ms 400 --llm-error-rate 0.02
+
+The registry file is the output of hash_employee_phones.py (one hash per line)
+or a file-backed KV from kv_registry_sync.py apply --local-kv (*.json).
+Only the standard library is used (asyncio streams, no web framework).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import random
+import secrets
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from hash_employee_phones import normalize_phone, sha256_hex
+
+
+REASONS = {
+    200: "OK",
+    204: "No Content",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+}
+
+MAX_BODY_BYTES = 2 * 1024 * 1024
+
+
+@dataclass
+class StandinConfig:
+    provider: str = "openai"
+    allowed_origin: str = "*"
+    rate_limit_max: int = 30
+    rate_limit_window_sec: int = 60
+    access_codes: list[str] = field(default_factory=list)
+    require_site_verification: bool = False
+    auth_token_secret: str = "standin-secret"
+    auth_token_ttl_days: int = 30
+    phone_hash_pepper: str = ""
+    otp_hash_pepper: str = ""
+    otp_ttl_sec: int = 600
+    registry: set[str] = field(default_factory=set)
+    # Fake upstreams
+    llm_latency_ms: float = 800.0
+    llm_jitter_ms: float = 300.0
+    llm_error_rate: float = 0.0
+    sms_latency_ms: float = 150.0
+    sms_error_rate: float = 0.0
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def _from_b64url(s: str) -> bytes:
+    return base64.urlsafe_b64decode(s + "=" * (-len(s) % 4))
+
+
+class MemoryKV:
+    """Tiny KV with expirationTtl, standing in for OTP_STORE."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, tuple[str, float]] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires = item
+        if expires and expires <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def put(self, key: str, value: str, expiration_ttl: Optional[int] = None) -> None:
+        expires = time.monotonic() + expiration_ttl if expiration_ttl else 0.0
+        self._data[key] = (value, expires)
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+
+class RateLimiter:
+    """Same fixed-window, per-IP logic as rateLimitCheck() in the Worker."""
+
+    def __init__(self, max_requests: int, window_sec: int) -> None:
+        self.max = max(1, max_requests)
+        self.window = max(1, window_sec)
+        self._state: dict[str, list[float]] = {}
+
+    def check(self, ip: str) -> tuple[bool, int]:
+        now = time.monotonic()
+        bucket = self._state.get(ip)
+        if bucket is None or now - bucket[0] >= self.window:
+            bucket = [now, 0]
+        bucket[1] += 1
+        self._state[ip] = bucket
+
+        if len(self._state) > 2000:
+            for k in [k for k, v in self._state.items() if now - v[0] >= self.window]:
+                del self._state[k]
+
+        limited = bucket[1] > self.max
+        retry_after = int(bucket[0] + self.window - now + 0.999) if limited else 0
+        return limited, retry_after
+
+
+@dataclass
+class Response:
+    status: int
+    body: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def text(cls, status: int, text: str, **headers: str) -> "Response":
+        return cls(status, text.encode("utf-8"), dict(headers))
+
+    @classmethod
+    def json(cls, status: int, payload: object) -> "Response":
+        return cls(status, json.dumps(payload).encode("utf-8"), {"content-type": "application/json"})
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    query: dict[str, list[str]]
+    headers: dict[str, str]
+    body: bytes
+
+    def header(self, name: str) -> str:
+        return self.headers.get(name.lower(), "")
+
+    def json(self) -> object:
+        return json.loads(self.body.decode("utf-8"))
+
+
+class BernyWorkerStandin:
+    def __init__(self, config: StandinConfig, *, seed: Optional[int] = None) -> None:
+        self.config = config
+        self.otp_store = MemoryKV()
+        self.rate = RateLimiter(config.rate_limit_max, config.rate_limit_window_sec)
+        self.sms_outbox: dict[str, str] = {}
+        self.stats: Counter[str] = Counter()
+        self._rng = random.Random(seed)
+
+    # ------------------------------------------------------------------
+    # Auth helpers (same token format as issueAuthToken/verifyAuthToken)
+    # ------------------------------------------------------------------
+    def issue_auth_token(self, phone_hash: str) -> tuple[str, int]:
+        now = int(time.time())
+        exp = now + max(1, self.config.auth_token_ttl_days) * 24 * 60 * 60
+        payload = json.dumps({"v": 1, "sub": phone_hash, "iat": now, "exp": exp}, separators=(",", ":"))
+        payload_b64 = _b64url(payload.encode("utf-8"))
+        sig = hmac.new(self.config.auth_token_secret.encode("utf-8"), payload_b64.encode("ascii"), hashlib.sha256)
+        return f"{payload_b64}.{_b64url(sig.digest())}", exp
+
+    def verify_auth_token(self, token: str) -> Optional[dict]:
+        payload_b64, _, sig_b64 = token.strip().partition(".")
+        if not payload_b64 or not sig_b64:
+            return None
+        try:
+            payload = json.loads(_from_b64url(payload_b64))
+            sig = _from_b64url(sig_b64)
+        except ValueError:
+            return None
+        expected = hmac.new(self.config.auth_token_secret.encode("utf-8"), payload_b64.encode("ascii"), hashlib.sha256)
+        if not hmac.compare_digest(expected.digest(), sig):
+            return None
+        exp = payload.get("exp") if isinstance(payload, dict) else None
+        if not isinstance(exp, (int, float)) or exp <= time.time():
+            return None
+        return payload
+
+    def is_phone_allowed(self, phone_hash: str) -> bool:
+        return bool(phone_hash) and phone_hash in self.config.registry
+
+    # ------------------------------------------------------------------
+    # Fake upstreams
+    # ------------------------------------------------------------------
+    async def _fake_latency(self, mean_ms: float, jitter_ms: float) -> None:
+        delay = max(0.0, self._rng.gauss(mean_ms, jitter_ms)) if jitter_ms else mean_ms
+        if delay:
+            await asyncio.sleep(delay / 1000.0)
+
+    async def fake_sms(self, phone: str, otp: str) -> bool:
+        await self._fake_latency(self.config.sms_latency_ms, self.config.sms_latency_ms / 4)
+        if self._rng.random() < self.config.sms_error_rate:
+            return False
+        self.sms_outbox[phone] = otp
+        return True
+
+    async def fake_llm(self, messages: list) -> Optional[str]:
+        await self._fake_latency(self.config.llm_latency_ms, self.config.llm_jitter_ms)
+        if self._rng.random() < self.config.llm_error_rate:
+            return None
+        last_user = next((m for m in reversed(messages) if isinstance(m, dict) and m.get("role") == "user"), {})
+        prompt = str(last_user.get("content") or "")
+        return f"[{self.config.provider} stand-in] Ricevuto: {prompt[:120]}"
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+    def _cors(self, origin: str) -> tuple[bool, dict[str, str]]:
+        allowed_raw = self.config.allowed_origin.strip() or "*"
+        allow_all = allowed_raw == "*"
+        allowed = [s.strip() for s in allowed_raw.split(",") if s.strip()]
+        is_allowed = allow_all or not origin or origin in allowed
+        if allow_all:
+            allow_header = "*"
+        elif origin and is_allowed:
+            allow_header = origin
+        else:
+            allow_header = allowed[0] if allowed else ""
+        headers = {
+            "Access-Control-Allow-Origin": allow_header,
+            "Access-Control-Allow-Methods": "POST, GET, OPTIONS",
+            "Access-Control-Allow-Headers": "Content-Type, X-Berny-Access-Code, X-Badiani-Auth",
+            "Access-Control-Max-Age": "86400",
+            "Vary": "Origin",
+        }
+        return is_allowed, headers
+
+    @staticmethod
+    def client_ip(req: Request, peer: str) -> str:
+        cf_ip = req.header("cf-connecting-ip")
+        if cf_ip:
+            return cf_ip
+        xff = req.header("x-forwarded-for")
+        if xff:
+            return xff.split(",")[0].strip()
+        return peer or "unknown"
+
+    async def handle(self, req: Request, peer: str = "") -> Response:
+        is_allowed, cors = self._cors(req.header("origin"))
+        resp = await self._route(req, peer, is_allowed)
+        resp.headers = {**cors, **resp.headers}
+        self.stats[f"{req.method} {req.path} {resp.status}"] += 1
+        return resp
+
+    async def _route(self, req: Request, peer: str, is_allowed: bool) -> Response:
+        if not is_allowed:
+            return Response.text(403, "Forbidden (CORS)")
+        if req.method == "OPTIONS":
+            return Response(204)
+
+        pathname = req.path or "/"
+        path = "/" + pathname[len("/berny/"):] if pathname.startswith("/berny/") else pathname
+
+        if req.method == "GET" and path.startswith("/__standin/"):
+            return self._standin_route(path, req)
+
+        if req.method == "POST" and path in ("/auth/request", "/auth/verify"):
+            return await self._auth(path, req)
+
+        if req.method == "GET" and path.rstrip("/") == "/health":
+            return Response.json(200, {"ok": True, "provider": self.config.provider})
+
+        if req.method == "GET" and path.rstrip("/") == "/models":
+            return Response.json(200, {"models": [{"name": "models/standin-fake"}]})
+
+        if req.method != "POST":
+            return Response.text(405, "Method Not Allowed")
+
+        return await self._chat(req, peer)
+
+    def _standin_route(self, path: str, req: Request) -> Response:
+        if path == "/__standin/otp":
+            phone = normalize_phone((req.query.get("phone") or [""])[0])
+            otp = self.sms_outbox.get(phone)
+            if not otp:
+                return Response.text(404, "Not Found")
+            return Response.json(200, {"phone": phone, "code": otp})
+        if path == "/__standin/stats":
+            return Response.json(200, dict(self.stats))
+        return Response.text(404, "Not Found")
+
+    async def _auth(self, path: str, req: Request) -> Response:
+        try:
+            body = req.json()
+        except ValueError:
+            return Response.text(400, "Bad JSON")
+        if not isinstance(body, dict):
+            body = {}
+
+        phone = normalize_phone(str(body.get("phone") or ""))
+        if not phone:
+            return Response.text(400, "Invalid phone")
+        phone_hash = sha256_hex(f"{phone}|{self.config.phone_hash_pepper}")
+        if not self.is_phone_allowed(phone_hash):
+            return Response.text(404, "Not Found")
+
+        otp_ttl = max(60, self.config.otp_ttl_sec)
+        pepper = self.config.otp_hash_pepper
+
+        if path == "/auth/request":
+            if self.otp_store.get(f"otp_req:{phone_hash}"):
+                return Response.text(429, "Too Many Requests")
+            otp = f"{secrets.randbelow(100000):05d}"
+            self.otp_store.put(f"otp:{phone_hash}", sha256_hex(f"{phone_hash}|{otp}|{pepper}"), otp_ttl)
+            self.otp_store.put(f"otp_req:{phone_hash}", "1", 60)
+            if not await self.fake_sms(phone, otp):
+                return Response.json(
+                    502, {"ok": False, "error": "sms_send_failed", "message": "SMS send failed", "twilio": None}
+                )
+            return Response.json(200, {"ok": True})
+
+        code = str(body.get("code") or "").strip()
+        if not (len(code) == 5 and code.isdigit()):
+            return Response.text(400, "Invalid code")
+        stored = self.otp_store.get(f"otp:{phone_hash}")
+        if not stored or stored != sha256_hex(f"{phone_hash}|{code}|{pepper}"):
+            return Response.text(401, "Unauthorized")
+        self.otp_store.delete(f"otp:{phone_hash}")
+        self.otp_store.delete(f"otp_req:{phone_hash}")
+        token, exp = self.issue_auth_token(phone_hash)
+        return Response.json(200, {"ok": True, "token": token, "exp": exp})
+
+    async def _chat(self, req: Request, peer: str) -> Response:
+        if self.config.require_site_verification:
+            if not self.verify_auth_token(req.header("x-badiani-auth")):
+                return Response.text(401, "Unauthorized")
+
+        if self.config.access_codes:
+            code = req.header("x-berny-access-code").strip()
+            if not code or code not in self.config.access_codes:
+                return Response.text(401, "Unauthorized")
+
+        limited, retry_after = self.rate.check(self.client_ip(req, peer))
+        if limited:
+            return Response.text(
+                429, "Too Many Requests", **{"Retry-After": str(retry_after or 1), "content-type": "text/plain; charset=utf-8"}
+            )
+
+        try:
+            body = req.json()
+        except ValueError:
+            return Response.text(400, "Bad JSON")
+        messages = body.get("messages") if isinstance(body, dict) else None
+        if not isinstance(messages, list) or not messages:
+            return Response.text(400, "Missing messages[]")
+
+        text = await self.fake_llm(messages)
+        if text is None:
+            return Response.text(500, f"{self.config.provider.capitalize()} error 503: fake upstream failure")
+        return Response.json(200, {"text": text})
+
+    # ------------------------------------------------------------------
+    # HTTP/1.1 over asyncio streams (keep-alive, Content-Length bodies)
+    # ------------------------------------------------------------------
+    async def serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peer_info = writer.get_extra_info("peername")
+        peer = peer_info[0] if isinstance(peer_info, tuple) else ""
+        try:
+            while True:
+                req, keep_alive = await _read_request(reader)
+                if req is None:
+                    break
+                resp = await self.handle(req, peer)
+                writer.write(_encode_response(resp, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start(self, host: str, port: int) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.serve_connection, host, port, backlog=1024)
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[Optional[Request], bool]:
+    line = await reader.readline()
+    if not line:
+        return None, False
+    method, target, version = line.decode("latin-1").strip().split(" ", 2)
+
+    headers: dict[str, str] = {}
+    while True:
+        raw = await reader.readline()
+        if raw in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = raw.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length") or 0)
+    if length > MAX_BODY_BYTES:
+        raise ValueError("body too large")
+    body = await reader.readexactly(length) if length else b""
+
+    conn = headers.get("connection", "").lower()
+    keep_alive = conn != "close" if version == "HTTP/1.1" else conn == "keep-alive"
+
+    parts = urlsplit(target)
+    return Request(method.upper(), parts.path, parse_qs(parts.query), headers, body), keep_alive
+
+
+def _encode_response(resp: Response, keep_alive: bool) -> bytes:
+    head = [f"HTTP/1.1 {resp.status} {REASONS.get(resp.status, 'Unknown')}"]
+    headers = {"content-type": "text/plain; charset=utf-8", **resp.headers}
+    headers["Content-Length"] = str(len(resp.body))
+    headers["Connection"] = "keep-alive" if keep_alive else "close"
+    head.extend(f"{k}: {v}" for k, v in headers.items())
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + resp.body
+
+
+def load_registry(path: Optional[Path]) -> set[str]:
+    if path is None:
+        return set()
+    if path.suffix.lower() == ".json":
+        return {str(k).lower() for k in json.loads(path.read_text(encoding="utf-8") or "{}")}
+    hashes: set[str] = set()
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            h = line.strip().lower()
+            if h and not h.startswith("#"):
+                hashes.add(h)
+    return hashes
+
+
+def add_config_arguments(ap: argparse.ArgumentParser) -> None:
+    ap.add_argument("--provider", default="openai", help="Provider name reported by /health")
+    ap.add_argument("--allowed-origin", default="*", help='ALLOWED_ORIGIN ("*" or comma-separated origins)')
+    ap.add_argument("--rate-limit-max", type=int, default=30, help="RATE_LIMIT_MAX (POST per window per IP)")
+    ap.add_argument("--rate-limit-window-sec", type=int, default=60, help="RATE_LIMIT_WINDOW_SEC")
+    ap.add_argument("--access-codes", default="", help="ACCESS_CODES (comma-separated)")
+    ap.add_argument("--require-site-verification", action="store_true", help="REQUIRE_SITE_VERIFICATION=1")
+    ap.add_argument("--auth-token-secret", default="standin-secret", help="AUTH_TOKEN_SECRET")
+    ap.add_argument("--pepper", default="", help="PHONE_HASH_PEPPER")
+    ap.add_argument("--otp-pepper", default="", help="OTP_HASH_PEPPER")
+    ap.add_argument("--otp-ttl-sec", type=int, default=600, help="OTP_TTL_SEC")
+    ap.add_argument("--registry", type=Path, default=None, help="Allowed phone hashes (.txt snapshot or local KV .json)")
+    ap.add_argument("--llm-latency-ms", type=float, default=800.0, help="Fake LLM mean latency")
+    ap.add_argument("--llm-jitter-ms", type=float, default=300.0, help="Fake LLM latency std-dev")
+    ap.add_argument("--llm-error-rate", type=float, default=0.0, help="Fraction of fake LLM calls that fail (0-1)")
+    ap.add_argument("--sms-latency-ms", type=float, default=150.0, help="Fake Twilio mean latency")
+    ap.add_argument("--sms-error-rate", type=float, default=0.0, help="Fraction of fake SMS sends that fail (0-1)")
+
+
+def config_from_args(args: argparse.Namespace, registry: Optional[set[str]] = None) -> StandinConfig:
+    return StandinConfig(
+        provider=args.provider.lower(),
+        allowed_origin=args.allowed_origin,
+        rate_limit_max=args.rate_limit_max,
+        rate_limit_window_sec=args.rate_limit_window_sec,
+        access_codes=[c.strip() for c in args.access_codes.split(",") if c.strip()],
+        require_site_verification=args.require_site_verification,
+        auth_token_secret=args.auth_token_secret,
+        phone_hash_pepper=args.pepper.strip(),
+        otp_hash_pepper=args.otp_pepper.strip(),
+        otp_ttl_sec=args.otp_ttl_sec,
+        registry=registry if registry is not None else load_registry(args.registry),
+        llm_latency_ms=args.llm_latency_ms,
+        llm_jitter_ms=args.llm_jitter_ms,
+        llm_error_rate=args.llm_error_rate,
+        sms_latency_ms=args.sms_latency_ms,
+        sms_error_rate=args.sms_error_rate,
+    )
+
+
+async def _serve_forever(standin: BernyWorkerStandin, host: str, port: int) -> None:
+    server = await standin.start(host, port)
+    addrs = ", ".join(str(s.getsockname()) for s in server.sockets or [])
+    print(f"🚀 berny-worker stand-in listening on {addrs} (registry={len(standin.config.registry)} hashes)", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Local asyncio stand-in for the berny Cloudflare Worker.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8787)
+    add_config_arguments(ap)
+    args = ap.parse_args()
+
+    standin = BernyWorkerStandin(config_from_args(args))
+    try:
+        asyncio.run(_serve_forever(standin, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
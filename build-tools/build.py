@@ -0,0 +1,571 @@
+#!/usr/bin/env python3
+"""Build orchestrator: runs the build-tools scripts as a dependency graph.
+
+Every tool is declared below as a Task with the files it reads (inputs) and the
+files it writes (outputs), as globs relative to the repo root. Edges come from
+those declarations (a task depends on any task whose outputs match its inputs)
+plus explicit `after` ordering, e.g.:
+
+  pdf-text -> kb-copy
+  knowledge -> prompt-budget
+  images-import -> images-png -> images-jpg -> audit-assets
+  knowledge / search-seed / deeplink-map -> dist-bundle -> dist-critical-css
+      -> dist-fingerprint -> dist-minify -> dist-precache -> dist-precompress
+
+A task is stale when the sha256 of its inputs (file contents, the script and
+the local modules it imports, the command line) differs from the last
+successful run, when one of its outputs is missing or was edited by hand, or
+when a task it depends on ran. Only stale tasks run, in topological order, with independent branches
+in parallel (--jobs). State lives in .build-state.json (gitignored); file
+hashes are cached by size + mtime so unchanged files are not re-read.
+
+Tasks sharing a `group` rewrite the same output tree in place (dist/): if one
+member is stale the whole chain reruns from its head, so no stage ever
+processes its own output twice.
+
+Tasks whose requirements are missing (PIL, PyPDF2, fontTools, ffmpeg...) or
+whose inputs match no file are skipped, and their dependents run on what is on
+disk. Dependents of a failed task are not run.
+
+Usage:
+  python build-tools/build.py --list
+  python build-tools/build.py --dry-run
+  python build-tools/build.py
+  python build-tools/build.py dist-minify knowledge --jobs 4
+  python build-tools/build.py --force audit-assets
+  python build-tools/build.py --profile          # per-task + per-stage traces in dist/profile/
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "python"))
+import perf_trace  # noqa: E402
+from build_knowledge import input_globs as knowledge_inputs  # noqa: E402
+from perf_trace import add_profile_arguments, count, profile_session, stage  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+STATE_FILE = ROOT / ".build-state.json"
+STATE_VERSION = 1
+
+LOCAL_IMPORT_RE = re.compile(r"^\s*(?:from|import)\s+([A-Za-z_]\w*)", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class Task:
+    name: str
+    script: str
+    args: tuple[str, ...] = ()
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    after: tuple[str, ...] = ()
+    group: str | None = None
+    requires: tuple[str, ...] = ()  # "PIL" (importable module) or "bin:ffmpeg" (executable on PATH)
+    explicit: bool = False  # only runs when named on the command line
+    doc: str = ""
+
+    @property
+    def cmd(self) -> list[str]:
+        return [sys.executable, self.script, *self.args]
+
+
+PAGES = ("*.html",)
+TASKS: tuple[Task, ...] = (
+    Task(
+        "pdf-text", "build-tools/python/extract_all_pdf_text.py",
+        inputs=("*.pdf",), outputs=("notes/pdf_text/*.txt",),
+        requires=("PyPDF2",), doc="Extract the root PDFs to notes/pdf_text/",
+    ),
+    Task(
+        "kb-copy", "build-tools/python/copy_kb.py",
+        inputs=("notes/pdf_text/*.txt",), outputs=("notes/kb/*/*.txt",),
+        doc="Copy the extracted text into notes/kb/<lang>/",
+    ),
+    Task(
+        "knowledge", "build-tools/build_knowledge.py",
+        inputs=knowledge_inputs(ROOT),  # from build_knowledge.SCAN_CONFIG
+        outputs=("scripts/berny-super-knowledge.js",),
+        doc="Berny knowledge base (scripts/berny-super-knowledge.js)",
+    ),
+    Task(
+        "search-seed", "build-tools/python/generate_search_catalog_seed.py",
+        inputs=(*PAGES, "scripts/i18n.js", "audit_deeplinks.py"),
+        outputs=("scripts/search-catalog-seed.js",),
+        doc="Prebuilt search catalogue (scripts/search-catalog-seed.js)",
+    ),
+    Task(
+        "deeplink-map", "audit_deeplinks.py", ("--map",),
+        inputs=(*PAGES, "scripts/i18n.js"), outputs=("scripts/deep-link-map.js",),
+        doc="Audit card deep links and write scripts/deep-link-map.js",
+    ),
+    Task(
+        "images-import", "build-tools/python/import_generated_images.py",
+        inputs=("assets/_inbox/*", "notes/assets-to-generate.md"),
+        outputs=("assets/*.jpg", "assets/*.webp", "assets/story/*.webp"),
+        requires=("PIL",), explicit=True,
+        doc="Import generated images from assets/_inbox/ (consumes the inbox; run by name)",
+    ),
+    Task(
+        "images-png", "build-tools/python/convert_png_to_jpg_webp.py",
+        inputs=("assets/**/*.png",), outputs=("assets/**/*.jpg", "assets/**/*.webp"),
+        requires=("PIL",), doc="PNG -> JPG + WEBP",
+    ),
+    Task(
+        "images-jpg", "build-tools/python/convert_jpg_to_webp.py",
+        inputs=("assets/**/*.jpg", "assets/**/*.jpeg"), outputs=("assets/**/*.webp",),
+        requires=("PIL",), doc="JPG -> WEBP",
+    ),
+    Task(
+        "audio", "build-tools/python/transcode_audio.py",
+        inputs=("Gelato Hub Loop.mp3",), outputs=("assets/audio/*.opus", "assets/audio/*.m4a", "assets/audio/manifest.json"),
+        requires=("bin:ffmpeg", "bin:ffprobe"), doc="Opus/AAC variants of the hub ambience track",
+    ),
+    Task(
+        "subset-fonts", "build-tools/python/subset_fonts.py",
+        inputs=(*PAGES, "scripts/i18n.js", "styles/site.css", "fonts/*.otf", "fonts/*.ttf", "fonts/*.woff2", "fonts/*.woff"),
+        outputs=("fonts/subset/*.woff2", "fonts/subset/fonts.css"),
+        requires=("fontTools", "brotli"), doc="WOFF2 subsets + unicode-range @font-face",
+    ),
+    Task(
+        "audit-assets", "build-tools/python/audit_assets.py",
+        inputs=(*PAGES, "scripts/**/*.js", "styles/**/*.css", "assets/**"),
+        doc="Report unused / missing assets",
+    ),
+    Task(
+        "audit-i18n", "build-tools/python/audit_i18n_cards.py",
+        inputs=PAGES, doc="Report guide cards without data-i18n markers",
+    ),
+    Task(
+        "prompt-budget", "build-tools/python/audit_prompt_budget.py", ("--json", "dist/prompt-budget.json"),
+        inputs=("scripts/berny-brain-api.js", "scripts/berny-knowledge.js", "scripts/berny-super-knowledge.js"),
+        outputs=("dist/prompt-budget.json",),
+        doc="Token budget of Berny's system prompt (fails when over budget)",
+    ),
+    Task(
+        "dist-bundle", "build-tools/bundle_site_js.py",
+        inputs=(*PAGES, "scripts/**/*.js", "build-tools/site-chunks.json"),
+        outputs=("dist/*.html", "dist/scripts/*.js"),
+        group="dist", doc="Split site.js into per-page chunks (dist/)",
+    ),
+    Task(
+        "dist-critical-css", "build-tools/python/critical_css.py", ("--pages-dir", "dist", "--out-dir", "dist"),
+        inputs=("styles/**/*.css", "scripts/**/*.js"), outputs=("dist/styles/*.css",),
+        after=("dist-bundle",), group="dist", doc="Inline critical CSS, async-load the pruned rest",
+    ),
+    Task(
+        "dist-fingerprint", "build-tools/python/fingerprint_assets.py", ("--pages-dir", "dist", "--out-dir", "dist"),
+        inputs=("scripts/**/*.js", "styles/**/*.css", "fonts/**", "assets/**"),
+        outputs=("dist/asset-manifest.json", "dist/_headers"),
+        after=("dist-critical-css",), group="dist", doc="Content-hashed asset names + _headers",
+    ),
+    Task(
+        "dist-minify", "build-tools/python/minify_pages.py", ("--pages-dir", "dist", "--out-dir", "dist"),
+        inputs=("styles/**/*.css", "assets/**/*.svg"), outputs=("dist/*.html.gz",),
+        after=("dist-fingerprint",), group="dist", doc="Minify, inline small assets, precompress pages",
+    ),
+    Task(
+        "dist-precache", "build-tools/python/generate_precache_manifest.py",
+        ("--pages-dir", "dist", "--out", "dist/precache-manifest.json"),
+        inputs=("scripts/**/*.js", "scripts/**/*.json", "styles/**/*.css", "fonts/**", "assets/**"),
+        outputs=("dist/precache-manifest.json",),
+        after=("dist-minify",), group="dist", doc="Service-worker precache manifest of what the dist pages load",
+    ),
+    Task(
+        "dist-precompress", "build-tools/python/precompress_assets.py", ("--dir", "dist"),
+        inputs=("scripts/**/*.js", "styles/**/*.css"), outputs=("dist/precompress-report.json",),
+        after=("dist-precache",), group="dist", doc="Max-effort .br/.gz siblings for dist JS/CSS/JSON + size report",
+    ),
+)
+
+
+def glob_regex(pattern: str) -> re.Pattern:
+    """Path-segment aware glob: * and ? stay inside a segment, ** spans segments."""
+    out = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out += "(?:.*/)?"
+            i += 3
+        elif pattern.startswith("**", i):
+            out += ".*"
+            i += 2
+        elif pattern[i] == "*":
+            out += "[^/]*"
+            i += 1
+        elif pattern[i] == "?":
+            out += "[^/]"
+            i += 1
+        else:
+            out += re.escape(pattern[i])
+            i += 1
+    return re.compile(out + r"\Z")
+
+
+def patterns_overlap(a: str, b: str) -> bool:
+    # Each pattern string is matched as a literal path against the other's regex;
+    # good enough for the globs declared above.
+    return bool(glob_regex(b).match(a) or glob_regex(a).match(b))
+
+
+def expand(patterns: tuple[str, ...]) -> set[str]:
+    files: set[str] = set()
+    for pattern in patterns:
+        files |= {p.relative_to(ROOT).as_posix() for p in ROOT.glob(pattern) if p.is_file()}
+    return files
+
+
+def local_imports(script: Path, seen: set[Path] | None = None) -> set[Path]:
+    """The script plus the sibling / build-tools modules it (transitively) imports."""
+    seen = set() if seen is None else seen
+    if script in seen or not script.is_file():
+        return seen
+    seen.add(script)
+    search = (script.parent, ROOT / "build-tools", ROOT / "build-tools" / "python", ROOT)
+    for name in LOCAL_IMPORT_RE.findall(script.read_text(encoding="utf-8")):
+        for base in search:
+            candidate = base / f"{name}.py"
+            if candidate.is_file():
+                local_imports(candidate, seen)
+                break
+    return seen
+
+
+def missing_requirements(task: Task) -> list[str]:
+    missing = []
+    for req in task.requires:
+        if req.startswith("bin:"):
+            if shutil.which(req[4:]) is None:
+                missing.append(req[4:])
+        elif importlib.util.find_spec(req) is None:
+            missing.append(req)
+    return missing
+
+
+class BuildState:
+    """.build-state.json: per-file hash cache + per-task hash of the last successful run."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        data = {}
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                data = {}
+        if data.get("version") != STATE_VERSION:
+            data = {}
+        self.files: dict[str, list] = data.get("files", {})
+        self.tasks: dict[str, dict] = data.get("tasks", {})
+
+    def file_hash(self, rel: str) -> str:
+        st = (ROOT / rel).stat()
+        with self.lock:
+            cached = self.files.get(rel)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            count("cache_hits")
+            return cached[2]
+        h = hashlib.sha256()
+        with (ROOT / rel).open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with self.lock:
+            self.files[rel] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def input_hash(self, task: Task) -> tuple[str, int]:
+        """(hash, number of matched input files); the task's own outputs are not inputs."""
+        files = expand(task.inputs) - expand(task.outputs)
+        code = {p.relative_to(ROOT).as_posix() for p in local_imports(ROOT / task.script)}
+        h = hashlib.sha256(json.dumps(task.cmd[1:]).encode("utf-8"))
+        for rel in sorted(files | code):
+            h.update(f"{rel}\0{self.file_hash(rel)}\n".encode("utf-8"))
+        return h.hexdigest(), len(files)
+
+    def output_hash(self, task: Task) -> str:
+        h = hashlib.sha256()
+        for rel in sorted(expand(task.outputs)):
+            h.update(f"{rel}\0{self.file_hash(rel)}\n".encode("utf-8"))
+        return h.hexdigest()
+
+    def record(self, task: Task, digest: str, seconds: float) -> None:
+        entry = {
+            "hash": digest,
+            "outputs": self.output_hash(task),
+            "seconds": round(seconds, 2),
+            "at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        with self.lock:
+            self.tasks[task.name] = entry
+
+    def forget(self, name: str) -> None:
+        with self.lock:
+            self.tasks.pop(name, None)
+
+    def save(self) -> None:
+        with self.lock:
+            live = {k: v for k, v in self.files.items() if (ROOT / k).exists()}
+            payload = {"version": STATE_VERSION, "files": live, "tasks": self.tasks}
+            self.path.write_text(json.dumps(payload, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def dependencies(tasks: tuple[Task, ...]) -> dict[str, set[str]]:
+    names = {t.name for t in tasks}
+    deps: dict[str, set[str]] = {t.name: {a for a in t.after if a in names} for t in tasks}
+    for consumer in tasks:
+        for producer in tasks:
+            if producer is consumer:
+                continue
+            if any(patterns_overlap(o, i) for o in producer.outputs for i in consumer.inputs):
+                deps[consumer.name].add(producer.name)
+    return deps
+
+
+def topo_order(tasks: tuple[Task, ...], deps: dict[str, set[str]]) -> list[str]:
+    order: list[str] = []
+    pending = [t.name for t in tasks]  # declaration order breaks ties
+    while pending:
+        ready = [n for n in pending if deps[n] <= set(order)]
+        if not ready:
+            raise SystemExit(f"❌ Dependency cycle between: {', '.join(pending)}")
+        order += ready
+        pending = [n for n in pending if n not in ready]
+    return order
+
+
+def select(targets: list[str], deps: dict[str, set[str]]) -> set[str]:
+    by_name = {t.name: t for t in TASKS}
+    unknown = [t for t in targets if t not in by_name]
+    if unknown:
+        raise SystemExit(f"❌ Unknown task(s): {', '.join(unknown)} (see --list)")
+    if not targets:
+        return {t.name for t in TASKS if not t.explicit}
+    chosen: set[str] = set()
+    stack = list(targets)
+    while stack:
+        name = stack.pop()
+        if name in chosen:
+            continue
+        chosen.add(name)
+        stack += [d for d in deps[name] if not by_name[d].explicit or d in targets]
+    return chosen
+
+
+class Builder:
+    def __init__(self, state: BuildState, deps: dict[str, set[str]], force: bool, verbose: bool) -> None:
+        self.state = state
+        self.deps = deps
+        self.force = force
+        self.verbose = verbose
+        self.by_name = {t.name: t for t in TASKS}
+        self.print_lock = threading.Lock()
+        self.unavailable: dict[str, list[str]] = {}
+
+    def log(self, line: str) -> None:
+        with self.print_lock:
+            print(line, flush=True)
+
+    def own_reason(self, task: Task) -> str | None:
+        """Why the task is stale on its own (ignoring dependencies), or None."""
+        if self.force:
+            return "forced"
+        digest, count = self.state.input_hash(task)
+        if task.inputs and count == 0:
+            return None  # nothing to build from; reported as skipped
+        last = self.state.tasks.get(task.name)
+        if last is None:
+            return "never built"
+        if last["hash"] != digest:
+            return "inputs changed"
+        missing = [o for o in task.outputs if not expand((o,))]
+        if missing:
+            return f"missing {missing[0]}"
+        # Later members of an in-place group rewrite earlier members' outputs.
+        if not task.group and last.get("outputs") != self.state.output_hash(task):
+            return "outputs changed outside the build"
+        return None
+
+    def plan(self, order: list[str], chosen: set[str]) -> dict[str, str]:
+        """name -> reason for every task that will run (group and dependency propagation included).
+
+        Tasks missing a requirement never count as stale, so they do not drag
+        their dependents along on every run.
+        """
+        self.unavailable = {n: m for n in order if n in chosen and (m := missing_requirements(self.by_name[n]))}
+        chosen = chosen - set(self.unavailable)
+        reasons = {n: r for n in order if n in chosen and (r := self.own_reason(self.by_name[n]))}
+        changed = True
+        while changed:
+            changed = False
+            for name in order:
+                if name not in chosen or name in reasons:
+                    continue
+                task = self.by_name[name]
+                ran = sorted(d for d in self.deps[name] if d in reasons)
+                mates = sorted(
+                    t.name for t in TASKS
+                    if task.group and t.group == task.group and t.name in reasons and t.name in chosen
+                )
+                if ran:
+                    reasons[name] = f"after {ran[0]}"
+                elif mates:
+                    reasons[name] = f"{task.group} chain rebuilds ({mates[0]})"
+                else:
+                    continue
+                changed = True
+        return reasons
+
+    def run_task(self, task: Task) -> tuple[str, float, str]:
+        """('ok' | 'failed' | 'skipped', seconds, detail)."""
+        missing = missing_requirements(task)
+        if missing:
+            return "skipped", 0.0, f"missing {', '.join(missing)}"
+        with stage(task.name):
+            digest, count = self.state.input_hash(task)
+            if task.inputs and count == 0:
+                return "skipped", 0.0, "no input files"
+            t0 = time.perf_counter()
+            proc = subprocess.run(task.cmd, cwd=ROOT, capture_output=True, text=True, encoding="utf-8", errors="replace")
+            seconds = time.perf_counter() - t0
+            output = (proc.stdout + proc.stderr).rstrip()
+            if proc.returncode != 0:
+                self.state.forget(task.name)
+                return "failed", seconds, output
+            # Recompute: inputs may include files a dependency just rewrote.
+            self.state.record(task, self.state.input_hash(task)[0], seconds)
+            return "ok", seconds, output
+
+    def execute(self, order: list[str], reasons: dict[str, str], jobs: int) -> int:
+        todo = [n for n in order if n in reasons]
+        done: set[str] = set()
+        failed: set[str] = set()
+        running = {}
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            while todo or running:
+                for name in list(todo):
+                    if any(d in failed for d in self.deps[name]):
+                        todo.remove(name)
+                        failed.add(name)
+                        self.log(f"⏭️  {name:<18} not run: a dependency failed")
+                        continue
+                    if all(d in done or d not in reasons for d in self.deps[name]):
+                        todo.remove(name)
+                        self.log(f"🔨 {name:<18} {reasons[name]}")
+                        running[pool.submit(self.run_task, self.by_name[name])] = name
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    status, seconds, detail = future.result()
+                    if status == "ok":
+                        done.add(name)
+                        self.log(f"✅ {name:<18} {seconds:6.2f}s")
+                        if self.verbose and detail:
+                            self.log("\n".join(f"   {line}" for line in detail.splitlines()))
+                    elif status == "skipped":
+                        done.add(name)
+                        self.log(f"⚠️  {name:<18} skipped: {detail}")
+                    else:
+                        failed.add(name)
+                        tail = detail.splitlines()[-15:]
+                        self.log(f"❌ {name:<18} failed after {seconds:.2f}s\n" + "\n".join(f"   {line}" for line in tail))
+                    self.state.save()
+        # A partially rebuilt in-place chain must rerun from its head next time.
+        for name in failed:
+            group = self.by_name[name].group
+            for t in TASKS:
+                if group and t.group == group:
+                    self.state.forget(t.name)
+        self.state.save()
+        return 1 if failed else 0
+
+
+def print_list(order: list[str], deps: dict[str, set[str]]) -> None:
+    by_name = {t.name: t for t in TASKS}
+    for name in order:
+        t = by_name[name]
+        flags = []
+        if t.group:
+            flags.append(f"group={t.group}")
+        if t.requires:
+            flags.append("requires " + ", ".join(r.removeprefix("bin:") for r in t.requires))
+        if t.explicit:
+            flags.append("by name only")
+        print(f"{name:<18} {t.doc}")
+        if deps[name]:
+            print(f"{'':<18}   after: {', '.join(sorted(deps[name], key=order.index))}")
+        if flags:
+            print(f"{'':<18}   {'; '.join(flags)}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Run the build-tools scripts that are out of date, in dependency order.")
+    ap.add_argument("targets", nargs="*", help="Tasks to bring up to date (default: all but by-name-only tasks)")
+    ap.add_argument("--list", action="store_true", help="Show the tasks and their dependencies")
+    ap.add_argument("--dry-run", action="store_true", help="Only print what would run and why")
+    ap.add_argument("--force", action="store_true", help="Treat every selected task as stale")
+    ap.add_argument("--jobs", "-j", type=int, default=4, help="Tasks run in parallel")
+    ap.add_argument("--verbose", "-v", action="store_true", help="Print each task's output")
+    ap.add_argument("--state", type=Path, default=STATE_FILE)
+    add_profile_arguments(ap)
+    args = ap.parse_args()
+
+    deps = dependencies(TASKS)
+    order = topo_order(TASKS, deps)
+    if args.list:
+        print_list(order, deps)
+        return 0
+
+    if args.profile or args.cprofile:
+        # Tasks inherit these, so every adopting tool writes its own trace next to build.trace.json.
+        args.profile = (args.profile or perf_trace.DEFAULT_DIR).resolve()
+        os.environ[perf_trace.ENV_DIR] = str(args.profile)
+        if args.cprofile:
+            os.environ[perf_trace.ENV_CPROFILE] = "1"
+    with profile_session("build", args):
+        return build(args, deps, order)
+
+
+def build(args: argparse.Namespace, deps: dict[str, set[str]], order: list[str]) -> int:
+    chosen = select(args.targets, deps)
+    state = BuildState(args.state)
+    builder = Builder(state, deps, args.force, args.verbose)
+    t0 = time.perf_counter()
+    reasons = builder.plan(order, chosen)
+    for name, missing in builder.unavailable.items():
+        print(f"⚠️  {name:<18} skipped: missing {', '.join(missing)}")
+    if not reasons:
+        state.save()
+        print(f"✅ Up to date ({len(chosen)} tasks checked in {time.perf_counter() - t0:.2f}s)")
+        return 0
+    if args.dry_run:
+        for name in order:
+            if name in reasons:
+                print(f"🔨 {name:<18} {reasons[name]}")
+        print(f"\n📊 {len(reasons)} of {len(chosen)} tasks would run")
+        return 0
+
+    print(f"🔍 {len(reasons)} of {len(chosen)} tasks stale")
+    rc = builder.execute(order, reasons, args.jobs)
+    print(f"\n{'✅ Build finished' if rc == 0 else '❌ Build failed'} in {time.perf_counter() - t0:.2f}s")
+    return rc
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
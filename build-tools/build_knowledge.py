@@ -1,14 +1,23 @@
+import argparse
+import contextlib
 import os
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "python"))
+from knowledge_dedup import THRESHOLD, DedupIndex, DedupStats, dedupe  # noqa: E402
+from perf_trace import add_profile_arguments, profile_session, stage  # noqa: E402
+
 # Configuration
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
 OUTPUT_FILE = PROJECT_ROOT / "scripts" / "berny-super-knowledge.js"
 
 # Folders to scan
+# The data/quiz/*.txt translation dumps are left out on purpose: the quiz runs in
+# code, and each language's dump (~75k chars) would more than double the prompt
+# sent with every chat message.
 SCAN_CONFIG = {
-    "data/quiz": [".txt"],
     "pages": [".html"],
     "scripts/i18n": [".json"],
     ".": [".html"] # Root HTML files
@@ -16,33 +25,63 @@ SCAN_CONFIG = {
 
 IGNORE_DIRS = {
     "node_modules", ".git", ".venv", "__pycache__", 
-    "backup_", "build-tools", "assets", "styles"
+    "backup_", "build-tools", "assets", "styles", "dist"
 }
 
+BLOCK_TAGS = r'p|div|li|ul|ol|h[1-6]|section|article|header|footer|nav|tr|table|br|details|summary|dl|dt|dd|blockquote|figcaption'
+
 def clean_html(html_content):
-    """Removes HTML tags, scripts, and styles, leaving only readable text."""
+    """Removes HTML tags, scripts, and styles, leaving only readable text (one line per block)."""
     # Remove scripts and styles
     cleaned = re.sub(r'<(script|style)[^>]*>.*?</\1>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
     # Remove comments
     cleaned = re.sub(r'<!--.*?-->', '', cleaned, flags=re.DOTALL)
+    # Block boundaries become line breaks (the dedup stage works on paragraphs)
+    cleaned = re.sub(rf'</?(?:{BLOCK_TAGS})\b[^>]*>', '\n', cleaned, flags=re.IGNORECASE)
     # Remove tags
     cleaned = re.sub(r'<[^>]+>', ' ', cleaned)
     # Collapse whitespace
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    cleaned = re.sub(r'[ \t\r\f\v]+', ' ', cleaned)
+    cleaned = re.sub(r' *\n[\s]*', '\n', cleaned).strip()
     return cleaned
 
-def build_context():
-    full_text = []
-    print(f"🔍 Scanning project for knowledge in: {PROJECT_ROOT}")
+def read_source(file_path):
+    """Text of a source file; honours UTF-16 BOMs (some quiz exports are UTF-16)."""
+    raw = Path(file_path).read_bytes()
+    if raw.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return raw.decode("utf-16", errors="ignore")
+    return raw.decode("utf-8-sig", errors="ignore")
+
+def _ignored_dir(name):
+    return name in IGNORE_DIRS or any(name.startswith(p) for p in ["backup_", "."])
+
+def input_globs(project_root=PROJECT_ROOT):
+    """Globs (relative to project_root) covering every file iter_source_paths() can pick.
 
+    build.py declares these as the knowledge task's inputs, so the two cannot drift apart.
+    """
+    globs = []
+    for folder, extensions in SCAN_CONFIG.items():
+        for ext in extensions:
+            if folder == ".":
+                # "." scans every non-ignored directory: root files + each top-level folder
+                globs.append(f"*{ext}")
+                top = sorted(d.name for d in Path(project_root).iterdir() if d.is_dir() and not _ignored_dir(d.name))
+                globs += [f"{d}/**/*{ext}" for d in top]
+            else:
+                globs.append(f"{folder}/**/*{ext}")
+    return tuple(dict.fromkeys(globs))
+
+def iter_source_paths(project_root=PROJECT_ROOT):
+    """(path, relative path) of every file SCAN_CONFIG selects, in a stable order."""
     # Walk through the project
-    for root, dirs, files in os.walk(PROJECT_ROOT):
+    for root, dirs, files in os.walk(project_root):
         # Filter ignored directories
-        dirs[:] = [d for d in dirs if d not in IGNORE_DIRS and not any(d.startswith(p) for p in ["backup_", "."])]
+        dirs[:] = sorted(d for d in dirs if not _ignored_dir(d))
         
-        rel_root = os.path.relpath(root, PROJECT_ROOT)
+        rel_root = os.path.relpath(root, project_root)
         
-        for file in files:
+        for file in sorted(files):
             file_path = Path(root) / file
             ext = file_path.suffix.lower()
             
@@ -56,59 +95,177 @@ def build_context():
             if not should_scan:
                 continue
 
-            try:
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read().strip()
-                    if not content:
-                        continue
+            yield file_path, os.path.relpath(file_path, project_root)
+
+def iter_sources(project_root=PROJECT_ROOT, verbose=True):
+    """(relative path, processed text) for every scanned file, one at a time, in a stable order."""
+    if verbose:
+        print(f"🔍 Scanning project for knowledge in: {project_root}")
 
-                    # Process content based on type
-                    if ext == ".html":
-                        processed_content = clean_html(content)
-                    elif ext == ".json":
-                        # Just keep it as string, maybe pretty print if it's small
-                        processed_content = content
-                    else:
-                        processed_content = content
+    for file_path, rel in iter_source_paths(project_root):
+        ext = file_path.suffix.lower()
+        try:
+            content = read_source(file_path).strip()
+            if not content:
+                continue
 
-                    if processed_content:
-                        header = f"\n=== FONTE: {os.path.relpath(file_path, PROJECT_ROOT)} ===\n"
-                        full_text.append(header + processed_content)
-                        print(f"✅ Added: {os.path.relpath(file_path, PROJECT_ROOT)}")
+            # Process content based on type
+            if ext == ".html":
+                processed_content = clean_html(content)
+            elif ext == ".json":
+                # Just keep it as string, maybe pretty print if it's small
+                processed_content = content
+            else:
+                processed_content = content
 
-            except Exception as e:
-                print(f"❌ Error reading {file}: {e}")
+            if processed_content:
+                if verbose:
+                    print(f"✅ Added: {rel}")
+                yield rel, processed_content
 
-    return "\n".join(full_text)
+        except Exception as e:
+            print(f"❌ Error reading {rel}: {e}")
 
-def save_output(context_text):
+def collect_sources(project_root=PROJECT_ROOT):
+    """[(relative path, processed text)] for every scanned file, in a stable order."""
+    return list(iter_sources(project_root))
+
+def format_context(sources):
+    return "\n".join(f"\n=== FONTE: {rel} ===\n{text}" for rel, text in sources)
+
+def report_dedup(stats):
+    saved = stats.chars_in - stats.chars_out
+    print(
+        f"🧹 Dedup: {stats.paragraphs_in} -> {stats.paragraphs_out} paragraphs "
+        f"({stats.exact} exact, {stats.near} near duplicates), "
+        f"{stats.chars_in:,} -> {stats.chars_out:,} chars (-{100 * saved / max(stats.chars_in, 1):.1f}%)"
+    )
+    for rel in stats.sources_dropped:
+        print(f"   fully covered by other sources: {rel}")
+
+def dedupe_sources(sources, threshold=THRESHOLD):
+    """Fold repeated paragraphs into their first copy (see python/knowledge_dedup.py)."""
+    deduped, stats = dedupe(sources, threshold)
+    report_dedup(stats)
+    return deduped
+
+def build_context(project_root=PROJECT_ROOT, dedup=True, threshold=THRESHOLD):
+    sources = collect_sources(project_root)
+    if dedup:
+        sources = dedupe_sources(sources, threshold)
+    return format_context(sources)
+
+def _js_template(text):
     # Escape backticks for JS template literal
-    escaped_text = context_text.replace("`", "\\`").replace("${", "\\${")
-    
-    js_content = f"""/**
+    return text.replace("`", "\\`").replace("${", "\\${")
+
+CONTEXT_SLOT = "\0FULL_APP_CONTEXT\0"
+
+BUNDLE_JS = f"""/**
  * BERNY SUPER KNOWLEDGE BASE
  * Auto-generated by build-tools/build_knowledge.py
  * Contains the full text context of the application for AI consumption.
  */
 
-const FULL_APP_CONTEXT = `{escaped_text}`;
+const FULL_APP_CONTEXT = `{CONTEXT_SLOT}`;
 
 if (typeof window !== 'undefined') {{
     window.FULL_APP_CONTEXT = FULL_APP_CONTEXT;
 }}
 """
-    
-    # Ensure directory exists
-    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        f.write(js_content)
-    
-    print(f"\n🚀 Success! Knowledge base saved to: {OUTPUT_FILE}")
+
+class KnowledgeWriter:
+    """Streams one bundle to disk: the JS wrapper, then the context escaped chunk by chunk.
+
+    Nothing bigger than one source's text is held in memory. Everything goes to a
+    .<name>.tmp file that replaces the bundle only once it is complete; on an error it is
+    deleted and the previous bundle stays in place. Compressed copies are left to the
+    dist-precompress task, which works on the hashed file under dist/.
+    """
+
+    def __init__(self, path, wrapper):
+        self.path = path
+        self.prefix, self.suffix = wrapper.split(CONTEXT_SLOT)
+        self.sources = 0
+        self.chars = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = path.with_name(f".{path.name}.tmp")
+        self._file = open(self._tmp, "wb")
+
+    def _emit(self, text):
+        self._file.write(text.encode("utf-8"))
+
+    def __enter__(self):
+        self._emit(self.prefix)
+        return self
+
+    def write_source(self, rel, text):
+        # Same layout as format_context(), one source at a time
+        self._emit(("\n" if self.sources else "") + _js_template(f"\n=== FONTE: {rel} ===\n"))
+        self._emit(_js_template(text))
+        self.sources += 1
+        self.chars += len(text)
+
+    def __exit__(self, exc_type, *exc):
+        done = False
+        try:
+            if exc_type is None:
+                self._emit(self.suffix)
+            self._file.close()
+            done = exc_type is None
+        finally:
+            if done:
+                os.replace(self._tmp, self.path)
+            else:
+                with contextlib.suppress(Exception):
+                    self._file.close()
+                self._tmp.unlink(missing_ok=True)
+
+    def report(self, label):
+        size = self.path.stat().st_size / 1024
+        print(f"🚀 {label} saved to: {self.path} ({self.sources} sources, {self.chars:,} chars; {size:.0f} KB)")
+
+def stream_knowledge(project_root=PROJECT_ROOT, dedup=True, threshold=THRESHOLD):
+    """Every source goes from disk to the bundle one at a time.
+
+    Without dedup each source is read once and written. With dedup it is read twice:
+    pass 1 indexes paragraph signatures and decides what is kept, pass 2 writes the
+    kept paragraphs; the index holds signatures, never source text.
+    """
+    with KnowledgeWriter(OUTPUT_FILE, BUNDLE_JS) as writer:
+        if not dedup:
+            with stage("stream"):
+                for rel, text in iter_sources(project_root):
+                    writer.write_source(rel, text)
+            return writer
+
+        index = DedupIndex(threshold)
+        stats = DedupStats()
+        plans = {}
+        with stage("dedup"):
+            for rel, text in iter_sources(project_root):
+                plans[rel] = (len(index.sources), index.add_source(rel, text, stats))
+        with stage("write"):
+            for rel, text in iter_sources(project_root, verbose=False):
+                if rel not in plans:
+                    continue  # appeared between the two passes
+                first, plan = plans[rel]
+                body = index.render(rel, text, plan, first, stats)
+                if body:
+                    writer.write_source(rel, body)
+        report_dedup(stats)
+    return writer
 
 if __name__ == "__main__":
-    context = build_context()
-    if context:
-        save_output(context)
+    ap = argparse.ArgumentParser(description="Build scripts/berny-super-knowledge.js from the project content.")
+    ap.add_argument("--no-dedup", action="store_true", help="Keep repeated paragraphs (no near-duplicate elimination); streams every source straight to disk")
+    ap.add_argument("--dedup-threshold", type=float, default=THRESHOLD, help="Shingle Jaccard similarity treated as a duplicate")
+    add_profile_arguments(ap)
+    args = ap.parse_args()
+    with profile_session("build_knowledge", args):
+        writer = stream_knowledge(dedup=not args.no_dedup, threshold=args.dedup_threshold)
+    if writer.sources:
+        print("")
+        writer.report("Knowledge base")
     else:
         print("⚠️ No content found to build knowledge base.")
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""Split scripts/site.js into a core chunk + route-level feature chunks.
+
+site.js is one ~690 KB classic script loaded by every page. This reads
+build-tools/site-chunks.json, cuts site.js at top-level statement boundaries and
+writes one file per run of consecutive statements, in source order:
+  scripts/site.core-<n>.js      everything not claimed by a feature chunk
+  scripts/site.<name>.js        feature chunks (auth, guide-cards, cockpit, ...)
+Keeping source order means a page that loads every chunk executes exactly what
+site.js did; a page that skips a chunk just skips that code.
+
+Each chunk lists regexes that pick whole top-level statements and the markup
+markers (data-* attributes) it needs. A page gets a chunk's <script> tag only if
+its HTML contains one of those markers ("*" = every page), so e.g. the Story
+Orbit code is no longer parsed on caffe.html.
+
+Classic scripts share one global lexical scope, so top-level consts still work
+across files. The bundler refuses to build if
+core (or another chunk) references a top-level name declared in a feature chunk
+(uses inside a statement that declares the same name locally are not references),
+if a chunk does not parse (node --check), or if the rewritten pages break the
+site.js-before-deep-link.js order checked by audit_deeplinks.check_script_order.
+
+Usage:
+  python build-tools/bundle_site_js.py                  # writes dist/ (HTML + chunks)
+  python build-tools/bundle_site_js.py --in-place       # rewrite the root pages
+  python build-tools/bundle_site_js.py --restore        # root pages back to site.js
+  python build-tools/bundle_site_js.py --measure-only   # parse-time report, no output
+
+Parse time is measured with node (vm.Script compile, median of --runs) for the
+full site.js vs the chunks each page loads. Without node only sizes are shown.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent / "python"))
+
+from audit_deeplinks import check_script_order  # noqa: E402
+from perf_trace import add_profile_arguments, profile_session, stage  # noqa: E402
+
+MANIFEST = ROOT / "build-tools" / "site-chunks.json"
+DEFAULT_OUT_DIR = ROOT / "dist"
+EXCLUDE_PAGES = {"debug-carousel.html", "quiz-solution.html"}
+
+CORE = "core"
+BLOCK_START = "<!-- site-chunks:start {src} -->"
+BLOCK_END = "<!-- site-chunks:end -->"
+SITE_TAG_RE = re.compile(
+    r"(?P<indent>[ \t]*)<script defer src=\"(?P<src>scripts/site\.js(?:\?[^\"]*)?)\"></script>(?P<nl>\r?\n)"
+)
+BLOCK_RE = re.compile(
+    r"(?P<indent>[ \t]*)<!-- site-chunks:start (?P<src>\S+) -->\r?\n.*?<!-- site-chunks:end -->(?P<nl>\r?\n)",
+    re.DOTALL,
+)
+TOP_DECL_RE = re.compile(r"^(?:const|let|var|function|class)\s+(?P<name>[A-Za-z_$][\w$]*)", re.MULTILINE)
+
+NODE_PARSE_BENCH = r"""
+const fs = require('fs');
+const vm = require('vm');
+const sets = JSON.parse(fs.readFileSync(process.argv[2], 'utf8'));
+const runs = Number(process.argv[3]) || 15;
+const out = {};
+for (const [label, files] of Object.entries(sets)) {
+  const srcs = files.map((f) => fs.readFileSync(f, 'utf8'));
+  const times = [];
+  for (let i = 0; i < runs; i++) {
+    const t0 = process.hrtime.bigint();
+    // A unique trailing comment defeats V8's per-isolate compilation cache.
+    srcs.forEach((s, j) => new vm.Script(s + `\n//${label}:${i}:${j}`, { filename: files[j] }));
+    times.push(Number(process.hrtime.bigint() - t0) / 1e6);
+  }
+  out[label] = times;
+}
+process.stdout.write(JSON.stringify(out));
+"""
+
+
+@dataclass
+class Statement:
+    text: str
+    head: str
+
+
+@dataclass
+class Chunk:
+    name: str
+    requires: list[str] | str
+    description: str = ""
+    statements: list[Statement] = field(default_factory=list)
+
+    @property
+    def source(self) -> str:
+        return "".join(s.text for s in self.statements)
+
+
+def split_statements(source: str) -> list[Statement]:
+    """Cut at lines starting in column 0 that open a statement (comments stick to the next one)."""
+    lines = source.splitlines(keepends=True)
+    statements: list[Statement] = []
+    buf: list[str] = []
+    head = ""
+    pending: list[str] = []  # column-0 comment lines waiting for their statement
+
+    def is_head(line: str) -> bool:
+        return bool(line.strip()) and line[0] not in " \t}/)]*"
+
+    for line in lines:
+        if line.startswith("//") or line.startswith("/*"):
+            pending.append(line)
+            continue
+        if is_head(line):
+            if buf:
+                statements.append(Statement("".join(buf), head or buf[0]))
+            buf = pending + [line]
+            head = line
+            pending = []
+            continue
+        if pending:
+            buf.extend(pending)
+            pending = []
+        buf.append(line)
+    buf.extend(pending)
+    if buf:
+        statements.append(Statement("".join(buf), head or buf[0]))
+    return statements
+
+
+def load_manifest(path: Path) -> tuple[Path, list[Chunk], list[list[re.Pattern]]]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    chunks = []
+    patterns = []
+    for entry in data["chunks"]:
+        name = entry["name"]
+        if name == CORE or not re.fullmatch(r"[a-z0-9-]+", name):
+            raise ValueError(f"invalid chunk name {name!r}")
+        chunks.append(Chunk(name=name, requires=entry.get("requires", "*"), description=entry.get("description", "")))
+        patterns.append([re.compile(p, re.MULTILINE) for p in entry["statements"]])
+    return ROOT / data.get("source", "scripts/site.js"), chunks, patterns
+
+
+@dataclass
+class Segment:
+    """A run of consecutive top-level statements owned by one chunk = one output file."""
+
+    chunk: Chunk
+    filename: str
+    source: str
+
+
+def assign(statements: list[Statement], chunks: list[Chunk], patterns: list[list[re.Pattern]]) -> tuple[Chunk, list[Segment]]:
+    core = Chunk(name=CORE, requires="*")
+    owners: list[Chunk] = []
+    for st in statements:
+        owner = None
+        for chunk, pats in zip(chunks, patterns):
+            if any(p.search(st.text) for p in pats):
+                if owner is not None:
+                    raise ValueError(f"statement {st.head.strip()[:60]!r} matches both {owner.name} and {chunk.name}")
+                owner = chunk
+        owner = owner or core
+        owner.statements.append(st)
+        owners.append(owner)
+
+    for chunk, pats in zip(chunks, patterns):
+        for p in pats:
+            if not any(p.search(st.text) for st in chunk.statements):
+                raise ValueError(f"chunk {chunk.name}: pattern {p.pattern!r} matched no top-level statement")
+
+    # Files follow source order (core-1, auth, core-2, ...) so a page that loads every
+    # chunk runs the statements exactly as site.js did; skipping a chunk only drops code.
+    runs: list[tuple[Chunk, list[Statement]]] = []
+    for st, owner in zip(statements, owners):
+        if runs and runs[-1][0] is owner:
+            runs[-1][1].append(st)
+        else:
+            runs.append((owner, [st]))
+    totals = {c.name: sum(1 for o, _ in runs if o is c) for c in (core, *chunks)}
+    seen: dict[str, int] = {}
+    segments = []
+    for owner, sts in runs:
+        seen[owner.name] = seen.get(owner.name, 0) + 1
+        suffix = f"-{seen[owner.name]}" if totals[owner.name] > 1 else ""
+        segments.append(Segment(owner, f"site.{owner.name}{suffix}.js", "".join(st.text for st in sts)))
+    return core, segments
+
+
+def check_cross_references(core: Chunk, chunks: list[Chunk]) -> list[str]:
+    """Names declared at the top of a feature chunk must not be used outside it.
+
+    A use inside a top-level statement that declares the same name itself
+    (`const toggles = ...` inside a function) refers to that local and is skipped;
+    any other use is an error. This is a text scan, not a parser.
+    """
+    errors = []
+    everything = [core, *chunks]
+    for chunk in chunks:
+        names = {m.group("name") for st in chunk.statements for m in TOP_DECL_RE.finditer(st.head)}
+        for name in sorted(names):
+            word = re.compile(rf"(?<![\w$.]){re.escape(name)}(?![\w$])")
+            local = re.compile(rf"\b(?:const|let|var|function)\s+{re.escape(name)}(?![\w$])")
+            for other in everything:
+                if other is chunk:
+                    continue
+                if any(word.search(st.text) and not local.search(st.text) for st in other.statements):
+                    errors.append(f"chunk '{other.name}' uses '{name}' declared in chunk '{chunk.name}'")
+    return errors
+
+
+def node_available() -> bool:
+    return shutil.which("node") is not None
+
+
+def node_check(path: Path) -> str | None:
+    proc = subprocess.run(["node", "--check", str(path)], capture_output=True, text=True)
+    if proc.returncode:
+        return proc.stderr.strip() or "node --check failed"
+    return None
+
+
+def page_chunks(html: str, chunks: list[Chunk]) -> list[Chunk]:
+    picked = []
+    for chunk in chunks:
+        if chunk.requires == "*" or any(marker in html for marker in chunk.requires):
+            picked.append(chunk)
+    return picked
+
+
+def _version(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:10]
+
+
+def rewrite_page(html: str, files: list[tuple[str, str]]) -> str | None:
+    """Replace the site.js tag (or a previous chunk block) with the chunk tags."""
+    m = BLOCK_RE.search(html) or SITE_TAG_RE.search(html)
+    if not m:
+        return None
+    indent, nl, src = m.group("indent"), m.group("nl"), m.group("src")
+    lines = [indent + BLOCK_START.format(src=src)]
+    lines += [f'{indent}<script defer src="scripts/{name}?v={ver}"></script>' for name, ver in files]
+    lines.append(indent + BLOCK_END)
+    return html[: m.start()] + nl.join(lines) + nl + html[m.end():]
+
+
+def restore_page(html: str) -> str | None:
+    m = BLOCK_RE.search(html)
+    if not m:
+        return None
+    tag = f'{m.group("indent")}<script defer src="{m.group("src")}"></script>{m.group("nl")}'
+    return html[: m.start()] + tag + html[m.end():]
+
+
+def read_text(path: Path) -> str:
+    with path.open("r", encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def write_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as f:
+        f.write(text)
+
+
+def measure_parse(sets: dict[str, list[Path]], runs: int) -> dict[str, float] | None:
+    if not node_available():
+        return None
+    with tempfile.TemporaryDirectory() as tmp:
+        sets_file = Path(tmp) / "sets.json"
+        bench_file = Path(tmp) / "bench.js"
+        sets_file.write_text(json.dumps({k: [str(p) for p in v] for k, v in sets.items()}), encoding="utf-8")
+        bench_file.write_text(NODE_PARSE_BENCH, encoding="utf-8")
+        proc = subprocess.run(["node", str(bench_file), str(sets_file), str(runs)], capture_output=True, text=True)
+    if proc.returncode:
+        print(f"⚠️  parse benchmark failed: {proc.stderr.strip()[:200]}")
+        return None
+    return {label: statistics.median(times) for label, times in json.loads(proc.stdout).items()}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Split scripts/site.js into core + route-level chunks.")
+    ap.add_argument("--manifest", type=Path, default=MANIFEST)
+    ap.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR, help="Where chunks + rewritten pages go (default: dist/)")
+    ap.add_argument("--in-place", action="store_true", help="Write chunks to scripts/ and rewrite the root pages")
+    ap.add_argument("--restore", action="store_true", help="Put the single site.js tag back in the root pages")
+    ap.add_argument("--measure-only", action="store_true", help="Only report sizes / parse times")
+    ap.add_argument("--runs", type=int, default=15, help="Parse-time samples per page (median is reported)")
+    add_profile_arguments(ap)
+    args = ap.parse_args()
+    with profile_session("bundle_site_js", args):
+        return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    pages = [p for p in sorted(ROOT.glob("*.html")) if p.name not in EXCLUDE_PAGES]
+
+    if args.restore:
+        for page in pages:
+            restored = restore_page(read_text(page))
+            if restored is not None:
+                write_text(page, restored)
+                print(f"✅ {page.name}: back to scripts/site.js")
+        return 0
+
+    source_path, chunks, patterns = load_manifest(args.manifest)
+    source = read_text(source_path)
+    with stage("split"):
+        statements = split_statements(source)
+        core, segments = assign(statements, chunks, patterns)
+    if "".join(seg.source for seg in segments) != source:
+        print("❌ internal error: segments do not cover site.js")
+        return 1
+
+    with stage("check_cross_references"):
+        errors = check_cross_references(core, chunks)
+    for msg in errors:
+        print(f"❌ {msg}")
+    if errors:
+        return 1
+
+    out_dir = ROOT if args.in_place else args.out_dir
+    scripts_dir = (out_dir / "scripts") if not args.measure_only else Path(tempfile.mkdtemp(prefix="site-chunks-"))
+    for stale in scripts_dir.glob("site.*.js"):
+        stale.unlink()
+    files: dict[str, Path] = {}
+    nl = "\r\n" if "\r\n" in source[:4096] else "\n"
+    rel_source = source_path.relative_to(ROOT).as_posix()
+    for seg in segments:
+        banner = f"// Generated by build-tools/bundle_site_js.py from {rel_source} - chunk '{seg.chunk.name}'.{nl}"
+        path = scripts_dir / seg.filename
+        write_text(path, banner + seg.source)
+        files[seg.filename] = path
+        if node_available():
+            with stage("node_check", file=seg.filename):
+                err = node_check(path)
+            if err:
+                print(f"❌ {seg.filename} does not parse on its own:\n{err}")
+                return 1
+
+    sets: dict[str, list[Path]] = {"site.js": [source_path]}
+    plan: dict[str, list[Segment]] = {}
+    any_errors = False
+    for page in pages:
+        html = read_text(page)
+        wanted = {core.name, *(c.name for c in page_chunks(html, chunks))}
+        picked = [seg for seg in segments if seg.chunk.name in wanted]
+        rewritten = rewrite_page(html, [(seg.filename, _version(seg.source)) for seg in picked])
+        if rewritten is None:
+            continue
+        for issue in check_script_order(page.name, rewritten):
+            print(f"❌ {page.name}: {issue}")
+            any_errors = True
+        plan[page.name] = picked
+        sets[page.name] = [files[seg.filename] for seg in picked]
+        if not args.measure_only:
+            write_text(out_dir / page.name, rewritten)
+    if any_errors:
+        return 1
+
+    full_bytes = len(source.encode("utf-8"))
+    print(f"🔍 {source_path.name}: {full_bytes / 1024:.1f} KB, {len(statements)} top-level statements -> {len(segments)} files")
+    for chunk in (core, *chunks):
+        size = len(chunk.source.encode("utf-8")) / 1024
+        req = "every page" if chunk.requires == "*" else ", ".join(chunk.requires)
+        parts = [seg.filename for seg in segments if seg.chunk is chunk]
+        print(f"   {chunk.name:<12} {size:8.1f} KB  ({req})  {', '.join(parts)}")
+
+    with stage("measure_parse"):
+        timings = measure_parse(sets, args.runs)
+    print("\n📊 Per page (bytes parsed vs full site.js):")
+    for page_name, picked in plan.items():
+        size = sum(len(seg.source.encode("utf-8")) for seg in picked)
+        names = sorted({seg.chunk.name for seg in picked}, key=lambda n: [core.name, *(c.name for c in chunks)].index(n))
+        line = f"   {page_name:<18} {size / 1024:8.1f} KB ({100 * (1 - size / full_bytes):5.1f}% less)"
+        if timings:
+            line += f"  parse {timings[page_name]:6.2f} ms vs {timings['site.js']:6.2f} ms"
+        print(f"{line}  [{' + '.join(names)}]")
+    if timings is None:
+        print("   (node not found: parse times skipped)")
+
+    if args.measure_only:
+        shutil.rmtree(scripts_dir, ignore_errors=True)
+    else:
+        print(f"\n✅ Chunks + {len(plan)} pages written to {out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
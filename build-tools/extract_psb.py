@@ -1,78 +1,326 @@
+"""Export avatar parts from the Berny PSB into assets/avatars/parts/<category>/.
+
+Each visible layer is cropped to its bounding box (instead of a full-canvas PNG)
+and its position on the scaled canvas is recorded in AVATAR_MANIFEST._layout,
+so scripts/avatar-lab.js can place it back.
+
+Layers are exported in parallel (one PSB handle per worker process). A layer is
+only composited when the PSB bytes or its metadata (name, position, size, blend
+mode, opacity, SCALE) changed since the last run, and only re-saved when its
+pixel hash, offset or SCALE changed (see CACHE_PATH). Use --force to re-export
+everything.
+
+With --atlas the cropped parts of each category are also packed into a few WEBP
+sprite sheets (<category>/atlas-<n>.webp, shelf packing, max ATLAS_MAX_SIZE px per
+side). Sheet sizes and per-part source rects go in AVATAR_MANIFEST._atlas and the
+avatar lab draws parts from the sheets instead of one PNG request per part.
+--atlas-only repacks from the current manifest + part files without the PSB.
+
+Usage:
+  python build-tools/extract_psb.py [--workers N] [--force] [--atlas]
+  python build-tools/extract_psb.py --atlas-only
+"""
+import argparse
+import hashlib
 import os
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor
 from psd_tools import PSDImage
 from PIL import Image
 
 PSD_PATH = r"assets/progetto avatar berny.psb"
 OUTPUT_DIR = r"assets/avatars/parts"
 MANIFEST_PATH = r"scripts/avatar-manifest.js"
+CACHE_PATH = os.path.join(OUTPUT_DIR, ".export-cache.json")
 
 # Canvas scale factor (0.5 = 50% size)
 SCALE = 0.5
 
+# Sprite sheets
+ATLAS_MAX_SIZE = 2048
+ATLAS_PADDING = 2
+ATLAS_QUALITY = 90
+
+_PSD = None
+
+
 def sanitize(name):
     return re.sub(r'[^a-zA-Z0-9]', '_', name.lower())
 
-def extract_layers():
+
+def load_cache():
+    try:
+        with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _file_hash(path):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _source_key(psd_digest, group_idx, item_idx, item):
+    """Cache key known before compositing: the PSB bytes + what places the layer on the canvas."""
+    meta = (group_idx, item_idx, item.name, tuple(item.offset), tuple(item.size),
+            str(item.blend_mode), item.opacity, SCALE)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(psd_digest.encode())
+    h.update(repr(meta).encode())
+    return h.hexdigest()
+
+
+def _init_worker(psd_path):
+    global _PSD
+    _PSD = PSDImage.open(psd_path)
+
+
+def _layer_hash(layer_image, offset):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{layer_image.mode}|{layer_image.size}|{offset}|{SCALE}".encode())
+    h.update(layer_image.tobytes())
+    return h.hexdigest()
+
+
+def export_layer(job):
+    """Runs in a worker process. Returns (key, entry, status).
+
+    Layers without pixels get {"source", "empty": True}: cached like the others, but
+    left out of the manifest.
+    """
+    group_idx, item_idx, key, source_key, file_path, cached, force = job
+    if not force and cached and cached.get("source") == source_key:
+        if cached.get("empty"):
+            return key, cached, "empty"
+        if os.path.exists(file_path):
+            return key, cached, "unchanged"
+    empty = {"source": source_key, "empty": True}
+    item = list(_PSD[group_idx])[item_idx]
+
+    # Get layer content
+    layer_image = item.composite()
+    if not layer_image:
+        return key, empty, "empty"
+
+    layer_image = layer_image.convert('RGBA')
+    digest = _layer_hash(layer_image, item.offset)
+    if not force and cached and cached.get("hash") == digest and os.path.exists(file_path):
+        # PSB touched elsewhere, same pixels: keep the file, remember the new source key
+        return key, {**cached, "source": source_key}, "unchanged"
+
+    bbox = layer_image.getchannel('A').getbbox()
+    if not bbox:
+        return key, empty, "empty"
+
+    # Crop to the opaque area, then scale it and its canvas position
+    cropped = layer_image.crop(bbox)
+    left = (item.offset[0] + bbox[0]) * SCALE
+    top = (item.offset[1] + bbox[1]) * SCALE
+    x, y = int(round(left)), int(round(top))
+    w = max(1, int(round(cropped.width * SCALE)))
+    h = max(1, int(round(cropped.height * SCALE)))
+    if (w, h) != cropped.size:
+        cropped = cropped.resize((w, h), Image.Resampling.LANCZOS)
+
+    cropped.save(file_path, optimize=True)
+    return key, {"hash": digest, "source": source_key, "x": x, "y": y, "w": w, "h": h}, "exported"
+
+
+def shelf_pack(sizes, max_size=ATLAS_MAX_SIZE, padding=ATLAS_PADDING):
+    """Pack (w, h) rects into sheets, tallest first.
+
+    Returns (placements, sheets): placements[i] = (sheet, x, y) for sizes[i],
+    sheets = [(width, height), ...] trimmed to their content.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    placements = [None] * len(sizes)
+    sheets = []
+    sheet = -1
+    x = y = shelf_h = max_size  # forces a new sheet on first rect
+    used_w = used_h = 0
+
+    for i in order:
+        w, h = sizes[i]
+        if x + w > max_size:
+            # next shelf
+            x = 0
+            y += shelf_h + padding
+            shelf_h = 0
+        if y + h > max_size:
+            if sheet >= 0:
+                sheets.append((used_w, used_h))
+            sheet += 1
+            x = y = shelf_h = used_w = used_h = 0
+        placements[i] = (sheet, x, y)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+        used_w = max(used_w, x - padding)
+        used_h = max(used_h, y + h)
+
+    if sheet >= 0:
+        sheets.append((used_w, used_h))
+    return placements, sheets
+
+
+def _open_rgba(path):
+    with Image.open(path) as im:
+        return im.convert('RGBA')
+
+
+def pack_atlases(manifest, quality=ATLAS_QUALITY):
+    """Pack each category's part files into WEBP sheets and return the _atlas entry."""
+    atlas = {}
+    for category, files in manifest.items():
+        if category.startswith("_") or not files:
+            continue
+        cat_dir = os.path.join(OUTPUT_DIR, category)
+        for stale in os.listdir(cat_dir):
+            if re.match(r"atlas-\d+\.webp$", stale):
+                os.remove(os.path.join(cat_dir, stale))
+
+        images = [_open_rgba(os.path.join(cat_dir, f)) for f in files]
+        # Parts bigger than a sheet stay standalone PNGs (the lab falls back to them)
+        fits = [(f, im) for f, im in zip(files, images) if max(im.size) <= ATLAS_MAX_SIZE]
+        if not fits:
+            continue
+        files, images = [f for f, _ in fits], [im for _, im in fits]
+        placements, sheets = shelf_pack([im.size for im in images])
+
+        canvases = [Image.new('RGBA', size, (0, 0, 0, 0)) for size in sheets]
+        parts = {}
+        for f, im, (sheet, x, y) in zip(files, images, placements):
+            canvases[sheet].paste(im, (x, y))
+            parts[f] = {"sheet": sheet, "sx": x, "sy": y, "sw": im.width, "sh": im.height}
+
+        sheet_entries = []
+        for n, canvas in enumerate(canvases):
+            name = f"atlas-{n}.webp"
+            canvas.save(os.path.join(cat_dir, name), format="WEBP", quality=quality, method=6)
+            sheet_entries.append({"file": name, "width": canvas.width, "height": canvas.height})
+
+        atlas[category] = {"sheets": sheet_entries, "parts": parts}
+        print(f"  atlas     {category}: {len(files)} parts -> {len(canvases)} sheet(s)")
+    return atlas
+
+
+def read_manifest():
+    with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+        raw = f.read()
+    return json.loads(raw[raw.index("{"):raw.rindex("}") + 1])
+
+
+def write_manifest(manifest):
+    js_content = f"const AVATAR_MANIFEST = {json.dumps(manifest, indent=2)};\n"
+    with open(MANIFEST_PATH, 'w') as f:
+        f.write(js_content)
+    print(f"Manifest written to {MANIFEST_PATH}")
+
+
+def repack_atlases(quality=ATLAS_QUALITY):
+    manifest = read_manifest()
+    if "_layout" not in manifest:
+        print("Error: manifest has no _layout (re-export cropped parts first).")
+        return
+    manifest["_atlas"] = pack_atlases(manifest, quality)
+    write_manifest(manifest)
+
+
+def extract_layers(workers=None, force=False, atlas=False, atlas_quality=ATLAS_QUALITY):
     if not os.path.exists(PSD_PATH):
         print(f"Error: {PSD_PATH} not found.")
         return
 
     print(f"Loading {PSD_PATH}...")
+    psd_digest = _file_hash(PSD_PATH)
     psd = PSDImage.open(PSD_PATH)
     print(f"Original Canvas Size: {psd.size}")
-    
+
     target_size = (int(psd.size[0] * SCALE), int(psd.size[1] * SCALE))
     print(f"Target Size: {target_size}")
 
+    cache = {} if force else load_cache()
     manifest = {}
+    jobs = []
 
-    for layer in psd:
+    for group_idx, layer in enumerate(psd):
         if layer.is_group():
             category = sanitize(layer.name)
-            
-            # Map PSD categories to logical Z-Index order if possible, or just use list
-            # We will use this in JS to determine stack order
-            
+
+            # Manifest order = PSD order; stacking is handled in JS (DEFAULT_LAYER_ORDER)
             print(f"Processing category: {category}")
             manifest[category] = []
-            
+
             cat_dir = os.path.join(OUTPUT_DIR, category)
             os.makedirs(cat_dir, exist_ok=True)
-            
-            for item in layer:
-                if item.is_visible(): 
-                    item_name = sanitize(item.name)
-                    filename = f"{item_name}.png"
+
+            for item_idx, item in enumerate(layer):
+                if item.is_visible():
+                    filename = f"{sanitize(item.name)}.png"
+                    key = f"{category}/{filename}"
                     file_path = os.path.join(cat_dir, filename)
-                    
-                    print(f"  Exporting {item.name} -> {filename}")
-                    
-                    # Get layer content
-                    layer_image = item.composite()
-                    
-                    if layer_image:
-                        # Create full canvas representation
-                        full_img = Image.new('RGBA', psd.size, (0, 0, 0, 0))
-                        # Paste layer at its offset
-                        full_img.paste(layer_image, item.offset)
-                        
-                        # Resize
-                        full_img = full_img.resize(target_size, Image.Resampling.LANCZOS)
-                        
-                        full_img.save(file_path)
-                        manifest[category].append(filename)
+                    manifest[category].append(filename)
+                    source_key = _source_key(psd_digest, group_idx, item_idx, item)
+                    jobs.append((group_idx, item_idx, key, source_key, file_path, cache.get(key), force))
         else:
             print(f"Skipping top-level layer: {layer.name} (not a group)")
 
-    # Write manifest
-    # Also include z-index hint? or we handle in JS
-    js_content = f"const AVATAR_MANIFEST = {json.dumps(manifest, indent=2)};\n"
-    with open(MANIFEST_PATH, 'w') as f:
-        f.write(js_content)
-    
-    print(f"Manifest written to {MANIFEST_PATH}")
+    del psd
+
+    new_cache = {}
+    layout = {}
+    counts = {"exported": 0, "unchanged": 0, "empty": 0}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(PSD_PATH,)) as pool:
+        for key, entry, status in pool.map(export_layer, jobs):
+            counts[status] += 1
+            if status != "unchanged" and entry != cache.get(key):  # cached empties stay quiet
+                print(f"  {status:<9} {key}")
+            new_cache[key] = entry
+            if not entry.get("empty"):
+                layout[key] = entry
+
+    # Drop parts that had no pixels, keep manifest order
+    for category, files in manifest.items():
+        manifest[category] = [f for f in files if f"{category}/{f}" in layout]
+
+    with open(CACHE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(new_cache, f, indent=1, sort_keys=True)
+
+    # Category lists stay plain filenames (avatar-lab.js reads them as-is);
+    # crop boxes live under _layout, relative to the scaled _canvas.
+    manifest["_canvas"] = {"width": target_size[0], "height": target_size[1]}
+    manifest["_layout"] = {
+        category: {
+            f: {k: layout[f"{category}/{f}"][k] for k in ("x", "y", "w", "h")}
+            for f in files
+        }
+        for category, files in manifest.items()
+        if not category.startswith("_")
+    }
+
+    if atlas:
+        manifest["_atlas"] = pack_atlases(manifest, atlas_quality)
+
+    print(
+        f"Layers: {counts['exported']} exported, {counts['unchanged']} unchanged, "
+        f"{counts['empty']} empty"
+    )
+    write_manifest(manifest)
+
 
 if __name__ == "__main__":
-    extract_layers()
+    ap = argparse.ArgumentParser(description="Export avatar parts from the PSB.")
+    ap.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    ap.add_argument("--force", action="store_true", help="Ignore the export cache and re-save every layer")
+    ap.add_argument("--atlas", action="store_true", help="Also pack parts into per-category WEBP sprite sheets")
+    ap.add_argument("--atlas-only", action="store_true", help="Repack sheets from the current manifest (no PSB)")
+    ap.add_argument("--atlas-quality", type=int, default=ATLAS_QUALITY, help="WEBP quality for sheets (0-100)")
+    args = ap.parse_args()
+    if args.atlas_only:
+        repack_atlases(args.atlas_quality)
+    else:
+        extract_layers(workers=args.workers, force=args.force, atlas=args.atlas, atlas_quality=args.atlas_quality)
@@ -7,13 +7,26 @@ This script mirrors the Worker normalization + hashing:
 Usage (example):
   python build-tools/hash_employee_phones.py employees.csv --pepper "..." --out hashes.txt
 
+  # Large HR exports from several franchises, constant memory:
+  python build-tools/hash_employee_phones.py franchise_*.csv --pepper "..." --out hashes.txt --stream
+
 Input:
 - CSV/TSV with headers. It will look for a column named one of:
   phone, mobile, cellulare, telefono
 - If not found, it will scan all cells and pick values that look like phone numbers.
 
 Output:
-- One unique hash per line (hex).
+- One unique hash per line (hex), sorted.
+
+Streaming mode (--stream):
+- Rows are hashed in batches on a thread pool with a bounded number of batches in flight.
+- Hashes are deduplicated with sorted runs spilled to a temp dir and a k-way merge,
+  so memory is bounded by --run-size instead of the number of rows.
+- Output is written while merging (same format as the default mode).
+
+KV delta export (--kv-sync-dir, requires --out):
+- Diffs the new snapshot against --previous and writes only additions/removals as
+  bulk JSON batches for EMPLOYEE_REGISTRY (see kv_registry_sync.py).
 
 Notes:
 - Export your Excel to CSV UTF-8.
@@ -25,12 +38,23 @@ from __future__ import annotations
 import argparse
 import csv
 import hashlib
+import heapq
+import os
 import re
+import sys
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional, TextIO
+
+from kv_registry_sync import KV_BULK_MAX_ITEMS, export_kv_sync, print_summary
 
 
 PHONE_RE = re.compile(r"^\+\d{8,16}$")
+SNIFF_BYTES = 4096
 
 
 def normalize_phone(raw: str) -> str:
@@ -59,10 +83,15 @@ def sha256_hex(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
 
+def sniff_dialect(path: Path) -> type[csv.Dialect]:
+    # Try sniffing delimiter (comma vs tab vs semicolon) from a bounded read.
+    with path.open("r", encoding="utf-8", errors="replace", newline="") as f:
+        sample = f.read(SNIFF_BYTES)
+    return csv.Sniffer().sniff(sample, delimiters=",;\t")
+
+
 def iter_rows(path: Path) -> Iterable[dict[str, str]]:
-    # Try sniffing delimiter (comma vs tab vs semicolon).
-    sample = path.read_text(encoding="utf-8", errors="replace")[:4096]
-    dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+    dialect = sniff_dialect(path)
     with path.open("r", encoding="utf-8", errors="replace", newline="") as f:
         reader = csv.DictReader(f, dialect=dialect)
         for row in reader:
@@ -87,25 +116,168 @@ def pick_phone_from_row(row: dict[str, str]) -> Optional[str]:
     return None
 
 
+@dataclass
+class HashStats:
+    total: int = 0
+    accepted: int = 0
+    unique: int = 0
+    runs: int = 0
+
+    @property
+    def rejected(self) -> int:
+        return self.total - self.accepted
+
+
+def iter_phone_batches(paths: Iterable[Path], batch_size: int, stats: HashStats) -> Iterator[list[str]]:
+    batch: list[str] = []
+    for path in paths:
+        for row in iter_rows(path):
+            stats.total += 1
+            phone = pick_phone_from_row(row)
+            if not phone:
+                continue
+            stats.accepted += 1
+            batch.append(phone)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def hash_batch(phones: list[str], pepper: str) -> list[str]:
+    return [sha256_hex(f"{phone}|{pepper}") for phone in phones]
+
+
+def iter_hash_batches(
+    batches: Iterable[list[str]], pepper: str, *, workers: int
+) -> Iterator[list[str]]:
+    """Hash batches on a thread pool, keeping at most 2*workers batches in flight."""
+    if workers <= 1:
+        for batch in batches:
+            yield hash_batch(batch, pepper)
+        return
+
+    pending: deque[Future[list[str]]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for batch in batches:
+            pending.append(pool.submit(hash_batch, batch, pepper))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _write_run(hashes: set[str], tmp_dir: Path, idx: int) -> Path:
+    run_path = tmp_dir / f"run_{idx:05d}.txt"
+    with run_path.open("w", encoding="ascii", newline="\n") as f:
+        for h in sorted(hashes):
+            f.write(h + "\n")
+    return run_path
+
+
+def write_sorted_runs(hash_batches: Iterable[list[str]], tmp_dir: Path, run_size: int) -> list[Path]:
+    """Spill deduplicated, sorted runs of at most run_size hashes to tmp_dir."""
+    runs: list[Path] = []
+    current: set[str] = set()
+    for hashes in hash_batches:
+        current.update(hashes)
+        if len(current) >= run_size:
+            runs.append(_write_run(current, tmp_dir, len(runs)))
+            current = set()
+    if current or not runs:
+        runs.append(_write_run(current, tmp_dir, len(runs)))
+    return runs
+
+
+def merge_unique(run_paths: list[Path]) -> Iterator[str]:
+    """K-way merge of sorted run files, dropping duplicates across runs."""
+    with ExitStack() as stack:
+        files = [stack.enter_context(p.open("r", encoding="ascii")) for p in run_paths]
+        last = None
+        for line in heapq.merge(*files):
+            h = line.rstrip("\n")
+            if h and h != last:
+                last = h
+                yield h
+
+
+def stream_hashes(
+    paths: list[Path],
+    pepper: str,
+    out: TextIO,
+    *,
+    batch_size: int,
+    workers: int,
+    run_size: int,
+    tmp_dir: Optional[Path] = None,
+) -> HashStats:
+    stats = HashStats()
+    with tempfile.TemporaryDirectory(prefix="phone_hash_runs_", dir=tmp_dir) as tmp:
+        batches = iter_phone_batches(paths, batch_size, stats)
+        runs = write_sorted_runs(iter_hash_batches(batches, pepper, workers=workers), Path(tmp), run_size)
+        stats.runs = len(runs)
+        for h in merge_unique(runs):
+            out.write(h + "\n")
+            stats.unique += 1
+    return stats
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
-    ap.add_argument("input", type=Path, help="CSV/TSV exported from Excel")
+    ap.add_argument("input", type=Path, nargs="+", help="CSV/TSV exported from Excel (one or more)")
     ap.add_argument("--pepper", required=True, help="PHONE_HASH_PEPPER value used by the Worker")
     ap.add_argument("--out", type=Path, default=None, help="Output file (default: stdout)")
+    ap.add_argument("--stream", action="store_true", help="Constant-memory mode for large exports")
+    ap.add_argument("--batch-size", type=int, default=5000, help="--stream: rows hashed per batch")
+    ap.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1), help="--stream: hashing threads")
+    ap.add_argument("--run-size", type=int, default=200_000, help="--stream: unique hashes kept in memory per sorted run")
+    ap.add_argument("--tmp-dir", type=Path, default=None, help="--stream: where sorted runs are spilled")
+    ap.add_argument("--kv-sync-dir", type=Path, default=None, help="Write KV bulk put/delete batches for the delta")
+    ap.add_argument("--previous", type=Path, default=None, help="Previous snapshot to diff against (default: empty)")
+    ap.add_argument("--kv-batch-size", type=int, default=KV_BULK_MAX_ITEMS, help="Max keys per KV bulk batch")
     args = ap.parse_args()
 
+    if args.kv_sync_dir and not args.out:
+        ap.error("--kv-sync-dir requires --out (the new snapshot)")
+    if args.out and args.previous and args.out.resolve() == args.previous.resolve():
+        ap.error("--previous must differ from --out")
+
+    pepper = args.pepper.strip()
+
+    if args.stream:
+        opts = dict(
+            batch_size=max(1, args.batch_size),
+            workers=max(1, args.workers),
+            run_size=max(1, args.run_size),
+            tmp_dir=args.tmp_dir,
+        )
+        if args.out:
+            with args.out.open("w", encoding="utf-8", newline="\n") as f:
+                stats = stream_hashes(args.input, pepper, f, **opts)
+        else:
+            stats = stream_hashes(args.input, pepper, sys.stdout, **opts)
+        print(
+            f"\n# rows={stats.total} accepted={stats.accepted} rejected={stats.rejected} "
+            f"unique_hashes={stats.unique} runs={stats.runs}",
+            flush=True,
+        )
+        export_registry_delta(args)
+        return 0
+
     hashes: set[str] = set()
     total = 0
     accepted = 0
 
-    for row in iter_rows(args.input):
-        total += 1
-        phone = pick_phone_from_row(row)
-        if not phone:
-            continue
-        accepted += 1
-        h = sha256_hex(f"{phone}|{args.pepper.strip()}")
-        hashes.add(h)
+    for path in args.input:
+        for row in iter_rows(path):
+            total += 1
+            phone = pick_phone_from_row(row)
+            if not phone:
+                continue
+            accepted += 1
+            h = sha256_hex(f"{phone}|{pepper}")
+            hashes.add(h)
 
     out_lines = sorted(hashes)
 
@@ -120,8 +292,16 @@ def main() -> int:
         flush=True,
     )
 
+    export_registry_delta(args)
     return 0
 
 
+def export_registry_delta(args: argparse.Namespace) -> None:
+    if not args.kv_sync_dir:
+        return
+    manifest = export_kv_sync(args.previous, args.out, args.kv_sync_dir, batch_size=args.kv_batch_size)
+    print_summary(manifest, args.kv_sync_dir)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
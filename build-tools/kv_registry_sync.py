@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Delta sync of employee phone hashes into the EMPLOYEE_REGISTRY KV namespace.
+
+hash_employee_phones.py writes a sorted snapshot (one hash per line). Instead of
+re-uploading the whole registry, this diffs the new snapshot against the previous
+one and emits only additions/removals as bulk JSON batches sized for KV:
+  put-0001.json     [{"key": "<hash>", "value": "1"}, ...]   (wrangler kv bulk put)
+  delete-0001.json  ["<hash>", ...]                          (wrangler kv bulk delete)
+  manifest.json     counts, batch files and the wrangler commands to run
+
+Both snapshots are read as sorted streams, so the diff runs in constant memory.
+
+Usage (examples):
+  python build-tools/kv_registry_sync.py diff hashes_prev.txt hashes.txt --out-dir kv-sync/
+  python build-tools/kv_registry_sync.py apply kv-sync/ --local-kv registry.local.json
+
+Or in one go from the hasher:
+  python build-tools/hash_employee_phones.py employees.csv --pepper "..." --out hashes.txt \
+      --kv-sync-dir kv-sync/ --previous hashes_prev.txt
+
+`apply --local-kv` replays the batches on a file-backed KV stand-in (a JSON object
+of key -> value). berny_worker_standin.py --registry accepts the same file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+# Cloudflare KV bulk endpoints accept up to 10,000 pairs (or keys) per request.
+KV_BULK_MAX_ITEMS = 10_000
+REGISTRY_VALUE = "1"
+DEFAULT_BINDING = "EMPLOYEE_REGISTRY"
+
+
+def iter_snapshot(path: Optional[Path]) -> Iterator[str]:
+    """Yield hashes from a sorted snapshot file; a missing path is an empty snapshot."""
+    if path is None or not path.exists():
+        return
+    last = ""
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            h = line.strip().lower()
+            if not h or h.startswith("#"):
+                continue
+            if h < last:
+                raise ValueError(f"{path} is not sorted (regenerate it with hash_employee_phones.py)")
+            if h != last:
+                last = h
+                yield h
+
+
+def diff_sorted(previous: Iterable[str], current: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Merge-join two sorted unique streams; yields ("+", h), ("-", h) or ("=", h)."""
+    prev_it = iter(previous)
+    cur_it = iter(current)
+    p = next(prev_it, None)
+    c = next(cur_it, None)
+    while p is not None or c is not None:
+        if p is None or (c is not None and c < p):
+            yield "+", c
+            c = next(cur_it, None)
+        elif c is None or p < c:
+            yield "-", p
+            p = next(prev_it, None)
+        else:
+            yield "=", c
+            p = next(prev_it, None)
+            c = next(cur_it, None)
+
+
+@dataclass
+class SyncManifest:
+    previous: str
+    current: str
+    binding: str = DEFAULT_BINDING
+    added: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    put: list[str] = field(default_factory=list)
+    delete: list[str] = field(default_factory=list)
+
+    def commands(self) -> list[str]:
+        cmds = [f"npx wrangler kv bulk put {name} --binding={self.binding}" for name in self.put]
+        cmds += [f"npx wrangler kv bulk delete {name} --binding={self.binding} --force" for name in self.delete]
+        return cmds
+
+    def to_json(self) -> dict:
+        return {
+            "previous": self.previous,
+            "current": self.current,
+            "binding": self.binding,
+            "added": self.added,
+            "removed": self.removed,
+            "unchanged": self.unchanged,
+            "put": self.put,
+            "delete": self.delete,
+            "commands": self.commands(),
+        }
+
+
+class _BatchWriter:
+    def __init__(self, out_dir: Path, prefix: str, batch_size: int) -> None:
+        self.out_dir = out_dir
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.files: list[str] = []
+        self._items: list[object] = []
+
+    def add(self, item: object) -> None:
+        self._items.append(item)
+        if len(self._items) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._items:
+            return
+        name = f"{self.prefix}-{len(self.files) + 1:04d}.json"
+        (self.out_dir / name).write_text(json.dumps(self._items, separators=(",", ":")), encoding="utf-8")
+        self.files.append(name)
+        self._items = []
+
+
+def export_kv_sync(
+    previous: Optional[Path],
+    current: Path,
+    out_dir: Path,
+    *,
+    batch_size: int = KV_BULK_MAX_ITEMS,
+    binding: str = DEFAULT_BINDING,
+) -> SyncManifest:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in list(out_dir.glob("put-*.json")) + list(out_dir.glob("delete-*.json")):
+        stale.unlink()
+
+    batch_size = max(1, min(batch_size, KV_BULK_MAX_ITEMS))
+    puts = _BatchWriter(out_dir, "put", batch_size)
+    deletes = _BatchWriter(out_dir, "delete", batch_size)
+    manifest = SyncManifest(previous=str(previous) if previous else "", current=str(current), binding=binding)
+
+    for op, h in diff_sorted(iter_snapshot(previous), iter_snapshot(current)):
+        if op == "+":
+            puts.add({"key": h, "value": REGISTRY_VALUE})
+            manifest.added += 1
+        elif op == "-":
+            deletes.add(h)
+            manifest.removed += 1
+        else:
+            manifest.unchanged += 1
+    puts.flush()
+    deletes.flush()
+
+    manifest.put = puts.files
+    manifest.delete = deletes.files
+    (out_dir / "manifest.json").write_text(json.dumps(manifest.to_json(), indent=2), encoding="utf-8")
+    return manifest
+
+
+class LocalKV:
+    """File-backed KV stand-in (JSON object key -> value) for testing bulk batches."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.data: dict[str, str] = {}
+        if path.exists():
+            self.data = json.loads(path.read_text(encoding="utf-8") or "{}")
+
+    def bulk_put(self, items: list[dict]) -> None:
+        for item in items:
+            self.data[str(item["key"])] = str(item["value"])
+
+    def bulk_delete(self, keys: list) -> None:
+        for key in keys:
+            self.data.pop(str(key.get("key") if isinstance(key, dict) else key), None)
+
+    def save(self) -> None:
+        self.path.write_text(json.dumps(dict(sorted(self.data.items())), indent=0), encoding="utf-8")
+
+
+def apply_to_local_kv(sync_dir: Path, kv_path: Path) -> LocalKV:
+    manifest = json.loads((sync_dir / "manifest.json").read_text(encoding="utf-8"))
+    kv = LocalKV(kv_path)
+    for name in manifest.get("put", []):
+        kv.bulk_put(json.loads((sync_dir / name).read_text(encoding="utf-8")))
+    for name in manifest.get("delete", []):
+        kv.bulk_delete(json.loads((sync_dir / name).read_text(encoding="utf-8")))
+    kv.save()
+    return kv
+
+
+def print_summary(manifest: SyncManifest, out_dir: Path) -> None:
+    print(
+        f"# added={manifest.added} removed={manifest.removed} unchanged={manifest.unchanged} "
+        f"put_batches={len(manifest.put)} delete_batches={len(manifest.delete)}"
+    )
+    print(f"# batches written to {out_dir}")
+    for cmd in manifest.commands():
+        print(f"#   {cmd}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Diff phone-hash snapshots into KV bulk batches.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    d = sub.add_parser("diff", help="Write put/delete batches for previous -> current")
+    d.add_argument("previous", type=Path, help="Previous snapshot (missing file = empty registry)")
+    d.add_argument("current", type=Path, help="New snapshot from hash_employee_phones.py")
+    d.add_argument("--out-dir", type=Path, required=True)
+    d.add_argument("--batch-size", type=int, default=KV_BULK_MAX_ITEMS)
+    d.add_argument("--binding", default=DEFAULT_BINDING)
+
+    a = sub.add_parser("apply", help="Replay a sync dir on a file-backed KV stand-in")
+    a.add_argument("sync_dir", type=Path)
+    a.add_argument("--local-kv", type=Path, required=True, help="JSON file used as the KV namespace")
+
+    args = ap.parse_args()
+
+    if args.cmd == "diff":
+        manifest = export_kv_sync(
+            args.previous, args.current, args.out_dir, batch_size=args.batch_size, binding=args.binding
+        )
+        print_summary(manifest, args.out_dir)
+        return 0
+
+    kv = apply_to_local_kv(args.sync_dir, args.local_kv)
+    print(f"# local KV {args.local_kv}: {len(kv.data)} keys")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,7 +7,9 @@ from datetime import datetime
 from pathlib import Path
 from urllib.parse import unquote
 
-ROOT = Path(__file__).resolve().parents[1]
+from perf_trace import add_profile_arguments, profile_session, stage
+
+ROOT = Path(__file__).resolve().parents[2]
 ASSETS_DIR = ROOT / "assets"
 
 SCAN_EXTS = {".html", ".css", ".js"}
@@ -34,9 +36,19 @@ def to_rel_asset(p: str) -> str:
     return p
 
 
-def gather_references() -> set[str]:
+def references_in(text: str) -> set[str]:
+    refs: set[str] = set()
+    for rx in RE_PATTERNS:
+        for m in rx.finditer(text):
+            rel = to_rel_asset(m.group("path"))
+            if rel.startswith("assets/"):
+                refs.add(rel)
+    return refs
+
+
+def gather_references(root: Path = ROOT) -> set[str]:
     refs: set[str] = set()
-    for path in ROOT.rglob("*"):
+    for path in root.rglob("*"):
         if not path.is_file():
             continue
         if path.suffix.lower() not in SCAN_EXTS:
@@ -45,11 +57,7 @@ def gather_references() -> set[str]:
             text = path.read_text(encoding="utf-8", errors="ignore")
         except Exception:
             continue
-        for rx in RE_PATTERNS:
-            for m in rx.finditer(text):
-                rel = to_rel_asset(m.group("path"))
-                if rel.startswith("assets/"):
-                    refs.add(rel)
+        refs |= references_in(text)
     return refs
 
 
@@ -103,14 +111,18 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Proceed even if there are missing references (referenced assets not found on disk).",
     )
+    add_profile_arguments(parser)
     args = parser.parse_args(argv)
 
     if args.delete_unused and args.move_unused_to:
         print("ERROR: Choose only one of --delete-unused or --move-unused-to", file=sys.stderr)
         return 2
 
-    assets = list_assets()
-    refs = gather_references()
+    with profile_session("audit_assets", args):
+        with stage("list_assets"):
+            assets = list_assets()
+        with stage("gather_references"):
+            refs = gather_references()
 
     # Also count references that point to directories or missing files.
     missing = sorted([r for r in refs if (ROOT / r).is_file() is False])
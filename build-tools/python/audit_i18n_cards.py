@@ -21,7 +21,7 @@ import os
 import re
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
+ROOT = Path(__file__).resolve().parents[2]
 
 ARTICLE_RE = re.compile(
     r"<article\b(?P<open>[^>]*)class=\"(?P<class>[^\"]*\bguide-card\b[^\"]*)\"(?P<open2>[^>]*)>(?P<body>.*?)</article>",
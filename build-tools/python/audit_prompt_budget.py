@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""Rebuild Berny's system prompt offline and check it against a token budget.
+
+BernyBrainAPI.buildSystemPrompt() (scripts/berny-brain-api.js) sends, on every
+chat turn:
+- the instruction template (the template literal it returns)
+- "INFO PRODOTTI (Legacy)": every BERNY_KNOWLEDGE.products[*].response
+  (scripts/berny-knowledge.js)
+- the whole FULL_APP_CONTEXT (scripts/berny-super-knowledge.js, written by
+  build-tools/build_knowledge.py), one `=== FONTE: <file> ===` section per
+  source file
+
+This tool reads the template and the language names straight from
+berny-brain-api.js, the data from the generated JS files (no JS runtime
+needed), rebuilds the prompt for each UI language and reports tokens per
+section and per FONTE source, biggest first. With --budget / --source-budget
+it exits 1 when the prompt (or a single source) is over budget, so the
+build fails before a bloated prompt ships.
+
+Tokens are estimated (word pieces of ~5 ASCII / ~3 non-ASCII characters,
+one per symbol; usually within ~15% of real tokenizers on this corpus).
+--tokenizer tiktoken gives exact OpenAI counts (pip install tiktoken).
+
+Usage:
+  python build-tools/python/audit_prompt_budget.py
+  python build-tools/python/audit_prompt_budget.py --budget 30000 --source-budget 6000
+  python build-tools/python/audit_prompt_budget.py --tokenizer tiktoken --json dist/prompt-budget.json
+  python build-tools/python/audit_prompt_budget.py --dump dist/prompt.it.txt --lang it
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from i18n_dict import LANGS, STR, js_string_value  # noqa: E402
+
+BRAIN_JS = ROOT / "scripts" / "berny-brain-api.js"
+KNOWLEDGE_JS = ROOT / "scripts" / "berny-knowledge.js"
+SUPER_KNOWLEDGE_JS = ROOT / "scripts" / "berny-super-knowledge.js"
+
+# A ratchet: the prompt build_knowledge.py produces today (~25.5k estimated tokens, pages and
+# notes only; the shipped bundle used to be ~31k) plus a little headroom.
+# Lower these as sources get trimmed.
+PROMPT_BUDGET_TOKENS = 28_000
+SOURCE_BUDGET_TOKENS = 5_000
+
+METHOD_RE = re.compile(r"^\s*buildSystemPrompt\s*\(\s*\)\s*\{", re.MULTILINE)
+LANG_MAP_RE = re.compile(r"const\s+langMap\s*=\s*\{(?P<body>[^}]*)\}")
+LANG_ENTRY_RE = re.compile(rf"(?P<key>{STR})\s*:\s*(?P<value>{STR})")
+PRODUCT_RE = re.compile(r"^\s{6}(?P<key>\w+)\s*:\s*\{", re.MULTILINE)
+RESPONSE_RE = re.compile(rf"response\s*:\s*(?P<value>(?:{STR})(?:\s*\+\s*(?:{STR}))*)", re.DOTALL)
+STR_RE = re.compile(STR, re.DOTALL)
+CONTEXT_RE = re.compile(r"const\s+FULL_APP_CONTEXT\s*=\s*(?P<lit>`(?:[^`\\]|\\.)*`)", re.DOTALL)
+FONTE_RE = re.compile(r"\n=== FONTE: (?P<source>.+?) ===\n")
+WORD_RE = re.compile(r"[A-Za-z0-9]+|[^\W\d_]+|\S", re.UNICODE)
+
+# The parts of buildSystemPrompt() this tool mirrors; if one disappears the port below is stale.
+PORTED_MARKERS = ("INFO PRODOTTI (Legacy):", "--- FULL APP CONTEXT ---", "--- END APP CONTEXT ---")
+
+
+@dataclass
+class Template:
+    parts: list[tuple[str, str]]  # ("text", literal) | ("expr", source)
+    lang_names: dict[str, str]
+    default_lang_name: str
+
+
+@dataclass
+class Prompt:
+    lang: str
+    text: str
+    sections: dict[str, str] = field(default_factory=dict)
+
+
+# -- reading the JS sources ----------------------------------------------------
+def _braced(src: str, start: int) -> str:
+    """Text from `start` (just past an opening brace) up to its matching closing brace.
+
+    Braces inside string literals and comments do not count (an apostrophe in an
+    Italian comment, "cosi'", must not open a string).
+    """
+    depth, i = 1, start
+    while depth and i < len(src):
+        c = src[i]
+        if c in "'\"`":
+            i = _skip_literal(src, i)
+            continue
+        if src.startswith("//", i):
+            end = src.find("\n", i)
+            i = len(src) if end == -1 else end + 1
+            continue
+        if src.startswith("/*", i):
+            end = src.find("*/", i + 2)
+            i = len(src) if end == -1 else end + 2
+            continue
+        depth += {"{": 1, "}": -1}.get(c, 0)
+        i += 1
+    return src[start:i - 1]
+
+
+def _method_body(src: str) -> str:
+    m = METHOD_RE.search(src)
+    if not m:
+        raise ValueError(f"buildSystemPrompt() not found in {BRAIN_JS.name}")
+    return _braced(src, m.end())
+
+
+def _skip_literal(src: str, i: int) -> int:
+    quote, i = src[i], i + 1
+    while i < len(src) and src[i] != quote:
+        i += 2 if src[i] == "\\" else 1
+    return i + 1
+
+
+def _template_parts(literal: str) -> list[tuple[str, str]]:
+    """Split a template literal body into text and ${expression} parts."""
+    parts: list[tuple[str, str]] = []
+    buf: list[str] = []
+    i = 0
+    while i < len(literal):
+        c = literal[i]
+        if c == "\\":
+            buf.append(literal[i:i + 2])
+            i += 2
+            continue
+        if literal.startswith("${", i):
+            parts.append(("text", js_string_value("`" + "".join(buf) + "`")))
+            buf = []
+            depth, j = 1, i + 2
+            while depth:
+                if literal[j] in "'\"":
+                    j = _skip_literal(literal, j)
+                    continue
+                depth += {"{": 1, "}": -1}.get(literal[j], 0)
+                j += 1
+            parts.append(("expr", literal[i + 2:j - 1].strip()))
+            i = j
+            continue
+        buf.append(c)
+        i += 1
+    parts.append(("text", js_string_value("`" + "".join(buf) + "`")))
+    return parts
+
+
+def load_template(path: Path = BRAIN_JS) -> Template:
+    body = _method_body(path.read_text(encoding="utf-8"))
+    for marker in PORTED_MARKERS:
+        if marker not in body:
+            raise ValueError(f"buildSystemPrompt() no longer contains {marker!r}: update {Path(__file__).name}")
+    ret = body.rfind("return `")
+    if ret < 0:
+        raise ValueError("buildSystemPrompt() does not end with `return `...``")
+    end = _skip_literal(body, ret + len("return "))
+    parts = _template_parts(body[ret + len("return ") + 1:end - 1])
+
+    lang_names: dict[str, str] = {}
+    m = LANG_MAP_RE.search(body)
+    if m:
+        for e in LANG_ENTRY_RE.finditer(m.group("body")):
+            lang_names[js_string_value(e.group("key"))] = js_string_value(e.group("value"))
+    default = re.search(rf"langMap\[userLangCode\]\s*\|\|\s*(?P<v>{STR})", body)
+    return Template(parts, lang_names, js_string_value(default.group("v")) if default else "Italiano")
+
+
+def load_products(path: Path = KNOWLEDGE_JS) -> dict[str, str]:
+    """BERNY_KNOWLEDGE.products key -> response, in source order."""
+    if not path.exists():
+        return {}
+    src = path.read_text(encoding="utf-8")
+    start = re.search(r"\bproducts\s*:\s*\{", src)
+    if not start:
+        return {}
+    src = _braced(src, start.end())
+    heads = list(PRODUCT_RE.finditer(src))
+    products: dict[str, str] = {}
+    for n, head in enumerate(heads):
+        block = src[head.end():heads[n + 1].start() if n + 1 < len(heads) else len(src)]
+        m = RESPONSE_RE.search(block)
+        if m:
+            products[head.group("key")] = "".join(js_string_value(s.group(0)) for s in STR_RE.finditer(m.group("value")))
+    return products
+
+
+def load_app_context(path: Path = SUPER_KNOWLEDGE_JS) -> str:
+    if not path.exists():
+        return ""
+    m = CONTEXT_RE.search(path.read_text(encoding="utf-8"))
+    return js_string_value(m.group("lit")) if m else ""
+
+
+def split_sources(context: str) -> dict[str, str]:
+    """FULL_APP_CONTEXT -> {source file: its section text (header included)}."""
+    heads = list(FONTE_RE.finditer(context))
+    out: dict[str, str] = {}
+    if heads and heads[0].start() > 0:
+        out["(preamble)"] = context[:heads[0].start()]
+    for n, m in enumerate(heads):
+        end = heads[n + 1].start() if n + 1 < len(heads) else len(context)
+        out[m.group("source").replace("\\", "/")] = context[m.start():end]
+    return out
+
+
+# -- rebuilding the prompt (mirror of buildSystemPrompt) -----------------------
+def _evaluate(expr: str, env: dict[str, str]) -> str:
+    """`name`, `name || 'fallback'`: all the template currently interpolates."""
+    for operand in (o.strip() for o in expr.split("||")):
+        if re.fullmatch(STR, operand):
+            value = js_string_value(operand)
+        elif operand in env:
+            value = env[operand]
+        else:
+            raise ValueError(f"buildSystemPrompt() interpolates ${{{expr}}}: teach {Path(__file__).name} about it")
+        if value:
+            return value
+    return ""
+
+
+def build_prompt(template: Template, lang: str, products: dict[str, str], context: str, nickname: str = "") -> Prompt:
+    legacy = ""
+    if products:
+        legacy = "INFO PRODOTTI (Legacy):\n" + "".join(f"- {k.upper()}: {v}\n" for k, v in products.items())
+    app = f"\n--- FULL APP CONTEXT ---\n{context}\n--- END APP CONTEXT ---\n" if context else ""
+    info = legacy + app  # BERNY_SUPER_KNOWLEDGE is never set on the site, so that branch adds nothing.
+
+    env = {
+        "userLang": template.lang_names.get(lang, template.default_lang_name),
+        "nickname": nickname,
+        "info": info,
+    }
+    text = "".join(value if kind == "text" else _evaluate(value, env) for kind, value in template.parts)
+    instructions = "".join(value if kind == "text" else _evaluate(value, env) for kind, value in template.parts if (kind, value) != ("expr", "info"))
+    return Prompt(lang, text, {"instructions": instructions, "legacy products": legacy, "app context": app})
+
+
+# -- token counting ------------------------------------------------------------
+def estimate_tokens(text: str) -> int:
+    total = 0
+    for piece in WORD_RE.findall(text):
+        if len(piece) == 1:
+            total += 1
+        elif piece.isascii():
+            total += math.ceil(len(piece) / 5)
+        else:
+            total += math.ceil(len(piece) / 3)
+    return total
+
+
+def make_counter(name: str):
+    if name == "estimate":
+        return estimate_tokens
+    import tiktoken  # optional
+
+    enc = tiktoken.get_encoding("o200k_base")
+    return lambda text: len(enc.encode(text, disallowed_special=()))
+
+
+# -- CLI -------------------------------------------------------------------------
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Token budget of Berny's system prompt, per language and per FONTE source.")
+    ap.add_argument("--lang", action="append", choices=LANGS, default=None, help="Only these UI languages (repeatable)")
+    ap.add_argument("--budget", type=int, default=PROMPT_BUDGET_TOKENS, help="Max tokens for the whole prompt (0 = no limit)")
+    ap.add_argument("--source-budget", type=int, default=SOURCE_BUDGET_TOKENS, help="Max tokens for one FONTE source (0 = no limit)")
+    ap.add_argument("--tokenizer", choices=("estimate", "tiktoken"), default="estimate")
+    ap.add_argument("--nickname", default="", help="Profile nickname to render into the prompt")
+    ap.add_argument("--top", type=int, default=15, help="Sources listed (biggest first)")
+    ap.add_argument("--json", type=Path, default=None, help="Write the breakdown as JSON")
+    ap.add_argument("--dump", type=Path, default=None, help="Write the rebuilt prompt of the first --lang to a file")
+    args = ap.parse_args()
+
+    try:
+        count = make_counter(args.tokenizer)
+    except ImportError:
+        print("❌ tiktoken not found. Install with: pip install tiktoken (or use --tokenizer estimate)")
+        return 1
+    try:
+        template = load_template()
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    products = load_products()
+    context = load_app_context()
+    if not context:
+        print(f"⚠️  No FULL_APP_CONTEXT in {SUPER_KNOWLEDGE_JS.relative_to(ROOT)} (run build-tools/build_knowledge.py)")
+    langs = args.lang or list(LANGS)
+    prompts = [build_prompt(template, lang, products, context, args.nickname) for lang in langs]
+
+    print(f"🔍 System prompt per language ({args.tokenizer} tokens):")
+    print(f"   {'lang':<6} {'chars':>9} {'tokens':>9}   " + "  ".join(f"{s:>16}" for s in prompts[0].sections))
+    langs_out = {}
+    errors: list[str] = []
+    for p in prompts:
+        tokens = count(p.text)
+        sections = {name: count(text) for name, text in p.sections.items()}
+        langs_out[p.lang] = {"chars": len(p.text), "tokens": tokens, "sections": sections}
+        print(f"   {p.lang:<6} {len(p.text):>9,} {tokens:>9,}   " + "  ".join(f"{n:>16,}" for n in sections.values()))
+        if args.budget and tokens > args.budget:
+            errors.append(f"{p.lang}: prompt is {tokens:,} tokens (budget {args.budget:,})")
+
+    sources = split_sources(context)
+    source_rows = sorted(
+        ({"source": name, "chars": len(text), "tokens": count(text)} for name, text in sources.items()),
+        key=lambda r: -r["tokens"],
+    )
+    for name, text in (("berny-knowledge.js products", prompts[0].sections["legacy products"]),
+                       ("instructions (template)", prompts[0].sections["instructions"])):
+        if text:
+            source_rows.append({"source": name, "chars": len(text), "tokens": count(text)})
+    source_rows.sort(key=lambda r: -r["tokens"])
+    total = sum(r["tokens"] for r in source_rows) or 1
+    for r in source_rows:
+        r["share"] = round(r["tokens"] / total, 4)
+        r["overBudget"] = bool(args.source_budget and r["source"] in sources and r["tokens"] > args.source_budget)
+        if r["overBudget"]:
+            errors.append(f"{r['source']}: {r['tokens']:,} tokens (source budget {args.source_budget:,})")
+    digest = hashlib.sha256(context.encode("utf-8")).hexdigest()[:12]
+    print(f"\n📊 Where the tokens come from (FULL_APP_CONTEXT {digest}, {len(sources)} sources):")
+    print(f"   {'source':<44} {'chars':>9} {'tokens':>9} {'share':>7}")
+    for r in source_rows[:args.top]:
+        flag = "  ⚠️ over source budget" if r["overBudget"] else ""
+        print(f"   {r['source'][:44]:<44} {r['chars']:>9,} {r['tokens']:>9,} {100 * r['share']:6.1f}%{flag}")
+    rest = source_rows[args.top:]
+    if rest:
+        print(f"   {f'... {len(rest)} more':<44} {sum(r['chars'] for r in rest):>9,} {sum(r['tokens'] for r in rest):>9,}")
+
+    if args.dump:
+        args.dump.parent.mkdir(parents=True, exist_ok=True)
+        args.dump.write_text(prompts[0].text, encoding="utf-8")
+        print(f"\n📝 {prompts[0].lang} prompt written to {args.dump}")
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            "tokenizer": args.tokenizer,
+            "budget": args.budget,
+            "sourceBudget": args.source_budget,
+            "langs": langs_out,
+            "sources": source_rows,
+            "errors": errors,
+        }
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\n✅ Breakdown written to {args.json}")
+
+    if errors:
+        print("")
+        for e in errors:
+            print(f"❌ Over budget: {e}")
+        return 1
+    print(f"\n✅ Within budget ({args.budget:,} per prompt, {args.source_budget:,} per source)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""Static reachability audit for shipped JS/CSS (dead files, dead top-level functions, duplicates).
+
+Starts from the <script src>, <link href>, importmap and inline module imports of
+every root *.html page and follows references found in the reached files:
+- JS:  import/export ... from, import(), importScripts(), and any quoted literal
+       that names a local .js/.css/.json (e.g. 'scripts/avatar-manifest.js?v=' + ...)
+- CSS: @import and url() pointing at .css
+Anything under scripts/, styles/ and public/ that is never reached is reported
+as unreachable, together with exact duplicates (same bytes) and same-name files
+that are near-copies of a reached one (e.g. scripts/legacy/berny-ui.js).
+
+For reached JS it also lists top-level functions (function f() / const f = () =>
+/ window.f = function) that no reached JS or HTML mentions. Classic scripts share
+the global scope, so a name counts as used if it appears anywhere else; this is
+an estimate, not a proof.
+
+The JSON prune plan (--json-out) lists files + bytes; --apply moves the files of
+a plan into backup_<timestamp>/ (same layout as cleanup-plan.sh, so rollback is a
+move back). --apply re-runs the audit first and refuses if a planned file became
+reachable.
+
+Usage:
+  python build-tools/python/audit_reachability.py
+  python build-tools/python/audit_reachability.py --json-out prune-plan.json
+  python build-tools/python/audit_reachability.py --apply prune-plan.json
+
+Exit code
+  0: ok
+  1: broken local references found (a page/script points at a missing file)
+  3: --apply refused
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import shutil
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "build-tools"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from audit_assets import _bytes  # noqa: E402
+from bundle_site_js import split_statements  # noqa: E402
+
+SCAN_DIRS = ("scripts", "styles", "public")
+CANDIDATE_EXTS = {".js", ".css", ".json"}
+# Not shipped: generated build output, backups of earlier cleanups.
+IGNORE_PREFIXES = ("dist/", "backup_")
+
+HTML_SCRIPT_RE = re.compile(r"<script\b(?P<attrs>[^>]*)>(?P<body>.*?)</script>", re.IGNORECASE | re.DOTALL)
+HTML_LINK_RE = re.compile(r"<link\b[^>]*\bhref=\"(?P<href>[^\"]+)\"", re.IGNORECASE)
+SRC_ATTR_RE = re.compile(r"\bsrc=\"(?P<src>[^\"]+)\"", re.IGNORECASE)
+INLINE_HANDLER_RE = re.compile(r"\bon[a-z]+=\"(?P<code>[^\"]+)\"", re.IGNORECASE)
+
+JS_IMPORT_RE = re.compile(
+    r"""(?:\bimport\s*(?:[\w*${}\s,]+\s*from\s*)?|\bexport\s*[\w*${}\s,]+\s*from\s*|\bimport\s*\(\s*|\bimportScripts\s*\(\s*)(?P<q>['"])(?P<path>[^'"]+)(?P=q)"""
+)
+QUOTED_PATH_RE = re.compile(r"""(?P<q>['"`])(?P<path>[^'"`\s<>]*?[\w-]\.(?:js|css|json))(?:[?#][^'"`]*)?(?P=q)""")
+CSS_REF_RE = re.compile(r"""(?:@import\s+(?:url\()?|url\()\s*(?P<q>['"]?)(?P<path>[^'")\s]+\.css)(?:[?#][^'")]*)?(?P=q)""", re.IGNORECASE)
+
+TOP_FUNC_RE = re.compile(
+    r"^(?:async\s+)?function\s*\*?\s*(?P<fn>[A-Za-z_$][\w$]*)\s*\("
+    r"|^(?:(?:const|let|var)\s+|window\.)(?P<arrow>[A-Za-z_$][\w$]*)\s*=\s*(?:async\s+)?"
+    r"(?:function\b|\([^()]*\)\s*=>|[A-Za-z_$][\w$]*\s*=>)"
+)
+
+
+@dataclass
+class Reach:
+    reached: dict[str, str] = field(default_factory=dict)  # rel path -> first referrer
+    missing: dict[str, set[str]] = field(default_factory=dict)  # rel path -> referrers
+    inline_js: list[str] = field(default_factory=list)  # inline <script> + on*="" handlers
+
+
+def rel(path: Path, root: Path = ROOT) -> str:
+    return path.resolve().relative_to(root.resolve()).as_posix()
+
+
+def read(path: Path) -> str:
+    return path.read_text(encoding="utf-8", errors="replace")
+
+
+def resolve_ref(raw: str, base_dir: Path, root: Path = ROOT) -> Path | None:
+    """Map a reference to a file under root (None for remote/data URLs)."""
+    parts = urlsplit(raw.strip())
+    if parts.scheme or parts.netloc or raw.startswith(("data:", "//", "#")):
+        return None
+    path = unquote(parts.path)
+    if not path:
+        return None
+    if path.startswith("/"):
+        return root / path.lstrip("/")
+    # Browsers resolve page-relative for classic scripts/fetch and module-relative for
+    # imports: accept whichever exists (root first, it's how site pages reference files).
+    for base in (root, base_dir):
+        candidate = (base / path).resolve()
+        if candidate.is_file():
+            return candidate
+    return (base_dir / path).resolve()
+
+
+def candidate_files() -> list[Path]:
+    out = []
+    for d in SCAN_DIRS:
+        base = ROOT / d
+        if not base.exists():
+            continue
+        for f in sorted(base.rglob("*")):
+            if f.is_file() and f.suffix.lower() in CANDIDATE_EXTS and not rel(f).startswith(IGNORE_PREFIXES):
+                out.append(f)
+    return out
+
+
+def page_refs(text: str, reach: Reach) -> list[str]:
+    refs = []
+    for m in HTML_SCRIPT_RE.finditer(text):
+        attrs, body = m.group("attrs") or "", m.group("body") or ""
+        src = SRC_ATTR_RE.search(attrs)
+        if src:
+            refs.append(src.group("src"))
+        elif "importmap" in attrs:
+            try:
+                refs.extend(str(v) for v in json.loads(body).get("imports", {}).values())
+            except ValueError:
+                pass
+        elif body.strip() and "ld+json" not in attrs:
+            reach.inline_js.append(body)
+            refs.extend(m2.group("path") for m2 in JS_IMPORT_RE.finditer(body))
+    refs.extend(m.group("href") for m in HTML_LINK_RE.finditer(text))
+    reach.inline_js.extend(m.group("code") for m in INLINE_HANDLER_RE.finditer(text))
+    return refs
+
+
+def file_refs(path: Path, text: str) -> list[str]:
+    if path.suffix.lower() == ".css":
+        return [m.group("path") for m in CSS_REF_RE.finditer(text)]
+    if path.suffix.lower() == ".js":
+        refs = [m.group("path") for m in JS_IMPORT_RE.finditer(text)]
+        refs += [m.group("path") for m in QUOTED_PATH_RE.finditer(text)]
+        return refs
+    return []
+
+
+def crawl(pages: list[Path], root: Path = ROOT) -> Reach:
+    """Everything reachable from the pages; root is the site root they are served from (dist/ after a build)."""
+    reach = Reach()
+    queue: list[tuple[str, Path, list[str]]] = []
+    for page in pages:
+        reach.reached[rel(page, root)] = "(entry)"
+        queue.append((rel(page, root), page.parent, page_refs(read(page), reach)))
+
+    while queue:
+        referrer, base_dir, refs = queue.pop()
+        for raw in refs:
+            target = resolve_ref(raw, base_dir, root)
+            if target is None:
+                continue
+            try:
+                key = rel(target, root)
+            except ValueError:
+                continue  # outside the repo
+            if not target.is_file():
+                if target.suffix.lower() in CANDIDATE_EXTS and "/" in raw:
+                    reach.missing.setdefault(key, set()).add(referrer)
+                continue
+            if key in reach.reached:
+                continue
+            reach.reached[key] = referrer
+            if target.suffix.lower() in (".js", ".css"):
+                queue.append((key, target.parent, file_refs(target, read(target))))
+    return reach
+
+
+def _sha(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _line_set(text: str) -> set[str]:
+    return {ln.strip() for ln in text.splitlines() if len(ln.strip()) > 3}
+
+
+def similarity(a: Path, b: Path) -> float:
+    la, lb = _line_set(read(a)), _line_set(read(b))
+    if not la or not lb:
+        return 0.0
+    return len(la & lb) / len(la | lb)
+
+
+def find_duplicates(unreachable: list[Path], reached: list[Path]) -> dict[str, dict]:
+    """unreachable rel path -> {"of": reached rel path, "kind": "identical"|"near", "similarity": x}"""
+    out: dict[str, dict] = {}
+    by_hash: dict[str, Path] = {}
+    by_name: dict[str, list[Path]] = {}
+    for f in reached:
+        by_hash.setdefault(_sha(f), f)
+        by_name.setdefault(f.name, []).append(f)
+    for f in unreachable:
+        same = by_hash.get(_sha(f))
+        if same:
+            out[rel(f)] = {"of": rel(same), "kind": "identical", "similarity": 1.0}
+            continue
+        base_name = re.sub(r"\.(old|bak|orig|copy)(?=\.)", "", f.name)
+        best = max(((similarity(f, g), g) for g in by_name.get(base_name, [])), default=(0.0, None))
+        if best[1] is not None and best[0] >= 0.3:
+            out[rel(f)] = {"of": rel(best[1]), "kind": "near", "similarity": round(best[0], 2)}
+    return out
+
+
+def unused_functions(reached_js: list[Path], reach: Reach, pages: list[Path]) -> list[dict]:
+    """Top-level functions of reached JS whose name never appears elsewhere."""
+    sources = {rel(f): read(f) for f in reached_js}
+    corpus = "\n".join([*sources.values(), *reach.inline_js, *(read(p) for p in pages)])
+    out = []
+    for path, text in sources.items():
+        line_no = 1
+        for st in split_statements(text):
+            m = TOP_FUNC_RE.match(st.head)
+            if m:
+                name = m.group("fn") or m.group("arrow")
+                uses = len(re.findall(rf"(?<![\w$]){re.escape(name)}(?![\w$])", corpus))
+                if uses <= 1:
+                    out.append({"file": path, "name": name, "line": line_no + _leading_comment_lines(st.text), "bytes": len(st.text.encode("utf-8"))})
+            line_no += st.text.count("\n")
+    return out
+
+
+def _leading_comment_lines(text: str) -> int:
+    n = 0
+    for ln in text.splitlines():
+        if ln.startswith(("//", "/*")):
+            n += 1
+        else:
+            break
+    return n
+
+
+def build_plan(pages: list[Path]) -> tuple[dict, Reach]:
+    reach = crawl(pages)
+    candidates = candidate_files()
+    reached = [f for f in candidates if rel(f) in reach.reached]
+    unreachable = [f for f in candidates if rel(f) not in reach.reached]
+    dups = find_duplicates(unreachable, reached)
+    funcs = unused_functions([f for f in reached if f.suffix == ".js"], reach, pages)
+
+    files = []
+    for f in unreachable:
+        entry = {"path": rel(f), "bytes": f.stat().st_size}
+        if rel(f) in dups:
+            entry["duplicate"] = dups[rel(f)]
+        files.append(entry)
+
+    plan = {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "entries": [rel(p) for p in pages],
+        "reachable": sorted(k for k in reach.reached if not k.endswith(".html")),
+        "missing": {k: sorted(v) for k, v in sorted(reach.missing.items())},
+        "unreachable_files": files,
+        "unused_functions": funcs,
+        "totals": {
+            "reachable_bytes": sum(f.stat().st_size for f in reached),
+            "unreachable_files": len(files),
+            "unreachable_bytes": sum(e["bytes"] for e in files),
+            "unused_functions": len(funcs),
+            "unused_function_bytes": sum(e["bytes"] for e in funcs),
+        },
+    }
+    return plan, reach
+
+
+def print_report(plan: dict) -> None:
+    t = plan["totals"]
+    print(f"Workspace: {ROOT}")
+    print(f"Entry pages: {len(plan['entries'])}")
+    print(f"Reachable JS/CSS/JSON: {len(plan['reachable'])} ({_bytes(t['reachable_bytes'])})")
+    print("")
+
+    if plan["missing"]:
+        print("REFERENCES TO MISSING FILES:")
+        for path, referrers in plan["missing"].items():
+            print(f"  - {path}  (from {', '.join(referrers)})")
+        print("")
+
+    if plan["unreachable_files"]:
+        print("UNREACHABLE FILES:")
+        for e in plan["unreachable_files"]:
+            dup = e.get("duplicate")
+            note = f"  [{dup['kind']} copy of {dup['of']}, {dup['similarity']:.0%}]" if dup else ""
+            print(f"  - {e['path']}  {_bytes(e['bytes'])}{note}")
+        print("")
+
+    if plan["unused_functions"]:
+        print("UNREFERENCED TOP-LEVEL FUNCTIONS (reachable files):")
+        for e in plan["unused_functions"]:
+            print(f"  - {e['file']}:{e['line']}  {e['name']}  {_bytes(e['bytes'])}")
+        print("")
+
+    print(
+        f"Estimated savings: {_bytes(t['unreachable_bytes'])} in {t['unreachable_files']} files"
+        f" + {_bytes(t['unused_function_bytes'])} in {t['unused_functions']} functions"
+    )
+
+
+def apply_plan(plan_path: Path, pages: list[Path]) -> int:
+    planned = json.loads(plan_path.read_text(encoding="utf-8"))
+    current, _ = build_plan(pages)
+    still_dead = {e["path"] for e in current["unreachable_files"]}
+    revived = [e["path"] for e in planned.get("unreachable_files", []) if e["path"] not in still_dead]
+    if revived:
+        print("Refusing to apply: these planned files are reachable now:", file=sys.stderr)
+        for path in revived:
+            print(f"  - {path}", file=sys.stderr)
+        return 3
+
+    backup_dir = ROOT / f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    moved = 0
+    total = 0
+    for e in planned.get("unreachable_files", []):
+        src = ROOT / e["path"]
+        if not src.is_file():
+            print(f"⚠️ Skip (not found): {e['path']}")
+            continue
+        dst = backup_dir / e["path"]
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        total += src.stat().st_size
+        shutil.move(str(src), str(dst))
+        moved += 1
+        print(f"✅ Moved: {e['path']} -> {rel(dst)}")
+    print(f"Moved {moved} files ({_bytes(total)}) into {rel(backup_dir) if moved else backup_dir.name}")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Report unreachable JS/CSS files and top-level functions.")
+    parser.add_argument("--json-out", type=Path, default=None, help="Write the prune plan as JSON.")
+    parser.add_argument("--apply", type=Path, default=None, help="Move the files of a prune plan into backup_<ts>/.")
+    args = parser.parse_args(argv)
+
+    pages = sorted(ROOT.glob("*.html"))
+    if not pages:
+        print("No HTML pages found in repo root.")
+        return 1
+
+    if args.apply:
+        return apply_plan(args.apply, pages)
+
+    plan, _ = build_plan(pages)
+    print_report(plan)
+    if args.json_out:
+        args.json_out.write_text(json.dumps(plan, indent=2), encoding="utf-8")
+        print(f"\nPrune plan written to {args.json_out}")
+    return 1 if plan["missing"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""Benchmark the build-tools pipelines on scaled corpora, with a JSON history.
+
+Stages (the library functions the tools are built on):
+- cards       audit_deeplinks.extract_cards over every page
+- knowledge   build_knowledge.build_context over the corpus root
+- quiz        parse_quiz_translations.parse_qa_file over the q&a files
+- references  audit_assets.gather_references over the corpus root
+- images      convert_jpg_to_webp.convert_folder            (requires PIL)
+- pdf         render_pdf_images.render_entry + save_webp    (requires PyMuPDF + PIL)
+
+Each scale (default 1x, 10x, 100x) gets a corpus built from the real project:
+the root pages (card ids suffixed per copy), data/quiz/*.txt and the q&a
+files repeated N times, plus N x 8 JPGs and an N-page PDF for the image
+stages. --synthetic builds it with generate_synthetic_catalogue.py instead
+(N brands of freshly generated cards, i18n entries and questions). Every
+stage x scale runs in a fresh worker process, so peak RSS is the stage's
+own; wall time is the median of --repeat runs.
+
+Results are appended to the history file (one entry per run: git commit,
+python, host, per stage x scale wall / CPU time, peak RSS, throughput) and
+compared with the previous run (or --baseline): a stage whose median wall
+time grew by more than --threshold is a regression. The report also shows
+how each stage scales (time exponent between the smallest and largest
+scale: 1.0 = linear).
+
+Usage:
+  python build-tools/python/bench_pipelines.py
+  python build-tools/python/bench_pipelines.py --scales 1,10 --stages cards,quiz --repeat 5
+  python build-tools/python/bench_pipelines.py --synthetic --scales 1,10,50
+  python build-tools/python/bench_pipelines.py --label "after regex change" --fail-on-regression
+  python build-tools/python/bench_pipelines.py --report-only --baseline 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "build-tools"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+HISTORY_FILE = ROOT / "build-tools" / "bench-history.json"
+DEFAULT_SCALES = (1, 10, 100)
+REGRESSION_THRESHOLD = 0.10
+
+QUIZ_FILES = ("q-a-easy-mode-english.txt", "q-a-easy-mode-spanish.txt", "q-a-easy-mode-french.txt", "q-a-easy-mode-italiano.txt")
+IMAGES_PER_SCALE = 8
+SYNTHETIC_CARDS_PER_PAGE = 14  # ~97 real cards over 7 card pages
+SYNTHETIC_QUESTIONS = 100
+CARD_ID_RE = re.compile(r"\bid=\"card-(?P<key>[^\"]+)\"")
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    unit: str
+    requires: tuple[str, ...] = ()
+
+
+STAGES = {
+    s.name: s
+    for s in (
+        Stage("cards", "cards"),
+        Stage("knowledge", "bytes"),
+        Stage("quiz", "questions"),
+        Stage("references", "files"),
+        Stage("images", "images", ("PIL",)),
+        Stage("pdf", "pages", ("fitz", "PIL")),
+    )
+}
+
+
+def missing_modules(stage: Stage) -> list[str]:
+    import importlib.util
+
+    return [m for m in stage.requires if importlib.util.find_spec(m) is None]
+
+
+# --------------------------------------------------------------------------
+# Corpus
+
+
+def build_corpus(dest: Path, scale: int, stages: list[str], synthetic: bool = False) -> None:
+    """Copy of the project's content repeated `scale` times (idempotent per dest)."""
+    marker = dest / ".corpus.json"
+    wanted = {"scale": scale, "stages": sorted(stages), "synthetic": synthetic}
+    if marker.exists() and json.loads(marker.read_text(encoding="utf-8")) == wanted:
+        return
+    shutil.rmtree(dest, ignore_errors=True)
+    if synthetic:
+        generate_synthetic(dest, scale)
+    else:
+        replicate_project(dest, scale)
+
+    if "images" in stages and not missing_modules(STAGES["images"]):
+        make_images(dest / "images", scale * IMAGES_PER_SCALE)
+    if "pdf" in stages and not missing_modules(STAGES["pdf"]):
+        make_pdf(dest / "corpus.pdf", scale)
+    marker.write_text(json.dumps(wanted), encoding="utf-8")
+
+
+def replicate_project(dest: Path, scale: int) -> None:
+    (dest / "data" / "quiz").mkdir(parents=True)
+    pages = sorted(ROOT.glob("*.html"))
+    for k in range(scale):
+        suffix = "" if k == 0 else f"-{k}"
+        for page in pages:
+            text = page.read_text(encoding="utf-8")
+            if suffix:
+                text = CARD_ID_RE.sub(lambda m: f'id="card-{m.group("key")}{suffix}"', text)
+            (dest / f"{page.stem}{suffix}.html").write_text(text, encoding="utf-8")
+        for src in sorted((ROOT / "data" / "quiz").glob("*.txt")):
+            shutil.copyfile(src, dest / "data" / "quiz" / f"{src.stem}{suffix}.txt")
+    for name in QUIZ_FILES:
+        src = ROOT / name
+        if src.exists():
+            blocks = src.read_text(encoding="utf-8").strip()
+            (dest / name).write_text("\n\n".join([blocks] * scale) + "\n", encoding="utf-8")
+    for rel in ("scripts", "styles"):
+        shutil.copytree(ROOT / rel, dest / rel, ignore=shutil.ignore_patterns("legacy", "*.debug.json"))
+
+
+def generate_synthetic(dest: Path, scale: int) -> None:
+    """generate_synthetic_catalogue.py output: `scale` brands, ~real card and question density per brand."""
+    cmd = [
+        sys.executable, str(Path(__file__).resolve().parent / "generate_synthetic_catalogue.py"),
+        "--out", str(dest), "--brands", str(scale), "--cards-per-page", str(SYNTHETIC_CARDS_PER_PAGE),
+        "--questions", str(SYNTHETIC_QUESTIONS * scale), "--no-assets",
+    ]
+    subprocess.run(cmd, check=True, capture_output=True)
+
+
+def make_images(folder: Path, count: int) -> None:
+    from PIL import Image
+
+    folder.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        # Gradient + noise: compresses like a photo, not like a flat fill.
+        im = Image.effect_noise((640, 480), 40 + i % 30).convert("RGB")
+        im = Image.blend(im, Image.linear_gradient("L").resize((640, 480)).convert("RGB"), 0.5)
+        im.save(folder / f"card-{i:05d}.jpg", quality=88)
+
+
+def make_pdf(path: Path, pages: int) -> None:
+    import fitz  # type: ignore
+
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page(width=595, height=842)
+        page.draw_rect(fitz.Rect(72, 120, 523, 480), color=(0.6, 0.2, 0.1), fill=(0.95, 0.85, 0.7))
+        page.insert_text((90, 160), f"Badiani training - page {i + 1}", fontsize=22)
+        for line in range(20):
+            page.insert_text((90, 520 + line * 14), "Espresso 25-30 sec, crema nocciola tigrata " * 2, fontsize=9)
+    doc.save(path)
+    doc.close()
+
+
+# --------------------------------------------------------------------------
+# Stages (run inside the worker process)
+
+
+def stage_cards(corpus: Path) -> tuple[int, int]:
+    from audit_deeplinks import extract_cards
+
+    count = size = 0
+    for page in sorted(corpus.glob("*.html")):
+        text = page.read_text(encoding="utf-8")
+        size += len(text)
+        count += len(extract_cards(str(page), text))
+    return count, size
+
+
+def stage_knowledge(corpus: Path) -> tuple[int, int]:
+    from build_knowledge import build_context
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        context = build_context(corpus)
+    size = len(context.encode("utf-8"))
+    return size, size
+
+
+def stage_quiz(corpus: Path) -> tuple[int, int]:
+    from parse_quiz_translations import parse_qa_file
+
+    count = size = 0
+    for path in sorted(corpus.glob("q-a-easy-mode-*.txt")):
+        size += path.stat().st_size
+        count += len(parse_qa_file(path))
+    return count, size
+
+
+def stage_references(corpus: Path) -> tuple[int, int]:
+    from audit_assets import SCAN_EXTS, gather_references
+
+    gather_references(corpus)
+    files = [p for p in corpus.rglob("*") if p.is_file() and p.suffix.lower() in SCAN_EXTS]
+    return len(files), sum(p.stat().st_size for p in files)
+
+
+def stage_images(corpus: Path) -> tuple[int, int]:
+    from convert_jpg_to_webp import convert_folder
+
+    folder = corpus / "images"
+    converted, _ = convert_folder(folder, force=True, quality=82, method=6)
+    return converted, sum(p.stat().st_size for p in folder.glob("*.jpg"))
+
+
+def stage_pdf(corpus: Path) -> tuple[int, int]:
+    import fitz  # type: ignore
+    from render_pdf_images import render_entry, save_webp
+
+    pdf = corpus / "corpus.pdf"
+    out = corpus / "pdf-out"
+    out.mkdir(exist_ok=True)
+    with fitz.open(pdf) as doc:
+        pages = doc.page_count
+    for i in range(pages):
+        # render_entry resolves the file against ROOT; an absolute path wins.
+        entry = {"file": str(pdf), "page": i, "name": f"page-{i}", "rect": [72.0, 120.0, 523.0, 480.0], "scale": 2.4}
+        with contextlib.redirect_stdout(io.StringIO()):
+            image = render_entry(entry)
+        save_webp(image, out / f"page-{i:04d}.webp")
+    return pages, pdf.stat().st_size
+
+
+STAGE_FUNCS = {
+    "cards": stage_cards,
+    "knowledge": stage_knowledge,
+    "quiz": stage_quiz,
+    "references": stage_references,
+    "images": stage_images,
+    "pdf": stage_pdf,
+}
+
+
+def peak_rss_kb() -> int | None:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss  # bytes on macOS, KB on Linux
+
+
+def run_worker(stage: str, corpus: Path, repeat: int) -> dict:
+    func = STAGE_FUNCS[stage]
+    rss_before = peak_rss_kb()
+    walls, cpus = [], []
+    units = size = 0
+    for _ in range(repeat):
+        t0, c0 = time.perf_counter(), time.process_time()
+        units, size = func(corpus)
+        walls.append(time.perf_counter() - t0)
+        cpus.append(time.process_time() - c0)
+    return {
+        "wall_s": round(statistics.median(walls), 5),
+        "wall_min_s": round(min(walls), 5),
+        "cpu_s": round(statistics.median(cpus), 5),
+        "peak_rss_kb": peak_rss_kb(),
+        "rss_before_kb": rss_before,
+        "units": units,
+        "input_bytes": size,
+    }
+
+
+# --------------------------------------------------------------------------
+# History + report
+
+
+def git_commit() -> str | None:
+    try:
+        proc = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    except OSError:
+        return None
+    return proc.stdout.strip() or None
+
+
+def load_history(path: Path) -> dict:
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return {"runs": []}
+
+
+def find_run(history: dict, ref: str | None, before: int) -> dict | None:
+    """Run by id or label; default: the run just before index `before`."""
+    runs = history["runs"]
+    if ref is None:
+        return runs[before - 1] if before > 0 else None
+    for run in reversed(runs):
+        if str(run["id"]) == ref or run.get("label") == ref or run.get("commit") == ref:
+            return run
+    raise SystemExit(f"❌ No run '{ref}' in history")
+
+
+def _fmt_s(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}ms" if seconds < 1 else f"{seconds:.2f}s"
+
+
+def report(run: dict, baseline: dict | None, threshold: float) -> int:
+    base = {(r["stage"], r["scale"]): r for r in (baseline or {}).get("results", [])}
+    print(f"\n📊 Run #{run['id']} ({run.get('label') or run.get('commit') or run['at']})"
+          + (f" vs #{baseline['id']} ({baseline.get('label') or baseline.get('commit') or baseline['at']})" if baseline else ""))
+    print(f"{'stage':<11} {'scale':>5} {'wall':>9} {'cpu':>9} {'peak RSS':>9} {'throughput':>22} {'vs base':>8}")
+    regressions = 0
+    for r in run["results"]:
+        if r.get("skipped"):
+            print(f"{r['stage']:<11} {r['scale']:>4}x  ⚠️ skipped: {r['skipped']}")
+            continue
+        rss = f"{r['peak_rss_kb'] / 1024:.0f}MB" if r.get("peak_rss_kb") else "-"
+        tput = f"{r['throughput']:,.0f} {STAGES[r['stage']].unit}/s"
+        delta = ""
+        prev = base.get((r["stage"], r["scale"]))
+        if prev and not prev.get("skipped") and prev["wall_s"] > 0:
+            change = r["wall_s"] / prev["wall_s"] - 1
+            delta = f"{change * 100:+.0f}%"
+            if change > threshold:
+                delta += " ❌"
+                regressions += 1
+        print(f"{r['stage']:<11} {r['scale']:>4}x {_fmt_s(r['wall_s']):>9} {_fmt_s(r['cpu_s']):>9} {rss:>9} {tput:>22} {delta:>8}")
+
+    print("\n📈 Scaling (time exponent, 1.0 = linear)")
+    for stage in dict.fromkeys(r["stage"] for r in run["results"]):
+        rows = sorted((r for r in run["results"] if r["stage"] == stage and not r.get("skipped")), key=lambda r: r["scale"])
+        if len(rows) < 2 or rows[0]["wall_s"] <= 0:
+            continue
+        lo, hi = rows[0], rows[-1]
+        exponent = math.log(hi["wall_s"] / lo["wall_s"]) / math.log(hi["scale"] / lo["scale"])
+        flag = " ⚠️ superlinear" if exponent > 1.2 else ""
+        print(f"  {stage:<11} {lo['scale']}x -> {hi['scale']}x: x{hi['wall_s'] / lo['wall_s']:.1f} time, exponent {exponent:.2f}{flag}")
+
+    if baseline:
+        print(f"\n{'❌' if regressions else '✅'} {regressions} regression(s) over {threshold * 100:.0f}%")
+    return regressions
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark build-tools stages on 1x/10x/100x corpora and track regressions.")
+    ap.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)), help="Comma-separated corpus multipliers")
+    ap.add_argument("--stages", default=",".join(STAGES), help=f"Comma-separated subset of: {', '.join(STAGES)}")
+    ap.add_argument("--repeat", type=int, default=3, help="Runs per stage x scale (median is recorded)")
+    ap.add_argument("--synthetic", action="store_true", help="Use generate_synthetic_catalogue.py corpora (scale = brands)")
+    ap.add_argument("--work-dir", type=Path, default=None, help="Where corpora are built (kept between runs if given)")
+    ap.add_argument("--history", type=Path, default=HISTORY_FILE)
+    ap.add_argument("--label", default=None, help="Name this run in the history")
+    ap.add_argument("--baseline", default=None, help="Compare against this run id / label / commit (default: previous run)")
+    ap.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="Wall-time growth counted as a regression")
+    ap.add_argument("--fail-on-regression", action="store_true")
+    ap.add_argument("--report-only", action="store_true", help="Only compare the latest run in the history")
+    ap.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    ap.add_argument("--corpus", type=Path, default=None, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.corpus, args.repeat)))
+        return 0
+
+    history = load_history(args.history)
+    if args.report_only:
+        if not history["runs"]:
+            print(f"❌ No runs in {args.history}")
+            return 1
+        latest = len(history["runs"]) - 1
+        regressions = report(history["runs"][latest], find_run(history, args.baseline, latest), args.threshold)
+        return 1 if regressions and args.fail_on_regression else 0
+
+    scales = sorted({int(s) for s in args.scales.split(",") if s.strip()})
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        print(f"❌ Unknown stage(s): {', '.join(unknown)}")
+        return 1
+
+    work = args.work_dir or Path(tempfile.mkdtemp(prefix="badiani-bench-"))
+    results = []
+    try:
+        for scale in scales:
+            corpus = work / f"x{scale}"
+            t0 = time.perf_counter()
+            build_corpus(corpus, scale, stages, args.synthetic)
+            print(f"🔍 {scale}x corpus ready in {time.perf_counter() - t0:.1f}s ({corpus})")
+            for stage in stages:
+                missing = missing_modules(STAGES[stage])
+                if missing:
+                    results.append({"stage": stage, "scale": scale, "skipped": f"missing {', '.join(missing)}"})
+                    continue
+                proc = subprocess.run(
+                    [sys.executable, __file__, "--worker", stage, "--corpus", str(corpus), "--repeat", str(args.repeat)],
+                    capture_output=True, text=True,
+                )
+                if proc.returncode != 0:
+                    print(f"❌ {stage} @ {scale}x failed:\n{proc.stderr.strip()[-2000:]}")
+                    return 1
+                r = json.loads(proc.stdout.strip().splitlines()[-1])
+                r.update(stage=stage, scale=scale, throughput=round(r["units"] / r["wall_s"], 1) if r["wall_s"] else 0.0)
+                results.append(r)
+                print(f"  {stage:<11} {scale:>4}x {_fmt_s(r['wall_s']):>9}")
+    finally:
+        if args.work_dir is None:
+            shutil.rmtree(work, ignore_errors=True)
+
+    run = {
+        "id": (history["runs"][-1]["id"] + 1) if history["runs"] else 1,
+        "at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "label": args.label,
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "host": f"{platform.system()} {platform.machine()} ({os.cpu_count()} cpu)",
+        "repeat": args.repeat,
+        "results": results,
+    }
+    history["runs"].append(run)
+    args.history.parent.mkdir(parents=True, exist_ok=True)
+    args.history.write_text(json.dumps(history, indent=1) + "\n", encoding="utf-8")
+
+    latest = len(history["runs"]) - 1
+    regressions = report(run, find_run(history, args.baseline, latest), args.threshold)
+    print(f"\n✅ Run #{run['id']} appended to {args.history}")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -20,9 +20,11 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from perf_trace import add_profile_arguments, count, profile_session, stage
+
 
 def _project_root() -> Path:
-    return Path(__file__).resolve().parents[1]
+    return Path(__file__).resolve().parents[2]
 
 
 def _should_convert(src: Path, dst: Path, force: bool) -> bool:
@@ -51,10 +53,11 @@ def convert_folder(folder: Path, *, force: bool, quality: int, method: int) -> t
         dst = src.with_suffix(".webp")
         if not _should_convert(src, dst, force):
             skipped += 1
+            count("cache_hits")
             continue
 
         try:
-            with Image.open(src) as im:
+            with stage("convert_image", file=src.name), Image.open(src) as im:
                 # Convert to RGB to avoid WEBP alpha surprises for JPEG sources
                 if im.mode not in ("RGB", "RGBA"):
                     im = im.convert("RGB")
@@ -77,6 +80,7 @@ def main() -> int:
     parser.add_argument("--force", action="store_true", help="Overwrite WEBP even if newer.")
     parser.add_argument("--quality", type=int, default=82, help="WEBP quality (0-100).")
     parser.add_argument("--method", type=int, default=6, help="WEBP method (0-6).")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     root = _project_root()
@@ -84,7 +88,8 @@ def main() -> int:
     if not folder.exists():
         raise SystemExit(f"Folder not found: {folder}")
 
-    converted, skipped = convert_folder(folder, force=args.force, quality=args.quality, method=args.method)
+    with profile_session("convert_jpg_to_webp", args):
+        converted, skipped = convert_folder(folder, force=args.force, quality=args.quality, method=args.method)
     print(f"WEBP converted/updated: {converted}")
     print(f"Skipped (up-to-date): {skipped}")
     return 0
@@ -21,9 +21,11 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from perf_trace import add_profile_arguments, count, profile_session, stage
+
 
 def _project_root() -> Path:
-    return Path(__file__).resolve().parents[1]
+    return Path(__file__).resolve().parents[2]
 
 
 def _is_newer(src: Path, dst: Path) -> bool:
@@ -54,10 +56,11 @@ def convert_folder(folder: Path, *, force: bool, jpg_quality: int, webp_quality:
 
         if not do_jpg and not do_webp:
             skipped += 1
+            count("cache_hits")
             continue
 
         try:
-            with Image.open(src) as im:
+            with stage("convert_image", file=src.name), Image.open(src) as im:
                 # Flatten alpha onto white for JPG; keep alpha for WEBP if present
                 if do_jpg:
                     if im.mode in ("RGBA", "LA"):
@@ -93,19 +96,21 @@ def main() -> int:
     parser.add_argument("--jpg-quality", type=int, default=88, help="JPEG quality (0-100).")
     parser.add_argument("--webp-quality", type=int, default=82, help="WEBP quality (0-100).")
     parser.add_argument("--webp-method", type=int, default=6, help="WEBP method (0-6).")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     folder = (_project_root() / args.dir).resolve()
     if not folder.exists():
         raise SystemExit(f"Folder not found: {folder}")
 
-    made_jpg, made_webp, skipped = convert_folder(
-        folder,
-        force=args.force,
-        jpg_quality=args.jpg_quality,
-        webp_quality=args.webp_quality,
-        webp_method=args.webp_method,
-    )
+    with profile_session("convert_png_to_jpg_webp", args):
+        made_jpg, made_webp, skipped = convert_folder(
+            folder,
+            force=args.force,
+            jpg_quality=args.jpg_quality,
+            webp_quality=args.webp_quality,
+            webp_method=args.webp_method,
+        )
 
     print(f"JPG created/updated: {made_jpg}")
     print(f"WEBP created/updated: {made_webp}")
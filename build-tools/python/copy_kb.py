@@ -1,6 +1,6 @@
 from pathlib import Path
 
-root = Path(__file__).resolve().parents[1]
+root = Path(__file__).resolve().parents[2]
 src = root / "notes" / "pdf_text"
 dst_root = root / "notes" / "kb"
 files = {
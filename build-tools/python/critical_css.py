@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""Per-page critical CSS + one shared pruned deferred stylesheet for styles/site.css.
+
+site.css (~270 KB) is render-blocking on every page. For each root page that
+links it, this:
+1. collects the classes / ids / tags the pages use (their markup) plus every token
+   found in string literals of scripts/*.js (classes toggled at runtime:
+   classList.add('is-open'), innerHTML templates, ...);
+2. keeps only the rules whose selectors can match those (a selector is dropped
+   only if it names a class, id or tag that appears nowhere; attribute selectors,
+   pseudo-classes and :not(...) never cause a drop);
+3. writes the rules kept for any page to one dist/styles/site.<content hash>.css
+   shared by every page (one cached URL across navigations), loaded without
+   blocking (rel=preload + onload swap, <noscript> fallback);
+4. inlines, in a <style data-critical> block, the subset matched by the first
+   --fold-bytes of <body> markup (nav + hero on mobile), within --budget bytes:
+   when the block would be larger the fold is shrunk until it fits, and a page
+   whose block cannot fit even with an empty fold fails the run.
+
+The budget (14 KB) is about what the first round trip of a new connection
+delivers (10 TCP segments), so the inline CSS should not cost an extra one.
+
+@font-face and @import are always kept; @keyframes only when a kept rule uses
+them; @media / @supports blocks are filtered recursively.
+
+Usage:
+  python build-tools/python/critical_css.py
+  python build-tools/python/critical_css.py --pages-dir dist --out-dir dist   # after bundle_site_js.py
+  python build-tools/python/critical_css.py --report-only
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from audit_assets import _bytes  # noqa: E402
+from perf_trace import add_profile_arguments, profile_session, stage  # noqa: E402
+
+CSS_FILE = ROOT / "styles" / "site.css"
+DEFAULT_OUT_DIR = ROOT / "dist"
+FOLD_BYTES = 12_000
+CRITICAL_BUDGET = 14_000
+DEFERRED_RE = re.compile(r"^site\.[0-9a-f]{8}\.css$")
+
+# site.js adds this on <html> before first paint.
+ALWAYS_USED_CLASSES = {"has-js"}
+ALWAYS_USED_TAGS = {"html", "body", "*"}
+BLOCK_AT_RULES = ("@media", "@supports", "@container", "@layer", "@document")
+
+LINK_RE = re.compile(r"(?P<indent>[ \t]*)<link\b[^>]*\bhref=\"(?P<href>styles/site\.css(?:\?[^\"]*)?)\"[^>]*>(?P<nl>\r?\n)?", re.IGNORECASE)
+BODY_RE = re.compile(r"<body\b[^>]*>", re.IGNORECASE)
+CLASS_ATTR_RE = re.compile(r"\bclass=\"(?P<v>[^\"]*)\"", re.IGNORECASE)
+ID_ATTR_RE = re.compile(r"\bid=\"(?P<v>[^\"]*)\"", re.IGNORECASE)
+TAG_RE = re.compile(r"<(?P<t>[a-zA-Z][a-zA-Z0-9-]*)")
+JS_STRING_RE = re.compile(r"'(?:[^'\\\n]|\\.)*'|\"(?:[^\"\\\n]|\\.)*\"|`(?:[^`\\]|\\.)*`", re.DOTALL)
+TOKEN_RE = re.compile(r"-?[_a-zA-Z][\w-]*")
+
+SEL_CLASS_RE = re.compile(r"\.(-?[_a-zA-Z](?:[\w-]|\\.)*)")
+SEL_ID_RE = re.compile(r"#(-?[_a-zA-Z](?:[\w-]|\\.)*)")
+SEL_TAG_RE = re.compile(r"(?:^|[\s>+~(])([a-zA-Z][a-zA-Z0-9-]*)")
+PSEUDO_FN_RE = re.compile(r"::?[\w-]+\((?:[^()]|\([^()]*\))*\)")
+PSEUDO_RE = re.compile(r"::?[\w-]+")
+ATTR_SEL_RE = re.compile(r"\[[^\]]*\]")
+ANIMATION_RE = re.compile(r"animation(?:-name)?\s*:\s*(?P<v>[^;}]+)", re.IGNORECASE)
+KEYFRAMES_RE = re.compile(r"@(?:-webkit-)?keyframes\s+(?P<name>[^\s{]+)", re.IGNORECASE)
+URL_RE = re.compile(r"url\((?P<q>['\"]?)(?P<path>\.\./[^'\")]+)(?P=q)\)")
+
+
+# ------------------------------------------------------------
+# Minimal CSS tree
+# ------------------------------------------------------------
+@dataclass
+class Node:
+    prelude: str
+    body: str | None = None  # raw declarations (rules, @font-face, @keyframes)
+    children: list["Node"] | None = None  # nested rules (@media, @supports)
+
+    @property
+    def is_at(self) -> bool:
+        return self.prelude.startswith("@")
+
+
+def _skip_string_or_comment(css: str, i: int) -> int:
+    ch = css[i]
+    if css.startswith("/*", i):
+        end = css.find("*/", i + 2)
+        return len(css) if end == -1 else end + 2
+    if ch in "'\"":
+        j = i + 1
+        while j < len(css) and css[j] != ch:
+            j += 2 if css[j] == "\\" else 1
+        return j + 1
+    return i
+
+
+def _match_brace(css: str, i: int) -> int:
+    """i is just after '{'; return the index of the matching '}'."""
+    depth = 1
+    while i < len(css):
+        j = _skip_string_or_comment(css, i)
+        if j != i:
+            i = j
+            continue
+        if css[i] == "{":
+            depth += 1
+        elif css[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return len(css)
+
+
+def parse_css(css: str) -> list[Node]:
+    nodes: list[Node] = []
+    i = 0
+    start = 0
+    while i < len(css):
+        j = _skip_string_or_comment(css, i)
+        if j != i:
+            if css.startswith("/*", i) and not css[start:i].strip():
+                start = j  # drop comments between rules
+            i = j
+            continue
+        ch = css[i]
+        if ch == ";" and css[start:i].strip().startswith("@"):
+            nodes.append(Node(css[start:i].strip()))
+            start = i = i + 1
+            continue
+        if ch == "{":
+            prelude = re.sub(r"/\*.*?\*/", "", css[start:i], flags=re.DOTALL).strip()
+            end = _match_brace(css, i + 1)
+            inner = css[i + 1:end]
+            if prelude.lower().startswith(BLOCK_AT_RULES):
+                nodes.append(Node(prelude, children=parse_css(inner)))
+            else:
+                nodes.append(Node(prelude, body=inner.strip()))
+            start = i = end + 1
+            continue
+        i += 1
+    return nodes
+
+
+def _squeeze(body: str) -> str:
+    """Drop comments and collapse whitespace, leaving string literals untouched."""
+    parts = re.split(r"(\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*')", body)
+    for k in range(0, len(parts), 2):
+        code = re.sub(r"/\*.*?\*/", "", parts[k], flags=re.DOTALL)
+        parts[k] = re.sub(r"\s*([;:{}])\s*", r"\1", re.sub(r"\s+", " ", code))
+    return "".join(parts).strip()
+
+
+def serialize(nodes: list[Node]) -> str:
+    out = []
+    for n in nodes:
+        if n.children is not None:
+            inner = serialize(n.children)
+            if inner:
+                out.append(f"{n.prelude}{{\n{inner}}}\n")
+        elif n.body is None:
+            out.append(f"{n.prelude};\n")
+        else:
+            out.append(f"{n.prelude}{{{_squeeze(n.body)}}}\n")
+    return "".join(out)
+
+
+# ------------------------------------------------------------
+# Usage sets
+# ------------------------------------------------------------
+@dataclass
+class Usage:
+    classes: set[str] = field(default_factory=set)
+    ids: set[str] = field(default_factory=set)
+    tags: set[str] = field(default_factory=set)
+
+    def update(self, other: "Usage") -> "Usage":
+        self.classes |= other.classes
+        self.ids |= other.ids
+        self.tags |= other.tags
+        return self
+
+
+def markup_usage(html: str) -> Usage:
+    u = Usage()
+    for m in CLASS_ATTR_RE.finditer(html):
+        u.classes.update(m.group("v").split())
+    for m in ID_ATTR_RE.finditer(html):
+        u.ids.add(m.group("v").strip())
+    u.tags.update(t.lower() for t in TAG_RE.findall(html))
+    return u
+
+
+def script_usage(script_dir: Path) -> Usage:
+    """Every identifier-like token inside a JS string literal may be a class or id."""
+    u = Usage()
+    for path in sorted(script_dir.glob("*.js")):
+        text = path.read_text(encoding="utf-8", errors="replace")
+        for m in JS_STRING_RE.finditer(text):
+            lit = m.group(0)[1:-1]
+            tokens = TOKEN_RE.findall(lit)
+            u.classes.update(tokens)
+            u.ids.update(tokens)
+            u.tags.update(t.lower() for t in TAG_RE.findall(lit))
+        u.tags.update(t.lower() for t in re.findall(r"createElement\(\s*['\"]([a-zA-Z][\w-]*)", text))
+    return u
+
+
+def _split_selectors(prelude: str) -> list[str]:
+    out, depth, cur = [], 0, []
+    for ch in prelude:
+        if ch in "([":
+            depth += 1
+        elif ch in ")]":
+            depth -= 1
+        if ch == "," and depth == 0:
+            out.append("".join(cur))
+            cur = []
+        else:
+            cur.append(ch)
+    out.append("".join(cur))
+    return [s.strip() for s in out if s.strip()]
+
+
+def selector_used(selector: str, usage: Usage) -> bool:
+    s = ATTR_SEL_RE.sub("", selector)
+    s = PSEUDO_FN_RE.sub("", s)  # :not(.x), :is(...), :nth-child(2n) never force a drop
+    s = PSEUDO_RE.sub("", s)
+    for c in SEL_CLASS_RE.findall(s):
+        if c.replace("\\", "") not in usage.classes and c not in ALWAYS_USED_CLASSES:
+            return False
+    for i in SEL_ID_RE.findall(s):
+        if i.replace("\\", "") not in usage.ids:
+            return False
+    bare = SEL_CLASS_RE.sub("", SEL_ID_RE.sub("", s))
+    for t in SEL_TAG_RE.findall(bare):
+        t = t.lower()
+        if t not in usage.tags and t not in ALWAYS_USED_TAGS:
+            return False
+    return True
+
+
+def prune(nodes: list[Node], usage: Usage, keep_fonts: bool = True) -> list[Node]:
+    kept: list[Node] = []
+    keyframes: list[Node] = []
+    for n in nodes:
+        p = n.prelude.lower()
+        if n.children is not None:
+            children = prune(n.children, usage, keep_fonts)
+            if children:
+                kept.append(Node(n.prelude, children=children))
+        elif KEYFRAMES_RE.match(n.prelude):
+            keyframes.append(n)
+        elif p.startswith("@font-face"):
+            if keep_fonts:
+                kept.append(n)
+        elif n.is_at:
+            kept.append(n)  # @import, @charset, @page, @property ...
+        elif any(selector_used(sel, usage) for sel in _split_selectors(n.prelude)):
+            kept.append(n)
+
+    used_animations = set()
+    for text in _declarations(kept):
+        for m in ANIMATION_RE.finditer(text):
+            used_animations.update(TOKEN_RE.findall(m.group("v")))
+    for kf in keyframes:
+        if KEYFRAMES_RE.match(kf.prelude).group("name") in used_animations:
+            kept.append(kf)
+    return kept
+
+
+def _declarations(nodes: list[Node]):
+    for n in nodes:
+        if n.children is not None:
+            yield from _declarations(n.children)
+        elif n.body:
+            yield n.body
+
+
+# ------------------------------------------------------------
+# Pages
+# ------------------------------------------------------------
+def fold_markup(html: str, fold_bytes: int) -> str:
+    m = BODY_RE.search(html)
+    start = m.end() if m else 0
+    return html[:start + fold_bytes]
+
+
+def critical_within(tree: list[Node], html: str, fold_bytes: int, budget: int) -> tuple[str, int]:
+    """(inline CSS, fold used): the largest fold <= fold_bytes whose critical CSS fits budget."""
+
+    def build(fold: int) -> str:
+        return inline_css(serialize(prune(tree, markup_usage(fold_markup(html, fold)))))
+
+    critical = build(fold_bytes)
+    if len(critical.encode("utf-8")) <= budget or fold_bytes <= 0:
+        return critical, fold_bytes
+    lo, hi = 0, fold_bytes  # the size only grows with the fold: bisect on it
+    best = build(0)
+    while hi - lo > 64:
+        mid = (lo + hi) // 2
+        css = build(mid)
+        if len(css.encode("utf-8")) <= budget:
+            lo, best = mid, css
+        else:
+            hi = mid
+    return best, lo
+
+
+def inline_css(css: str) -> str:
+    # The inline block lives in the page (repo root), site.css in styles/.
+    return URL_RE.sub(lambda m: f"url({m.group('q')}{m.group('path')[3:]}{m.group('q')})", css)
+
+
+def rewrite_page(html: str, critical: str, deferred_href: str) -> str | None:
+    m = LINK_RE.search(html)
+    if not m:
+        return None
+    indent, nl = m.group("indent"), m.group("nl") or "\n"
+    block = (
+        f"{indent}<style data-critical>{nl}{critical.replace(chr(10), nl)}</style>{nl}"
+        f"{indent}<link rel=\"preload\" as=\"style\" href=\"{deferred_href}\" onload=\"this.onload=null;this.rel='stylesheet'\" />{nl}"
+        f"{indent}<noscript><link rel=\"stylesheet\" href=\"{deferred_href}\" /></noscript>{nl}"
+    )
+    return html[:m.start()] + block + html[m.end():]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Critical CSS + pruned deferred site.css per page.")
+    ap.add_argument("--css", type=Path, default=CSS_FILE)
+    ap.add_argument("--pages-dir", type=Path, default=ROOT, help="Where to read the *.html pages from")
+    ap.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR)
+    ap.add_argument("--fold-bytes", type=int, default=FOLD_BYTES, help="Body markup treated as above the fold (at most)")
+    ap.add_argument("--budget", type=int, default=CRITICAL_BUDGET, help="Max bytes of inline critical CSS per page")
+    ap.add_argument("--report-only", action="store_true")
+    add_profile_arguments(ap)
+    args = ap.parse_args()
+    with profile_session("critical_css", args):
+        return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    with stage("parse_css"):
+        css_text = args.css.read_text(encoding="utf-8")
+        tree = parse_css(css_text)
+    with stage("script_usage"):
+        js = script_usage(ROOT / "scripts")
+    full_bytes = len(css_text.encode("utf-8"))
+
+    pages = []
+    for page in sorted(args.pages_dir.glob("*.html")):
+        html = page.read_bytes().decode("utf-8")  # keep CRLF line endings
+        if LINK_RE.search(html):
+            pages.append((page, html))
+
+    # One deferred sheet for every page: a second page is then a cache hit, not another download.
+    with stage("prune", page="*"):
+        usage = Usage().update(js)
+        for _, html in pages:
+            usage.update(markup_usage(html))
+        deferred = serialize(prune(tree, usage))
+    d_bytes = len(deferred.encode("utf-8"))
+    removed = full_bytes - d_bytes
+    # Named after the content, so a changed sheet never hits a stale cache entry.
+    css_name = f"site.{hashlib.sha1(deferred.encode('utf-8')).hexdigest()[:8]}.css"
+
+    print(f"🔍 {args.css.name}: {_bytes(full_bytes)}, {len(tree)} top-level rules; {len(js.classes)} JS string tokens")
+    print(f"   shared deferred sheet styles/{css_name}: {_bytes(d_bytes)} ({_bytes(removed)}, {100 * removed / full_bytes:4.1f}% removed)")
+    print(f"{'page':<20} {'critical':>10} {'fold':>7}")
+    over_budget = []
+    for page, html in pages:
+        with stage("critical", page=page.name):
+            critical, fold = critical_within(tree, html, args.fold_bytes, args.budget)
+        c_bytes = len(critical.encode("utf-8"))
+        print(f"{page.name:<20} {_bytes(c_bytes):>10} {fold:>7}")
+        if c_bytes > args.budget:
+            over_budget.append(page.name)
+
+        if args.report_only:
+            continue
+        with (args.out_dir / page.name).open("w", encoding="utf-8", newline="") as f:
+            f.write(rewrite_page(html, critical, f"styles/{css_name}"))
+
+    if not args.report_only and pages:
+        styles = args.out_dir / "styles"
+        styles.mkdir(parents=True, exist_ok=True)
+        (styles / css_name).write_text(deferred, encoding="utf-8")
+        stems = {page.stem for page, _ in pages}
+        for stale in styles.glob("site.*.css"):
+            # site.<page>.css: the per-page names earlier builds used
+            if stale.name != css_name and (DEFERRED_RE.match(stale.name) or stale.stem[5:] in stems):
+                stale.unlink()
+        print(f"\n✅ Pages + pruned stylesheet written to {args.out_dir}")
+    for name in over_budget:
+        print(f"❌ {name}: inline critical CSS over the {_bytes(args.budget)} budget even with an empty fold")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
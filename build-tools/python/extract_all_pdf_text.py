@@ -16,7 +16,7 @@ def extract_pdf_text(pdf_path: Path) -> str:
 
 
 def main() -> None:
-    root = Path(__file__).resolve().parents[1]
+    root = Path(__file__).resolve().parents[2]
     outdir = root / "notes" / "pdf_text"
     outdir.mkdir(parents=True, exist_ok=True)
 
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Content-hashed filenames for static assets (name.<hash>.ext) + reference rewrite.
+
+For every root *.html page (read from --pages-dir, so it can run after
+bundle_site_js.py / critical_css.py wrote dist/):
+1. collect local references: src / href / poster attributes and the
+   audit_assets regexes (quoted "assets/..." strings, url(assets/...));
+2. stylesheets are processed first-hand: their url()s (fonts, images) are
+   fingerprinted and rewritten, then the rewritten CSS itself is hashed;
+3. each referenced JS / CSS / image / font / audio file is copied to
+   --out-dir as name.<sha256[:10]>.ext and the page is rewritten to point at
+   it (the ?v= cache-buster is dropped, the hash replaces it).
+
+Originals are copied alongside, so URLs built at runtime in JS
+('scripts/avatar-manifest.js?v=' + ...) keep resolving.
+
+Outputs in --out-dir:
+- asset-manifest.json   original path -> hashed path
+- _headers              Cloudflare Pages / Netlify format: hashed files get
+                        "public, max-age=31536000, immutable", pages "no-cache"
+
+Usage:
+  python build-tools/python/fingerprint_assets.py
+  python build-tools/python/fingerprint_assets.py --pages-dir dist --out-dir dist
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from urllib.parse import quote, unquote, urlsplit
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from audit_assets import RE_PATTERNS, _bytes  # noqa: E402
+from perf_trace import add_profile_arguments, count, profile_session, stage  # noqa: E402
+
+DEFAULT_OUT_DIR = ROOT / "dist"
+HASH_EXTS = {
+    ".js", ".css",
+    ".png", ".jpg", ".jpeg", ".webp", ".avif", ".gif", ".svg",
+    ".woff2", ".woff", ".otf", ".ttf",
+    ".mp3", ".opus", ".m4a",
+}
+HASH_LEN = 10
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+ATTR_RE = re.compile(r"\b(?:src|href|poster)=(?P<q>[\"'])(?P<path>[^\"']+)(?P=q)", re.IGNORECASE)
+CSS_URL_RE = re.compile(r"url\(\s*(?P<q>['\"]?)(?P<path>[^'\")]+)(?P=q)\s*\)", re.IGNORECASE)
+HTML_PATTERNS = (ATTR_RE, *RE_PATTERNS)
+HASHED_NAME_RE = re.compile(rf"\.[0-9a-f]{{{HASH_LEN}}}\.[a-z0-9]+$")
+
+
+def _relative_dir(base_dir: Path, roots: tuple[Path, ...]) -> Path:
+    for root in roots:
+        if base_dir.is_relative_to(root):
+            return base_dir.relative_to(root)
+    return Path()
+
+
+class Fingerprinter:
+    def __init__(self, pages_dir: Path, out_dir: Path) -> None:
+        self.pages_dir = pages_dir
+        self.out_dir = out_dir
+        self.mapping: dict[str, str] = {}  # rel original -> rel hashed
+        self.hashed: set[str] = set()
+
+    def locate(self, raw: str, base_dir: Path) -> tuple[Path, str] | None:
+        """Resolve a reference to (file on disk, path relative to the site root)."""
+        parts = urlsplit(raw)
+        if parts.scheme or parts.netloc or raw.startswith(("data:", "//", "#")):
+            return None
+        path = unquote(parts.path)
+        if not path or Path(path).suffix.lower() not in HASH_EXTS or HASHED_NAME_RE.search(path):
+            return None
+        rel_dir = _relative_dir(base_dir, (self.pages_dir, ROOT))
+        for root in (self.pages_dir, ROOT):
+            candidate = (root / rel_dir / path).resolve()
+            if candidate.is_file():
+                try:
+                    return candidate, candidate.relative_to(root).as_posix()
+                except ValueError:
+                    return None
+        return None
+
+    def fingerprint(self, src: Path, rel: str) -> str:
+        if rel in self.mapping:
+            count("cache_hits")
+            return self.mapping[rel]
+        data = src.read_bytes()
+        if src.suffix.lower() == ".css":
+            text = self.rewrite(data.decode("utf-8"), src.parent, (CSS_URL_RE,))
+            data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()[:HASH_LEN]
+        rel_path = Path(rel)
+        hashed = rel_path.with_name(f"{rel_path.stem}.{digest}{rel_path.suffix}").as_posix()
+        for name, payload in ((hashed, data), (rel, src.read_bytes())):
+            dest = self.out_dir / name
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            if dest.resolve() != src.resolve():
+                dest.write_bytes(payload)
+        self.mapping[rel] = hashed
+        self.hashed.add(hashed)
+        return hashed
+
+    def rewrite(self, text: str, base_dir: Path, patterns) -> str:
+        def repl(m: re.Match) -> str:
+            raw = m.group("path")
+            found = self.locate(raw, base_dir)
+            if found is None or found[1] in self.hashed:
+                return m.group(0)  # external, not fingerprintable, or already rewritten
+            hashed = self.fingerprint(*found)
+            parts = urlsplit(raw)
+            old_name = parts.path.rsplit("/", 1)[-1]
+            new_name = hashed.rsplit("/", 1)[-1]
+            if "%" in old_name:
+                new_name = quote(new_name)
+            new_path = parts.path[: len(parts.path) - len(old_name)] + new_name
+            new_ref = new_path + (f"#{parts.fragment}" if parts.fragment else "")
+            s, e = m.start("path") - m.start(0), m.end("path") - m.start(0)
+            return m.group(0)[:s] + new_ref + m.group(0)[e:]
+
+        for rx in patterns:
+            text = rx.sub(repl, text)
+        return text
+
+
+def write_headers(out_dir: Path, mapping: dict[str, str]) -> None:
+    lines = ["/", "  Cache-Control: no-cache", "/*.html", "  Cache-Control: no-cache", ""]
+    for hashed in sorted(mapping.values()):
+        lines += [f"/{quote(hashed)}", f"  Cache-Control: {IMMUTABLE}", ""]
+    (out_dir / "_headers").write_text("\n".join(lines), encoding="utf-8")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Copy assets to content-hashed names and rewrite page references.")
+    ap.add_argument("--pages-dir", type=Path, default=ROOT, help="Where to read the *.html pages from")
+    ap.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR)
+    add_profile_arguments(ap)
+    args = ap.parse_args()
+    with profile_session("fingerprint_assets", args):
+        return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    pages_dir, out_dir = args.pages_dir.resolve(), args.out_dir.resolve()
+    pages = sorted(pages_dir.glob("*.html"))
+    if not pages:
+        print(f"❌ No HTML pages found in {pages_dir}")
+        return 1
+
+    fp = Fingerprinter(pages_dir, out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for page in pages:
+        before = len(fp.mapping)
+        text = page.read_bytes().decode("utf-8")  # keep CRLF pages byte-identical outside the rewrites
+        with stage("rewrite", page=page.name):
+            rewritten = fp.rewrite(text, pages_dir, HTML_PATTERNS)
+        with (out_dir / page.name).open("w", encoding="utf-8", newline="") as f:
+            f.write(rewritten)
+        print(f"  {page.name:<22} {len(fp.mapping) - before:>3} new assets")
+
+    (out_dir / "asset-manifest.json").write_text(json.dumps(fp.mapping, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    write_headers(out_dir, fp.mapping)
+    total = sum((out_dir / h).stat().st_size for h in fp.mapping.values())
+    print(f"\n📊 {len(fp.mapping)} fingerprinted files ({_bytes(total)}) can be served with '{IMMUTABLE}'")
+    print(f"✅ Pages, asset-manifest.json and _headers written to {out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -15,6 +15,7 @@ Outputs:
 
 from __future__ import annotations
 
+import argparse
 import json
 import os
 import re
@@ -22,7 +23,9 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
+from perf_trace import add_profile_arguments, profile_session, stage
+
+ROOT = Path(__file__).resolve().parents[2]
 NOTES_DIR = ROOT / "notes"
 
 HTML_PAGES = [
@@ -537,19 +540,26 @@ def write_outputs(items: list[ImageItem]) -> None:
 
 
 def main() -> None:
-    items = build_pack()
-
-    # De-duplicate exact same asset refs (e.g. repeated img tags) keeping the first.
-    seen: set[tuple[str | None, str | None, str]] = set()
-    unique: list[ImageItem] = []
-    for it in items:
-        key = (it.asset_webp, it.asset_img, it.title)
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(it)
+    ap = argparse.ArgumentParser(description="Generate the image inventory + prompt pack (notes/image-pack.*).")
+    add_profile_arguments(ap)
+    args = ap.parse_args()
+
+    with profile_session("generate_image_pack", args):
+        with stage("build_pack"):
+            items = build_pack()
+
+        # De-duplicate exact same asset refs (e.g. repeated img tags) keeping the first.
+        seen: set[tuple[str | None, str | None, str]] = set()
+        unique: list[ImageItem] = []
+        for it in items:
+            key = (it.asset_webp, it.asset_img, it.title)
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(it)
 
-    write_outputs(unique)
+        with stage("write_outputs", items=len(unique)):
+            write_outputs(unique)
     print(f"Generated {len(unique)} items -> notes/image-pack.md + notes/image-pack.json")
 
 
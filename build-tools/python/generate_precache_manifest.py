@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Generate a service-worker precache manifest (url + content revision + tier).
+
+Walks what the site actually ships, starting from the *.html pages of
+--pages-dir (the repo root, or dist/ after the dist build: then the URLs are
+the bundled chunks, pruned stylesheets and name.<hash>.ext files the dist
+pages really request, not the unbundled sources):
+- scripts / styles / json reached from the pages (audit_reachability.crawl)
+- fonts referenced by url() in the reached stylesheets
+- assets/... referenced by the pages, reached JS and CSS (audit_assets.references_in)
+
+Files listed as fingerprinted in --pages-dir/asset-manifest.json
+(fingerprint_assets.py) take the hash in their name as revision: the URL
+already changes with the content.
+
+Every entry gets a revision = first 12 hex chars of its sha256, so a service
+worker can keep serving cached bytes across visits and re-download only the
+entries whose revision changed. URLs carry no ?v= query: match requests with
+{ignoreSearch: true}.
+
+Tiers:
+- core: the app shell, precached on install: pages, the scripts/styles a page
+        loads directly (whatever their size), and any other JS, CSS, JSON or
+        font up to --core-max-bytes
+- lazy: everything else (images, audio, large lazily-loaded bundles), cached
+        on first use
+
+Usage:
+  python build-tools/python/generate_precache_manifest.py
+  python build-tools/python/generate_precache_manifest.py --out dist/precache-manifest.json --core-max-bytes 200000
+  python build-tools/python/generate_precache_manifest.py --pages-dir dist      # after the dist build
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "build-tools"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from audit_assets import _bytes, references_in  # noqa: E402
+from audit_reachability import crawl, read, rel, resolve_ref  # noqa: E402
+from perf_trace import add_profile_arguments, profile_session, stage  # noqa: E402
+
+DEFAULT_OUT = ROOT / "dist" / "precache-manifest.json"
+ASSET_MANIFEST = "asset-manifest.json"
+CORE_MAX_BYTES = 150_000
+CORE_EXTS = {".html", ".js", ".css", ".json", ".woff2", ".woff", ".otf", ".ttf", ".ico", ".svg"}
+# Debug/utility pages are not part of the app shell.
+EXCLUDED_PAGES = {"debug-carousel.html"}
+
+CSS_URL_RE = re.compile(r"url\(\s*(?P<q>['\"]?)(?P<path>[^'\")]+)(?P=q)\s*\)", re.IGNORECASE)
+HASHED_NAME_RE = re.compile(r"\.(?P<hash>[0-9a-f]{10})\.[a-z0-9]+$")
+
+
+def revision(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+
+
+def load_hashed(site_root: Path) -> set[str]:
+    """Fingerprinted URLs (the values of asset-manifest.json), empty when there is none."""
+    try:
+        return set(json.loads((site_root / ASSET_MANIFEST).read_text(encoding="utf-8")).values())
+    except (OSError, ValueError, AttributeError):
+        return set()
+
+
+def shipped_files(pages: list[Path], site_root: Path = ROOT) -> dict[str, str]:
+    """rel path -> first referrer, for every local file a page can load."""
+    reach = crawl(pages, site_root)
+    files = {k: v for k, v in reach.reached.items() if (site_root / k).is_file()}
+    for key in list(files):
+        path = site_root / key
+        if path.suffix.lower() not in (".html", ".js", ".css"):
+            continue
+        text = read(path)
+        if path.suffix.lower() == ".css":
+            for m in CSS_URL_RE.finditer(text):
+                target = resolve_ref(m.group("path"), path.parent, site_root)
+                if target is not None and target.is_file():
+                    files.setdefault(rel(target, site_root), key)
+        for ref in references_in(text):
+            if (site_root / ref).is_file():
+                files.setdefault(ref, key)
+    return files
+
+
+def build_manifest(pages: list[Path], core_max_bytes: int, site_root: Path = ROOT) -> dict:
+    entries = []
+    files = shipped_files(pages, site_root)
+    hashed = load_hashed(site_root)
+    for key in sorted(files):
+        path = site_root / key
+        size = path.stat().st_size
+        shell = files[key] == "(entry)" or files[key].endswith(".html")
+        core = path.suffix.lower() in CORE_EXTS and (shell or size <= core_max_bytes)
+        m = HASHED_NAME_RE.search(key) if key in hashed else None
+        rev = m.group("hash") if m else revision(path)
+        entries.append({"url": key, "revision": rev, "bytes": size, "tier": "core" if core else "lazy"})
+
+    version = hashlib.sha256("".join(e["url"] + e["revision"] for e in entries).encode("utf-8")).hexdigest()[:12]
+    totals = {
+        tier: {"files": sum(1 for e in entries if e["tier"] == tier), "bytes": sum(e["bytes"] for e in entries if e["tier"] == tier)}
+        for tier in ("core", "lazy")
+    }
+    return {"version": version, "coreMaxBytes": core_max_bytes, "totals": totals, "entries": entries}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Generate a hashed service-worker precache manifest.")
+    ap.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    ap.add_argument("--pages-dir", type=Path, default=ROOT, help="Site root to walk from its *.html pages (dist after a build)")
+    ap.add_argument("--core-max-bytes", type=int, default=CORE_MAX_BYTES, help="Largest file precached on install")
+    add_profile_arguments(ap)
+    args = ap.parse_args()
+
+    site_root = args.pages_dir.resolve()
+    pages = [p for p in sorted(site_root.glob("*.html")) if p.name not in EXCLUDED_PAGES]
+    if not pages:
+        print(f"❌ No HTML pages found in {site_root}.")
+        return 1
+
+    with profile_session("generate_precache_manifest", args), stage("build_manifest"):
+        manifest = build_manifest(pages, args.core_max_bytes, site_root)
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+    for tier, t in manifest["totals"].items():
+        print(f"📊 {tier:<5} {t['files']:>4} files  {_bytes(t['bytes']):>9}")
+    heaviest = sorted((e for e in manifest["entries"] if e["tier"] == "lazy"), key=lambda e: -e["bytes"])[:5]
+    for e in heaviest:
+        print(f"   lazy  {_bytes(e['bytes']):>9}  {e['url']}")
+    print(f"✅ Precache manifest v{manifest['version']} written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
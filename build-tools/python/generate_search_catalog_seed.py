@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""Generate scripts/search-catalog-seed.js from the guide cards in the root *.html pages.
+
+The seed used to be a hand-maintained object literal; now it is derived from the
+markup with the same rules the runtime hydrator in site.js uses:
+- cardKey from id="card-<key>" (else slugified <h3> title), via audit_deeplinks.extract_cards
+- category from the page <h1>
+- signals (sicurezza/chiusura/upselling) from title + .tag-row + .details text
+
+It also emits a per-language search index (window.__BADIANI_SEARCH_INDEX__):
+- names[doc]: the lowercased haystack the menu search matches against
+  (title in that language + markup title + category + intents)
+- prefix: token prefixes (1-2 chars) -> docs, for short queries
+- tri:    3-char windows of names -> docs, for queries of 3+ chars
+Posting lists are delta-encoded base36 ids joined by ",".
+
+Usage:
+  python build-tools/python/generate_search_catalog_seed.py
+  python build-tools/python/generate_search_catalog_seed.py --check
+  python build-tools/python/generate_search_catalog_seed.py --debug-json scripts/search-catalog-seed.debug.json
+
+Exit code (--check)
+  0: seed is up to date
+  1: seed differs from the markup (rerun without --check)
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import json
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from audit_deeplinks import ARTICLE_RE, TAG_RE, extract_cards  # noqa: E402
+from i18n_dict import LANGS, load_i18n_dict  # noqa: E402
+from perf_trace import add_profile_arguments, profile_session, stage  # noqa: E402
+
+OUTPUT_FILE = ROOT / "scripts" / "search-catalog-seed.js"
+STORAGE_KEY = "badianiSearchCatalog.v2"
+
+# Same exclusions as audit_deeplinks + the hub (site.js never hydrates index.html).
+EXCLUDE_PAGES = {"debug-carousel.html", "quiz-solution.html", "index.html", "index_new.html"}
+
+H1_RE = re.compile(r"<h1\b(?P<attrs>[^>]*)>(?P<text>.*?)</h1>", re.IGNORECASE | re.DOTALL)
+H3_OPEN_RE = re.compile(r"<h3\b(?P<attrs>[^>]*)>", re.IGNORECASE)
+I18N_ATTR_RE = re.compile(r"\bdata-i18n=\"(?P<key>[^\"]+)\"", re.IGNORECASE)
+TAG_ROW_RE = re.compile(r"<span\b[^>]*class=\"[^\"]*\btag\b[^\"]*\"[^>]*>(?P<t>.*?)</span>", re.IGNORECASE | re.DOTALL)
+DETAILS_RE = re.compile(r"<div\b[^>]*class=\"[^\"]*\bdetails\b[^\"]*\"[^>]*>(?P<body>.*)", re.IGNORECASE | re.DOTALL)
+TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+PREFIX_MAX = 2
+NGRAM = 3
+
+
+def _text(fragment: str) -> str:
+    return re.sub(r"\s+", " ", html.unescape(TAG_RE.sub(" ", fragment or ""))).strip()
+
+
+def normalize(value: str) -> str:
+    # Mirrors normalize() in the site.js menu search: lowercase + trim only.
+    return (value or "").lower().strip()
+
+
+def card_signals(title: str, body: str) -> dict[str, bool]:
+    tags = " ".join(_text(m.group("t")) for m in TAG_ROW_RE.finditer(body))
+    details_m = DETAILS_RE.search(body)
+    details = _text(details_m.group("body")) if details_m else ""
+    norm = f"{title} {tags} {details}".lower()
+    return {
+        "sicurezza": "sicurezza" in norm or "safety" in norm,
+        "chiusura": "chiusura" in norm or "closing" in norm,
+        "upselling": "upselling" in norm or "upsell" in norm,
+    }
+
+
+def extract_page(path: Path) -> dict:
+    content = path.read_text(encoding="utf-8", errors="replace")
+    page = path.name
+
+    h1 = H1_RE.search(content)
+    category = _text(h1.group("text")) if h1 else page[: -len(".html")]
+    category_key = ""
+    if h1:
+        km = I18N_ATTR_RE.search(h1.group("attrs") or "")
+        category_key = km.group("key") if km else ""
+
+    cards = []
+    bodies = [m.group("body") or "" for m in ARTICLE_RE.finditer(content)]
+    for card, body in zip(extract_cards(str(path), content), bodies):
+        if not card.title or not card.card_key:
+            continue
+        h3 = H3_OPEN_RE.search(body)
+        key_m = I18N_ATTR_RE.search(h3.group("attrs")) if h3 else None
+        cards.append(
+            {
+                "title": card.title,
+                "cardKey": card.card_key,
+                "titleKey": key_m.group("key") if key_m else "",
+                "signals": card_signals(card.title, body),
+            }
+        )
+
+    return {"href": page, "category": category, "categoryKey": category_key, "cards": cards}
+
+
+def collect_pages(root: Path = ROOT) -> dict[str, dict]:
+    pages: dict[str, dict] = {}
+    for path in sorted(root.glob("*.html")):
+        if path.name in EXCLUDE_PAGES:
+            continue
+        pages[path.name] = extract_page(path)
+    return pages
+
+
+def _encode_postings(ids: list[int]) -> str:
+    out = []
+    prev = 0
+    for i in ids:
+        out.append(_b36(i - prev))
+        prev = i
+    return ",".join(out)
+
+
+def _b36(n: int) -> str:
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    if n == 0:
+        return "0"
+    s = ""
+    while n:
+        n, r = divmod(n, 36)
+        s = digits[r] + s
+    return s
+
+
+def build_index(pages: dict[str, dict], i18n: dict[str, dict[str, str]]) -> dict:
+    docs: list[list] = []
+    page_keys = list(pages)
+    for p_idx, page_key in enumerate(page_keys):
+        for card in pages[page_key]["cards"]:
+            docs.append([p_idx, card["cardKey"]])
+
+    langs: dict[str, dict] = {}
+    for lang in LANGS:
+        strings = i18n.get(lang, {})
+        names: list[str] = []
+        prefix: dict[str, set[int]] = {}
+        tri: dict[str, set[int]] = {}
+
+        for page_key in page_keys:
+            page = pages[page_key]
+            category = strings.get(page["categoryKey"], "") or page["category"]
+            for card in page["cards"]:
+                title = strings.get(card["titleKey"], "") if card["titleKey"] else ""
+                title = _text(title) if title else card["title"]
+                intents = " ".join(k for k, v in card["signals"].items() if v)
+                parts = [title]
+                if normalize(card["title"]) != normalize(title):
+                    parts.append(card["title"])
+                if normalize(category) != normalize(page["category"]):
+                    parts.append(page["category"])
+                parts += [category, intents]
+                name = normalize(" ".join(p for p in parts if p))
+                doc = len(names)
+                names.append(name)
+
+                for tok in TOKEN_RE.findall(name):
+                    for n in range(1, min(PREFIX_MAX, len(tok)) + 1):
+                        prefix.setdefault(tok[:n], set()).add(doc)
+                for i in range(len(name) - NGRAM + 1):
+                    tri.setdefault(name[i : i + NGRAM], set()).add(doc)
+
+        langs[lang] = {
+            "names": names,
+            "prefix": {k: _encode_postings(sorted(v)) for k, v in sorted(prefix.items())},
+            "tri": {k: _encode_postings(sorted(v)) for k, v in sorted(tri.items())},
+        }
+
+    return {"v": 1, "pages": page_keys, "docs": docs, "langs": langs}
+
+
+JS_TEMPLATE = """(function(){
+  'use strict';
+  // Auto-generated by build-tools/python/generate_search_catalog_seed.py - do not edit by hand.
+  var KEY = '__KEY__';
+  var nowIso = new Date().toISOString();
+  var SEED = { updatedAt: nowIso, pages: __PAGES__ };
+  var INDEX = __INDEX__;
+
+  try { window.__BADIANI_SEARCH_CATALOG_SEED__ = SEED; } catch (e) {}
+  try { window.__BADIANI_SEARCH_INDEX__ = INDEX; } catch (e) {}
+
+  function safeParse(raw) {
+    try { return JSON.parse(raw); } catch (e) { return null; }
+  }
+
+  try {
+    var catalog = safeParse(localStorage.getItem(KEY));
+    if (!catalog || typeof catalog !== 'object') catalog = {};
+    if (!catalog.pages || typeof catalog.pages !== 'object') catalog.pages = {};
+
+    var seedPages = SEED.pages || {};
+    Object.keys(seedPages).forEach(function(pageKey) {
+      var sp = seedPages[pageKey];
+      var ep = catalog.pages[pageKey];
+      if (!ep || typeof ep !== 'object') {
+        catalog.pages[pageKey] = sp;
+        return;
+      }
+
+      if (!ep.href) ep.href = sp.href;
+      if (!ep.category) ep.category = sp.category;
+      if (!ep.updatedAt) ep.updatedAt = sp.updatedAt;
+
+      var ec = Array.isArray(ep.cards) ? ep.cards : [];
+      var sc = Array.isArray(sp.cards) ? sp.cards : [];
+      var byKey = {};
+      ec.forEach(function(c) { if (c && c.cardKey) byKey[String(c.cardKey)] = true; });
+      sc.forEach(function(c) {
+        if (c && c.cardKey && !byKey[String(c.cardKey)]) {
+          ec.push(c);
+          byKey[String(c.cardKey)] = true;
+        }
+      });
+      ep.cards = ec;
+      catalog.pages[pageKey] = ep;
+    });
+
+    catalog.updatedAt = nowIso;
+    localStorage.setItem(KEY, JSON.stringify(catalog));
+  } catch (e) {
+    /* ignore */
+  }
+})();
+"""
+
+
+def _compact(value: object) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def render_seed_js(pages: dict[str, dict], index: dict) -> str:
+    seed_pages = {
+        key: {"href": p["href"], "category": p["category"], "updatedAt": "__NOW__", "cards": p["cards"]}
+        for key, p in pages.items()
+    }
+    pages_js = _compact(seed_pages).replace('"updatedAt":"__NOW__"', '"updatedAt":nowIso')
+    return (
+        JS_TEMPLATE.replace("__KEY__", STORAGE_KEY)
+        .replace("__PAGES__", pages_js)
+        .replace("__INDEX__", _compact(index))
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Generate the search catalog seed + index from the HTML cards.")
+    ap.add_argument("--out", type=Path, default=OUTPUT_FILE)
+    ap.add_argument("--check", action="store_true", help="Fail if --out is not up to date")
+    ap.add_argument("--debug-json", type=Path, default=None, help="Also dump the catalog pages as readable JSON")
+    add_profile_arguments(ap)
+    args = ap.parse_args()
+
+    with profile_session("generate_search_catalog_seed", args):
+        with stage("collect_pages"):
+            pages = collect_pages()
+        with stage("build_index"):
+            index = build_index(pages, load_i18n_dict())
+        with stage("render_seed_js"):
+            js = render_seed_js(pages, index)
+
+    total_cards = sum(len(p["cards"]) for p in pages.values())
+    if args.check:
+        current = args.out.read_text(encoding="utf-8") if args.out.exists() else ""
+        if current != js:
+            print(f"❌ {args.out.name} is out of date ({len(pages)} pages, {total_cards} cards in markup).")
+            return 1
+        print(f"✅ {args.out.name} is up to date.")
+        return 0
+
+    args.out.write_text(js, encoding="utf-8")
+    print(f"✅ Seed written to {args.out} ({len(pages)} pages, {total_cards} cards, {len(js) / 1024:.1f} KB)")
+    for lang, data in index["langs"].items():
+        print(f"   {lang}: {len(data['prefix'])} prefixes, {len(data['tri'])} trigrams")
+
+    if args.debug_json:
+        args.debug_json.write_text(json.dumps({"key": STORAGE_KEY, "pages": pages}, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"   debug dump: {args.debug_json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
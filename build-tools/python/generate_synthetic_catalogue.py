@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Generate a scaled, synthetic copy of the project for scale-testing the tooling.
+
+The output is a project-shaped tree (pages at the root, scripts/, styles/,
+assets/, data/quiz/, q&a files) built from the real files as templates:
+- pages: every root page that has guide cards is copied once per brand
+  (<brand>-<page>.html; brand 1 keeps the real names) and each real card is
+  replaced by generated cards with the same markup: id="card-...", tag row,
+  <h3 data-i18n>, <picture>, data-i18n desc, data-i18n-html stats/details
+- scripts/i18n.js: the real runtime with every generated key added to the
+  it / en / es / fr blocks (one `'key': "value",` per line, as i18n_dict.py
+  parses it); --quiz-i18n also adds quiz.q.tm-/sm- keys for the questions
+- q&a files: q-a-easy-mode-<lang>.txt and "q&a very-easy mode -<lang>.txt"
+  in each language's own markers (Solution / Solución / Réponse : / Soluzione)
+- assets/products/<brand>/<card>.png: one small valid PNG per card
+
+Text is drawn from per-language word pools harvested from the real i18n.js,
+so accents, lengths and tokenisation look like the real copy. --seed makes
+the output reproducible.
+
+Usage:
+  python build-tools/python/generate_synthetic_catalogue.py
+  python build-tools/python/generate_synthetic_catalogue.py --brands 10 --cards-per-page 80 --questions 25000
+  python build-tools/python/generate_synthetic_catalogue.py --out /tmp/catalogue --no-assets --quiz-i18n
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import shutil
+import struct
+import sys
+import zlib
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from audit_assets import _bytes  # noqa: E402
+from audit_deeplinks import ARTICLE_RE, TAG_RE, extract_cards  # noqa: E402
+from i18n_dict import LANGS, load_i18n_dict, parse_i18n_dict  # noqa: E402
+
+DEFAULT_OUT = ROOT / "dist" / "synthetic"
+LANG_BLOCK_RE = re.compile(r"^(?P<indent>\s{2,6})(?P<lang>[a-z]{2})\s*:\s*\{\s*$", re.MULTILINE)
+WORD_RE = re.compile(r"[^\W\d_]{3,}", re.UNICODE)
+ENTITY_RE = re.compile(r"&\w+;")
+
+# (question-file language suffix, answer marker, explanation marker) per mode.
+QUIZ_FILES = {
+    "easy": ("q-a-easy-mode-{name}.txt", {
+        "en": ("english", "Solution:", "Explanation:"),
+        "es": ("spanish", "Solución:", "Explicación:"),
+        "fr": ("french", "Réponse :", "Explication :"),
+        "it": ("italiano", "Soluzione:", "Motivazione:"),
+    }),
+    "very-easy": ("q&a very-easy mode -{name}.txt", {
+        "en": ("english", "Solution:", "Motivation:"),
+        "es": ("spanish", "Solución:", "Motivación:"),
+        "fr": ("french", "Réponse :", "Motivation :"),
+        "it": ("italiano", "Soluzione:", "Motivazione:"),
+    }),
+}
+QUIZ_PREFIX = {"easy": "tm", "very-easy": "sm"}
+COPY_DIRS = ("scripts", "styles", "fonts", "data")
+
+
+def word_pools(i18n: dict[str, dict[str, str]]) -> dict[str, list[str]]:
+    pools = {}
+    for lang in LANGS:
+        counts: Counter[str] = Counter()
+        for value in i18n.get(lang, {}).values():
+            counts.update(w.lower() for w in WORD_RE.findall(ENTITY_RE.sub(" ", TAG_RE.sub(" ", value))))
+        pools[lang] = sorted(counts)
+    return pools
+
+
+class Writer:
+    """Deterministic text + markup generator for one run."""
+
+    def __init__(self, pools: dict[str, list[str]], seed: int) -> None:
+        self.pools = pools
+        self.rng = random.Random(seed)
+
+    def words(self, lang: str, lo: int, hi: int) -> str:
+        return " ".join(self.rng.choices(self.pools[lang], k=self.rng.randint(lo, hi)))
+
+    def sentence(self, lang: str, lo: int = 6, hi: int = 16) -> str:
+        text = self.words(lang, lo, hi)
+        return text[:1].upper() + text[1:] + "."
+
+    def title(self, lang: str) -> str:
+        return " ".join(w.capitalize() for w in self.words(lang, 2, 3).split())
+
+    def card_values(self, lang: str) -> dict[str, str]:
+        stats = "".join(f"<li><strong>{self.title(lang)}:</strong> {self.words(lang, 2, 5)}</li>" for _ in range(3))
+        steps = "".join(f"<span>{i} · {self.sentence(lang, 5, 10)}</span>" for i in range(1, 4))
+        return {
+            "title": self.title(lang),
+            "desc": self.sentence(lang, 10, 22),
+            "stats": stats,
+            "details": f'<div class="steps">{steps}</div><div class="tips"><strong>Tip:</strong> {self.sentence(lang)}</div>',
+        }
+
+    def question(self, lang: str) -> tuple[str, list[str], int, str]:
+        return (
+            self.sentence(lang, 8, 18)[:-1] + "?",
+            [self.words(lang, 1, 5).capitalize() for _ in range(4)],
+            self.rng.randrange(4),
+            self.sentence(lang, 10, 24),
+        )
+
+
+def camel(words: str) -> str:
+    parts = re.findall(r"[a-z0-9]+", words.lower())
+    return parts[0] + "".join(p.capitalize() for p in parts[1:]) if parts else "card"
+
+
+def card_markup(key_prefix: str, card_id: str, image: str, values: dict[str, str], tags: list[str], nl: str) -> str:
+    indent = " " * 10
+    lines = [
+        f'<article class="guide-card guide-card--product" data-carousel-item id="card-{card_id}">',
+        '  <div class="tag-row">',
+        *(f'    <span class="tag">{t}</span>' for t in tags),
+        "  </div>",
+        f'  <h3 data-i18n="{key_prefix}.title">{values["title"]}</h3>',
+        '  <figure class="guide-media">',
+        "    <picture>",
+        f'      <source srcset="{image}" type="image/png" />',
+        f'      <img src="{image}" alt="{values["title"]}" loading="lazy" />',
+        "    </picture>",
+        "  </figure>",
+        f'  <p data-i18n="{key_prefix}.desc">{values["desc"]}</p>',
+        f'  <ul class="stat-list" data-i18n-html="{key_prefix}.stats">{values["stats"]}</ul>',
+        '  <button class="btn-ghost" data-toggle-card data-i18n="card.stepsTw">Step & TW</button>',
+        f'  <div class="details" data-i18n-html="{key_prefix}.details">{values["details"]}</div>',
+        "</article>",
+    ]
+    return nl.join(indent + line if i else line for i, line in enumerate(lines))
+
+
+def png_bytes(width: int, height: int, rng: random.Random) -> bytes:
+    """A valid RGB PNG: one noisy row, shifted per line (compresses like a small photo, not a flat fill)."""
+    row = rng.randbytes(width * 3)
+    raw = b"".join(b"\0" + row[3 * (y % width):] + row[:3 * (y % width)] for y in range(height))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw, 6)) + chunk(b"IEND", b"")
+
+
+def generate_pages(out: Path, writer: Writer, brands: int, cards_per_page: int, assets: bool, asset_size: tuple[int, int]) -> tuple[dict[str, dict[str, str]], int]:
+    """Write the pages (and card images); return the i18n entries per language and the card count."""
+    entries: dict[str, dict[str, str]] = {lang: {} for lang in LANGS}
+    cards = 0
+    for page in sorted(ROOT.glob("*.html")):
+        text = page.read_bytes().decode("utf-8")
+        real = list(ARTICLE_RE.finditer(text))
+        if not real:
+            shutil.copyfile(page, out / page.name)
+            continue
+        nl = "\r\n" if "\r\n" in text else "\n"
+        for brand in range(1, brands + 1):
+            brand_slug = f"b{brand:02d}"
+            name = page.name if brand == 1 else f"{brand_slug}-{page.name}"
+            # Spread the generated cards over the real card slots, keeping the sections around them.
+            share = [cards_per_page // len(real) + (1 if i < cards_per_page % len(real) else 0) for i in range(len(real))]
+            parts, last = [], 0
+            for m, count in zip(real, share):
+                parts.append(text[last:m.start()])
+                generated = []
+                for _ in range(count):
+                    cards += 1
+                    values = {lang: writer.card_values(lang) for lang in LANGS}
+                    slug = f"{camel(values['en']['title'])}{cards:05d}"
+                    key_prefix = f"{page.stem}.{brand_slug}.cards.{slug}"
+                    card_id = f"{brand_slug}-{re.sub(r'(?<!^)(?=[A-Z0-9])', '-', slug).lower()}"
+                    image = f"assets/products/{brand_slug}/{card_id}.png"
+                    if assets:
+                        dest = out / image
+                        dest.parent.mkdir(parents=True, exist_ok=True)
+                        dest.write_bytes(png_bytes(*asset_size, writer.rng))
+                    for lang in LANGS:
+                        for field, value in values[lang].items():
+                            entries[lang][f"{key_prefix}.{field}"] = value
+                    tags = [writer.title("it"), f"{writer.rng.randint(5, 60)} sec"]
+                    generated.append(card_markup(key_prefix, card_id, image, values["it"], tags, nl))
+                parts.append((nl + nl + " " * 10).join(generated))
+                last = m.end()
+            parts.append(text[last:])
+            with (out / name).open("w", encoding="utf-8", newline="") as f:
+                f.write("".join(parts))
+    return entries, cards
+
+
+def generate_quiz(out: Path, writer: Writer, questions: int) -> dict[str, dict[str, str]]:
+    """Write the q&a files; return quiz.q.* i18n entries mirroring them."""
+    entries: dict[str, dict[str, str]] = {lang: {} for lang in LANGS}
+    for mode, (pattern, langs) in QUIZ_FILES.items():
+        for lang, (name, answer, explain) in langs.items():
+            blocks = []
+            for n in range(1, questions + 1):
+                question, options, correct, explanation = writer.question(lang)
+                blocks.append("\n".join([
+                    question,
+                    *(f"{'ABCD'[i]}) {opt}" for i, opt in enumerate(options)),
+                    f"{answer} {'ABCD'[correct]}",
+                    f"{explain} {explanation}",
+                ]))
+                qid = f"{QUIZ_PREFIX[mode]}-{n:05d}"
+                entries[lang][f"quiz.q.{qid}.question"] = question
+                for i, opt in enumerate(options):
+                    entries[lang][f"quiz.q.{qid}.option.{i}"] = opt
+                entries[lang][f"quiz.q.{qid}.explain"] = explanation
+            (out / pattern.format(name=name)).write_text("\n\n".join(blocks) + "\n", encoding="utf-8")
+    return entries
+
+
+def write_i18n(out: Path, entries: dict[str, dict[str, str]]) -> None:
+    source = (ROOT / "scripts" / "i18n.js").read_bytes().decode("utf-8")
+    nl = "\r\n" if "\r\n" in source else "\n"
+
+    def inject(m: re.Match) -> str:
+        indent = m.group("indent") + "  "
+        lines = [f"{indent}'{k}': {json.dumps(v, ensure_ascii=False)}," for k, v in entries.get(m.group("lang"), {}).items()]
+        return m.group(0) + (nl + nl.join(lines) if lines else "")
+
+    dest = out / "scripts" / "i18n.js"
+    with dest.open("w", encoding="utf-8", newline="") as f:
+        f.write(LANG_BLOCK_RE.sub(inject, source, count=len(LANGS)))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Generate a scaled synthetic copy of the catalogue (pages, i18n.js, quiz files, assets).")
+    ap.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    ap.add_argument("--brands", type=int, default=4, help="Copies of every card page")
+    ap.add_argument("--cards-per-page", type=int, default=60)
+    ap.add_argument("--questions", type=int, default=10000, help="Questions per q&a file (per mode and language)")
+    ap.add_argument("--quiz-i18n", action="store_true", help="Also add quiz.q.tm-/sm- keys for every question to i18n.js")
+    ap.add_argument("--no-assets", action="store_true", help="Do not write the card images")
+    ap.add_argument("--asset-size", default="160x120", help="Card image size (WxH)")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    out = args.out.resolve()
+    if out == ROOT or ROOT.is_relative_to(out):
+        print(f"❌ Refusing to write over the project: {out}")
+        return 1
+    width, height = (int(v) for v in args.asset_size.lower().split("x"))
+
+    i18n = load_i18n_dict()
+    writer = Writer(word_pools(i18n), args.seed)
+    print(f"🔍 Word pools: {', '.join(f'{lang}={len(p)}' for lang, p in writer.pools.items())}")
+
+    shutil.rmtree(out, ignore_errors=True)
+    out.mkdir(parents=True)
+    for rel in COPY_DIRS:
+        if (ROOT / rel).is_dir():
+            shutil.copytree(ROOT / rel, out / rel, ignore=shutil.ignore_patterns("legacy", "*.debug.json"))
+
+    entries, cards = generate_pages(out, writer, args.brands, args.cards_per_page, not args.no_assets, (width, height))
+    quiz_entries = generate_quiz(out, writer, args.questions)
+    if args.quiz_i18n:
+        for lang in LANGS:
+            entries[lang].update(quiz_entries[lang])
+    write_i18n(out, entries)
+
+    # Self-check with the same parsers the tools use.
+    parsed = parse_i18n_dict((out / "scripts" / "i18n.js").read_text(encoding="utf-8"))
+    pages = sorted(out.glob("*.html"))
+    found = sum(len(extract_cards(str(p), p.read_text(encoding="utf-8"))) for p in pages)
+    missing = [k for lang in LANGS for k in entries[lang] if k not in parsed.get(lang, {})]
+    size = sum(p.stat().st_size for p in out.rglob("*") if p.is_file())
+
+    print(f"📊 {len(pages)} pages, {found} cards ({cards} generated), "
+          f"{sum(len(parsed.get(lang, {})) for lang in LANGS)} i18n entries, "
+          f"{args.questions * len(QUIZ_FILES)} questions per language, {cards if not args.no_assets else 0} images")
+    if missing or found < cards:
+        print(f"❌ Self-check failed: {len(missing)} i18n keys not parsed back, {cards - found} cards not extracted")
+        return 1
+    print(f"✅ Synthetic catalogue ({_bytes(size)}) written to {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
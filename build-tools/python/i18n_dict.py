@@ -0,0 +1,95 @@
+"""Read the runtime dictionary out of scripts/i18n.js.
+
+i18n.js keeps `const dict = { it: {...}, en: {...}, es: {...}, fr: {...} }`
+with one `'key': 'value',` entry per line. This parses that literal (no JS
+runtime needed) so build tools can work with the translations.
+
+Usage:
+  from i18n_dict import load_i18n_dict
+  d = load_i18n_dict()          # {"it": {"caffe.hero.title": "Bar & Drinks", ...}, ...}
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+I18N_JS = ROOT / "scripts" / "i18n.js"
+
+LANGS = ("it", "en", "es", "fr")
+
+DICT_START_RE = re.compile(r"const\s+dict\s*=\s*\{")
+LANG_RE = re.compile(r"^\s{2,6}(?P<lang>[a-z]{2})\s*:\s*\{\s*$")
+STR = r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`(?:[^`\\]|\\.)*`"
+ENTRY_RE = re.compile(rf"(?P<key>{STR})\s*:\s*(?P<value>{STR})", re.DOTALL)
+ESCAPE_RE = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)", re.DOTALL)
+
+_SIMPLE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+
+
+def _unescape(body: str) -> str:
+    def repl(m: re.Match) -> str:
+        e = m.group(1)
+        if e.startswith("u{"):
+            return chr(int(e[2:-1], 16))
+        if e[0] in "ux" and len(e) > 1:
+            return chr(int(e[1:], 16))
+        if e == "\n":  # line continuation
+            return ""
+        return _SIMPLE_ESCAPES.get(e, e)
+
+    return ESCAPE_RE.sub(repl, body)
+
+
+def js_string_value(literal: str) -> str:
+    """Decode a single JS string literal ('...', "..." or `...` without ${})."""
+    return _unescape(literal[1:-1])
+
+
+def parse_i18n_dict(text: str) -> dict[str, dict[str, str]]:
+    start = DICT_START_RE.search(text)
+    if not start:
+        return {}
+
+    out: dict[str, dict[str, str]] = {}
+    lang = None
+    depth = 1
+    chunk: list[str] = []
+
+    def flush() -> None:
+        if lang and chunk:
+            block = "\n".join(chunk)
+            entries = out.setdefault(lang, {})
+            for m in ENTRY_RE.finditer(block):
+                entries[js_string_value(m.group("key"))] = js_string_value(m.group("value"))
+
+    for line in text[start.end():].splitlines():
+        stripped = line.strip()
+        m = LANG_RE.match(line)
+        if m and depth == 1:
+            lang = m.group("lang")
+            chunk = []
+            depth = 2
+            continue
+        if depth == 2 and stripped in ("},", "}"):
+            flush()
+            lang = None
+            depth = 1
+            continue
+        if depth == 1 and stripped.startswith("}"):
+            break
+        if depth == 2:
+            chunk.append(line)
+
+    return out
+
+
+def load_i18n_dict(path: Path = I18N_JS) -> dict[str, dict[str, str]]:
+    return parse_i18n_dict(path.read_text(encoding="utf-8", errors="replace"))
+
+
+if __name__ == "__main__":
+    d = load_i18n_dict()
+    for lang, entries in d.items():
+        print(f"{lang}: {len(entries)} keys")
@@ -1,4 +1,4 @@
-"""Import generated images into the project with the exact filenames expected by HTML.
+r"""Import generated images into the project with the exact filenames expected by HTML.
 
 Problem this solves
 - The site references images directly (assets/... and assets/story/...).
@@ -56,7 +56,7 @@ class TargetItem:
 
 
 def _project_root() -> Path:
-    return Path(__file__).resolve().parents[1]
+    return Path(__file__).resolve().parents[2]
 
 
 def _read_text(path: Path) -> str:
@@ -0,0 +1,218 @@
+"""Near-duplicate paragraph elimination for the Berny knowledge bundle.
+
+build_knowledge.py concatenates sources that repeat each other: the quiz
+dumps in data/quiz/ are near-copies (the same question under tm-/sm- keys,
+partial and full exports) and every root page carries the same navigation
+and shared copy. dedupe() keeps one canonical copy of each paragraph and
+annotates it with the other sources that contained it:
+
+    <canonical paragraph>
+    [+ festive.html, pastries.html]
+
+How:
+- paragraphs: consecutive lines grouped until they hold MIN_WORDS words (a
+  blank line always ends one), so one-line-per-block HTML text and
+  one-entry-per-line quiz dumps are cut the same way
+- comparison ignores case, punctuation and identifier-like tokens
+  (quiz.q.tm-001.option.0, ids), so the same fact under another key matches
+- word 3-shingles -> 64-permutation MinHash -> LSH (16 bands x 4 rows)
+  finds candidates; a candidate is only dropped when the Jaccard similarity
+  estimated from the two MinHashes (matching slots / 64) is >= threshold
+  (default 0.85)
+- the index keeps a 16-byte hash of the normalized words, the MinHash and
+  the refs of each kept paragraph, never its text: DedupIndex takes one
+  source at a time and build_knowledge.py reads each source twice (plan,
+  then render) instead of holding the corpus
+- the first occurrence in scan order is canonical; the scan order is sorted,
+  so the output is deterministic
+
+Usage:
+  from knowledge_dedup import dedupe
+  sections, stats = dedupe([("caffe.html", text), ("festive.html", text2)])
+
+  index = DedupIndex()                      # streaming: one source at a time
+  first = len(index.sources)
+  plan = index.add_source("caffe.html", text, stats)
+  body = index.render("caffe.html", text, plan, first, stats)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import zlib
+from array import array
+from dataclasses import dataclass, field
+
+SHINGLE = 3
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+THRESHOLD = 0.85
+MIN_WORDS = 8
+
+_PRIME = (1 << 61) - 1
+_MASK = (1 << 32) - 1
+# Fixed seeds: the same input always yields the same bundle.
+_PERMS = [((i * 0x9E3779B97F4A7C15 + 0x632BE59BD9B4E019) % _PRIME | 1, (i * 0xBF58476D1CE4E5B9 + 1) % _PRIME) for i in range(NUM_PERM)]
+
+IDENT_RE = re.compile(r"\b[\w-]+(?:\.[\w-]+)+\b")
+WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+@dataclass
+class DedupStats:
+    paragraphs_in: int = 0
+    paragraphs_out: int = 0
+    chars_in: int = 0
+    chars_out: int = 0
+    exact: int = 0
+    near: int = 0
+    sources_dropped: list[str] = field(default_factory=list)
+
+
+def split_paragraphs(text: str, min_words: int = MIN_WORDS) -> list[str]:
+    out: list[str] = []
+    buf: list[str] = []
+    words = 0
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            if buf:
+                out.append("\n".join(buf))
+                buf, words = [], 0
+            continue
+        buf.append(line)
+        words += len(line.split())
+        if words >= min_words:
+            out.append("\n".join(buf))
+            buf, words = [], 0
+    if buf:
+        out.append("\n".join(buf))
+    return out
+
+
+def normalize(text: str) -> list[str]:
+    return WORD_RE.findall(IDENT_RE.sub(" ", text).lower())
+
+
+def shingles(words: list[str], k: int = SHINGLE) -> set[int]:
+    if len(words) < k:
+        return set()
+    return {zlib.crc32(" ".join(words[i:i + k]).encode("utf-8")) for i in range(len(words) - k + 1)}
+
+
+def minhash(hashes: set[int]) -> tuple[int, ...]:
+    return tuple(min(((a * h + b) % _PRIME) & _MASK for h in hashes) for a, b in _PERMS)
+
+
+def signature(para: str) -> tuple[bytes, array | None]:
+    """(exact-match key, MinHash) of a paragraph; both fixed-size, so the index never holds its text."""
+    words = normalize(para)
+    # Tiny fragments are always kept
+    key = hashlib.blake2b(" ".join(words).encode("utf-8"), digest_size=16).digest() if len(words) >= SHINGLE else b""
+    sh = shingles(words)
+    return key, (array("I", minhash(sh)) if sh else None)
+
+
+def estimate_jaccard(a: array, b: array) -> float:
+    return sum(x == y for x, y in zip(a, b)) / NUM_PERM
+
+
+def _band_keys(sig: array) -> list[int]:
+    # hash() of a tuple of ints is not salted per process: the buckets, and so the output, are stable
+    return [hash((b, *sig[b * ROWS:(b + 1) * ROWS])) for b in range(BANDS)]
+
+
+class DedupIndex:
+    """Signatures of the paragraphs kept so far, fed one source at a time.
+
+    add_source() decides which paragraphs of a source are kept (its plan) and
+    render() rebuilds the source's text from that plan, so a caller can read
+    each source twice instead of holding every text until the end. Only the
+    16-byte exact key, the MinHash and the list of sources a paragraph was
+    also found in are kept per paragraph.
+    """
+
+    def __init__(self, threshold: float = THRESHOLD) -> None:
+        self.threshold = threshold
+        self.sources: list[str] = []
+        self.refs: list[list[str]] = []
+        self.sigs: list[array | None] = []
+        self.keys: list[bytes] = []
+        self.exact: dict[bytes, int] = {}
+        self.buckets: dict[int, list[int]] = {}
+
+    def _match(self, key: bytes, sig: array | None, stats: DedupStats) -> int | None:
+        match = self.exact.get(key) if key else None
+        if match is not None:
+            stats.exact += 1
+            return match
+        if sig is None:
+            return None
+        candidates = {i for bucket in _band_keys(sig) for i in self.buckets.get(bucket, ())}
+        best = max(candidates, key=lambda i: estimate_jaccard(sig, self.sigs[i]), default=None)
+        if best is not None and estimate_jaccard(sig, self.sigs[best]) >= self.threshold:
+            stats.near += 1
+            return best
+        return None
+
+    def add_source(self, source: str, text: str, stats: DedupStats) -> list[bool]:
+        """Index one source; per paragraph, whether it is kept (False: folded into an earlier copy)."""
+        plan: list[bool] = []
+        stats.chars_in += len(text)
+        for para in split_paragraphs(text):
+            stats.paragraphs_in += 1
+            key, sig = signature(para)
+            match = self._match(key, sig, stats)
+            if match is not None:
+                refs = self.refs[match]
+                if source != self.sources[match] and source not in refs:
+                    refs.append(source)
+                plan.append(False)
+                continue
+
+            idx = len(self.sources)
+            self.sources.append(source)
+            self.refs.append([])
+            self.sigs.append(sig)
+            self.keys.append(key)
+            if key:
+                self.exact[key] = idx
+            if sig is not None:
+                for bucket in _band_keys(sig):
+                    self.buckets.setdefault(bucket, []).append(idx)
+            plan.append(True)
+        return plan
+
+    def render(self, source: str, text: str, plan: list[bool], first: int, stats: DedupStats) -> str:
+        """The kept paragraphs of `text` (indexed from `first` on), each followed by its refs; "" if none."""
+        out = []
+        idx = first
+        for para, keep in zip(split_paragraphs(text), plan):
+            if not keep:
+                continue
+            refs = self.refs[idx]
+            out.append(para + (f"\n[+ {', '.join(refs)}]" if refs else ""))
+            idx += 1
+        body = "\n\n".join(out)
+        if not body:
+            stats.sources_dropped.append(source)
+        stats.paragraphs_out += len(out)
+        stats.chars_out += len(body)
+        return body
+
+
+def dedupe(sections: list[tuple[str, str]], threshold: float = THRESHOLD) -> tuple[list[tuple[str, str]], DedupStats]:
+    """[(source, text)] -> the same list with repeated paragraphs folded into their first copy."""
+    index = DedupIndex(threshold)
+    stats = DedupStats()
+    plans = []
+    for source, text in sections:
+        plans.append((len(index.sources), index.add_source(source, text, stats)))
+    out: list[tuple[str, str]] = []
+    for (source, text), (first, plan) in zip(sections, plans):
+        body = index.render(source, text, plan, first, stats)
+        if body:
+            out.append((source, body))
+    return out, stats
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Minify the root *.html pages, inline tiny SVG/CSS, precompress to .br/.gz.
+
+Dependency-free minifier tuned for this markup:
+- comments are dropped (except <!--[if ...]> and the site-chunks markers that
+  bundle_site_js.py --restore relies on)
+- whitespace inside tags is collapsed outside quoted attribute values
+- whitespace-only text between block-level tags is removed; any other run of
+  whitespace becomes one space (inline spacing is preserved)
+- <pre>, <textarea>, <script> bodies are left untouched; <style> bodies lose
+  comments and redundant whitespace (never around ':' — `a :hover` != `a:hover`)
+Attribute values are never modified, so data-i18n* attributes and card ids stay
+as they are; the guide cards (audit_deeplinks.extract_cards) and the data-i18n
+keys of every page are compared before/after and a mismatch is an error.
+
+<link rel=stylesheet> and <img src="*.svg"> pointing at local files under
+--inline-max-bytes are inlined (<style> / data: URL).
+
+.gz is always written (stdlib); .br needs the brotli module (pip install brotli).
+
+Usage:
+  python build-tools/python/minify_pages.py
+  python build-tools/python/minify_pages.py --pages-dir dist --out-dir dist --inline-max-bytes 4096
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+from urllib.parse import quote, unquote, urlsplit
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from audit_assets import _bytes  # noqa: E402
+from audit_deeplinks import extract_cards  # noqa: E402
+from perf_trace import add_profile_arguments, profile_session, stage  # noqa: E402
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_OUT_DIR = ROOT / "dist"
+INLINE_MAX_BYTES = 2048
+
+BLOCK_TAGS = {
+    "html", "head", "body", "title", "meta", "link", "script", "style", "noscript", "template",
+    "main", "header", "footer", "nav", "section", "article", "aside", "div", "form", "fieldset",
+    "ul", "ol", "li", "dl", "dt", "dd", "p", "h1", "h2", "h3", "h4", "h5", "h6", "hr", "br",
+    "table", "thead", "tbody", "tfoot", "tr", "td", "th", "figure", "figcaption", "picture",
+    "source", "dialog", "details", "summary", "option", "select", "svg", "path", "g",
+}
+
+TOKEN_RE = re.compile(
+    r"(?P<comment><!--.*?-->)"
+    r"|(?P<raw><(?P<rawtag>pre|textarea|script|style)\b[^>]*>.*?</(?P=rawtag)\s*>)"
+    r"|(?P<tag></?[a-zA-Z][^>]*>|<![^>]*>)",
+    re.IGNORECASE | re.DOTALL,
+)
+TAG_NAME_RE = re.compile(r"</?([a-zA-Z][a-zA-Z0-9-]*)")
+KEEP_COMMENT_RE = re.compile(r"^<!--\s*(?:\[if|<!\[endif|site-chunks:)", re.IGNORECASE)
+I18N_ATTR_RE = re.compile(r"\bdata-i18n(?:-[a-z-]+)?=\"[^\"]*\"")
+STYLE_BLOCK_RE = re.compile(r"^(<style\b[^>]*>)(.*?)(</style\s*>)$", re.IGNORECASE | re.DOTALL)
+LINK_CSS_RE = re.compile(r"<link\b[^>]*\brel=\"stylesheet\"[^>]*>", re.IGNORECASE)
+IMG_SVG_RE = re.compile(r"(<img\b[^>]*\bsrc=\")(?P<src>[^\"]+\.svg(?:\?[^\"]*)?)(\")", re.IGNORECASE)
+HREF_RE = re.compile(r"\bhref=\"(?P<href>[^\"]+)\"", re.IGNORECASE)
+MEDIA_RE = re.compile(r"\bmedia=\"(?P<media>[^\"]+)\"", re.IGNORECASE)
+CSS_URL_RE = re.compile(r"url\(\s*(?P<q>['\"]?)(?P<path>[^'\")]+)(?P=q)\s*\)", re.IGNORECASE)
+
+
+# ------------------------------------------------------------
+# Minifier
+# ------------------------------------------------------------
+def _collapse_tag(tag: str) -> str:
+    parts = re.split(r"(\"[^\"]*\"|'[^']*')", tag)
+    for i in range(0, len(parts), 2):
+        parts[i] = re.sub(r"\s+", " ", parts[i])
+    out = "".join(parts)
+    return re.sub(r"\s+(/?>)$", r"\1", out)
+
+
+def _tag_name(tag: str) -> str | None:
+    m = TAG_NAME_RE.match(tag)
+    return m.group(1).lower() if m else None
+
+
+def _is_block(token: str | None) -> bool:
+    if token is None:
+        return True  # start / end of document
+    name = _tag_name(token)
+    return name in BLOCK_TAGS if name else token.startswith("<!")
+
+
+def minify_html(html: str) -> str:
+    tokens: list[tuple[str, str]] = []  # (kind, text)
+    pos = 0
+    for m in TOKEN_RE.finditer(html):
+        if m.start() > pos:
+            tokens.append(("text", html[pos:m.start()]))
+        if m.group("comment"):
+            if KEEP_COMMENT_RE.match(m.group("comment")):
+                tokens.append(("tag", m.group("comment")))
+        elif m.group("raw"):
+            raw = m.group("raw")
+            style = STYLE_BLOCK_RE.match(raw)
+            if style:
+                raw = _collapse_tag(style.group(1)) + _squeeze_css(style.group(2)) + style.group(3)
+            else:
+                open_end = raw.index(">") + 1
+                raw = _collapse_tag(raw[:open_end]) + raw[open_end:]
+            tokens.append(("tag", raw))
+        else:
+            tokens.append(("tag", _collapse_tag(m.group("tag"))))
+        pos = m.end()
+    if pos < len(html):
+        tokens.append(("text", html[pos:]))
+
+    out: list[str] = []
+    for i, (kind, text) in enumerate(tokens):
+        if kind == "tag":
+            out.append(text)
+            continue
+        if text.strip():
+            out.append(re.sub(r"\s+", " ", text))
+            continue
+        prev_tag = next((t for k, t in reversed(tokens[:i]) if k == "tag"), None)
+        next_tag = tokens[i + 1][1] if i + 1 < len(tokens) else None
+        if not (_is_block(prev_tag) or _is_block(next_tag)):
+            out.append(" ")
+    return "".join(out).strip() + "\n"
+
+
+def _squeeze_css(css: str) -> str:
+    """Drop comments and collapse whitespace in a stylesheet, leaving strings untouched."""
+    parts = re.split(r"(\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*')", css)
+    for i in range(0, len(parts), 2):
+        code = re.sub(r"/\*.*?\*/", "", parts[i], flags=re.DOTALL)
+        parts[i] = re.sub(r"\s*([;{}])\s*", r"\1", re.sub(r"\s+", " ", code))
+    return "".join(parts).strip()
+
+
+# ------------------------------------------------------------
+# Inlining
+# ------------------------------------------------------------
+def _local_file(ref: str, base_dir: Path, roots: tuple[Path, ...]) -> Path | None:
+    parts = urlsplit(ref)
+    if parts.scheme or parts.netloc or ref.startswith(("data:", "//")):
+        return None
+    for root in roots:
+        candidate = (root / unquote(parts.path)).resolve()
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _rebase_css(css: str, css_dir: Path, page_dir: Path) -> str:
+    """url()s are relative to the stylesheet; once inlined they resolve against the page."""
+    def repl(m: re.Match) -> str:
+        path = m.group("path")
+        if urlsplit(path).scheme or path.startswith(("/", "data:", "#")):
+            return m.group(0)
+        target = (css_dir / path).resolve()
+        try:
+            rel = target.relative_to(page_dir.resolve()).as_posix()
+        except ValueError:
+            return m.group(0)
+        return f"url({m.group('q')}{rel}{m.group('q')})"
+
+    return CSS_URL_RE.sub(repl, css)
+
+
+def inline_assets(html: str, roots: tuple[Path, ...], max_bytes: int) -> tuple[str, list[str]]:
+    inlined: list[str] = []
+
+    def link_repl(m: re.Match) -> str:
+        href = HREF_RE.search(m.group(0))
+        path = _local_file(href.group("href"), roots[0], roots) if href else None
+        if path is None or path.stat().st_size > max_bytes:
+            return m.group(0)
+        media = MEDIA_RE.search(m.group(0))
+        media_attr = f' media="{media.group("media")}"' if media and media.group("media") != "all" else ""
+        site_root = next(r for r in roots if path.is_relative_to(r))
+        css = _rebase_css(path.read_text(encoding="utf-8"), path.parent, site_root)
+        inlined.append(href.group("href"))
+        return f"<style{media_attr}>{_squeeze_css(css)}</style>"
+
+    def svg_repl(m: re.Match) -> str:
+        path = _local_file(m.group("src"), roots[0], roots)
+        if path is None or path.stat().st_size > max_bytes:
+            return m.group(0)
+        svg = re.sub(r"\s+", " ", path.read_text(encoding="utf-8")).strip().replace('"', "'")
+        inlined.append(m.group("src"))
+        return m.group(1) + "data:image/svg+xml," + quote(svg, safe=" =:/'") + m.group(3)
+
+    html = LINK_CSS_RE.sub(link_repl, html)
+    html = IMG_SVG_RE.sub(svg_repl, html)
+    return html, inlined
+
+
+# ------------------------------------------------------------
+# Guards + compression
+# ------------------------------------------------------------
+def preserved_markers(name: str, html: str) -> tuple[list[tuple], Counter]:
+    cards = [(c.id_attr, c.card_key, " ".join((c.title or "").split())) for c in extract_cards(name, html)]
+    return cards, Counter(I18N_ATTR_RE.findall(html))
+
+
+def write_compressed(path: Path, data: bytes) -> dict[str, int]:
+    sizes = {"gz": 0, "br": 0}
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    path.with_name(path.name + ".gz").write_bytes(gz)
+    sizes["gz"] = len(gz)
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        path.with_name(path.name + ".br").write_bytes(br)
+        sizes["br"] = len(br)
+    return sizes
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Minify root pages, inline tiny assets and precompress.")
+    ap.add_argument("--pages-dir", type=Path, default=ROOT, help="Where to read the *.html pages from")
+    ap.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR)
+    ap.add_argument("--inline-max-bytes", type=int, default=INLINE_MAX_BYTES)
+    add_profile_arguments(ap)
+    args = ap.parse_args()
+    with profile_session("minify_pages", args):
+        return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    pages = sorted(args.pages_dir.glob("*.html"))
+    if not pages:
+        print(f"❌ No HTML pages found in {args.pages_dir}")
+        return 1
+    if brotli is None:
+        print("⚠️  brotli not installed: writing .gz only (pip install brotli)")
+
+    roots = (args.pages_dir.resolve(), ROOT)
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    errors = 0
+    totals = Counter()
+    print(f"{'page':<20} {'before':>9} {'minified':>9} {'gzip':>9} {'brotli':>9}  inlined")
+    for page in pages:
+        original = page.read_bytes().decode("utf-8")
+        with stage("minify", page=page.name):
+            html, inlined = inline_assets(original, roots, args.inline_max_bytes)
+            html = minify_html(html)
+
+        if preserved_markers(page.name, original) != preserved_markers(page.name, html):
+            print(f"❌ {page.name}: guide cards or data-i18n attributes changed during minification")
+            errors += 1
+            continue
+
+        data = html.encode("utf-8")
+        out = args.out_dir / page.name
+        out.write_bytes(data)
+        with stage("compress", page=page.name):
+            sizes = write_compressed(out, data)
+        before = len(original.encode("utf-8"))
+        totals.update(before=before, after=len(data), gz=sizes["gz"], br=sizes["br"])
+        br = _bytes(sizes["br"]) if sizes["br"] else "-"
+        print(f"{page.name:<20} {_bytes(before):>9} {_bytes(len(data)):>9} {_bytes(sizes['gz']):>9} {br:>9}  {len(inlined)}")
+
+    saved = totals["before"] - totals["after"]
+    print(f"\n📊 {_bytes(totals['before'])} -> {_bytes(totals['after'])} minified ({'-' if saved >= 0 else '+'}{_bytes(abs(saved))}), {_bytes(totals['gz'])} gzip")
+    if errors:
+        return 1
+    print(f"✅ Minified pages written to {args.out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
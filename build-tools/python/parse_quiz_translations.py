@@ -73,19 +73,6 @@ def parse_qa_file(filepath):
     
     return questions
 
-# Parse all three files
-print("Parsing English...")
-en_questions = parse_qa_file('../q&a easy mode -english.txt')
-print(f"  Found {len(en_questions)} questions")
-
-print("Parsing Spanish...")
-es_questions = parse_qa_file('../q&a easy mode -spanish.txt')
-print(f"  Found {len(es_questions)} questions")
-
-print("Parsing French...")
-fr_questions = parse_qa_file('../q&a easy mode -french.txt')
-print(f"  Found {len(fr_questions)} questions")
-
 # Generate i18n format for each language
 def generate_i18n_output(questions, language_code):
     """Generate i18n.js format for quiz questions."""
@@ -99,26 +86,45 @@ def generate_i18n_output(questions, language_code):
         output.append("")  # Blank line for readability
     return '\n'.join(output)
 
-# Generate outputs
-print("\n=== GENERATING i18n OUTPUT ===")
-en_i18n = generate_i18n_output(en_questions, 'en')
-es_i18n = generate_i18n_output(es_questions, 'es')
-fr_i18n = generate_i18n_output(fr_questions, 'fr')
 
-# Save to files
-with open('quiz_i18n_en.txt', 'w', encoding='utf-8') as f:
-    f.write("// English quiz translations - add to i18n.js 'en' section\n")
-    f.write(en_i18n)
-    print(f"✅ Saved English translations to quiz_i18n_en.txt ({len(en_questions)} questions)")
+def main():
+    # Parse all three files
+    print("Parsing English...")
+    en_questions = parse_qa_file('../q&a easy mode -english.txt')
+    print(f"  Found {len(en_questions)} questions")
+
+    print("Parsing Spanish...")
+    es_questions = parse_qa_file('../q&a easy mode -spanish.txt')
+    print(f"  Found {len(es_questions)} questions")
+
+    print("Parsing French...")
+    fr_questions = parse_qa_file('../q&a easy mode -french.txt')
+    print(f"  Found {len(fr_questions)} questions")
+
+    # Generate outputs
+    print("\n=== GENERATING i18n OUTPUT ===")
+    en_i18n = generate_i18n_output(en_questions, 'en')
+    es_i18n = generate_i18n_output(es_questions, 'es')
+    fr_i18n = generate_i18n_output(fr_questions, 'fr')
+
+    # Save to files
+    with open('quiz_i18n_en.txt', 'w', encoding='utf-8') as f:
+        f.write("// English quiz translations - add to i18n.js 'en' section\n")
+        f.write(en_i18n)
+        print(f"✅ Saved English translations to quiz_i18n_en.txt ({len(en_questions)} questions)")
+
+    with open('quiz_i18n_es.txt', 'w', encoding='utf-8') as f:
+        f.write("// Spanish quiz translations - add to i18n.js 'es' section\n")
+        f.write(es_i18n)
+        print(f"✅ Saved Spanish translations to quiz_i18n_es.txt ({len(es_questions)} questions)")
+
+    with open('quiz_i18n_fr.txt', 'w', encoding='utf-8') as f:
+        f.write("// French quiz translations - add to i18n.js 'fr' section\n")
+        f.write(fr_i18n)
+        print(f"✅ Saved French translations to quiz_i18n_fr.txt ({len(fr_questions)} questions)")
 
-with open('quiz_i18n_es.txt', 'w', encoding='utf-8') as f:
-    f.write("// Spanish quiz translations - add to i18n.js 'es' section\n")
-    f.write(es_i18n)
-    print(f"✅ Saved Spanish translations to quiz_i18n_es.txt ({len(es_questions)} questions)")
+    print("\nFiles ready to integrate into i18n.js!")
 
-with open('quiz_i18n_fr.txt', 'w', encoding='utf-8') as f:
-    f.write("// French quiz translations - add to i18n.js 'fr' section\n")
-    f.write(fr_i18n)
-    print(f"✅ Saved French translations to quiz_i18n_fr.txt ({len(fr_questions)} questions)")
 
-print("\nFiles ready to integrate into i18n.js!")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Aggregate field performance samples (BadianiPerf beacons) into percentiles.
+
+scripts/site.js posts batched timing samples from real devices: navigation
+timing (nav.ttfb / nav.dcl / nav.load / nav.lcp), i18n.js download, eval and
+apply (i18n.download / i18n.eval / i18n.apply / i18n.ready), quiz start
+(quiz.start) and Berny round trips (berny.roundtrip). Each sample carries the
+page, a device class (mobile-low, desktop-high, ...) and the UI language.
+
+Accepted input, one JSON value per line (.jsonl, .jsonl.gz or - for stdin):
+- a sample:  {"metric": "nav.load", "ms": 1830.2, "page": "index.html", ...}
+- a batch:   {"samples": [ ...samples... ]}  (what the page POSTs)
+- a `wrangler tail --format json` event whose logs carry the Worker's
+  console.log(JSON) lines from POST /perf
+Anything else (blank lines, tail noise) is skipped and counted.
+BadianiPerf.exportJsonl() output from a phone's console works as-is.
+
+For every metric it prints nearest-rank p50 / p75 / p95 per page, per device
+class and per language, then the slowest page x device x language paths
+ranked by p75 (groups with fewer than --min-samples samples are left out).
+
+Usage:
+  python build-tools/python/perf_beacon_report.py perf.jsonl
+  wrangler tail --format json | python build-tools/python/perf_beacon_report.py -
+  python build-tools/python/perf_beacon_report.py logs/*.jsonl.gz --metric nav.load --metric berny.roundtrip
+  python build-tools/python/perf_beacon_report.py perf.jsonl --days 7 --json dist/perf-report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import io
+import json
+import math
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+DIMENSIONS = ("page", "device", "lang")
+PERCENTILES = (50, 75, 95)
+MAX_MS = 600_000  # same cap as the Worker
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Nearest-rank percentile on an already sorted list: always an observed sample.
+
+    berny_loadtest.py imports this one, so field and load-test percentiles are comparable.
+    """
+    if not sorted_values:
+        return math.nan
+    k = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+def summarize(values: list[float]) -> dict:
+    values = sorted(values)
+    out = {"n": len(values)}
+    for p in PERCENTILES:
+        out[f"p{p}"] = round(percentile(values, p), 1)
+    out["max"] = round(values[-1], 1)
+    return out
+
+
+def _samples_in(obj) -> list[dict]:
+    if not isinstance(obj, dict):
+        return []
+    if "metric" in obj and "ms" in obj:
+        return [obj]
+    if isinstance(obj.get("samples"), list):
+        return [s for s in obj["samples"] if isinstance(s, dict)]
+    found: list[dict] = []
+    for log in obj.get("logs") or ():  # wrangler tail event
+        for message in (log or {}).get("message") or ():
+            if isinstance(message, str):
+                try:
+                    message = json.loads(message)
+                except ValueError:
+                    continue
+            found += _samples_in(message)
+    return found
+
+
+def _open(path: str):
+    if path == "-":
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace")
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, encoding="utf-8", errors="replace")
+
+
+def read_samples(paths: list[str], stats: Counter) -> list[dict]:
+    samples: list[dict] = []
+    for path in paths:
+        with _open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    found = _samples_in(json.loads(line))
+                except ValueError:
+                    found = []
+                if not found:
+                    stats["skipped lines"] += 1
+                for s in found:
+                    try:
+                        ms = float(s["ms"])
+                    except (TypeError, ValueError):
+                        stats["invalid samples"] += 1
+                        continue
+                    if not (0 <= ms <= MAX_MS) or not isinstance(s.get("metric"), str):
+                        stats["invalid samples"] += 1
+                        continue
+                    s["ms"] = ms
+                    for dim in DIMENSIONS:
+                        s[dim] = str(s.get(dim) or "unknown")
+                    samples.append(s)
+    return samples
+
+
+def aggregate(samples: list[dict], min_samples: int) -> dict:
+    by_metric: dict[str, list[dict]] = defaultdict(list)
+    for s in samples:
+        by_metric[s["metric"]].append(s)
+
+    report: dict[str, dict] = {}
+    for metric, rows in sorted(by_metric.items()):
+        entry = {"all": summarize([r["ms"] for r in rows])}
+        for dim in DIMENSIONS:
+            groups: dict[str, list[float]] = defaultdict(list)
+            for r in rows:
+                groups[r[dim]].append(r["ms"])
+            entry[dim] = {k: summarize(v) for k, v in sorted(groups.items())}
+        paths: dict[tuple, list[float]] = defaultdict(list)
+        for r in rows:
+            paths[tuple(r[d] for d in DIMENSIONS)].append(r["ms"])
+        entry["paths"] = sorted(
+            ({**dict(zip(DIMENSIONS, key)), **summarize(v)} for key, v in paths.items() if len(v) >= min_samples),
+            key=lambda row: -row["p75"],
+        )
+        report[metric] = entry
+    return report
+
+
+def _row(label: str, s: dict, width: int) -> str:
+    cells = "".join(f"{s[f'p{p}']:>10.0f}" for p in PERCENTILES)
+    return f"   {label[:width]:<{width}} {s['n']:>6}{cells}{s['max']:>10.0f}"
+
+
+def print_report(report: dict, min_samples: int, top: int) -> None:
+    header = "".join(f"{f'p{p} ms':>10}" for p in PERCENTILES)
+    for metric, entry in report.items():
+        print(f"\n📊 {metric}  ({entry['all']['n']} samples, p75 {entry['all']['p75']:.0f} ms)")
+        for dim in DIMENSIONS:
+            groups = {k: v for k, v in entry[dim].items() if v["n"] >= min_samples}
+            if not groups:
+                continue
+            print(f"   {dim:<28} {'n':>6}{header}{'max':>10}")
+            for key, s in sorted(groups.items(), key=lambda kv: -kv[1]["p75"]):
+                print(_row(key, s, 28))
+        if entry["paths"]:
+            print("   🐢 slowest paths (page / device / lang, by p75):")
+            for row in entry["paths"][:top]:
+                print(_row(" / ".join(row[d] for d in DIMENSIONS), row, 44))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Percentiles of the BadianiPerf field samples per page, device class and language.")
+    ap.add_argument("inputs", nargs="+", help="JSONL files (.gz ok) or - for stdin")
+    ap.add_argument("--metric", action="append", default=None, help="Only these metrics (repeatable)")
+    ap.add_argument("--page", action="append", default=None, help="Only these pages (repeatable)")
+    ap.add_argument("--days", type=float, default=None, help="Only samples from the last N days")
+    ap.add_argument("--min-samples", type=int, default=5, help="Hide groups smaller than this")
+    ap.add_argument("--top", type=int, default=10, help="Slowest paths listed per metric")
+    ap.add_argument("--json", type=Path, default=None, help="Also write the full aggregate as JSON")
+    args = ap.parse_args()
+
+    for path in args.inputs:
+        if path != "-" and not Path(path).is_file():
+            print(f"❌ Input not found: {path}")
+            return 1
+
+    stats: Counter = Counter()
+    samples = read_samples(args.inputs, stats)
+    if args.metric:
+        samples = [s for s in samples if s["metric"] in args.metric]
+    if args.page:
+        samples = [s for s in samples if s["page"] in args.page]
+    if args.days is not None:
+        cutoff = (time.time() - args.days * 86400) * 1000
+        samples = [s for s in samples if float(s.get("ts") or 0) >= cutoff]
+
+    skipped = ", ".join(f"{n} {what}" for what, n in stats.items())
+    print(f"🔍 {len(samples)} samples from {len(args.inputs)} input(s)" + (f" ({skipped})" if skipped else ""))
+    if not samples:
+        print("⚠️  Nothing to aggregate.")
+        return 1
+    sessions = {s.get("sid") for s in samples if s.get("sid")}
+    if sessions:
+        print(f"   {len(sessions)} page views")
+
+    report = aggregate(samples, args.min_samples)
+    print_report(report, args.min_samples, args.top)
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\n✅ Aggregate written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
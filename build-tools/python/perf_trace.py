@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""Stage timing and I/O accounting for the build tools (--profile / --cprofile).
+
+In a tool:
+
+    from perf_trace import add_profile_arguments, count, profile_session, stage, traced
+
+    ap = argparse.ArgumentParser(...)
+    add_profile_arguments(ap)
+    args = ap.parse_args()
+    with profile_session("critical_css", args):
+        with stage("parse"):
+            ...
+        count("cache_hits")  # e.g. an up-to-date output that was skipped
+
+Each stage records wall time, CPU time, files read, bytes read and written,
+and cache hits. Nested stages are inclusive. Counters are kept per thread, so
+stages running in parallel (build.py -j) only see their own I/O; the
+session's top-level row adds up every thread. While a session is active,
+open() / io.open() are hooked, so Path.read_text(), shutil.copyfile(),
+PIL's save() and similar are counted without touching the tool's code.
+
+--profile [DIR] writes DIR/<tool>.trace.json in Chrome trace-event format;
+open it in chrome://tracing or https://ui.perfetto.dev. It also prints a
+per-stage table. --cprofile adds DIR/<tool>.prof, readable with pstats or
+snakeviz. BADIANI_PROFILE=DIR (and BADIANI_CPROFILE=1) switch profiling on
+for every tool that adopts this module; build.py --profile sets them for
+its tasks. With profiling off, stage(), traced() and count() do nothing.
+
+Any other script can be profiled without editing it:
+
+  python build-tools/python/perf_trace.py build-tools/python/copy_kb.py
+  python build-tools/python/perf_trace.py --cprofile build-tools/build_knowledge.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import builtins
+import contextlib
+import cProfile
+import functools
+import io
+import json
+import os
+import runpy
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_DIR = ROOT / "dist" / "profile"
+ENV_DIR = "BADIANI_PROFILE"
+ENV_CPROFILE = "BADIANI_CPROFILE"
+
+COUNTERS = ("files_read", "bytes_read", "files_written", "bytes_written", "cache_hits")
+
+_active: Tracer | None = None
+_NULL = contextlib.nullcontext()
+
+
+class _WrittenFile:
+    """Delegating wrapper that adds a write-mode file's final growth to bytes_written on close."""
+
+    def __init__(self, f, tracer: Tracer) -> None:
+        self._f = f
+        self._tracer = tracer
+        self._start = self._size()
+        self._closed = False
+
+    def _size(self) -> int:
+        try:
+            return os.fstat(self._f.fileno()).st_size
+        except (OSError, ValueError, io.UnsupportedOperation):
+            return 0
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            with contextlib.suppress(OSError, ValueError):
+                self._f.flush()
+            self._tracer.add("bytes_written", max(0, self._size() - self._start))
+        self._f.close()
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+    def __iter__(self):
+        return iter(self._f)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        with contextlib.suppress(Exception):
+            self.close()
+
+
+class Tracer:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.t0 = time.perf_counter()
+        self.pid = os.getpid()
+        self.lock = threading.Lock()
+        self.counters: dict[int, Counter[str]] = {}
+        self.events: list[dict] = []
+        self.threads: dict[int, str] = {}
+        self._open = builtins.open
+
+    # -- counters ---------------------------------------------------------
+    def add(self, key: str, n: int = 1) -> None:
+        with self.lock:
+            self.counters.setdefault(threading.get_ident(), Counter())[key] += n
+
+    def snapshot(self, all_threads: bool = False) -> Counter[str]:
+        with self.lock:
+            if all_threads:
+                return sum(self.counters.values(), Counter())
+            return Counter(self.counters.get(threading.get_ident(), ()))
+
+    # -- I/O hooks --------------------------------------------------------
+    def _hooked_open(self, file, mode="r", *args, **kwargs):
+        f = self._open(file, mode, *args, **kwargs)
+        if isinstance(file, int):
+            return f
+        if any(c in mode for c in "wax+"):
+            self.add("files_written")
+            return _WrittenFile(f, self)
+        self.add("files_read")
+        with contextlib.suppress(OSError, ValueError, io.UnsupportedOperation):
+            self.add("bytes_read", os.fstat(f.fileno()).st_size)
+        return f
+
+    def install(self) -> None:
+        builtins.open = io.open = self._hooked_open
+
+    def uninstall(self) -> None:
+        builtins.open = io.open = self._open
+
+    # -- events -----------------------------------------------------------
+    def record(self, name: str, start: float, cpu: float, before: Counter[str], args: dict, all_threads: bool = False) -> None:
+        end = time.perf_counter()
+        delta = self.snapshot(all_threads)
+        delta.subtract(before)
+        tid = threading.get_ident()
+        event = {
+            "name": name,
+            "cat": "stage",
+            "ph": "X",
+            "ts": round((start - self.t0) * 1e6, 1),
+            "dur": round((end - start) * 1e6, 1),
+            "pid": self.pid,
+            "tid": tid,
+            "args": {
+                "cpu_ms": round((time.thread_time() - cpu) * 1000, 3),
+                **{k: v for k, v in delta.items() if v},
+                **args,
+            },
+        }
+        with self.lock:
+            self.threads.setdefault(tid, threading.current_thread().name)
+            self.events.append(event)
+
+    def chrome_trace(self) -> dict:
+        meta = [{"name": "process_name", "ph": "M", "pid": self.pid, "tid": 0, "args": {"name": self.name}}]
+        meta += [{"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": tname}} for tid, tname in self.threads.items()]
+        return {"traceEvents": meta + sorted(self.events, key=lambda e: e["ts"]), "displayTimeUnit": "ms"}
+
+    def summary(self) -> list[str]:
+        rows: dict[str, dict] = {}
+        for e in self.events:
+            row = rows.setdefault(e["name"], {"calls": 0, "wall": 0.0, "cpu": 0.0, **{k: 0 for k in COUNTERS}})
+            row["calls"] += 1
+            row["wall"] += e["dur"] / 1000
+            row["cpu"] += e["args"]["cpu_ms"]
+            for k in COUNTERS:
+                row[k] += e["args"].get(k, 0)
+        lines = [f"   {'stage':<28} {'calls':>5} {'wall ms':>10} {'cpu ms':>10} {'read':>13} {'written':>13} {'cache':>6}"]
+        for name, r in sorted(rows.items(), key=lambda kv: -kv[1]["wall"]):
+            read = f"{r['files_read']}f/{_kb(r['bytes_read'])}"
+            written = f"{r['files_written']}f/{_kb(r['bytes_written'])}"
+            lines.append(f"   {name[:28]:<28} {r['calls']:>5} {r['wall']:>10.1f} {r['cpu']:>10.1f} {read:>13} {written:>13} {r['cache_hits']:>6}")
+        return lines
+
+
+def _kb(n: int) -> str:
+    return f"{n / 1024:.0f}KB" if n < 1024 * 1024 else f"{n / 1024 / 1024:.1f}MB"
+
+
+@contextlib.contextmanager
+def _stage(tracer: Tracer, name: str, args: dict, all_threads: bool = False):
+    start, cpu, before = time.perf_counter(), time.thread_time(), tracer.snapshot(all_threads)
+    try:
+        yield
+    finally:
+        tracer.record(name, start, cpu, before, args, all_threads)
+
+
+def stage(name: str, **args):
+    """Context manager timing one stage (no-op unless a profile session is active)."""
+    tracer = _active
+    return _NULL if tracer is None else _stage(tracer, name, args)
+
+
+def traced(name_or_func=None):
+    """Decorator form of stage(): @traced or @traced("name")."""
+    def wrap(func, name: str | None):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def inner(*a, **kw):
+            if _active is None:
+                return func(*a, **kw)
+            with stage(label):
+                return func(*a, **kw)
+        return inner
+
+    if callable(name_or_func):
+        return wrap(name_or_func, None)
+    return lambda func: wrap(func, name_or_func)
+
+
+def count(key: str, n: int = 1) -> None:
+    """Bump a counter (cache_hits, or any custom key) in the active session."""
+    if _active is not None:
+        _active.add(key, n)
+
+
+def add_profile_arguments(ap: argparse.ArgumentParser) -> None:
+    ap.add_argument("--profile", nargs="?", type=Path, const=DEFAULT_DIR, default=None, metavar="DIR",
+                    help=f"Write a Chrome trace of the stages (default dir: {DEFAULT_DIR.relative_to(ROOT)})")
+    ap.add_argument("--cprofile", action="store_true", help="Also dump a cProfile .prof next to the trace")
+
+
+@contextlib.contextmanager
+def profile_session(tool: str, args: argparse.Namespace | None = None):
+    """Profile everything inside the block when --profile/--cprofile (or BADIANI_PROFILE) asks for it."""
+    global _active
+    out_dir = getattr(args, "profile", None)
+    want_cprofile = bool(getattr(args, "cprofile", False)) or os.environ.get(ENV_CPROFILE) == "1"
+    if out_dir is None and os.environ.get(ENV_DIR):
+        out_dir = Path(os.environ[ENV_DIR])
+    if out_dir is None and want_cprofile:
+        out_dir = DEFAULT_DIR
+    if out_dir is None or _active is not None:
+        yield None
+        return
+
+    tracer = Tracer(tool)
+    profiler = cProfile.Profile() if want_cprofile else None
+    _active = tracer
+    tracer.install()
+    if profiler:
+        profiler.enable()
+    try:
+        with _stage(tracer, tool, {}, all_threads=True):
+            yield tracer
+    finally:
+        if profiler:
+            profiler.disable()
+        tracer.uninstall()
+        _active = None
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        trace_path = out_dir / f"{tool}.trace.json"
+        trace_path.write_text(json.dumps(tracer.chrome_trace()) + "\n", encoding="utf-8")
+        print(f"\n⏱️  Profile of {tool}:", file=sys.stderr)
+        print("\n".join(tracer.summary()), file=sys.stderr)
+        print(f"   trace: {trace_path}", file=sys.stderr)
+        if profiler:
+            prof_path = out_dir / f"{tool}.prof"
+            profiler.dump_stats(prof_path)
+            print(f"   cProfile: {prof_path} (python -m pstats {prof_path})", file=sys.stderr)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Run any build-tools script under the profiler (no code changes needed).")
+    ap.add_argument("--out", type=Path, default=DEFAULT_DIR, help="Where the trace / .prof go")
+    ap.add_argument("--cprofile", action="store_true")
+    ap.add_argument("script", type=Path)
+    ap.add_argument("argv", nargs=argparse.REMAINDER, help="Arguments for the script")
+    args = ap.parse_args()
+
+    script = args.script.resolve()
+    if not script.is_file():
+        print(f"❌ Script not found: {script}")
+        return 1
+    # Scripts that adopt this module must see this (active) instance, not a fresh import.
+    sys.modules.setdefault("perf_trace", sys.modules[__name__])
+    sys.argv = [str(script), *args.argv]
+    sys.path.insert(0, str(script.parent))
+    session = argparse.Namespace(profile=args.out, cprofile=args.cprofile)
+    code = 0
+    with profile_session(script.stem, session):
+        try:
+            runpy.run_path(str(script), run_name="__main__")
+        except SystemExit as exc:
+            code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+    return code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
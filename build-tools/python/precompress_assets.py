@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Precompressed .br / .gz siblings for the text assets a static host serves.
+
+Static hosts (Cloudflare Pages, Netlify, nginx gzip_static / brotli_static)
+can serve name.js.br / name.js.gz as-is instead of compressing on the fly,
+so every sibling is written with maximum effort:
+- brotli quality 11, 16 MB window (lgwin 24), text mode — needs the brotli
+  module (pip install brotli); without it only .gz is written
+- gzip via zopfli when installed (pip install zopfli), else zlib level 9;
+  mtime 0, so unchanged input gives byte-identical output
+
+Files are picked under --dir by extension (.js .css .json .svg .txt .xml
+.webmanifest by default; the pages get theirs from minify_pages.py) and size
+(--min-bytes). A sibling that would not be smaller than the file is not
+written (a stale one is removed).
+
+Unchanged files are skipped: --dir/precompress-report.json records the
+sha256 of every compressed file, and a file whose hash matches and whose
+siblings still exist is left alone. Identical content under two names (the
+fingerprinted copy and its original, name.<hash>.js / name.js) is compressed
+once per run.
+
+The report (console + precompress-report.json) lists original, gzip and
+brotli sizes per file and in total.
+
+Usage:
+  python build-tools/python/precompress_assets.py
+  python build-tools/python/precompress_assets.py --dir dist --min-bytes 512 --top 20
+  python build-tools/python/precompress_assets.py --dir dist --ext .js --ext .css --force
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from audit_assets import _bytes  # noqa: E402
+from perf_trace import add_profile_arguments, count, profile_session, stage  # noqa: E402
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from zopfli.gzip import compress as zopfli_gzip
+except ImportError:
+    zopfli_gzip = None
+
+DEFAULT_DIR = ROOT / "dist"
+REPORT_NAME = "precompress-report.json"
+DEFAULT_EXTS = (".js", ".css", ".json", ".svg", ".txt", ".xml", ".webmanifest")
+MIN_BYTES = 1024
+ENCODINGS = ("gz", "br")
+
+
+def gzip_max(data: bytes) -> bytes:
+    if zopfli_gzip is not None:
+        return zopfli_gzip(data)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def brotli_max(data: bytes) -> bytes:
+    return brotli.compress(data, quality=11, lgwin=24, mode=brotli.MODE_TEXT)
+
+
+def gzip_method() -> str:
+    return "zopfli" if zopfli_gzip is not None else "zlib-9"
+
+
+class Precompressor:
+    def __init__(self, root: Path, previous: dict, force: bool) -> None:
+        self.root = root
+        self.previous = previous
+        self.force = force
+        self.encodings = ENCODINGS if brotli is not None else ("gz",)
+        self.lock = threading.Lock()
+        self.memo: dict[str, dict[str, bytes]] = {}  # sha256 -> encoding -> bytes
+
+    def _compress(self, sha: str, data: bytes) -> dict[str, bytes]:
+        with self.lock:
+            cached = self.memo.get(sha)
+        if cached is not None:
+            count("cache_hits")
+            return cached
+        out = {"gz": gzip_max(data)}
+        if brotli is not None:
+            out["br"] = brotli_max(data)
+        with self.lock:
+            self.memo[sha] = out
+        return out
+
+    def up_to_date(self, rel: str, sha: str) -> dict | None:
+        prev = self.previous.get(rel)
+        if self.force or not prev or prev.get("sha256") != sha:
+            return None
+        if any(enc not in prev for enc in self.encodings):
+            return None  # brotli became available since the last run
+        path = self.root / rel
+        for enc in self.encodings:
+            sibling = path.with_name(f"{path.name}.{enc}")
+            if prev[enc] and (not sibling.is_file() or sibling.stat().st_size != prev[enc]):
+                return None
+        return prev
+
+    def process(self, path: Path) -> tuple[str, dict, bool]:
+        rel = path.relative_to(self.root).as_posix()
+        data = path.read_bytes()
+        sha = hashlib.sha256(data).hexdigest()
+        prev = self.up_to_date(rel, sha)
+        if prev is not None:
+            count("cache_hits")
+            return rel, prev, False
+
+        with stage("compress", file=rel):
+            compressed = self._compress(sha, data)
+        entry = {"sha256": sha, "bytes": len(data)}
+        for enc in self.encodings:
+            sibling = path.with_name(f"{path.name}.{enc}")
+            payload = compressed[enc]
+            if len(payload) < len(data):
+                sibling.write_bytes(payload)
+                entry[enc] = len(payload)
+            else:
+                sibling.unlink(missing_ok=True)
+                entry[enc] = 0
+        return rel, entry, True
+
+
+def candidates(root: Path, exts: set[str], min_bytes: int) -> list[Path]:
+    out = []
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and path.suffix.lower() in exts and path.name != REPORT_NAME and path.stat().st_size >= min_bytes:
+            out.append(path)
+    return out
+
+
+def load_report(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("files", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def remove_orphans(root: Path, previous: dict, current: dict) -> int:
+    """Siblings of files that were compressed last time but are gone (or no longer picked) now."""
+    removed = 0
+    for rel in set(previous) - set(current):
+        path = root / rel
+        for enc in ENCODINGS:
+            sibling = path.with_name(f"{path.name}.{enc}")
+            if sibling.is_file():
+                sibling.unlink()
+                removed += 1
+    return removed
+
+
+def _ratio(part: int, whole: int) -> str:
+    return f"{100 * part / whole:5.1f}%" if part and whole else "     -"
+
+
+def print_report(files: dict, fresh: set[str], top: int) -> dict:
+    rows = sorted(files.items(), key=lambda kv: -kv[1]["bytes"])
+    print(f"   {'file':<48} {'bytes':>9} {'gzip':>9} {'':>6} {'brotli':>9} {'':>6}")
+    for rel, e in rows[:top]:
+        mark = "" if rel in fresh else "  (unchanged)"
+        br = _bytes(e.get("br") or 0) if e.get("br") else "-"
+        print(f"   {rel[-48:]:<48} {_bytes(e['bytes']):>9} {_bytes(e['gz']) if e['gz'] else '-':>9} {_ratio(e['gz'], e['bytes'])}"
+              f" {br:>9} {_ratio(e.get('br') or 0, e['bytes'])}{mark}")
+    if len(rows) > top:
+        print(f"   ... {len(rows) - top} more")
+    totals = {
+        "files": len(rows),
+        "bytes": sum(e["bytes"] for _, e in rows),
+        # What a client downloads with each encoding (files without a smaller sibling count at full size).
+        "gz": sum(e["gz"] or e["bytes"] for _, e in rows),
+        "br": sum(e.get("br") or e["bytes"] for _, e in rows) if brotli is not None else 0,
+    }
+    br = f", {_bytes(totals['br'])} brotli ({_ratio(totals['br'], totals['bytes']).strip()})" if totals["br"] else ""
+    print(f"\n📊 {totals['files']} files, {_bytes(totals['bytes'])} -> {_bytes(totals['gz'])} gzip ({_ratio(totals['gz'], totals['bytes']).strip()}){br}")
+    return totals
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Write max-effort .br/.gz siblings for text assets, skipping unchanged files.")
+    ap.add_argument("--dir", type=Path, default=DEFAULT_DIR, help="Tree to precompress (default: dist/)")
+    ap.add_argument("--ext", action="append", default=None, help=f"Extensions to compress (repeatable; default: {' '.join(DEFAULT_EXTS)})")
+    ap.add_argument("--min-bytes", type=int, default=MIN_BYTES, help="Smaller files are served as they are")
+    ap.add_argument("--force", action="store_true", help="Recompress everything, ignoring the previous report")
+    ap.add_argument("--top", type=int, default=15, help="Files listed in the report (largest first)")
+    ap.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Files compressed in parallel")
+    add_profile_arguments(ap)
+    args = ap.parse_args()
+    with profile_session("precompress_assets", args):
+        return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    root = args.dir.resolve()
+    if not root.is_dir():
+        print(f"❌ Directory not found: {root}")
+        return 1
+    if brotli is None:
+        print("⚠️  brotli not installed: writing .gz only (pip install brotli)")
+    exts = {e.lower() if e.startswith(".") else f".{e.lower()}" for e in (args.ext or DEFAULT_EXTS)}
+
+    report_path = root / REPORT_NAME
+    previous = load_report(report_path)
+    with stage("scan"):
+        paths = candidates(root, exts, args.min_bytes)
+    if not paths:
+        print(f"⚠️  Nothing to compress in {root}")
+        return 0
+
+    pc = Precompressor(root, previous, args.force)
+    files: dict[str, dict] = {}
+    fresh: set[str] = set()
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:  # zlib and brotli release the GIL
+        for rel, entry, compressed in pool.map(pc.process, paths):
+            files[rel] = entry
+            if compressed:
+                fresh.add(rel)
+    removed = remove_orphans(root, previous, files)
+
+    print(f"🔍 {len(files)} files in {root} ({len(fresh)} compressed, {len(files) - len(fresh)} unchanged"
+          + (f", {removed} orphaned siblings removed" if removed else "") + f"); gzip: {gzip_method()}, brotli: {'q11' if brotli else 'off'}")
+    totals = print_report(files, fresh, args.top)
+    report = {"gzip": gzip_method(), "brotli": "q11-lgwin24" if brotli is not None else None, "totals": totals, "files": dict(sorted(files.items()))}
+    report_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"✅ Report written to {report_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
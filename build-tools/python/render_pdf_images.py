@@ -8,7 +8,7 @@ from typing import Any, Dict, List
 import fitz  # type: ignore
 from PIL import Image
 
-ROOT = Path(__file__).resolve().parents[1]
+ROOT = Path(__file__).resolve().parents[2]
 ASSETS = ROOT / "assets"
 ASSETS.mkdir(exist_ok=True)
 
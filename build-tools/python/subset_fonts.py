@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""Subset fonts/SuperGrotesk* to the glyphs the site actually renders.
+
+Glyph set = text of every root *.html page + every value of the four languages
+in scripts/i18n.js + a safety range (printable ASCII, Latin-1, common
+punctuation), so user input and untranslated fallbacks still render.
+
+For each @font-face in styles/site.css the source font is subset into one WOFF2
+per unicode-range group ("latin": the safety range, "latin-ext": whatever else
+the copy uses, e.g. œ, ⅓, arrows) under fonts/subset/. The matching @font-face
+rules (same family / weight / style, with unicode-range) are written to
+fonts/subset/fonts.css; --apply also swaps them into styles/site.css.
+
+Requires fontTools + brotli (pip install fonttools brotli). --chars-only works
+without them.
+
+Usage:
+  python build-tools/python/subset_fonts.py --chars-only
+  python build-tools/python/subset_fonts.py
+  python build-tools/python/subset_fonts.py --apply
+"""
+
+from __future__ import annotations
+
+import argparse
+import html as html_lib
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from audit_assets import _bytes  # noqa: E402
+from critical_css import CSS_FILE, parse_css  # noqa: E402
+from i18n_dict import LANGS, load_i18n_dict  # noqa: E402
+from perf_trace import add_profile_arguments, profile_session, stage  # noqa: E402
+
+FONTS_DIR = ROOT / "fonts"
+OUT_DIR = FONTS_DIR / "subset"
+SAFETY_RANGES = (
+    (0x0020, 0x007E),  # printable ASCII
+    (0x00A0, 0x00FF),  # Latin-1 (it/es/fr accents, « », ¿ ¡)
+    (0x2010, 0x2027),  # dashes, quotes, bullet, ellipsis
+    (0x20AC, 0x20AC),  # €
+)
+# Code points outside these go to the "latin-ext" face, which browsers only
+# download when a page actually contains one of them.
+GROUPS = ("latin", "latin-ext")
+SOURCE_PREFERENCE = (".otf", ".ttf", ".woff2", ".woff")
+
+FONT_FACE_RE = re.compile(r"@font-face\s*\{[^}]*\}\s*", re.IGNORECASE)
+SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b[^>]*>.*?</\1>", re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r"<[^>]+>")
+ATTR_TEXT_RE = re.compile(r"\b(?:alt|title|placeholder|aria-label|content)=\"([^\"]*)\"", re.IGNORECASE)
+DECL_RE = re.compile(r"(?P<prop>font-family|font-weight|font-style|font-display)\s*:\s*(?P<value>[^;]+)", re.IGNORECASE)
+SRC_URL_RE = re.compile(r"url\(['\"]?(?P<path>[^'\")]+)['\"]?\)")
+
+
+@dataclass
+class Face:
+    family: str
+    weight: str
+    style: str
+    display: str
+    sources: list[Path]
+
+    @property
+    def existing(self) -> list[Path]:
+        return [p for p in self.sources if p.exists()]
+
+    @property
+    def source(self) -> Path | None:
+        """Best file to subset from (outlines over WOFF2), or None when no src exists."""
+        existing = self.existing
+        return min(existing, key=lambda p: SOURCE_PREFERENCE.index(p.suffix.lower())) if existing else None
+
+
+def page_text(html: str) -> str:
+    body = SCRIPT_STYLE_RE.sub(" ", html)
+    attrs = " ".join(ATTR_TEXT_RE.findall(body))
+    return html_lib.unescape(TAG_RE.sub(" ", body) + " " + attrs)
+
+
+def collect_chars(root: Path = ROOT) -> tuple[set[int], dict[str, int]]:
+    """Code points used by the pages and i18n, plus where they came from (for the report)."""
+    used: set[int] = set()
+    counts: dict[str, int] = {}
+    for page in sorted(root.glob("*.html")):
+        chars = {ord(c) for c in page_text(page.read_text(encoding="utf-8"))}
+        counts[page.name] = len(chars)
+        used |= chars
+    i18n = load_i18n_dict()
+    for lang in LANGS:
+        chars = {ord(c) for v in i18n.get(lang, {}).values() for c in html_lib.unescape(TAG_RE.sub(" ", v))}
+        counts[f"i18n:{lang}"] = len(chars)
+        used |= chars
+    return {cp for cp in used if cp >= 0x20}, counts
+
+
+def in_safety(cp: int) -> bool:
+    return any(lo <= cp <= hi for lo, hi in SAFETY_RANGES)
+
+
+def split_groups(used: set[int]) -> dict[str, set[int]]:
+    latin = {cp for lo, hi in SAFETY_RANGES for cp in range(lo, hi + 1)}
+    return {"latin": latin, "latin-ext": {cp for cp in used if not in_safety(cp)}}
+
+
+def unicode_range(cps: set[int]) -> str:
+    spans: list[str] = []
+    ordered = sorted(cps)
+    i = 0
+    while i < len(ordered):
+        j = i
+        while j + 1 < len(ordered) and ordered[j + 1] == ordered[j] + 1:
+            j += 1
+        lo, hi = ordered[i], ordered[j]
+        spans.append(f"U+{lo:04X}" if lo == hi else f"U+{lo:04X}-{hi:04X}")
+        i = j + 1
+    return ", ".join(spans)
+
+
+def load_faces(css_path: Path = CSS_FILE) -> list[Face]:
+    faces: list[Face] = []
+    for node in parse_css(css_path.read_text(encoding="utf-8")):
+        if not node.prelude.lower().startswith("@font-face") or node.body is None:
+            continue
+        decls = {m.group("prop").lower(): m.group("value").strip() for m in DECL_RE.finditer(node.body)}
+        sources = [(css_path.parent / m.group("path")).resolve() for m in SRC_URL_RE.finditer(node.body)]
+        faces.append(Face(
+            family=decls.get("font-family", "").strip("'\""),
+            weight=decls.get("font-weight", "400"),
+            style=decls.get("font-style", "normal"),
+            display=decls.get("font-display", "swap"),
+            sources=sources,
+        ))
+    return faces
+
+
+def subset_face(face: Face, groups: dict[str, set[int]], out_dir: Path) -> list[tuple[str, Path, set[int]]]:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    cmap = set(TTFont(face.source, lazy=True).getBestCmap())
+    written = []
+    for group in GROUPS:
+        cps = groups[group] & cmap
+        if not cps:
+            continue
+        options = subset.Options()
+        options.flavor = "woff2"
+        options.layout_features = ["*"]
+        options.name_IDs = ["*"]
+        options.notdef_outline = True
+        font = subset.load_font(str(face.source), options)
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=sorted(cps))
+        subsetter.subset(font)
+        out = out_dir / f"{face.source.stem}.{group}.woff2"
+        subset.save_font(font, str(out), options)
+        written.append((group, out, cps))
+    return written
+
+
+def font_face_css(face: Face, group: str, path: Path, cps: set[int], css_dir: Path) -> str:
+    # fonts.css sits next to the subsets; site.css lives in styles/.
+    rel = Path("..") / path.relative_to(ROOT) if css_dir == ROOT / "styles" else Path(path.name)
+    return (
+        "@font-face {\n"
+        f"  font-family: \"{face.family}\";\n"
+        f"  src: url(\"{rel.as_posix()}\") format(\"woff2\");\n"
+        f"  font-weight: {face.weight};\n"
+        f"  font-style: {face.style};\n"
+        f"  font-display: {face.display};\n"
+        f"  unicode-range: {unicode_range(cps)};\n"
+        "}\n"
+    )
+
+
+def apply_to_site_css(css_path: Path, faces_css: str) -> None:
+    text = css_path.read_text(encoding="utf-8")
+    blocks = list(FONT_FACE_RE.finditer(text))
+    if not blocks:
+        raise SystemExit(f"❌ No @font-face in {css_path}")
+    head = text[:blocks[0].start()]
+    rest = FONT_FACE_RE.sub("", text[blocks[0].start():blocks[-1].end()])
+    css_path.write_text(head + faces_css + "\n" + rest + text[blocks[-1].end():], encoding="utf-8")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Subset SuperGrotesk fonts to the site's glyphs and emit WOFF2 + unicode-range CSS.")
+    ap.add_argument("--out-dir", type=Path, default=OUT_DIR)
+    ap.add_argument("--chars-only", action="store_true", help="Only report the glyph set (no fontTools needed)")
+    ap.add_argument("--apply", action="store_true", help="Replace the @font-face rules in styles/site.css")
+    add_profile_arguments(ap)
+    args = ap.parse_args()
+    with profile_session("subset_fonts", args):
+        return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    with stage("collect_chars"):
+        used, counts = collect_chars()
+    groups = split_groups(used)
+    print(f"🔍 {len(used)} distinct code points in use ({', '.join(f'{k}={v}' for k, v in counts.items())})")
+    print(f"   latin (safety range): {len(groups['latin'])} | latin-ext: {len(groups['latin-ext'])}")
+    if groups["latin-ext"]:
+        print(f"   latin-ext: {''.join(chr(cp) for cp in sorted(groups['latin-ext']))}")
+    if args.chars_only:
+        return 0
+
+    try:
+        import fontTools  # noqa: F401
+        import brotli  # noqa: F401
+    except ImportError:
+        print("❌ fontTools/brotli not found. Install with: pip install fonttools brotli")
+        return 1
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    css_parts: list[str] = []
+    site_parts: list[str] = []
+    before = after = 0
+    skipped = 0
+    for face in load_faces():
+        src = face.source
+        if src is None:
+            print(f"⚠️  {face.family} {face.weight} {face.style}: none of its src files exist, skipped")
+            skipped += 1
+            continue
+        original = face.existing[0].stat().st_size  # what browsers fetch today (first src that exists)
+        with stage("subset_face", face=src.name):
+            written = subset_face(face, groups, args.out_dir)
+        size = sum(p.stat().st_size for _, p, _ in written)
+        before += original
+        after += size
+        print(f"  {face.family:<24} {src.name:<28} {_bytes(original):>9} -> {_bytes(size):>9} ({', '.join(g for g, _, _ in written)})")
+        for group, path, cps in written:
+            css_parts.append(font_face_css(face, group, path, cps, args.out_dir))
+            site_parts.append(font_face_css(face, group, path, cps, ROOT / "styles"))
+
+    (args.out_dir / "fonts.css").write_text("\n".join(css_parts), encoding="utf-8")
+    print(f"\n📊 Font bytes: {_bytes(before)} -> {_bytes(after)}")
+    print(f"✅ Subsets + fonts.css written to {args.out_dir}")
+    if args.apply and skipped:
+        print(f"❌ {skipped} face(s) skipped: not rewriting {CSS_FILE.relative_to(ROOT)}, their rules would be lost")
+        return 1
+    if args.apply:
+        apply_to_site_css(CSS_FILE, "\n".join(site_parts))
+        print(f"✅ @font-face rules in {CSS_FILE.relative_to(ROOT)} now point at the subsets")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
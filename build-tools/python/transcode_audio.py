@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Transcode "Gelato Hub Loop.mp3" into small streaming variants + a manifest.
+
+The source is a ~2.8 MB MP3. This produces, under assets/audio/:
+- gelato-hub-loop.full.opus / .m4a   whole track, low bitrate (Opus + AAC fallback)
+- gelato-hub-loop.loop.opus / .m4a   a short segment whose tail is cross-faded
+                                     into its head, so `<audio loop>` repeats it
+                                     without a click or gap
+- manifest.json                      byte sizes, durations and the preferred
+                                     order of <source> candidates
+
+The loop segment is what the hub should play for ambience: ~1/10 of the source
+(or less) and playable as soon as the first few KB arrive.
+
+Requires ffmpeg + ffprobe on PATH (with libopus). --dry-run prints the commands.
+
+Usage:
+  python build-tools/python/transcode_audio.py
+  python build-tools/python/transcode_audio.py --loop-seconds 24 --crossfade 2
+  python build-tools/python/transcode_audio.py --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shlex
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from audit_assets import _bytes  # noqa: E402
+from perf_trace import add_profile_arguments, profile_session, stage  # noqa: E402
+
+SOURCE = ROOT / "Gelato Hub Loop.mp3"
+OUT_DIR = ROOT / "assets" / "audio"
+STEM = "gelato-hub-loop"
+
+# (codec name, extension, MIME type for <source type>, encoder args)
+CODECS = {
+    "opus": ("opus", "audio/ogg; codecs=opus", ["-c:a", "libopus", "-vbr", "on", "-application", "audio"]),
+    "aac": ("m4a", "audio/mp4; codecs=mp4a.40.2", ["-c:a", "aac", "-movflags", "+faststart"]),
+}
+# Background ambience: stereo is kept, bitrates are picked per role.
+BITRATES = {
+    ("full", "opus"): "32k",
+    ("full", "aac"): "48k",
+    ("loop", "opus"): "48k",
+    ("loop", "aac"): "64k",
+}
+
+
+def site_path(path: Path) -> str:
+    """Repo-relative posix path for the manifest; absolute when the file lives outside the repo."""
+    path = path.resolve()
+    return path.relative_to(ROOT).as_posix() if path.is_relative_to(ROOT) else path.as_posix()
+
+
+def run(cmd: list[str], dry_run: bool) -> None:
+    print("  $ " + " ".join(shlex.quote(c) for c in cmd))
+    if not dry_run:
+        subprocess.run(cmd, check=True, capture_output=True)
+
+
+def probe_duration(path: Path) -> float | None:
+    proc = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", str(path)],
+        capture_output=True, text=True,
+    )
+    try:
+        return round(float(proc.stdout.strip()), 2)
+    except ValueError:
+        return None
+
+
+def loop_filter(start: float, length: float, crossfade: float) -> str:
+    """Cut [start, start+length) and mix the following `crossfade` seconds onto its head.
+
+    The segment's end then flows into its (already faded-in) beginning, so a
+    plain `loop` attribute plays it seamlessly.
+    """
+    body_end = start + length
+    return (
+        "[0:a]asplit=2[a][b];"
+        f"[a]atrim=start={start}:end={body_end},asetpts=PTS-STARTPTS,afade=t=in:d={crossfade}[body];"
+        f"[b]atrim=start={body_end}:end={body_end + crossfade},asetpts=PTS-STARTPTS,afade=t=out:d={crossfade}[tail];"
+        "[body][tail]amix=inputs=2:duration=first:normalize=0[out]"
+    )
+
+
+def build_commands(source: Path, out_dir: Path, loop_start: float, loop_seconds: float, crossfade: float) -> list[tuple[str, str, Path, list[str]]]:
+    jobs = []
+    for role in ("full", "loop"):
+        for codec, (ext, _, enc) in CODECS.items():
+            out = out_dir / f"{STEM}.{role}.{ext}"
+            cmd = ["ffmpeg", "-y", "-v", "error", "-i", str(source), "-vn", "-map_metadata", "-1"]
+            if role == "loop":
+                cmd += ["-filter_complex", loop_filter(loop_start, loop_seconds, crossfade), "-map", "[out]"]
+            cmd += enc + ["-b:a", BITRATES[(role, codec)], str(out)]
+            jobs.append((role, codec, out, cmd))
+    return jobs
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Transcode the hub ambience MP3 into Opus/AAC full + seamless-loop variants.")
+    ap.add_argument("--source", type=Path, default=SOURCE)
+    ap.add_argument("--out-dir", type=Path, default=OUT_DIR)
+    ap.add_argument("--loop-start", type=float, default=0.0, help="Where the loop segment starts (s)")
+    ap.add_argument("--loop-seconds", type=float, default=30.0, help="Length of the loop segment (s)")
+    ap.add_argument("--crossfade", type=float, default=1.5, help="Tail-to-head cross-fade (s)")
+    ap.add_argument("--dry-run", action="store_true", help="Print the ffmpeg commands only")
+    add_profile_arguments(ap)
+    args = ap.parse_args()
+
+    if not args.source.exists():
+        print(f"❌ Source not found: {args.source}")
+        return 1
+    if not args.dry_run and not (shutil.which("ffmpeg") and shutil.which("ffprobe")):
+        print("❌ ffmpeg/ffprobe not found on PATH (install ffmpeg with libopus)")
+        return 1
+
+    source_bytes = args.source.stat().st_size
+    print(f"🔍 {args.source.name}: {_bytes(source_bytes)}")
+    if not args.dry_run:
+        args.out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = build_commands(args.source, args.out_dir, args.loop_start, args.loop_seconds, args.crossfade)
+    with profile_session("transcode_audio", args):
+        for role, codec, _, cmd in jobs:
+            with stage("ffmpeg", role=role, codec=codec):
+                run(cmd, args.dry_run)
+        if args.dry_run:
+            return 0
+
+        variants = []
+        with stage("probe"):
+            for role, codec, out, _ in jobs:
+                size = out.stat().st_size
+                variants.append({
+                    "role": role,
+                    "codec": codec,
+                    "type": CODECS[codec][1],
+                    "file": site_path(out),
+                    "bitrate": BITRATES[(role, codec)],
+                    "bytes": size,
+                    "duration": probe_duration(out),
+                    "ratio": round(size / source_bytes, 3),
+                })
+    manifest = {
+        "source": {
+            "file": site_path(args.source),
+            "bytes": source_bytes,
+            "duration": probe_duration(args.source),
+        },
+        "loop": {"start": args.loop_start, "seconds": args.loop_seconds, "crossfade": args.crossfade},
+        "variants": variants,
+        # <source> order for the ambience player: smallest seamless loop first.
+        "preferred": [v["file"] for v in sorted(variants, key=lambda v: (v["role"] != "loop", v["bytes"]))],
+    }
+    (args.out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+    print(f"\n{'file':<36} {'bytes':>9} {'of source':>10}")
+    for v in variants:
+        print(f"{Path(v['file']).name:<36} {_bytes(v['bytes']):>9} {v['ratio'] * 100:9.1f}%")
+    print(f"\n✅ Manifest written to {site_path(args.out_dir / 'manifest.json')}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -410,6 +410,48 @@ export default {
       }
     }
 
+    // ============================================================
+    // FIELD PERFORMANCE BEACON
+    // - POST /perf  { samples: [{ metric, ms, page, device, lang, ... }] }
+    // - Sent by scripts/site.js (BadianiPerf) as text/plain (sendBeacon, no preflight).
+    // - Each sample is logged as one JSON line; collect them with
+    //   `wrangler tail --format json > perf.jsonl` and aggregate with
+    //   build-tools/python/perf_beacon_report.py.
+    // ============================================================
+    if (request.method === 'POST' && path === '/perf') {
+      const raw = await request.text().catch(() => '');
+      if (raw.length > 64 * 1024) return new Response('Payload Too Large', { status: 413, headers: corsHeaders });
+      let body;
+      try {
+        body = JSON.parse(raw);
+      } catch {
+        return new Response('Bad JSON', { status: 400, headers: corsHeaders });
+      }
+      const samples = Array.isArray(body?.samples) ? body.samples.slice(0, 50) : [];
+      const clip = (v, n = 48) => String(v ?? '').slice(0, n);
+      for (const s of samples) {
+        const ms = Number(s?.ms);
+        if (!s || typeof s.metric !== 'string' || !Number.isFinite(ms) || ms < 0 || ms > 600000) continue;
+        const out = {
+          kind: 'perf',
+          v: Number(s.v) || 1,
+          ts: Number(s.ts) || Date.now(),
+          metric: clip(s.metric, 64),
+          ms,
+          page: clip(s.page, 96),
+          device: clip(s.device),
+          lang: clip(s.lang, 8),
+          sid: clip(s.sid, 16),
+        };
+        for (const k of ['conn', 'type', 'mode', 'status', 'first', 'bytes']) {
+          if (s[k] !== undefined) out[k] = typeof s[k] === 'number' || typeof s[k] === 'boolean' ? s[k] : clip(s[k]);
+        }
+        if (request.cf?.country) out.country = request.cf.country;
+        console.log(JSON.stringify(out));
+      }
+      return new Response(null, { status: 204, headers: corsHeaders });
+    }
+
     // Health endpoint (no secrets). Useful to confirm routing + provider.
     // Usage: open https://<worker>.workers.dev/health in the browser.
     if (request.method === 'GET' && (pathname === '/health' || pathname === '/health/' || pathname === '/berny/health' || pathname === '/berny/health/')) {
@@ -64,6 +64,39 @@ const AvatarLab = (() => {
     document.body.appendChild(script);
   }
 
+  // Cropped parts (build-tools/extract_psb.py) carry their box on the export canvas.
+  // Returns fractions of the canvas, or null for legacy full-canvas PNGs.
+  function getPartLayout(cat, file) {
+    const canvas = manifest && manifest._canvas;
+    const box = manifest && manifest._layout && manifest._layout[cat] && manifest._layout[cat][file];
+    if (!canvas || !box) return null;
+    return {
+      left: box.x / canvas.width,
+      top: box.y / canvas.height,
+      width: box.w / canvas.width,
+      height: box.h / canvas.height
+    };
+  }
+
+  // Sprite-sheet source for a part (extract_psb.py --atlas), or null to load the PNG.
+  function getPartSprite(cat, file) {
+    const atlas = manifest && manifest._atlas && manifest._atlas[cat];
+    const part = atlas && atlas.parts && atlas.parts[file];
+    const sheet = part && atlas.sheets && atlas.sheets[part.sheet];
+    if (!sheet || !getPartLayout(cat, file)) return null;
+    return {
+      src: `${ASSET_PATH}${cat}/${sheet.file}`,
+      sx: part.sx, sy: part.sy, sw: part.sw, sh: part.sh,
+      aw: sheet.width, ah: sheet.height
+    };
+  }
+
+  // Sheet <img> shifted so only the part's rect shows inside an overflow:hidden box.
+  function spriteImgHTML(sprite) {
+    const style = `position:absolute; max-width:none; left:${-sprite.sx/sprite.sw*100}%; top:${-sprite.sy/sprite.sh*100}%; width:${sprite.aw/sprite.sw*100}%; height:${sprite.ah/sprite.sh*100}%;`;
+    return `<img src="${sprite.src}" style="${style}">`;
+  }
+
   function initDefaultState() {
      if (!state.offsets) state.offsets = {};
      if (!state.scales) state.scales = {};
@@ -511,11 +544,17 @@ const AvatarLab = (() => {
       const isNone = item.name === 'none';
       const isSelected = state[activeCategory] === (isNone ? null : item.name);
       const src = isNone ? '' : `${ASSET_PATH}${activeCategory}/${item.name}`;
+      const sprite = isNone ? null : getPartSprite(activeCategory, item.name);
+      const preview = sprite
+        ? `<div style="width:80%; height:80%; display:flex; align-items:center; justify-content:center;">
+             <div style="position:relative; overflow:hidden; ${sprite.sw >= sprite.sh ? 'width:100%' : 'height:100%'}; aspect-ratio:${sprite.sw}/${sprite.sh};">${spriteImgHTML(sprite)}</div>
+           </div>`
+        : `<img src="${src}" loading="lazy">`;
       
       return `
         <div class="item-thumb ${isSelected ? 'selected' : ''}" 
              onclick="AvatarLab.equip('${activeCategory}', '${item.name}')">
-             ${isNone ? '<span style="font-size:18px;">🚫</span>' : `<img src="${src}" loading="lazy">`}
+             ${isNone ? '<span style="font-size:18px;">🚫</span>' : preview}
         </div>
       `;
     }).join('');
@@ -541,9 +580,21 @@ const AvatarLab = (() => {
           const isActive = cat === activeCategory;
           
           const style = `z-index:${idx*10}; transform: translate(${offset.x}px, ${offset.y}px) scale(${scale});`;
-          html += `<img class="avatar-layer ${isActive ? 'is-active' : ''}" 
-                        src="${ASSET_PATH}${cat}/${item}" 
-                        style="${style}">`;
+          const box = getPartLayout(cat, item);
+          if (box) {
+            const boxStyle = `position:absolute; left:${box.left*100}%; top:${box.top*100}%; width:${box.width*100}%; height:${box.height*100}%;`;
+            const sprite = getPartSprite(cat, item);
+            const part = sprite
+              ? `<div style="${boxStyle} overflow:hidden;">${spriteImgHTML(sprite)}</div>`
+              : `<img src="${ASSET_PATH}${cat}/${item}" style="${boxStyle}">`;
+            html += `<div class="avatar-layer ${isActive ? 'is-active' : ''}" style="${style}">
+                        ${part}
+                     </div>`;
+          } else {
+            html += `<img class="avatar-layer ${isActive ? 'is-active' : ''}" 
+                          src="${ASSET_PATH}${cat}/${item}" 
+                          style="${style}">`;
+          }
        }
     });
     
@@ -616,11 +667,17 @@ const AvatarLab = (() => {
      ctx.fillStyle = "#ffffff";
      ctx.fillRect(0,0,size,size);
 
-     const layers = state.layerOrder.map(cat => state[cat] ? {
-        src: `${ASSET_PATH}${cat}/${state[cat]}`,
-        offset: state.offsets[cat] || {x:0,y:0},
-        scale: state.scales[cat] || DEFAULT_SCALES[cat]
-     } : null).filter(Boolean);
+     const layers = state.layerOrder.map(cat => {
+        if (!state[cat]) return null;
+        const sprite = getPartSprite(cat, state[cat]);
+        return {
+           src: sprite ? sprite.src : `${ASSET_PATH}${cat}/${state[cat]}`,
+           sprite,
+           box: getPartLayout(cat, state[cat]),
+           offset: state.offsets[cat] || {x:0,y:0},
+           scale: state.scales[cat] || DEFAULT_SCALES[cat]
+        };
+     }).filter(Boolean);
 
      let loaded = 0;
      if (layers.length === 0) { cb(canvas.toDataURL()); return; }
@@ -638,7 +695,14 @@ const AvatarLab = (() => {
                  ctx.translate(size/2, size/2);
                  ctx.scale(layer.scale, layer.scale);
                  ctx.translate(-size/2, -size/2);
-                 ctx.drawImage(layer.img, 0, 0, size, size); // Draw stretched to fill? No, assume sprite is large enough
+                 if (layer.sprite) {
+                    const sp = layer.sprite;
+                    ctx.drawImage(layer.img, sp.sx, sp.sy, sp.sw, sp.sh, layer.box.left*size, layer.box.top*size, layer.box.width*size, layer.box.height*size);
+                 } else if (layer.box) {
+                    ctx.drawImage(layer.img, layer.box.left*size, layer.box.top*size, layer.box.width*size, layer.box.height*size);
+                 } else {
+                    ctx.drawImage(layer.img, 0, 0, size, size); // Draw stretched to fill? No, assume sprite is large enough
+                 }
                  ctx.restore();
               });
               cb(canvas.toDataURL());
@@ -598,7 +598,7 @@ class BernyBrainAPI {
     const catalog = this.loadSearchCatalog();
     const page = catalog?.pages?.[pageKey];
     const cards = Array.isArray(page?.cards) ? page.cards : [];
-    if (!cards.length) return rawHref;
+    if (!cards.length) return this.canonicalizeDeepLink(rawHref);
 
     const qSlug = this.slugifyKey(qRaw);
     const qNorm = this.normalizeText(qRaw);
@@ -665,7 +665,23 @@ class BernyBrainAPI {
       }
     }
 
-    return rawHref;
+    return this.canonicalizeDeepLink(rawHref);
+  }
+
+  // Rewrite page.html?q=<anything the map knows> to the page that actually holds the card
+  // and its stable cardKey (scripts/deep-link-map.js, built by audit_deeplinks.py --map).
+  canonicalizeDeepLink(href) {
+    const rawHref = String(href || '').trim();
+    try {
+      const url = new URL(rawHref, window.location.href);
+      const q = String(url.searchParams.get('q') || '').trim();
+      const hit = q ? window.BadianiDeepLinkMap?.resolve?.(q) : null;
+      if (!hit || !hit.page || !hit.cardKey) return rawHref;
+      url.searchParams.set('q', hit.cardKey);
+      return `${hit.page}?${url.searchParams.toString()}${url.hash || ''}`;
+    } catch {
+      return rawHref;
+    }
   }
 
   // ------------------------------
@@ -1752,6 +1768,8 @@ class BernyBrainAPI {
           if (authToken) headers['x-badiani-auth'] = authToken;
         } catch {}
 
+        // Field timing: reported by site.js (BadianiPerf) as 'berny.roundtrip'.
+        const sentAt = performance.now();
         const r = await fetch(endpoint, {
           method: 'POST',
           headers,
@@ -1766,6 +1784,9 @@ class BernyBrainAPI {
           signal: ctrl ? ctrl.signal : undefined,
         });
         clearTimeout(timer);
+        try {
+          performance.measure('badiani:berny.roundtrip', { start: sentAt, detail: { status: r?.status || 0 } });
+        } catch {}
 
         if (r && r.status === 401) {
           return "🔒 Accesso richiesto. Scrivi '/access IL_TUO_CODICE' per attivarmi.";
@@ -6,46 +6,3358 @@
 
 const FULL_APP_CONTEXT = `
 === FONTE: caffe.html ===
-Bar & Drinks · Badiani Training Menu Categorie Brilla: i dettagli fanno la differenza. Story Orbit Operations &amp; Setup Bar & Drinks Sweet Treat Atelier Pastry Lab Slitti & Yo-Yo Gelato Lab Festive & Churros Lingua Italiano Italiano English Español Français Bar & Drinks · 2025 ⭐ Stelle: 18/18 Bar & Drinks La guida completa al beverage Badiani: dai classici della caffetteria italiana al nuovo Matcha Bar, fino agli Smoothies e le bevande fredde. Include procedure per servizio al tavolo e Take Away (TW). Classics Caffetteria Italiana Single / Double 25-30 sec Espresso Single L'essenza del caffè. Estrazione perfetta per un gusto intenso, corpo rotondo e crema persistente. Dose: 1 shot in tazzina piccola Estrazione: 25-30 secondi Crema: Color nocciola, tigrata, elastica Step & TW 1 · Pulisci e asciuga il portafiltro. Macina la dose al momento. 2 · Livella e pressa (tamping) in modo uniforme. 3 · Estrai e servi immediatamente (la crema svanisce in fretta). 🥡 Take Away (TW) Usa cup 4oz. Chiudi sempre con coperchio. Troubleshooting: Troppo veloce ( 35s)? Macinatura troppo fine. Double Shot Intenso Espresso Double Doppia dose di energia. Due shot estratti nello stesso tempo per un gusto più ricco. Dose: 2 shot in tazzina grande o bicchierino Estrazione: 25-30 secondi (flusso costante) Crema: Spessa e persistente Step & TW 1 · Usa il filtro doppio. Macina dose doppia. 2 · Tamping deciso e uniforme. 3 · Estrai 2 shot in 25-30s. 🥡 Take Away (TW) Usa cup 4oz o 8oz a richiesta. Coperchio obbligatorio. Single Shot Milk Foam Espresso Macchiato Espresso "macchiato" con una piccola quantità di schiuma di latte calda. Base: 1 shot espresso Top: 1-2 cucchiaini di schiuma di latte Servizio: Tazzina espresso Step & TW 1 · Prepara un espresso singolo. 2 · Monta una piccola quantità di latte (microfoam). 3 · Adagia delicatamente la schiuma al centro della crema ("macchia"). 🥡 Take Away (TW) Cup 4oz. La schiuma deve rimanere compatta anche nel trasporto. Double Shot Milk Foam Double Macchiato Doppio espresso con una macchia di latte schiumato. Più intenso, stesso tocco di latte. Base: 2 shot espresso Top: Schiuma di latte (microfoam) Servizio: Tazza grande o bicchierino Step & TW 1 · Prepara un doppio espresso. 2 · Aggiungi la schiuma di latte al centro. 3 · Servi immediatamente. 🥡 Take Away (TW) Cup 4oz o 8oz. Mantieni la proporzione caffè/schiuma. Acqua 2cm dal bordo TW Option Americano Acqua calda + espresso estratto direttamente in tazza. Disponibile in versione Take Away. Ricetta single: 8 oz acqua calda Ricetta double: 12 oz acqua calda Spazio di sicurezza: lascia 2 cm dalla sommità Step & TW 1 · Riempi la tazza con acqua calda lasciando 2 cm. 2 · Estrai espresso direttamente in tazza o in beaker separato. 3 · Servi con piattino e spoon; integra latte a parte su richiesta. 🥡 Take Away (TW) Usa cup di carta e sleeve se bollente. Chiudi sempre con coperchio. 🛠️ Pro tip: Americano troppo amaro? Verifica estrazione shot. Se cliente abituale chiede "forte" = doppio shot. Foam +⅓ volume TW Option Cappuccino Espresso, latte caldo e schiuma fine. Texture vellutata senza bolle grandi. Formato: 8 oz (regular) / 12 oz (large) Foam: circa 1/3 del volume Temperatura: 65°C (sweet spot) Step & TW 1 · Espresso in tazza. 2 · Stretch 3-5s (aria), poi rolling (vortice) fino a microfoam. 3 · Versa controllando la schiuma; chiedi se desidera cacao. 🥡 Take Away (TW) Per il TW, mantieni la stessa qualità della schiuma. Assicura il coperchio saldamente. 🛠️ Qualità: Foam perfetto = microbolle, superficie lucida. Mai oltre 70°C. Doppio shot Microfoam Flat White Doppio espresso + latte con microfoam sottilissima. Texture setosa. Latte: stretch 3 secondi, poi whirlpool. Temperatura: 65°C. Versata: inizia alta, poi abbassa per latte art. Step & TW 1 · Doppio espresso in 8 oz. 2 · Monta latte evitando eccesso di aria (microfoam). 3 · Versa per texture lucida e uniforme. 🥡 Take Away (TW) Il Flat White TW richiede la stessa cura nella microfoam. Usa cup 8oz. Cioccolato + espresso TW Option Mocha Espresso + cacao + latte. Sciogli prima il cacao nell’espresso. Shot single Milk: stretch leggero Vaso 8 oz Step & TW 1 · Miscelare espresso e cacao nella tazza. 2 · Montare latte come per latte classico. 3 · Versare mantenendo il vortice. 🥡 Take Away (TW) Mescola bene il cacao anche nel cup di carta prima di aggiungere il latte. Hot chocolate TW Option Hot Chocolate Cioccolata calda cremosa: consistenza liscia, servizio caldo. Temperatura: 65°C Texture: setosa (zero grumi) Servizio: cucchiaino + piattino Step & TW 1 · Scalda la base fino a temperatura di servizio. 2 · Mescola/omogeneizza prima di versare. 3 · Versa, pulisci bordo tazza, servi con spoon. 🥡 Take Away (TW) Attenzione alla temperatura per il TW. Assicura bene il coperchio. Chai 2 pump Dirty option Chai Latte 2 pump di sciroppo chai, latte montato lucido e cannella. Sciroppo: 2 pump Temperatura latte: 65°C Finish: cannella (dust leggero) Step & tips 1 · Eroga lo sciroppo chai in tazza. 2 · (Dirty) Estrai 1 shot e mescola con lo sciroppo. 3 · Monta latte e versa; finisci con cannella. Consiglia Dirty Chai a chi vuole spezie + caffeina. Infusion 3-5 min TW Option Tea Selection Selezione di tè premium. Servito con teiera e clessidra per infusione perfetta. Acqua: 90-95°C (Black/Herbal), 80°C (Green) Infusione: 3-5 minuti Servizio: Teiera + tazza + latte/limone a parte Step & TW 1 · Scalda la teiera, inserisci la bustina/filtro. 2 · Riempi con acqua alla temperatura corretta. 3 · Servi con clessidra e piattino per bustina esausta. 🥡 Take Away (TW) Non riempire fino all'orlo. Chiudi bene e metti sleeve se bollente. Experience Sharing Afternoon Tea Set Selezione di mini dolci, scones e sandwich per l'esperienza del tè pomeridiano. Include: Scones, finger sandwiches, mini pastries Bevanda: Tè o Prosecco Servizio: Alzatina a 3 piani Step & tips 1 · Prepara l'alzatina: salato sotto, scones in mezzo, dolci sopra. 2 · Servi il tè o la bevanda scelta. 3 · Spiega i componenti al tavolo. Gelato 70 g Showtime Affogato Gelato “annegato” con espresso: servi 1 scoop di Buontalenti e versa un doppio espresso davanti al cliente. Bicchiere 8 oz raffreddato Espresso doppio Servire subito Step & TW 1 · Pre-raffredda la tazza. 2 · Dosare 70 g di Buontalenti. 3 · Versa l'espresso davanti al cliente per valorizzare lo show. 🥡 Take Away (TW) Per il TW, usa la coppetta gelato grande o cup caffè basso. Versa l'espresso sopra prima di chiudere. Espresso + panna Servire subito Whipped Coffee Espresso singolo sormontato da panna montata fresca. Tazzina 2 oz preriscaldata Panna montata al momento Servire con cucchiaino Step & tips 1 · Prepara espresso singolo. 2 · Spruzza panna montata formando una cupola compatta. 3 · Servi immediatamente. Matcha Premium Latte Art Matcha Latte Tè verde Matcha cerimoniale con latte montato. Colore verde brillante e gusto umami. Dose Matcha: 2g (o misurino dedicato) Acqua: 30ml calda (80°C) per sciogliere Latte: montato come cappuccino Step & tips 1 · Sciogli il matcha in poca acqua calda con il frustino (chasen) o mixer. 2 · Monta il latte per ottenere una crema setosa. 3 · Versa il latte sulla base matcha creando latte art. Evita acqua bollente (brucia il matcha). La pasta deve essere liscia senza grumi. Iced Layering Iced Matcha Latte Versione fredda rinfrescante. Matcha versato su latte e ghiaccio per effetto bicolor. Ghiaccio: riempire il bicchiere Latte freddo: 3/4 bicchiere Top: base matcha concentrata Step & tips 1 · Riempi il bicchiere di ghiaccio e latte freddo. 2 · Prepara il matcha concentrato con acqua calda. 3 · Versa lentamente il matcha sopra il latte per creare i layer. Dessert Gelato Matcha Affogato Scoop di gelato Buontalenti affogato con una dose di Matcha cerimoniale caldo. Gelato: 1 scoop Buontalenti Matcha: dose standard concentrata Servizio: versare al tavolo Step & tips 1 · Prepara la coppetta con lo scoop di gelato. 2 · Prepara il matcha caldo in un bricchetto. 3 · Servi e versa il matcha verde brillante sul gelato bianco. Fusion Espresso + Matcha Dirty Matcha L'incontro tra Oriente e Occidente: Matcha Latte con l'aggiunta di uno shot di espresso. Base: Matcha Latte (caldo o freddo) Aggiunta: 1 shot espresso Profilo: Energizzante e complesso Step & tips 1 · Prepara un Matcha Latte standard. 2 · Estrai uno shot di espresso. 3 · Versa l'espresso nel drink (se iced, versa sopra per layering). Iced Americano Water + espresso Iced Americano 3 cubi grandi di ghiaccio, acqua fredda e doppio espresso versato lentamente. 12 oz cup Lascia 1/4 spazio Mix zucchero nello shot Step & tips 1 · Aggiungi ghiaccio e acqua lasciando spazio. 2 · Esegui doppio espresso in tazzina separata. 3 · Versa lentamente sopra un cubo per effetto visivo. Iced Latte Milk show Iced Latte Ghiaccio + latte freddo, doppio espresso versato direttamente sopra creando layering. 3 cubi grandi o 9 piccoli Latte fino a 3/4 Sciroppi: mixare con espresso Step & tips 1 · Aggiungi ghiaccio e latte lasciando spazio. 2 · Estrai doppio espresso. 3 · Versa lentamente su un cubo per effetto "slow motion". Signature iced Layering Pistachio Iced Latte Iced latte al pistacchio: salsa/sciroppo + latte freddo + espresso per effetto cascade. Formato: 12 oz Ghiaccio: 3 cubi grandi Syrup/salsa: prima del latte Step & tips 1 · Metti sauce/sciroppo nel bicchiere (swirl interno). 2 · Aggiungi ghiaccio e latte. 3 · Versa espresso sopra. Tropical Vitamin C Smoothie Giallo Passion Mix tropicale con mango, ananas e frutto della passione. Colore giallo vibrante. Base: Succo mela/arancia o acqua cocco Mix frutta: Giallo pack Blend: 30 secondi Step & tips 1 · Versa la base liquida nel blender. 2 · Aggiungi il contenuto del pack frutta congelata. 3 · Frulla fino a consistenza liscia e servi con cannuccia larga. Antioxidant Berries Smoothie Rosso Berry Esplosione di frutti di bosco: fragole, lamponi, mirtilli. Dolce e acidulo. Base: Succo mela o latte (se richiesto) Mix frutta: Rosso pack Blend: 30 secondi Step & tips 1 · Versa la base liquida nel blender. 2 · Aggiungi il contenuto del pack frutta congelata. 3 · Frulla fino a consistenza liscia. Detox Green Power Smoothie Verde Boost Mix salutare con spinaci, mela verde, cetriolo e zenzero. Fresco e dissetante. Base: Acqua o succo mela Mix frutta/verdura: Verde pack Blend: 30 secondi Step & tips 1 · Versa la base liquida nel blender. 2 · Aggiungi il contenuto del pack verde. 3 · Frulla bene per sminuzzare le fibre delle verdure. Setup &amp; Conservazione Apertura · Setting · Dati tecnici · Storage · Chiusura Apertura Matcha Daily batch Prep Matcha premade (una volta al giorno) Prepara il premade matcha una volta al giorno e conservalo in frigo con etichetta. Shelf life: 1 giorno (incluso il giorno di preparazione). Big batch: acqua fredda + matcha setacciato (no grumi) e whisk fino a liscio Trasferisci in squeeze bottle di plastica dedicata Conserva in frigo fino all'uso Procedura 1 · Aggiungi acqua fredda nella jug e setaccia il matcha (no lumps). 2 · Whisk (manuale o elettrico) finché completamente disciolto. 3 · Squeeze bottle + frigo + label (data/ora). Matcha premade = velocità in rush. Ma dura solo 1 giorno: label sempre. Setting Iced 25 ml Setting Iced Matcha Latte (standard) Standard di montaggio: ghiaccio → latte → matcha (versata lenta). Così ottieni sempre lo stesso effetto e riduci gli errori. Ice: riempi fino alla linea indicata sul bicchiere Milk: circa 200 ml (fino alla linea sotto il bordo) Premade matcha: 25 ml (versato lentamente per creare pattern) Note 1 · Ice → milk → matcha (slow pour). 2 · Lid + straw; lascia al cliente la mescolata. 3 · (Optional) 1 pump vanilla syrup su richiesta. Versata lenta sopra ghiaccio/latte = effetto bicolor “Instagram”. Dati tecnici Smoothies 30s Smoothies: parametri di produzione Smoothie standard: frozen fruit bag + 250 ml di apple juice, blend veloce, poi sticker colore corretto prima del servizio. Base: 250 ml apple juice (no added sugars) + frozen fruit bag Blender: 30 secondi (o finché smooth) Finish: cup corretta + cannuccia + sticker (pink/green/yellow) Checklist 1 · Apri bag frutta, aggiungi nel mixer. 2 · Versa 250 ml apple juice e frulla 30s. 3 · Cup + straw + sticker corretto prima di servire. Sticker corretto = zero errori al pass e brand consistency. Conservazione Frigo 1 giorno Storage Matcha premade (HACCP) Il premade matcha ha shelf life 1 giorno (incluso il giorno di preparazione). Conserva sempre in frigo e con label. Contenitore: squeeze bottle pulita e dedicata Frigo: sempre (mai banco) Label: data/ora preparazione + scadenza Regole 1 · Se manca la label: non usare. 2 · Se oltre shelf life: elimina e rifai batch. 3 · Mantieni utensili asciutti per evitare grumi/contaminazioni. Chiusura Reset Pulizia Chiusura stazione Matcha / Blender Routine di fine giornata per ripartire veloci domani: elimina i premade fuori shelf life e lascia strumenti pronti. Matcha premade: verifica label e scarta se oltre 1 giorno Blender: rimuovi residui frutta e lava/igienizza secondo standard store Postazione: wipe e riordino (bottiglie, straw, sticker) Checklist 1 · Controlla scadenze e riponi tutto in frigo/freezer corretti. 2 · Pulisci e asciuga blender e utensili (niente residui appiccicati). 3 · Prepara la stazione per l'apertura: stock e tool in posizione. Una chiusura fatta bene = 10 minuti risparmiati domani mattina. ☕ Bar & Drinks Caffetteria, Matcha & Smoothies 18 Prodotti Prodotti Listino locale Range Tutto l'anno Stagione
+Bar & Drinks · Badiani
+Training
+Menu
+Categorie
+
+Brilla: i dettagli fanno la differenza.
+Story Orbit
+[+ index.html, slitti-yoyo.html, story-orbit.html, sweet-treats.html]
+
+Operations &amp; Setup
+Bar & Drinks
+Sweet Treat Atelier
+[+ index.html, slitti-yoyo.html, story-orbit.html, sweet-treats.html]
+
+Pastry Lab
+Slitti & Yo-Yo
+Gelato Lab
+Festive & Churros
+[+ index.html, slitti-yoyo.html]
+
+👤 Profilo
+🌐
+Lingua
+Italiano
+Italiano
+English
+Español
+[+ index.html, operations.html, slitti-yoyo.html, story-orbit.html, sweet-treats.html]
+
+Français
+Bar & Drinks · 2025
+⭐ Stelle: 18/18
+
+Bar & Drinks
+La guida completa al beverage Badiani: dai classici della caffetteria italiana al nuovo Matcha Bar,
+
+fino agli Smoothies e le bevande fredde. Include procedure per servizio al tavolo e Take Away (TW).
+
+Classics
+Caffetteria Italiana
+Single / Double
+25-30 sec
+
+Espresso Single
+L'essenza del caffè. Estrazione perfetta per un gusto intenso, corpo rotondo e crema persistente.
+
+Dose: 1 shot in tazzina piccola
+Estrazione: 25-30 secondi
+
+Crema: Color nocciola, tigrata, elastica
+Step & TW
+
+1 · Pulisci e asciuga il portafiltro. Macina la dose al momento.
+
+2 · Livella e pressa (tamping) in modo uniforme.
+
+3 · Estrai e servi immediatamente (la crema svanisce in fretta).
+
+🥡 Take Away (TW)
+Usa cup 4oz. Chiudi sempre con coperchio.
+
+Troubleshooting: Troppo veloce ( 35s)? Macinatura troppo fine.
+
+Double Shot
+Intenso
+Espresso Double
+Doppia dose di energia. Due shot estratti nello stesso tempo per un gusto più ricco.
+
+Dose: 2 shot in tazzina grande o bicchierino
+
+Estrazione: 25-30 secondi (flusso costante)
+Crema: Spessa e persistente
+
+Step & TW
+1 · Usa il filtro doppio. Macina dose doppia.
+
+2 · Tamping deciso e uniforme.
+3 · Estrai 2 shot in 25-30s.
+
+🥡 Take Away (TW)
+Usa cup 4oz o 8oz a richiesta. Coperchio obbligatorio.
+
+Single Shot
+Milk Foam
+Espresso Macchiato
+Espresso "macchiato" con una piccola quantità di schiuma di latte calda.
+
+Base: 1 shot espresso
+Top: 1-2 cucchiaini di schiuma di latte
+
+Servizio: Tazzina espresso
+Step & TW
+1 · Prepara un espresso singolo.
+
+2 · Monta una piccola quantità di latte (microfoam).
+
+3 · Adagia delicatamente la schiuma al centro della crema ("macchia").
+
+🥡 Take Away (TW)
+Cup 4oz. La schiuma deve rimanere compatta anche nel trasporto.
+
+Double Shot
+Milk Foam
+Double Macchiato
+Doppio espresso con una macchia di latte schiumato. Più intenso, stesso tocco di latte.
+
+Base: 2 shot espresso
+Top: Schiuma di latte (microfoam)
+
+Servizio: Tazza grande o bicchierino
+Step & TW
+
+1 · Prepara un doppio espresso.
+2 · Aggiungi la schiuma di latte al centro.
+
+3 · Servi immediatamente.
+🥡 Take Away (TW)
+
+Cup 4oz o 8oz. Mantieni la proporzione caffè/schiuma.
+
+Acqua 2cm dal bordo
+TW Option
+Americano
+Acqua calda + espresso estratto direttamente in tazza. Disponibile in versione Take Away.
+
+Ricetta single: 8 oz acqua calda
+Ricetta double: 12 oz acqua calda
+
+Spazio di sicurezza: lascia 2 cm dalla sommità
+
+Step & TW
+1 · Riempi la tazza con acqua calda lasciando 2 cm.
+
+2 · Estrai espresso direttamente in tazza o in beaker separato.
+
+3 · Servi con piattino e spoon; integra latte a parte su richiesta.
+
+🥡 Take Away (TW)
+Usa cup di carta e sleeve se bollente. Chiudi sempre con coperchio.
+
+🛠️ Pro tip: Americano troppo amaro? Verifica estrazione shot. Se cliente abituale chiede "forte" = doppio shot.
+
+Foam +⅓ volume
+TW Option
+Cappuccino
+Espresso, latte caldo e schiuma fine. Texture vellutata senza bolle grandi.
+
+Formato: 8 oz (regular) / 12 oz (large)
+
+Foam: circa 1/3 del volume
+Temperatura: 65°C (sweet spot)
+
+Step & TW
+1 · Espresso in tazza.
+
+2 · Stretch 3-5s (aria), poi rolling (vortice) fino a microfoam.
+
+3 · Versa controllando la schiuma; chiedi se desidera cacao.
+
+🥡 Take Away (TW)
+Per il TW, mantieni la stessa qualità della schiuma. Assicura il coperchio saldamente.
+
+🛠️ Qualità: Foam perfetto = microbolle, superficie lucida. Mai oltre 70°C.
+
+Doppio shot
+Microfoam
+Flat White
+Doppio espresso + latte con microfoam sottilissima. Texture setosa.
+
+Latte: stretch 3 secondi, poi whirlpool.
+Temperatura: 65°C.
+
+Versata: inizia alta, poi abbassa per latte art.
+
+Step & TW
+1 · Doppio espresso in 8 oz.
+
+2 · Monta latte evitando eccesso di aria (microfoam).
+
+3 · Versa per texture lucida e uniforme.
+
+🥡 Take Away (TW)
+Il Flat White TW richiede la stessa cura nella microfoam. Usa cup 8oz.
+
+Cioccolato + espresso
+TW Option
+Mocha
+Espresso + cacao + latte. Sciogli prima il cacao nell’espresso.
+
+Shot single
+Milk: stretch leggero
+Vaso 8 oz
+
+Step & TW
+1 · Miscelare espresso e cacao nella tazza.
+
+2 · Montare latte come per latte classico.
+
+3 · Versare mantenendo il vortice.
+🥡 Take Away (TW)
+
+Mescola bene il cacao anche nel cup di carta prima di aggiungere il latte.
+
+Hot chocolate
+TW Option
+Hot Chocolate
+Cioccolata calda cremosa: consistenza liscia, servizio caldo.
+
+Temperatura: 65°C
+Texture: setosa (zero grumi)
+Servizio: cucchiaino + piattino
+
+Step & TW
+1 · Scalda la base fino a temperatura di servizio.
+
+2 · Mescola/omogeneizza prima di versare.
+3 · Versa, pulisci bordo tazza, servi con spoon.
+
+🥡 Take Away (TW)
+Attenzione alla temperatura per il TW. Assicura bene il coperchio.
+
+Chai 2 pump
+Dirty option
+Chai Latte
+2 pump di sciroppo chai, latte montato lucido e cannella.
+
+Sciroppo: 2 pump
+Temperatura latte: 65°C
+Finish: cannella (dust leggero)
+
+Step & tips
+1 · Eroga lo sciroppo chai in tazza.
+
+2 · (Dirty) Estrai 1 shot e mescola con lo sciroppo.
+
+3 · Monta latte e versa; finisci con cannella.
+
+Consiglia Dirty Chai a chi vuole spezie + caffeina.
+
+Infusion 3-5 min
+TW Option
+Tea Selection
+Selezione di tè premium. Servito con teiera e clessidra per infusione perfetta.
+
+Acqua: 90-95°C (Black/Herbal), 80°C (Green)
+Infusione: 3-5 minuti
+
+Servizio: Teiera + tazza + latte/limone a parte
+
+Step & TW
+1 · Scalda la teiera, inserisci la bustina/filtro.
+
+2 · Riempi con acqua alla temperatura corretta.
+
+3 · Servi con clessidra e piattino per bustina esausta.
+
+🥡 Take Away (TW)
+Non riempire fino all'orlo. Chiudi bene e metti sleeve se bollente.
+
+Experience
+Sharing
+Afternoon Tea Set
+Selezione di mini dolci, scones e sandwich per l'esperienza del tè pomeridiano.
+
+Include: Scones, finger sandwiches, mini pastries
+Bevanda: Tè o Prosecco
+
+Servizio: Alzatina a 3 piani
+Step & tips
+
+1 · Prepara l'alzatina: salato sotto, scones in mezzo, dolci sopra.
+
+2 · Servi il tè o la bevanda scelta.
+
+3 · Spiega i componenti al tavolo.
+Gelato 70 g
+
+Showtime
+Affogato
+Gelato “annegato” con espresso: servi 1 scoop di Buontalenti e versa un doppio espresso davanti al cliente.
+
+Bicchiere 8 oz raffreddato
+Espresso doppio
+Servire subito
+
+Step & TW
+1 · Pre-raffredda la tazza.
+
+2 · Dosare 70 g di Buontalenti.
+3 · Versa l'espresso davanti al cliente per valorizzare lo show.
+
+🥡 Take Away (TW)
+Per il TW, usa la coppetta gelato grande o cup caffè basso. Versa l'espresso sopra prima di chiudere.
+
+Espresso + panna
+Servire subito
+Whipped Coffee
+Espresso singolo sormontato da panna montata fresca.
+
+Tazzina 2 oz preriscaldata
+Panna montata al momento
+
+Servire con cucchiaino
+Step & tips
+1 · Prepara espresso singolo.
+
+2 · Spruzza panna montata formando una cupola compatta.
+
+3 · Servi immediatamente.
+Matcha Premium
+Latte Art
+
+Matcha Latte
+Tè verde Matcha cerimoniale con latte montato. Colore verde brillante e gusto umami.
+
+Dose Matcha: 2g (o misurino dedicato)
+Acqua: 30ml calda (80°C) per sciogliere
+
+Latte: montato come cappuccino
+Step & tips
+1 · Sciogli il matcha in poca acqua calda con il frustino (chasen) o mixer.
+
+2 · Monta il latte per ottenere una crema setosa.
+
+3 · Versa il latte sulla base matcha creando latte art.
+
+Evita acqua bollente (brucia il matcha). La pasta deve essere liscia senza grumi.
+
+Iced
+Layering
+Iced Matcha Latte
+Versione fredda rinfrescante. Matcha versato su latte e ghiaccio per effetto bicolor.
+
+Ghiaccio: riempire il bicchiere
+Latte freddo: 3/4 bicchiere
+
+Top: base matcha concentrata
+Step & tips
+1 · Riempi il bicchiere di ghiaccio e latte freddo.
+
+2 · Prepara il matcha concentrato con acqua calda.
+
+3 · Versa lentamente il matcha sopra il latte per creare i layer.
+
+Dessert
+Gelato
+Matcha Affogato
+Scoop di gelato Buontalenti affogato con una dose di Matcha cerimoniale caldo.
+
+Gelato: 1 scoop Buontalenti
+Matcha: dose standard concentrata
+
+Servizio: versare al tavolo
+Step & tips
+1 · Prepara la coppetta con lo scoop di gelato.
+
+2 · Prepara il matcha caldo in un bricchetto.
+
+3 · Servi e versa il matcha verde brillante sul gelato bianco.
+
+Fusion
+Espresso + Matcha
+Dirty Matcha
+L'incontro tra Oriente e Occidente: Matcha Latte con l'aggiunta di uno shot di espresso.
+
+Base: Matcha Latte (caldo o freddo)
+Aggiunta: 1 shot espresso
+
+Profilo: Energizzante e complesso
+Step & tips
+1 · Prepara un Matcha Latte standard.
+
+2 · Estrai uno shot di espresso.
+3 · Versa l'espresso nel drink (se iced, versa sopra per layering).
+
+Iced Americano
+Water + espresso
+Iced Americano
+3 cubi grandi di ghiaccio, acqua fredda e doppio espresso versato lentamente.
+
+12 oz cup
+Lascia 1/4 spazio
+Mix zucchero nello shot
+
+Step & tips
+1 · Aggiungi ghiaccio e acqua lasciando spazio.
+
+2 · Esegui doppio espresso in tazzina separata.
+
+3 · Versa lentamente sopra un cubo per effetto visivo.
+
+Iced Latte
+Milk show
+Iced Latte
+Ghiaccio + latte freddo, doppio espresso versato direttamente sopra creando layering.
+
+3 cubi grandi o 9 piccoli
+Latte fino a 3/4
+
+Sciroppi: mixare con espresso
+Step & tips
+1 · Aggiungi ghiaccio e latte lasciando spazio.
+
+2 · Estrai doppio espresso.
+3 · Versa lentamente su un cubo per effetto "slow motion".
+
+Signature iced
+Layering
+Pistachio Iced Latte
+Iced latte al pistacchio: salsa/sciroppo + latte freddo + espresso per effetto cascade.
+
+Formato: 12 oz
+Ghiaccio: 3 cubi grandi
+Syrup/salsa: prima del latte
+
+Step & tips
+1 · Metti sauce/sciroppo nel bicchiere (swirl interno).
+
+2 · Aggiungi ghiaccio e latte.
+3 · Versa espresso sopra.
+
+Tropical
+Vitamin C
+Smoothie Giallo Passion
+Mix tropicale con mango, ananas e frutto della passione. Colore giallo vibrante.
+
+Base: Succo mela/arancia o acqua cocco
+Mix frutta: Giallo pack
+
+Blend: 30 secondi
+Step & tips
+1 · Versa la base liquida nel blender.
+
+2 · Aggiungi il contenuto del pack frutta congelata.
+
+3 · Frulla fino a consistenza liscia e servi con cannuccia larga.
+
+Antioxidant
+Berries
+Smoothie Rosso Berry
+Esplosione di frutti di bosco: fragole, lamponi, mirtilli. Dolce e acidulo.
+
+Base: Succo mela o latte (se richiesto)
+Mix frutta: Rosso pack
+
+3 · Frulla fino a consistenza liscia.
+Detox
+
+Green Power
+Smoothie Verde Boost
+Mix salutare con spinaci, mela verde, cetriolo e zenzero. Fresco e dissetante.
+
+Base: Acqua o succo mela
+Mix frutta/verdura: Verde pack
+
+2 · Aggiungi il contenuto del pack verde.
+
+3 · Frulla bene per sminuzzare le fibre delle verdure.
+
+Setup &amp; Conservazione
+Apertura · Setting · Dati tecnici · Storage · Chiusura
+[+ sweet-treats.html]
+
+Apertura
+Matcha
+Daily batch
+Prep Matcha premade (una volta al giorno)
+
+Prepara il premade matcha una volta al giorno e conservalo in frigo con etichetta. Shelf life: 1 giorno (incluso il giorno di preparazione).
+
+Big batch: acqua fredda + matcha setacciato (no grumi) e whisk fino a liscio
+
+Trasferisci in squeeze bottle di plastica dedicata
+Conserva in frigo fino all'uso
+
+Procedura
+1 · Aggiungi acqua fredda nella jug e setaccia il matcha (no lumps).
+
+2 · Whisk (manuale o elettrico) finché completamente disciolto.
+
+3 · Squeeze bottle + frigo + label (data/ora).
+
+Matcha premade = velocità in rush. Ma dura solo 1 giorno: label sempre.
+
+Setting
+Iced
+25 ml
+Setting Iced Matcha Latte (standard)
+
+Standard di montaggio: ghiaccio → latte → matcha (versata lenta). Così ottieni sempre lo stesso effetto e riduci gli errori.
+
+Ice: riempi fino alla linea indicata sul bicchiere
+
+Milk: circa 200 ml (fino alla linea sotto il bordo)
+
+Premade matcha: 25 ml (versato lentamente per creare pattern)
+
+Note
+1 · Ice → milk → matcha (slow pour).
+
+2 · Lid + straw; lascia al cliente la mescolata.
+
+3 · (Optional) 1 pump vanilla syrup su richiesta.
+
+Versata lenta sopra ghiaccio/latte = effetto bicolor “Instagram”.
+
+Dati tecnici
+Smoothies
+30s
+Smoothies: parametri di produzione
+
+Smoothie standard: frozen fruit bag + 250 ml di apple juice, blend veloce, poi sticker colore corretto prima del servizio.
+
+Base: 250 ml apple juice (no added sugars) + frozen fruit bag
+
+Blender: 30 secondi (o finché smooth)
+Finish: cup corretta + cannuccia + sticker (pink/green/yellow)
+
+Checklist
+1 · Apri bag frutta, aggiungi nel mixer.
+
+2 · Versa 250 ml apple juice e frulla 30s.
+
+3 · Cup + straw + sticker corretto prima di servire.
+
+Sticker corretto = zero errori al pass e brand consistency.
+
+Conservazione
+Frigo
+1 giorno
+Storage Matcha premade (HACCP)
+
+Il premade matcha ha shelf life 1 giorno (incluso il giorno di preparazione). Conserva sempre in frigo e con label.
+
+Contenitore: squeeze bottle pulita e dedicata
+Frigo: sempre (mai banco)
+
+Label: data/ora preparazione + scadenza
+Regole
+1 · Se manca la label: non usare.
+
+2 · Se oltre shelf life: elimina e rifai batch.
+
+3 · Mantieni utensili asciutti per evitare grumi/contaminazioni.
+
+Chiusura
+Reset
+Pulizia
+Chiusura stazione Matcha / Blender
+
+Routine di fine giornata per ripartire veloci domani: elimina i premade fuori shelf life e lascia strumenti pronti.
+
+Matcha premade: verifica label e scarta se oltre 1 giorno
+
+Blender: rimuovi residui frutta e lava/igienizza secondo standard store
+
+Postazione: wipe e riordino (bottiglie, straw, sticker)
+Checklist
+
+1 · Controlla scadenze e riponi tutto in frigo/freezer corretti.
+
+2 · Pulisci e asciuga blender e utensili (niente residui appiccicati).
+
+3 · Prepara la stazione per l'apertura: stock e tool in posizione.
+
+Una chiusura fatta bene = 10 minuti risparmiati domani mattina.
+
+☕
+Bar & Drinks
+Caffetteria, Matcha & Smoothies
+
+18 Prodotti
+Prodotti
+Listino locale
+Range
+Tutto l'anno
+
+Stagione
 
 === FONTE: debug-carousel.html ===
-Debug Carousel Test Carousel Puro Se questo scorre, il problema è nel CSS del sito principale. Card 1 Prima scheda Card 2 Seconda scheda Card 3 Terza scheda Card 4 Quarta scheda Card 5 Quinta scheda Scroll position: 0
+Debug Carousel
+Test Carousel Puro
+Se questo scorre, il problema è nel CSS del sito principale.
+
+Card 1
+Prima scheda
+Card 2
+Seconda scheda
+
+Card 3
+Terza scheda
+Card 4
+Quarta scheda
+
+Card 5
+Quinta scheda
+Scroll position: 0
 
 === FONTE: festive.html ===
-Festive - Badiani Training Menu Categorie Brilla: i dettagli fanno la differenza. Story Orbit Operations &amp; Setup Bar & Drinks Sweet Treat Atelier Pastry Lab Slitti & Yo-Yo Gelato Lab Festive & Churros Lingua Italiano Italiano English Español Français Linea Festiva ⭐ Stelle: 10/10 Churros, Panettoni & Vin Brule' Procedura ufficiale per i prodotti delle feste: frittura churros, servizio Panettone/Pandoro con upsell Buontalenti, mini gift e gestione mulled wine. Prodotti Festivi Churros · Panettoni · Vin Brulé Fryer 190 °C 8 pezzi/porzione Churros Bastoncini di pastella fritta, croccanti fuori e morbidi dentro. Serviti caldi (8 pezzi) con zucchero e cannella. Step &amp; tips 1 - Prepara il mix zucchero/cannella in una teglia larga. 2 - Preleva 8 churros dal freezer, friggi 8-9 min finche' dorati. 3 - Scola bene l'olio e passa i churros nel mix per una copertura uniforme. Controlla costantemente i tempi per evitare centro crudo; sostituisci l'olio quando scurisce. 💰 Upselling Batch doppio: "Vuoi 16 churros per condividere?" Combo salse: "Prova il mix pistacchio + cioccolato fondente" Bundle: "Churros + cioccolata calda = combo perfetta" 🛠️ Pro tip: Temperatura olio critica: 190 °C esatti. Piu' bassa = unto, piu' alta = bruciato esterno/crudo interno. Sostituisci olio ogni 40 porzioni o quando scurisce. Slice service 8 porzioni Panettone Classico Il re delle feste. Ricetta tradizionale con uvetta e canditi, lievitazione naturale. Servito a fetta (1/8) su piatto dessert con posate. Taglio: verticale seguendo le 8 linee guida, coltello seghettato lungo Porzioni: 8 spicchi uniformi per coerenza Presentazione: piatto dessert + cutlery sempre Campione visivo: tieni una fetta visibile al banco per stimolare ordini (storytelling visivo) Abbinamenti suggeriti: gelato Buontalenti, salsa pistacchio, cioccolata calda Procedura 1 - Taglia verticale seguendo le linee guida. 2 - Disponi sul piatto con cutlery. 3 - Offri subito upsell: scoop Buontalenti + sauce o hot chocolate. Campiona una delle 8 fette per storytelling e conversione vendite. 💰 Upselling Opzione 1: "Fetta + scoop Buontalenti e' il nostro abbinamento signature" Opzione 2: "Aggiungi salsa pistacchio per contrasto perfetto?" Opzione 3: "Con cioccolata calda diventa un momento di pura indulgenza" 🛠️ Pro tip: Usa coltello seghettato lungo per taglio netto senza sbriciolare. 8 spicchi uniformi seguendo guida. Esponi fetta campione per stimolare ordini visivi. Warm option Crepe plate Panettone Dark Chocolate Variante golosa con gocce di cioccolato fondente nell'impasto. Ottimo servito tiepido (10'' su piastra) per sciogliere il cioccolato. Piastra crepe: pulita e asciutta (no olio) Timing: 10 secondi per lato esatti (non di piu' o perde croccantezza) Servizio immediato: servi subito dopo cottura Abbinamenti: Dark Chocolate + salsa pistacchio (contrasto gourmet) Upsell: gelato freddo + panettone caldo = contrasto di temperatura sensazionale Step &amp; tips 1 - Posiziona la fetta sulla piastra crepe. 2 - Tosta 10 secondi per lato (no olio). 3 - Servi con sauce e Buontalenti se richiesto. La versione Dark Chocolate si abbina con sauce Pistacchio per contrasti. 💰 Upselling Opzione 1: "Versione calda con gelato freddo = contrasto incredibile" Opzione 2: "Dark Chocolate + sauce pistacchio? Abbinamento gourmet" Opzione 3: "Proponi sempre opzione tiepida per esperienza premium" 🛠️ Pro tip: Piastra crepe pulita e asciutta. 10 secondi per lato, no olio. Servi immediatamente per mantenere croccante fuori/morbido dentro. Profumo attira altri clienti. Powder sugar Pandoro Classico Soffice, burroso, a forma di stella a 8 punte. Servito con spolverata di zucchero a velo al momento. Taglio: seguendo la guida a stella per 8 spicchi uniformi (effetto presentazione professionale) Zucchero a velo: SEMPRE al momento del servizio, non prima (effetto neve fresca visivamente) Piatto dessert + cutlery: sempre Temperatura: ambiente per massimo profumo Storytelling: "Lievitazione 36 ore con ingredienti premium" (giustifica valore) Abbinamenti suggeriti: gelato Buontalenti, salsa mascarpone o pistacchio Step &amp; tips 1 - Taglia seguendo la guida (A) per ottenere spicchi regolari. 2 - Disponi su piatto con cutlery. 3 - Spolvera zucchero a velo e proponi scoop Buontalenti + sauce pistacchio. Racconta il metodo di lievitazione naturale per valore percepito. 💰 Upselling Opzione 1: "Pandoro + Buontalenti = tradizione + innovazione" Opzione 2: "Salsa mascarpone o pistacchio per twist gourmet?" Opzione 3: "Racconta lievitazione 36 ore per giustificare valore" 🛠️ Pro tip: Spolvera zucchero a velo AL MOMENTO del servizio per effetto neve fresca. Taglia spicchi uniformi stella a 8 punte. Temperatura ambiente per massimo profumo. Hot drink Spezie Arancia Mulled Wine (Vin Brulé) Bevanda calda speziata, servita con fetta d'arancia. È la proposta “comfort” della stagione: racconta profumo e rituale, poi guida l'upsell (mini panettone / churros / shot opzionali secondo store). Servizio: cup + mestolo dedicato Garnish: fetta d'arancia (sempre) Timing: servi caldo, non bollente Script: "È il nostro Vin Brulé speziato, perfetto da abbinare a un mini panettone" Pitch 1 - Presenta: profumo, spezie, fetta d'arancia (rituale). 2 - Servi con mestolo dedicato e garnish. 3 - Proponi combo: mini panettone / churros / dolce caldo. Collega sempre Vin Brulé ↔ macchina ↔ procedure (setup/chiusura) per coerenza e qualità. 💰 Upselling Combo: "Vuoi abbinarlo a un mini panettone?" Extra: "Aggiungiamo una salsa a parte per il dolce?" Premium: "Shot opzionale (secondo listino locale)" Warm slice 10" x lato No oil Servizio Caldo (Pandoro) Chiedi sempre se la fetta la vuole tiepida. Tosta 10 secondi per lato sulla piastra crepe (senza olio) e servi immediatamente. Piastra crepe: pulita e asciutta (mai olio) Timing: 10 secondi per lato Servizio immediato: impiatta subito per mantenere volume e calore Checklist 1 · Chiedi preferenza calda/fredda. 2 · Tosta 10" + 10" (no oil). 3 · Impiatta e proponi pairing (gelato/sauce). La fetta tiepida profuma e “vende” anche ai clienti vicini. Operazioni &amp; Conservazione Setup · Dati tecnici · Storage · Shelf life · Chiusura Setup Vin Brulé 600 ml Setup macchina Vin Brulé Setup corretto: outer tank con ~600 ml di acqua (senza raggiungere il max) e inner container inserito bene (non deve galleggiare). Outer tank: ~600 ml acqua, non oltre max Inner container: inserire correttamente (non float) Lid: sempre in posizione durante il mantenimento Procedura 1 · Acqua nel tank esterno (~600 ml, no max). 2 · Inserisci il contenitore interno e chiudi con lid. 3 · Versa il mix nel tank argento quando pronto a scaldare. Setting Level 10 25/30 min Warm-up &amp; mantenimento (Vin Brulé) Warm-up e mantenimento: livello 10 per 25–30 minuti, poi livello 6–7. Versare 500/1000 ml (meglio meno che troppo, in base alle vendite) Warm-up: livello 10 per 25–30 min Hold: livello 6–7 Checklist 1 · Versa il mix e porta a livello 10 (25–30 min). 2 · Quando è caldo, setta 6–7 per mantenimento. 3 · Lid sempre: riduce evaporazione e mantiene aromi. Conservazione Night Frigo Come conservarlo di notte Fine servizio: travasa in una jug, lascia raffreddare, copri con cling film e conserva in frigo con label. Jug: travaso a fine servizio Cool down: prima di coprire Frigo + shelf life label Procedura 1 · Travasa in jug e lascia raffreddare. 2 · Cling film una volta freddo. 3 · Frigo + label (data/ora). Dati tecnici Shelf life 3 / 30 Shelf life Vin Brulé (quick) Regola shelf life: in macchina 3 giorni dal primo warm-up; in box 30 giorni dal primo opening. Label obbligatoria. In macchina (warm): 3 giorni dal primo warm-up In box (mix): 30 giorni dal primo opening Label obbligatoria per entrambi Note 1 · Segna la data del primo warm-up. 2 · Applica label visibile in frigo. 3 · Se oltre shelf life: elimina. Chiusura Pulizia Soap + hot water Pulizia macchina (fine giornata) Dopo il travaso: lava inner container + lid con sapone e acqua calda, svuota/asciuga il tank acqua e pulisci l'esterno con panno umido. Inner container + lid: lavare con sapone e acqua calda Tank acqua: svuotare e asciugare Esterno: panno umido Checklist 1 · Lava e asciuga i pezzi interni. 2 · Svuota e asciuga il tank esterno. 3 · Rimonta e lascia la macchina pulita per l'apertura. Packaging Delivery Freezer hold Packaging mini panettone (delivery) Delivery standard: sauce pot 3/4 (1 pot per 2), panettoni agli angoli del treat box, lid + tape e freezer fino al ritiro rider. Sauce pot: 3/4 (quantità per due) Posizionamento: panettoni ai quattro angoli, sauce al centro Freezer: conserva in bag fino al pick-up driver Procedura 1 · Sauce pot 3/4 e posiziona al centro. 2 · Mini panettoni agli angoli del box, chiudi lid + tape. 3 · Bag in freezer fino al ritiro del driver. 🎉 Linea Festiva Tradizione e calore nelle feste 6 Prodotti 4 Procedure Nov-Gen Stagione
+Festive - Badiani
+Training
+Menu
+Categorie
+Brilla: i dettagli fanno la differenza.
 
-=== FONTE: gelato-lab.html ===
-Gelato Lab - Badiani Training Menu Categorie Brilla: i dettagli fanno la differenza. Story Orbit Operations &amp; Setup Bar & Drinks Sweet Treat Atelier Pastry Lab Slitti & Yo-Yo Gelato Lab Festive & Churros Lingua Italiano Italiano English Español Français Linea gelato ⭐ Stelle: 8/8 Gelato Lab Manuale per il banco gelato: porzioni, servizio take me home, coppe scenografiche e manutenzione della vetrina a -14/-15 °C. Gelato Lab Linea gelato Cups Piccolo 100g Coppette Coppette in tre misure: Piccolo (1 gusto, 100 g), Medio (1-2 gusti, 140 g), Grande (1-3 gusti, 180 g). La chiave è dosare correttamente il gelato e compattarlo bene per eliminare bolle d'aria e dare una presentazione uniforme. Pesatura: Piccolo 100-120g, Medio 160-200g, Grande 200-240g (controlla sempre) Tecnica scoop: lineare + ball per look professionale Compattamento: spingi il gelato sul lato della coppetta eliminando aria Ammorbidimento spatola: scaldala passandola sul gelato per facilitare il prelievo Completamento: offri sempre wafer e panna (upselling) Temperatura ideale gelato: -14/-15°C (se più caldo è difficile da dosare) Procedura 1 · Scalda spatola passando sul gusto per ammorbidirlo. 2 · Spingi gelato sul lato della coppetta eliminando aria. 3 · Offri wafer/panna e sorridi. Bambini possono scegliere due gusti anche sul piccolo. 💰 Upselling Opzione 1: "Vuoi passare al medio? Aggiungi un altro gusto e panna" Opzione 2: "Ti aggiungo panna montata e wafer croccante?" Opzione 3: "Con salsa al pistacchio diventa ancora più goloso" 🛠️ Pro tip: Pesa sempre le coppette per rispettare range grammi. Usa tecnica "scoop lineare + ball" per look professionale. Temperatura gelato ideale: -14/-15°C. Coni GF & Choco Coni classici Coni in tre varianti: Classico (1 gusto), Cioccolato o Gluten Free (1-2 gusti). Ogni cono va avvolto con tissue per grip e presentazione. Mantieni l'area dei coni sempre pulita per evitare contaminazioni di sapori. Avvolgimento: tissue sempre, per grip e look Dosaggio: 1 ball per cono piccolo, 1-2 ball per coni speciali (choco/GF) Posizionamento: appoggia la ball ruotando il cono per stabilità Pulizia area: ogni 30 minuti elimina briciole (assorbono umidità) Stock rotation: FIFO rigoroso (i coni assorbono umidità, usa quelli meno freschi prima) Upgrade upsell: cono cioccolato (ricoperto dentro e fuori), panna montata Procedura 1 · Avvolgi cono con tissue. 2 · Prepara ball e appoggiala ruotando. 3 · Proponi upgrade al cono choco o panna montata. Mantieni l'area dei coni pulita eliminando briciole. 💰 Upselling Opzione 1: "Upgrade al cono cioccolato? è ricoperto dentro e fuori" Opzione 2: "Cono gluten-free disponibile (se presente)" Opzione 3: "Vuoi panna montata sopra per look Instagram?" 🛠️ Pro tip: Pulisci area coni ogni 30 minuti per eliminare briciole. Rotazione stock: i coni assorbono umidità, usa FIFO rigoroso. Avvolgi sempre con tissue per grip. Box 500-1000 ml Gelato Boxes Gelato da asporto in box termici da 500/750/1000 ml. Ogni box mantiene il gelato al giusto stato per circa 1 ora se messo nella borsa termica. Comunica sempre al cliente di mettere subito in freezer a casa: il gelato cambia di consistenza quando si scongela. Piccolo: 500 ml (1-3 gusti) Medio: 750 ml (1-4 gusti) Grande: 1000 ml (1-5 gusti) Ordine inserimento: inizia dai gusti più morbidi (sorbet prima) per evitare contaminazione sapori Compattamento: elimina bene le bolle d'aria, pulisci bordi con spatola prima di sigillare Sigillatura: film + nastro Badiani, consegna in borsa termica Autonomia: 1 ora in borsa termica; comunica sempre il freezer a casa per mantenere qualità Procedura 1 · Inserisci gusti iniziando dai più morbidi (sorbet prima per evitare contaminazioni). 2 · Compatta eliminando bolle d'aria e pulisci bordi. 3 · Sigilla con film + nastro Badiani, consegna in borsa. Upsell box più grande + pack 10 waffle o coni. 💰 Upselling Opzione 1: "Il box grande da 1L ti fa provare più gusti diversi" Opzione 2: "Aggiungiamo pack di coni per servire a casa?" Opzione 3: "Con borsa termica mantieni tutto perfetto fino a 2 ore" 🛠️ Pro tip: Compatta bene eliminando aria per evitare cristalli. Pulisci bordi prima di sigillare. Autonomia: 1h in borsa termica, comunica sempre al cliente di mettere subito in freezer. Coppa gelato Whipped cream Coppa Gelato Tre boules di gelato in coppa di vetro, completate con panna montata, una salsa a scelta, mini cono e wafer Badiani. È la proposta “wow”: va costruita con ordine e servita subito per mantenere texture e pulizia del topping. Base: coppa in vetro Porzione: 3 scoops con scooper tondo (anche 3 gusti diversi) Top: panna montata + swirl di sauce scelta Finitura: mini cono + wafer Badiani Servizio: cucchiaio in acciaio, consegna immediata Procedura 1 · Prendi una coppa di vetro e prepara i gusti con lo scooper tondo: 3 boules regolari (anche di gusti diversi). 2 · Completa con panna montata e uno swirl della sauce scelta (senza sporcare i bordi). 3 · Aggiungi mini cono + wafer Badiani e servi con cucchiaio in acciaio. Proponi pairing con Slitti dragée per un dessert completo. 💰 Upselling Opzione 1: "Vuoi aggiungere granella di nocciola tostata e dragée Slitti?" Opzione 2: "Con doppia salsa pistacchio e cioccolato diventa signature" Opzione 3: "Abbinamento perfetto: Coppa + espresso affogato style" 🛠️ Pro tip: Usa bicchieri in vetro freddi per mantenere temperatura. Monta boules con scooper tondo per estetica uniforme. Servi immediatamente dopo guarnizione per evitare scioglimento panna. Setup &amp; Conservazione Apertura · Setting · Storage · Scampoli · Chiusura Apertura Vetrina gelato -14/-15 °C Preparazione vetrina (mattino) Pulisci, lucida e prepara la vetrina prima di esporre. Esponi solo quando la macchina arriva a -14/-15 °C. Pulizia: panno umido con acqua calda + sanitiser giallo sulle macchie gelato Metalli: blue spray + blue roll per far “shine” le superfici Setup: inserisci barre porta-vaschette, accendi, posiziona vaschette e sliding doors Esposizione: quando arriva a -14/-15 °C, carica i gusti e chiudi le sliding doors Checklist 1 · Pulisci e lucida (soprattutto metalli e sliding doors). 2 · Accendi e posiziona barre + vaschette. 3 · A -14/-15°C: esponi gelato e chiudi le porte scorrevoli. Controlla prima lo scampoli freezer: se un gusto è recuperabile, usalo correttamente. Setting Sliding doors HACCP Temperatura &amp; porte (standard) Standard chiave: vetrina a -14/-15 °C. Se lo store non è busy, le sliding doors devono essere in posizione per preservare la temperatura. Target: -14/-15 °C (registra su log HACCP se previsto in store) Porte: in posizione quando non c'è servizio attivo Utensili: le spatole usate per pulire vanno lavate e asciugate prima di passare ad altri gusti Regole 1 · Controlla temperatura e annota secondo standard locale. 2 · Mantieni le sliding doors chiuse tra un servizio e l'altro. 3 · Lava/asciuga gli utensili dopo ogni uso di pulizia per evitare contaminazioni. Conservazione Treat freezer Shelf life Shelf life treats (dopo esposizione) Tabella rapida: giorni massimi dopo esposizione nella vetrina treats. Cakes / Pinguinos / Mini semifreddo: 35 giorni Mini cakes / Mini cones: 21 giorni Cookies: 14 giorni Tabella Shelf life una volta esposti Cakes / Pinguinos / Mini semifreddo: 35 giorni Mini cakes / Mini cones: 21 giorni Cookies: 14 giorni Setting Treat freezer -14 °C Gestione treat freezer Vetrina verticale a -14 °C, defrost weekly, tutto esposto con guanti. Disporre cakes su shelf alto, cookies/pinguini su quello basso (eye level kids) Shelf life dopo esposizione: cakes/pinguini 35 giorni, mini semifreddi 35, mini cakes 21, mini cones 21, cookies 14 Routine 1 · Massimizza spazio, FIFO. 2 · Ricorda ai clienti che sono prodotti gelato. 3 · Usa box termico (autonomia 1h) per take away. Pulizia ghiaccio weekly per mantenere visibilità impeccabile. 💰 Upselling Tecnica 1: "Posiziona treats a eye-level bambini per vendite impulse" Tecnica 2: "Box misto pinguini/cookies per feste (secondo listino locale)" Tecnica 3: "Mini semifreddi perfetti per dessert last-minute a casa" 🛠️ Pro tip: Mantieni freezer a -14°C costanti. Rimuovi ghiaccio settimanale con spatola plastica per non graffiare. Usa guanti sempre per manipolazione igienica. Dati tecnici Scampoli 5–7 cm Regola Scampolo (1/4 pan) Quando un gusto ha meno di 1/4 di vaschetta è uno scampolo e va sostituito. Puoi integrarlo poco alla volta nella vaschetta nuova, senza superare 5–7 cm. Definizione: &lt; 1/4 pan = scampolo Aggiunta: circa 100 g alla volta (lato di uno scoop) Limite: massimo 5–7 cm di scampolo totale Procedura 1 · Prendi lo scampolo dallo scampoli freezer. 2 · Aggiungi piccoli quantitativi e livella (non deve “sembrare aggiunto”). 3 · Non superare 5–7 cm di scampolo complessivo. Scampolo = controllo sprechi, ma sempre rispettando lo standard visivo. Chiusura Deep clean Weekly Chiusura &amp; deep clean vetrina Routine: vetrina OFF ogni notte. Deep clean completo una volta a settimana, inclusa la pulizia filtri. Ogni sera: switch off + pulizia ordinaria Weekly: deep clean completo + cleaning filtri Focus: rimuovere nuts/crumbs e sanificare tutte le superfici Deep clean steps 1 · Rimuovi pannelli bottom e pulisci macchie gelato. 2 · Elimina nuts/crumbs; sanitising spray + panno su tutte le superfici. 3 · Blue spray + blue roll per lucidare; deep clean label stands; rimonta e riaccendi. Porte scorrevoli: se non busy, devono essere in posizione per preservare temperatura. 🍦 Gelato Lab L'arte del gelato fiorentino -14°C Temp. Ideale 1932 Heritage
+Story Orbit
+Operations &amp; Setup
+Bar & Drinks
+[+ gelato-lab.html, pastries.html]
 
-=== FONTE: index.html ===
-Badiani Training Orbit Caricamento in corso... Training Profilo Menu Orbit Hub Story Orbit Operations &amp; Setup Beverage & Treats Bar & Drinks Sweet Treat Atelier Pastry Lab Gelato & Speciali Slitti & Yo-Yo Gelato Lab Festive & Churros Lingua Italiano Italiano English Español Français Training Orbit Hub operativo · aggiornato ogni giorno Playbook operativo Badiani 1932 Tradizione fiorentina, rituali di boutique e procedure digitalizzate in un'unica plancia: consulta, ripassa e chiudi i quiz per riscattare gelati reali. Apri categorie Regolamento Orbit cockpit Panoramica live Scorri le schede e resta sempre sul pezzo. Training 📅 Training quotidiano Caricamento... Guadagna stelline extra. Oggi 0 Stelle Gelati 0 Quiz OK 0 Storico 0 Gelati Totali Stelle Tot 0 Bonus 0 Errori 0 Recenti Vedi tutti Giorni 📊 Storico Attivit ultimi 14 giorni Profilo 👤 — — Modifica Cambia Parla con BERNY Assistente Categorie Brilla: i dettagli fanno la differenza. Story Orbit Operations &amp; Setup Bar & Drinks Sweet Treat Atelier Pastry Lab Slitti & Yo-Yo Gelato Lab Festive & Churros 👤 Profilo 🌍 Lingua Italiano Italiano English Español Français
+Sweet Treat Atelier
+Pastry Lab
+Slitti & Yo-Yo
+[+ gelato-lab.html, pastries.html]
 
-=== FONTE: operations.html ===
-Operations &amp; Setup · Badiani Training Menu Categorie Brilla: i dettagli fanno la differenza. Hub Operations &amp; Setup Story Orbit Bar &amp; Drinks Sweet Treat Atelier Pastry Lab Slitti &amp; Yo-Yo Gelato Lab Festive &amp; Churros Lingua Italiano Italiano English Español Français Playbook operativo ⭐ Stelle: 0/6 Operations &amp; Setup Una sezione dedicata a tutte le schede che non sono “prodotti”: apertura, set-up vetrine, packaging, procedure di servizio e chiusura. Qui trovi gli standard che tengono il banco pulito, veloce e coerente. Standard operativi Apertura · Setup · Service · Chiusura Prep mattino -14 °C HACCP Routine apertura Controllo temperature, pulizia vetri, riordino vaschette (FIFO) e verifica etichette. La vetrina è il primo biglietto da visita: deve essere impeccabile e ordinata. Temperature: -14/-15°C (registra su log HACCP) Pulizia: vetri interni/esterni con prodotto specifico Vaschette: riordina per colore/gusto, pulisci bordi vaschetta Etichette: tutte presenti, dritte e pulite Utensili: spatole pulite e in acqua corrente (se sistema a flusso continuo) o cambi frequenti Checklist 1 · Registra temperature su log HACCP. 2 · Pulisci vetri e bordi vaschette. 3 · Verifica etichette e utensili pronti. Se una vaschetta è quasi vuota, sostituiscila subito (non raschiare il fondo davanti al cliente). Display FIFO Visual Set-up giornaliero Cake stand con slice mancante, croissant su tray dedicati, brownies/puddings allineati. Vetrina deve sembrare sempre piena Label accanto al prodotto Prima fetta di loaf esposta Checklist 1 - Posiziona cakes sui cake stand e rimuovi una fetta per mostrare l'interno. 2 - Disponi croissant in base ai gusti disponibili mantenendo le file pulite. 3 - Aggiorna etichette, verifica shelf life e riempi all'occorrenza. Fotografa il set-up ideale e condividilo nel gruppo store per mantenere coerenza. Warm slice 10'' x lato Service Servizio Caldo (Pandoro) Pandoro scaldato: stessa tecnica del panettone. 10 secondi per lato sulla piastra crepe (senza olio). Toasta leggero per ravvivare la struttura. Servi immediatamente con pairing consigliato (crema mascarpone tiepida, gelato, sauce). Chiedi preferenza al cliente: "Vuoi la versione tiepida?" Piastra crepe: pulita e asciutta, no olio Timing: 10 secondi per lato (non di piu') Servizio immediato: impiatta subito per mantenere volume e calore Campioni: tieni piccoli triangoli per assaggiare durante le ore di punta (storytelling) Abbinamenti tiepidi: crema mascarpone calda, gelato freddo (contrasto), salsa cioccolato Checklist 1 - Chiedi preferenza al cliente. 2 - Tosta e impiatta rapidamente per non perdere volume. 3 - Servi con pairing consigliato. Campiona piccoli triangoli per raccontare prodotto nelle ore di traffico. 💰 Upselling Opzione 1: "Vuoi la versione calda con gelato? Esperienza premium" Opzione 2: "Aggiungiamo crema mascarpone tiepida?" Opzione 3: "Chiedi SEMPRE preferenza calda/fredda per guidare upsell" 🛠️ Pro tip: 10 secondi per lato esatti, no di piu' o si secca. Impiatta veloce per non perdere volume soffice. Campiona triangolini nelle ore punta per stimolare ordini. Delivery Treat box Take away Packaging take away Per due panettoni: una sauce pot riempita 3/4, quattro angoli del treat box. Procedura 1 - Inserisci sauce pot al centro, blocca i panettoni agli angoli. 2 - Chiudi con lid + tape, etichetta shelf life. 3 - Conserva in freezer finche' il rider arriva. Comunica al cliente autonomia termica e modalita' di servizio. 💰 Upselling Opzione 1: "Box da 4 mini invece di 2? Perfetto per famiglia" Opzione 2: "Aggiungiamo doppia salsa per variare gusti?" Opzione 3: "Con biglietto auguri brandizzato diventa regalo perfetto" 🛠️ Pro tip: Sauce pot al centro per stabilita'. Blocca mini negli angoli. Etichetta shelf life e istruzioni servizio. Conserva in freezer fino consegna rider per mantenere qualita'. Setup Vin Brulé Tank Allestimento macchina Macchina Vin Brulé: riempire tank esterno con 600 ml d'acqua senza superare il max, inserire contenitore interno. Procedura 1 - Versa 500/1000 ml di mix nel tank argento. 2 - Porta temperatura a livello 10 per 25-30 min; poi mantieni a 6-7. 3 - Usa il coperchio durante il mantenimento per evitare evaporazione. Meglio scaldare piccoli lotti per garantire freschezza e aromi. 💰 Upselling Visual appeal: "Setup macchina in area visibile per attirare ordini" Sampling: "Offri mini assaggi nelle ore punta per conversione" Bundle: "Mulled wine + mini panettone = combo festiva perfetta" 🛠️ Pro tip: Tank esterno: 600ml acqua max. Livello 10 per 25-30 min riscaldamento, poi 6-7 mantenimento. Piccoli batch = freschezza. Coperchio evita evaporazione aromi. Servizio Vin Brulé Chiusura Service & chiusura Vin Brulé: servi con mestolo, fetta d'arancia e controllo shelf life. Procedura 1 - Riempire cup con mestolo, aggiungere fetta d'arancia. 2 - A fine giornata travasa nel bricco, lascia raffreddare e copri con pellicola. 3 - Frigo + label (3 giorni dal primo warm-up; 30 giorni per mix non aperto). Pulire tank, contenitore e esterno macchina ogni sera con acqua calda e detergente. 💰 Upselling Opzione 1: "Vuoi aggiungere shot di rum per versione adulta?" Opzione 2: "Fetta d'arancia fresca + cannella stick = presentazione Instagram" Opzione 3: "Racconta spezie natalizie e tradizione per valore percepito" 🛠️ Pro tip: Servi con mestolo dedicato. Fetta arancia fresca sempre. Shelf life: 3 giorni da primo riscaldamento, 30 giorni mix chiuso. Pulizia tank ogni sera con acqua calda. Dati tecnici &amp; Conservazione Quick reference · Temperature · Shelf life · FIFO Setting Temperature Quick ref Temperature chiave (quick map) Temperature chiave da tenere a mente per evitare prodotti fuori standard. Gelato vetrina: -14/-15 °C (target) Display freezer treats: almeno -14 e senza ghiaccio (defrost weekly) Thermal storage box (gelato take-away): autonomia max 1 ora prima di tornare in freezer Uso 1 · Se la temperatura è fuori range: avvisa subito e non “compensare” con service tricks. 2 · Sliding doors in posizione quando non busy per preservare -14/-15. 3 · Defrost e pulizia programmata = stabilità temperature. Conservazione FIFO Label FIFO &amp; etichette (regola d'oro) Ogni modulo “storage” in questo training ha un punto comune: FIFO + label chiare. Etichetta sempre: data preparazione/apertura + scadenza First in, first out: usa prima ciò che scade prima Se manca la label: non servire (chiedi al manager) Checklist 1 · Controllo label a inizio turno. 2 · Controllo FIFO durante i refill. 3 · Controllo scadenze in chiusura. Shelf life Prep Frigo Shelf life rapidi (mix &amp; premade) Promemoria shelf life per controlli veloci durante apertura, refill e chiusura. Crepe mix: 3 giorni (frigo) + riposo minimo 2 ore Waffle mix (pre-packed): 2 giorni Premade matcha: 1 giorno (incluso giorno di preparazione) → frigo Mulled wine: 3 giorni dal primo warm-up (mix in macchina) Regole 1 · Prepara batch “quanto serve”: meno sprechi, più qualità. 2 · Label sempre (data/ora). 3 · Oltre shelf life: elimina e rifai. Packaging Take away 1h Take-away: autonomia termica La thermal storage box ha autonomia massima di 1 ora: poi il prodotto deve tornare in freezer. Comunicalo sempre al cliente (qualità e sicurezza) Consiglia freezer appena possibile Evita soste “lunghe” fuori controllo (rider/attese) Script 1 · “Questa box tiene circa 1 ora: poi freezer.” 2 · Offri bag termica se prevista dallo store. 3 · Per delivery: conserva in freezer fino al ritiro. Chiusura Weekly Routine Schedule pulizie (giorno / settimana) Chiusura e manutenzione programmata = performance costanti e meno imprevisti in servizio. Gelato vetrina: OFF ogni notte Gelato vetrina: deep clean weekly Filtri: cleaning weekly Display freezer treats: defrost weekly (free of ice) Checklist 1 · Segna la giornata di deep clean (non improvvisare). 2 · Pulisci prima che si accumuli: è più veloce. 3 · Dopo la pulizia: rimonta, sanitizza e lucida. 🧩 Operations &amp; Setup Standard che rendono il servizio semplice 6 Schede Daily Uso Setup Focus
+Gelato Lab
+Festive & Churros
+👤 Profilo
+🌐
+[+ gelato-lab.html, pastries.html]
 
-=== FONTE: pastries.html ===
-Pastry Lab · Badiani Training Menu Categorie Brilla: i dettagli fanno la differenza. Story Orbit Operations &amp; Setup Bar & Drinks Sweet Treat Atelier Pastry Lab Slitti & Yo-Yo Gelato Lab Festive & Churros Lingua Italiano Italiano English Español Français Pasticceria da banco ⭐ Stelle: 6/6 Pastry Lab Tutte le referenze servite al banco: cakes, brownies, loaf, croissant farciti e scones con scoop di Buontalenti. Ogni scheda include shelf life, porzioni e script di upselling. Pastry Lab Pasticceria da banco 14 fette Shelf 2-3 giorni Cakes Chocolate (3g), Carrot (2g), Walnut (3g) rispettando 14 fette per torta. Usa il cake slicer come guida Servi su piatto con posate Upsell scoop Buontalenti + sauce Step & tips 1 → Posiziona il cutter e incidi le 14 porzioni. 2 → Servi la fetta su piatto e racconta pairing con gelato. 3 → Se upsell riuscito, aggiungi scoop con milkshake scooper e drizzle sulla fetta. Ricorda al team: tazza di cioccolata calda + cake crea combo premium. 💫 Upselling Opzione 1: "Vuoi arricchire la fetta con uno scoop di Buontalenti?" Opzione 2: "Aggiungiamo un drizzle di salsa pistacchio o caramello?" Opzione 3: "La combo perfetta? Cake + cioccolata calda" ✨ Pro tip: Conserva le cakes coperte con film tra un taglio e l'altro per evitare secchezza. Temperature ambiente: max 2 ore fuori frigo. Brownie Shelf 4 giorni Brownie Tray Taglio 4x3 (12 pezzi) e servizio su piatto con cutlery. Display su tray dedicato Upsell gelato + sauce Comunicare shelf life Step & tips 1 - Taglia 12 pezzi uguali, esponi su vassoio. 2 - All'ordine, impiatta e offri scoop Buontalenti. 3 - Servi con drizzle sul brownie e sul gelato. Ricorda di usare il round scooper per mantenere porzione perfetta. Loaf 10 slice Shelf 4 giorni Banana / altri loaf Ogni loaf deve fornire 10 fette. Servizio e upsell identici alle cakes. Taglia spessori costanti Servi con posate Proponi sauce preferita Step & tips 1 - Taglia 10 slice uguali, esponi la prima. 2 - Aggiungi scoop + sauce se il cliente accetta. 3 - Mantieni il loaf avvolto quando non in uso. Comunica shelf life sul label per facilitare i controlli HACCP. Croissant Shelf 2 giorni Croissant farciti Croissant gia' sfogliato, da farcire con la sauce richiesta dal cliente. Apri lateralmente, riempi e completa la presentazione su piatto con forchetta e coltello. Ricordati di riscaldare leggermente i croissant del giorno prima per ravvivare la fragranza. Shelf life: 2 giorni dal defrost (controlla data) Incisione: usa coltello seghettato, apri il lato in orizzontale Riempimento: sac a poche per uniformita' e precisione Presentazione: sauce inside + drizzle sopra, piatto pulito, posate sempre Riscaldamento (se necessario): 8-10 secondi solo; mai oltre 15s (la farcitura si scioglie) Step & tips 1 - Incidi lato con coltello seghettato. 2 - Riempie interno e topping esterno con la stessa sauce. 3 - Impiatta, aggiungi posate e servi. Comunica shelf life e rotazione: 2 giorni dal defrost. Scones Gelato 70 g Scone con Buontalenti Scalda 15 s nel gelato burger machine, farcisci con scoop Buontalenti e sauce. Taglia orizzontalmente Usa milkshake scooper Finitura pistacchio o cioccolato Step & tips 1 - Riscalda 15 s. 2 - Taglia, inserisci scoop e richiudi. 3 - Sauce top, impiatta con posate. Ricorda ai clienti la doppia consistenza caldo/freddo per valorizzare l'upsell. Setup &amp; Conservazione Apertura · Dati tecnici · Shelf life · FIFO · Chiusura Apertura Display FIFO Set-up vetrina (look &amp; ordine) Obiettivo apertura: vetrina piena, ordinata e leggibile. Label sempre accanto al tray corretto; le cakes sui cake stand con una fetta rimossa per mostrare l'interno. CAKES: cake stands + rimuovi 1 slice (visual interno) CROISSANTS: su tray dedicati (file pulite) BROWNIES/PUDDING/TARTS/SCONES: su tray, allineati LOAF: taglia e mostra la prima fetta sul tray Checklist 1 · Ripristina vetrina “full look” (senza buchi visivi). 2 · Metti le label accanto al tray giusto (mai generiche). 3 · Verifica FIFO e shelf life prima del primo servizio. Coerenza visiva = vendite. Il banco “pieno” invita all'acquisto. Dati tecnici Taglio Porzioni Tagli standard (porzionatura) Porzioni costanti = qualità costante. Usa sempre gli stessi tagli per controllo food cost e per lavorare “in squadra”. Cake: usa il cake slicer guida 14 fette Brownie tray: taglio 4×3 = 12 pezzi Loaf: ricava 10 fette dalla forma intera Note 1 · Usa sempre lo stesso strumento guida (slicer / righello visivo). 2 · Se una porzione è fuori standard, correggi subito il taglio successivo. 3 · Mantieni le lame pulite: taglio netto = presentazione premium. Shelf life Etichette Controllo Shelf life (quick list) Lista shelf life per controlli quotidiani, rotazione e label corrette. Chocolate Cake: 3 giorni Carrot Cake: 2 giorni Walnut Cake: 3 giorni Brownie: 4 giorni Banana Loaf: 4 giorni Croissants: 2 giorni Scones: 2 giorni Regole 1 · Etichetta sempre: data defrost/apertura + scadenza. 2 · FIFO rigoroso (first in, first out). 3 · In dubbio: non servire (chiedi al manager). Conservazione Vetrina piena Label Come mantenerla “sempre piena” Regola vetrina: deve apparire sempre piena e ordinata. Le label stanno accanto al tray corretto, sempre. Ridisponi i prodotti per chiudere vuoti (senza mescolare referenze) Allinea fronti: brownie/loaf/croissant sempre “in squadra” Controlla che le label siano leggibili e coerenti con il tray Checklist 1 · Riempi e riallinea dopo ogni rush. 2 · Aggiorna le label quando cambia il tray (mai lasciare “vecchie”). 3 · Verifica scadenze durante i refill. Visual merchandising = training: è una skill, non un dettaglio. Chiusura Pulizia FIFO Chiusura vetrina (routine) Obiettivo: ripristinare ordine e preparare una partenza veloce domani, senza perdere controllo su shelf life. Rimuovi briciole e residui dai tray (prima che diventino “incollati”) Raggruppa per referenza e verifica scadenze (FIFO) Controlla che tutte le label siano presenti e corrette Checklist 1 · Riordina per categoria, controlla date e scarta ciò che è oltre shelf life. 2 · Pulisci superfici e tray; asciuga prima di richiudere. 3 · Prepara il banco “apertura-ready”: label e layout già impostati. 🥐 Pastry Lab Colazione & Merenda Daily Frequenza Fresh Qualità
+Lingua
+Italiano
+Italiano
+English
+Español
+Français
+Linea Festiva
 
-=== FONTE: quiz-solution.html ===
-Soluzione quiz · Badiani Quiz · Soluzione Rivedi la risposta corretta Caricamento domanda... Caricamento risposta corretta... Spiegazione: Suggerimento: 📚 Berny consiglia di rivedere: ⬅ Torna all'hub 📖 Apri specifiche ↩ Torna indietro
+⭐ Stelle: 10/10
+Churros, Panettoni & Vin Brule'
 
-=== FONTE: slitti-yoyo.html ===
-Slitti & Yo-Yo - Badiani Training Menu Categorie Brilla: i dettagli fanno la differenza. Story Orbit Operations &amp; Setup Bar & Drinks Sweet Treat Atelier Pastry Lab Slitti & Yo-Yo Gelato Lab Festive & Churros Lingua Italiano Italiano English Español Français Cioccolato & snack ⭐ Stelle: 7/7 Slitti & Yo-Yo Storytelling sul brand toscano Slitti, gamma premium (tavolette, mini cakes, praline, dragée, creme) e la procedura Yo-Yo per servire il biscotto farcito con gelato. Slitti & Yo-Yo Cioccolato & snack Montecatini Terme Since 1969 Timeline essenziale Luciano Slitti apre come torrefazione nel 1969. Nel 1990 Andrea introduce il cioccolato e, insieme al fratello Daniele, conquista premi internazionali (Grand Prix 1994, Eurochocolate 1996, miglior chocolatier italiano 2008). Key message 1. Valorizza la selezione rigorosa di materie prime. 2. Racconta premi e heritage toscano per giustificare il posizionamento premium. 3. Invita il cliente ad assaggiare abbinando caffè o gelato. Usa la palette blu/pink per creare piccole schede storytelling accanto all'esposizione. Tavolette Gran Cacao Tavolette LatteNero & Gran Cacao Tavolette Slitti in diversi profili di cacao (45%, 51%, 73%, 82%, 100%) + Caffè Latte aromatizzata con arabica tostata. Spiega il blend: cacao + cacao butter per morbidezza, equilibrio tra zuccheri e latte (nei profili più dolci). Profili disponibili: LatteNero (45%, 51%, 73%, 82%, 100%), Caffè Latte con arabica Composizione: cacao selezionato + cacao butter + latte (nei profili LatteNero) Conservazione: 16-18°C, lontano da luce diretta e odori forti Pitch 1. Chiedi preferenza cliente (latte/dark). 2. Suggerisci pairing con espresso o cappuccino. 3. Ricorda la confezione regalo e shelf life lunga. Esporre sample aperto per mostrare pattern; mantieni stock FIFO. Mini cakes Hazelnut / Almond Minicake Mini cake Slitti con materie prime d'eccellenza: nocciole Tonda Gentile (Langhe) e mandorle Avola (Sicilia). Tre varianti: latte nocciole, fondente mix fruit, fondente mandorle. Servi a temperatura ambiente o leggermente tiepida. Varianti: latte nocciole Langhe, fondente mix fruit, fondente mandorle Avola Materie prime: Tonda Gentile Langhe DOP, mandorla Avola DOP (comunica origine) Servizio: temperatura ambiente oppure 10 secondi microonde per esaltare profumi Notes 1. Spiega differenza ingredienti (Tonda Gentile, mandorla Avola). 2. Servi a temperatura ambiente o leggermente tiepida. 3. Consiglia accompagnamento con crema spalmabile Slittosa. Praline Dragée Praline & Dragée Praline Origin e Irish Coffee (0,9% alc) + dragée su base di pistacchio, mandorla, nocciola, cranberry, arachidi caramel, amarene e arabica. Ogni dragée racconta la propria provenienza: Bronte, Avola, Langhe. Mantieni sempre temperatura fresca e luce bassa. Praline: Origin, Irish Coffee (0,9% alcol), Passion Fruit Dragée: pistacchio Bronte, mandorla Avola DOP, nocciola Langhe, cranberry, arachidi caramel, amarene, arabica, zenzero Provenienza: evidenzia su lavagnette (Bronte, Avola, Langhe) per valore Display tips 1 · Mantieni temperatura fresca e luce bassa. 2 · Offri assaggio se apri una confezione campione. 3 · Pairing suggeriti: pistacchi con Pistachio Hot, ginger con chai. Spalmabili 37-57% nocciole Creme Slittosa / Riccosa / Gianera Solo nocciole Tonda Gentile + cacao selezionato. Nocciola %: 37 (Slittosa), 51 (Riccosa), 57 (Gianera). Composizione: solo nocciole Tonda Gentile + cacao (zero olio di palma) Profili: Slittosa 37% (dolce), Riccosa 51% (equilibrio), Gianera 57% (intensa) Display: mostra texture con spatola monouso per igiene Vendita 1 · Mostra texture con spatola monouso per igiene. 2 · Suggerisci su crepe, waffle, panettone o gelato. 3 · Posizionamento strategico vicino cassa per impulse buy. Yo-Yo Gelato Sandwich Yo-Yo Due biscotti morbidi che racchiudono uno strato di gelato. Disponibile in vari gusti. Conservazione: -18°C (freezer) Servizio: Tovagliolino o piattino Varianti: Classico, Pistacchio, Cioccolato Step & tips 1 · Preleva dal freezer al momento dell'ordine. 2 · Servi immediatamente per evitare che il gelato si sciolga. 3 · Suggerisci come snack veloce o dessert da passeggio. Setup &amp; Conservazione Apertura · Display · Dati tecnici · Storage · Chiusura Apertura Display Yo-Yo Allestimento Yo-Yo (banco) Yo‑Yo al centro sopra la vetrina: area sempre pulita e rifornita (mai vuoto visivo). Posizionamento: centrale, sopra la gelato vetrina Hygiene: superficie sempre free of crumbles Replenish: riempi/rifornisci ogni volta (mai “vuoto” visivo) Checklist 1 · Pulisci l'area (zero briciole). 2 · Posiziona la stazione Yo-Yo in punto visibile e centrale. 3 · Prepara wafer/tool e guanti monouso per il servizio. Il Yo-Yo vende anche “con gli occhi”: non lasciarlo mai disordinato. Setting Tool Gloves Stazione e strumenti (standard) Stazione pronta = servizio veloce e pulito: guanti, tool e wafer già a portata. Guanti: indossali prima di maneggiare wafer/Yo-Yo tool Tool: appoggia Yo-Yo tool su un piatto con 2 wafer pronti Flow: prepara wafer → gelato → chiusura, senza “giri” inutili Procedura 1 · Guanti on. 2 · Wafer sul tool, una base pronta. 3 · Chiudi subito dopo porzionatura per evitare overflow. Ordine fisso = velocità e costanza tra team. Dati tecnici 80/90 g Precisione Porzionatura gelato Yo-Yo Porzione 80–90 g: gelato dentro i wafer, bordo pulito (zero overflow). Porzione target: 80–90 g Scoop: usa il gelato con ice-cream scooper Controllo: non overflow (è un difetto visivo + sporca la stazione) Tips 1 · Posiziona il gelato centralmente. 2 · Chiudi con il secondo wafer e verifica bordo pulito. 3 · Se sporchi: pulisci subito (non “rimandare”). Precisione oggi = meno sprechi domani. Conservazione Pan method Label Pan storage method (etichettatura) Pan storage: etichetta sempre (data/contenuto). Label chiare = meno errori. Etichetta: data + contenuto + responsabile (secondo standard store) Non miscelare wafer diversi nello stesso contenitore Controllo briciole: ogni refill = quick wipe Checklist 1 · Applica label sempre prima di mettere in posizione. 2 · Controlla integrità wafer (no rotti in vista). 3 · Refill = anche pulizia: togli crumbles e residui. Chiusura Pulizia Riordino Chiusura stazione Yo-Yo Chiusura: pulisci, riordina e lascia la stazione “apertura‑ready”. Rimuovi crumbles e residui dalla superficie e dagli strumenti Riponi wafer e tool secondo procedura (con label se usi pan storage) Check rapido: stazione “apertura-ready” Checklist 1 · Pulisci e asciuga strumenti e area. 2 · Riponi stock con label corrette. 3 · Lascia il piano libero e ordinato. 🍫 Slitti & Yo-Yo Cioccolato d'autore & Snack Premium Qualità Toscana Origine
+Procedura ufficiale per i prodotti delle feste: frittura churros, servizio Panettone/Pandoro con upsell
 
-=== FONTE: story-orbit.html ===
-Story Orbit · Badiani Training Menu Orbit Hub Story Orbit Operations &amp; Setup Beverage &amp; Treats Bar & Drinks Sweet Treat Atelier Pastry Lab Gelato &amp; Speciali Slitti &amp; Yo-Yo Gelato Lab Festive Lingua Italiano Italiano English Español Français Categorie Brilla: i dettagli fanno la differenza. Story Orbit Operations &amp; Setup Bar & Drinks Sweet Treat Atelier Pastry Lab Slitti &amp; Yo-Yo Gelato Lab Festive &amp; Churros Lingua Italiano Italiano English Español Français Brand Book – Heritage ⭐ Stelle: 0/5 Story Orbit Badiani 1932 Timeline immersiva per raccontare origine, cultura del Buontalenti e promessa di marca. Materiale estratto dal Brand Book ufficiale con immagini leggibili, citazioni e rituali da usare nei training. History Gelato culture Brand promise Click per ingrandire 🏛️ Tradizione Origini 1932 – Firenze Heritage Tradizione fiorentina Origini 1932: gelateria artigianale nel cuore di Firenze. Stile italiano: eleganza, accoglienza, cura del dettaglio. Storia di famiglia: passaggi generazionali e know-how. Pitch da 20 secondi "Firenze nel cono, ogni giorno": racconta che la stessa mano artigianale del 1932 vive in ogni laboratorio Badiani. Cartolina dal Piazzale Accoglienza boutique Passaggi generazionali Firenze 1932 ✨ Idea Badiani Visione e filosofia Visione Idea Badiani Innovazione continua su gusti e rituali di servizio. Esperienza boutique: qualità percepita in ogni touchpoint. Team training: storytelling coerente con la brand promise. Mantra da banco "Nuovo e fedele": ogni novità preserva l'equilibrio e la gentilezza del gesto italiano. Brand promise Tono caldo, sicuro Curiosità sul menù Brand book Vision 🍦 Cultura Gelato Buontalenti &amp; spatolatura Gelato Cultura del gelato Buontalenti: crema iconica, texture setosa e spatolatura morbida. Ingredienti: latte fresco, panna, tuorlo, zucchero bilanciato. Rituale: primo assaggio consigliato per educare il palato. Rituale di degustazione Offri un micro-assaggio di Buontalenti prima di ogni scelta e spiega che la spatola serve a tenere l'aria fuori e la cremosità dentro. Prima cucchiaiata guidata Texture seta Voce da laboratorio Buontalenti Signature 👑 Buontalenti Signature hero Iconic Buontalenti signature Il nostro eroe: crema inventata a Firenze, simbolo del brand. Racconto al banco: invita all'assaggio e spiega la spatolatura. Pairing: affogato, coppetta con topping caldo, degustazione guidata. Hero moment Firma l'ordine con un suggerimento: "Provi il Buontalenti con una colata di cioccolato Slitti o in affogato?" Signature tasting Assaggio guidato Pairing caldo/freddo Signature Experience 📖 Story Orbit Heritage Badiani 1932 4 Moduli Moduli Brand Story Brand Story Firenze Origine Origine &times;
+Buontalenti, mini gift e gestione mulled wine.
+Prodotti Festivi
 
-=== FONTE: sweet-treats.html ===
-Sweet Treat Atelier · Badiani Training Menu Categorie Brilla: i dettagli fanno la differenza. Story Orbit Operations &amp; Setup Bar & Drinks Sweet Treat Atelier Pastry Lab Slitti &amp; Yo-Yo Gelato Lab Festive &amp; Churros Lingua Italiano Italiano English Español Français Linea Dessert · 2025 ⭐ Stelle: 13/13 Sweet Treat Atelier Laboratorio digitale per crepe, waffle, burger di gelato e set da tè. Include grammature, shelf life, ordine di assemblaggio e scenografia di servizio per stupire in boutique. Sweet Crepes & Waffles Dolci tentazioni Base Mix Sauce Only Crepe con Salsa Crepe classica servita con una delle nostre salse signature (Pistacchio, Nocciola, Cioccolato). Base perfetta per ogni aggiunta. Shelf life mix: 3 giorni (frigo) Riposo: almeno 2 ore (frigo) Cottura: 20s per lato Step & tips 1 · Stendi mix, gira quando dorata. 2 · Spalma la salsa su metà, chiudi a mezzaluna poi a ventaglio. 3 · Impiatta, zucchero a velo e drizzle di salsa sopra. ✨ Pro tip: La piastra deve essere ben calda ma non fumante. Il primo giro è spesso di test. Best Seller Buontalenti Signature Buontalenti Crepe Il nostro best seller: Crepe con salsa a scelta e uno scoop di Buontalenti on top. Gelato: 1 scoop Buontalenti (70g) Salsa: 30g interna + decorazione Servizio: Piatto dessert con posate Step & tips 1 · Prepara la crepe con salsa come da standard. 2 · Piega a ventaglio e spolvera con zucchero a velo. 3 · Adagia lo scoop di Buontalenti sopra e finisci con salsa. Aggiungi il gelato solo all'ultimo secondo per evitare che si sciolga sulla crepe calda. Crunchy 5 min totali Waffles Waffle dorato e croccante fuori, soffice dentro. Servito con salse, frutta o gelato. Cottura: 2.5 min per lato (5 min tot) Riposo: 45s per croccantezza Batter: 1 scoop (177ml) Step & tips 1 · Versa il mix nella piastra calda e chiudi. 2 · Cuoci 2.5 min, gira e cuoci altri 2.5 min. 3 · Lascia riposare su griglia 45s prima di decorare. Il riposo è fondamentale: se servito subito risulta molle. Stack x3 Breakfast Pancake Stack Torre di 3 pancake soffici. Serviti con sciroppo d'acero, frutta fresca o salse Badiani. Porzione: 3 pezzi Cottura: Fino a comparsa bolle Topping: Generoso Step & tips 1 · Versa 3 dischi di impasto sulla piastra. 2 · Gira quando compaiono le bolle in superficie. 3 · Impila e decora abbondantemente. Savory Plain Base Crepe Italiana (Plain) Mozzarella, rucola e pomodorini su base classica. Fresca e leggera. Base: Classica Ripieno: Mozzarella, rucola, pomodorini Condimento: Olio EVO, sale, origano Step & tips 1 · Cuoci la crepe e gira. 2 · Aggiungi mozzarella e fai sciogliere leggermente. 3 · Aggiungi rucola e pomodorini conditi, chiudi a portafoglio. Savory Beetroot Base Crepe Italiana (Beetroot) La variante colorata: impasto alla barbabietola per un look unico e un tocco dolce-terroso. Base: Beetroot (Barbabietola) Ripieno: Mozzarella, rucola, pomodorini Visual: Colore rosso/viola intenso Step & tips 1 · Usa il mix beetroot (3g polvere per 250g mix). 2 · Procedi come per la classica Italiana. 3 · Il contrasto di colori è il punto di forza: lascia intravedere il ripieno. Prosciutto Plain Base Crepe Prosciutto (Plain) Classica con Prosciutto Crudo, mozzarella e rucola. Base: Classica Ripieno: Crudo, mozzarella, rucola Servizio: Calda e filante Step & tips 1 · Sciogli la mozzarella sulla crepe in cottura. 2 · Aggiungi il prosciutto a fine cottura per non cuocerlo troppo. 3 · Completa con rucola e chiudi. Prosciutto Beetroot Base Crepe Prosciutto (Beetroot) Prosciutto Crudo su base alla barbabietola. Un twist moderno su un classico. Base: Beetroot Ripieno: Crudo, mozzarella, rucola Gusto: Sapido + dolce (impasto) Step & tips 1 · Prepara la base beetroot. 2 · Farcisci generosamente. 3 · Servi tagliata a metà per mostrare gli strati. Signature Brioche Gelato Burger Una scoop di gelato in una brioche morbida, chiusa a caldo in pochi secondi: effetto “wow” e servizio veloce. Pane: Brioche bun leggermente scaldato Gelato: 1 scoop (circa 70 g) a scelta Sauce: 1 sola scelta (standard) Step & tips 1 · Scalda leggermente la brioche (non tostare troppo). 2 · Inserisci una scoop di gelato (circa 70 g) e rifinisci con una sola salsa a scelta. 3 · Chiudi, servi subito e consiglia di mangiare come un panino. Setup &amp; Conservazione Apertura · Setting · Dati tecnici · Storage · Chiusura Apertura Crepe / Waffle Gelato Burger Checklist apertura stazioni Prima del servizio verifica che le macchine siano pronte e che mix/ingredienti siano in ordine. La Gelato Burger Machine va accesa all'apertura e spenta alla chiusura. Waffle machine: accendi e attendi entrambe le luci verdi (READY + POWER) Gelato Burger Machine: ON all'apertura; in genere pronta ~10 min dopo l'accensione Crepe mix: deve aver riposato in frigo almeno 2 ore prima dell'uso Checklist 1 · Accendi macchine e verifica che siano in temperatura/pronte. 2 · Controlla mix e scorte (etichette, FIFO, date). 3 · Prepara blue roll e bottiglie sauce per un banco pulito e veloce. Obiettivo: zero attese al primo ordine e stazioni già “service ready”. Setting Power 3 Timer 12s Settaggi macchine (standard) Imposta i parametri base prima del rush: riduce errori, sprechi e prodotti fuori standard. Waffle: olia leggermente con olio di semi; power livello 3; cottura 2,5 min per lato (tot 5 min) Waffle: lascia riposare 45s prima di topping/gelato (croccantezza) Gelato Burger: timer 12 secondi; non serve oliare le piastre Dettagli 1 · Waffle: set power 3 e non iniziare finché READY + POWER sono attive. 2 · Gelato Burger: set timer 12s e usa solo blue-roll per eventuali gocce/salse. 3 · Mantieni la superficie sempre pulita: briciole = qualità visiva in caduta. No oil sulla Gelato Burger machine: le superfici non vanno unte. Conservazione Frigo Etichette Shelf life &amp; storage rapidi Questo modulo è “più storage che show”: tieni sempre sotto controllo date e condizioni. Crepe mix: shelf life 3 giorni (frigo) + riposo minimo 2 ore (frigo) Waffle mix (pre-packed): shelf life 2 giorni Gelato Burger: bun shelf life quando defrosted = 2 giorni Gelato Croissant: plain croissant shelf life = 2 giorni Regole 1 · Applica etichette con data preparazione/apertura e scadenza. 2 · FIFO rigoroso: usa prima ciò che scade prima. 3 · Se fuori range/senza label: non servire. Lo storage è training: qualità costante = clienti che tornano. Dati tecnici 177 ml 70 g Porzionatura &amp; dosi (quick ref) Una scheda “da banco”: dosi chiave per velocità e standard. Waffle: 1 scoop intero di batter = 177 ml Crepe: 1 scoop o 1,5 small ladle scoop di mix Signature Buontalenti Crepe: Buontalenti 70 g + sauce top ~30 g Gelato Burger: 1 scoop di gelato = 70 g (uno solo) + una sola scelta sauce Uso 1 · Usa scoop dedicati: riduci variazioni tra operatori. 2 · Se il prodotto esce fuori standard, correggi subito (non “compensare” con extra). 3 · Segna gli errori ricorrenti: sono training points. Chiusura Spegnere Blue-roll Chiusura &amp; pulizia rapida A fine giornata riduci residui e rischi: sulla Gelato Burger Machine si usa solo blue-roll per gelato/salsa fuoriusciti e per rimuovere le briciole. Gelato Burger Machine: OFF a chiusura; superficie senza residui/particelle Waffle: rimuovi residui e prepara la stazione per il giorno dopo Mix: riponi in frigo con etichetta (o elimina se oltre shelf life) Checklist 1 · Spegni le macchine e lascia raffreddare in sicurezza. 2 · Pulisci con blue-roll: niente olio sulle piastre Gelato Burger. 3 · Frigo + label per mix/ingredienti; smaltisci ciò che supera shelf life. Pulito e asciutto oggi = apertura più veloce domani. 🥞 Sweet Treat Atelier Crepes, Waffles & More 10+ Varianti Menu Sweet & Savory Gusti
+Churros · Panettoni · Vin Brulé
+Fryer 190 °C
+
+8 pezzi/porzione
+Churros
+Bastoncini di pastella fritta, croccanti fuori e morbidi dentro.
+
+Serviti caldi (8 pezzi) con zucchero e cannella.
+
+Step &amp; tips
+1 - Prepara il mix zucchero/cannella in una teglia larga.
+
+2 - Preleva 8 churros dal freezer, friggi 8-9 min finche' dorati.
+
+3 - Scola bene l'olio e passa i churros nel mix per una copertura uniforme.
+
+Controlla costantemente i tempi per evitare centro crudo; sostituisci l'olio quando scurisce.
+
+💰 Upselling
+Batch doppio: "Vuoi 16 churros per condividere?"
+
+Combo salse: "Prova il mix pistacchio + cioccolato fondente"
+
+Bundle: "Churros + cioccolata calda = combo perfetta"
+
+🛠️ Pro tip: Temperatura olio critica: 190 °C esatti. Piu' bassa = unto, piu' alta = bruciato esterno/crudo interno. Sostituisci olio ogni 40 porzioni o quando scurisce.
+
+Slice service
+8 porzioni
+Panettone Classico
+Il re delle feste. Ricetta tradizionale con uvetta e canditi, lievitazione naturale.
+
+Servito a fetta (1/8) su piatto dessert con posate.
+
+Taglio: verticale seguendo le 8 linee guida, coltello seghettato lungo
+
+Porzioni: 8 spicchi uniformi per coerenza
+Presentazione: piatto dessert + cutlery sempre
+
+Campione visivo: tieni una fetta visibile al banco per stimolare ordini (storytelling visivo)
+
+Abbinamenti suggeriti: gelato Buontalenti, salsa pistacchio, cioccolata calda
+
+Procedura
+1 - Taglia verticale seguendo le linee guida.
+
+2 - Disponi sul piatto con cutlery.
+3 - Offri subito upsell: scoop Buontalenti + sauce o hot chocolate.
+
+Campiona una delle 8 fette per storytelling e conversione vendite.
+
+💰 Upselling
+Opzione 1: "Fetta + scoop Buontalenti e' il nostro abbinamento signature"
+
+Opzione 2: "Aggiungi salsa pistacchio per contrasto perfetto?"
+
+Opzione 3: "Con cioccolata calda diventa un momento di pura indulgenza"
+
+🛠️ Pro tip: Usa coltello seghettato lungo per taglio netto senza sbriciolare. 8 spicchi uniformi seguendo guida. Esponi fetta campione per stimolare ordini visivi.
+
+Warm option
+Crepe plate
+Panettone Dark Chocolate
+Variante golosa con gocce di cioccolato fondente nell'impasto.
+
+Ottimo servito tiepido (10'' su piastra) per sciogliere il cioccolato.
+
+Piastra crepe: pulita e asciutta (no olio)
+Timing: 10 secondi per lato esatti (non di piu' o perde croccantezza)
+
+Servizio immediato: servi subito dopo cottura
+Abbinamenti: Dark Chocolate + salsa pistacchio (contrasto gourmet)
+
+Upsell: gelato freddo + panettone caldo = contrasto di temperatura sensazionale
+
+Step &amp; tips
+1 - Posiziona la fetta sulla piastra crepe.
+
+2 - Tosta 10 secondi per lato (no olio).
+
+3 - Servi con sauce e Buontalenti se richiesto.
+
+La versione Dark Chocolate si abbina con sauce Pistacchio per contrasti.
+
+💰 Upselling
+Opzione 1: "Versione calda con gelato freddo = contrasto incredibile"
+
+Opzione 2: "Dark Chocolate + sauce pistacchio? Abbinamento gourmet"
+
+Opzione 3: "Proponi sempre opzione tiepida per esperienza premium"
+
+🛠️ Pro tip: Piastra crepe pulita e asciutta. 10 secondi per lato, no olio. Servi immediatamente per mantenere croccante fuori/morbido dentro. Profumo attira altri clienti.
+
+Powder sugar
+Pandoro Classico
+Soffice, burroso, a forma di stella a 8 punte.
+
+Servito con spolverata di zucchero a velo al momento.
+
+Taglio: seguendo la guida a stella per 8 spicchi uniformi (effetto presentazione professionale)
+
+Zucchero a velo: SEMPRE al momento del servizio, non prima (effetto neve fresca visivamente)
+
+Piatto dessert + cutlery: sempre
+Temperatura: ambiente per massimo profumo
+
+Storytelling: "Lievitazione 36 ore con ingredienti premium" (giustifica valore)
+
+Abbinamenti suggeriti: gelato Buontalenti, salsa mascarpone o pistacchio
+
+Step &amp; tips
+1 - Taglia seguendo la guida (A) per ottenere spicchi regolari.
+
+2 - Disponi su piatto con cutlery.
+3 - Spolvera zucchero a velo e proponi scoop Buontalenti + sauce pistacchio.
+
+Racconta il metodo di lievitazione naturale per valore percepito.
+
+💰 Upselling
+Opzione 1: "Pandoro + Buontalenti = tradizione + innovazione"
+
+Opzione 2: "Salsa mascarpone o pistacchio per twist gourmet?"
+
+Opzione 3: "Racconta lievitazione 36 ore per giustificare valore"
+
+🛠️ Pro tip: Spolvera zucchero a velo AL MOMENTO del servizio per effetto neve fresca. Taglia spicchi uniformi stella a 8 punte. Temperatura ambiente per massimo profumo.
+
+Hot drink
+Spezie
+Arancia
+Mulled Wine (Vin Brulé)
+
+Bevanda calda speziata, servita con fetta d'arancia. È la proposta “comfort” della stagione:
+
+racconta profumo e rituale, poi guida l'upsell (mini panettone / churros / shot opzionali secondo store).
+
+Servizio: cup + mestolo dedicato
+Garnish: fetta d'arancia (sempre)
+
+Timing: servi caldo, non bollente
+Script: "È il nostro Vin Brulé speziato, perfetto da abbinare a un mini panettone"
+
+Pitch
+1 - Presenta: profumo, spezie, fetta d'arancia (rituale).
+
+2 - Servi con mestolo dedicato e garnish.
+
+3 - Proponi combo: mini panettone / churros / dolce caldo.
+
+Collega sempre Vin Brulé ↔ macchina ↔ procedure (setup/chiusura) per coerenza e qualità.
 
-=== FONTE: notes\modal-essentials-component.html ===
-Attached HTML and CSS Context In primo piano Latte 1-4 L intero +. Mix cacao + amido (vedi tabella). Riposo 5 minuti in frigo dopo la miscelazione. Shelf life life 3 giorni dal primo. /* Matched Rule from user-agent */ div { display: block; } /* Matched Rule from user-agent */ address, blockquote, center, div, figure, figcaption, footer, form, header, hr, legend, listing, main, p, plaintext, pre, summary, xmp, article, aside, h1, h2, h3, h4, h5, h6, hgroup, nav, section, search, table, caption, colgroup, col, thead, tbody, tfoot, tr, td, th, dir, dd, dl, dt, menu, ol, ul, li, bdi, output, [dir="ltr" i], [dir="rtl" i], [dir="auto" i] { unicode-bidi: isolate; } /* Matched Rule from regular */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Matched Rule from regular */ .card-modal-essentials { border: 1px solid rgba(33, 64, 152, 0.14); border-radius: 14px; padding: 16px; background: rgba(33, 64, 152, 0.03); border-top-width: 1px; border-right-width: 1px; border-bottom-width: 1px; border-left-width: 1px; border-top-style: solid; border-right-style: solid; border-bottom-style: solid; border-left-style: solid; border-top-color: rgba(33, 64, 152, 0.14); border-right-color: rgba(33, 64, 152, 0.14); border-bottom-color: rgba(33, 64, 152, 0.14); border-left-color: rgba(33, 64, 152, 0.14); border-image-source: initial; border-image-slice: initial; border-image-width: initial; border-image-outset: initial; border-image-repeat: initial; border-top-left-radius: 14px; border-top-right-radius: 14px; border-bottom-right-radius: 14px; border-bottom-left-radius: 14px; padding-top: 16px; padding-right: 16px; padding-bottom: 16px; padding-left: 16px; background-image: initial; background-position-x: initial; background-position-y: initial; background-size: initial; background-repeat: initial; background-attachment: initial; background-origin: initial; background-clip: initial; background-color: rgba(33, 64, 152, 0.03); } /* Inherited from ancestor level 1 (user-agent) */ div { display: block; } /* Inherited from ancestor level 1 (user-agent) */ address, blockquote, center, div, figure, figcaption, footer, form, header, hr, legend, listing, main, p, plaintext, pre, summary, xmp, article, aside, h1, h2, h3, h4, h5, h6, hgroup, nav, section, search, table, caption, colgroup, col, thead, tbody, tfoot, tr, td, th, dir, dd, dl, dt, menu, ol, ul, li, bdi, output, [dir="ltr" i], [dir="rtl" i], [dir="auto" i] { unicode-bidi: isolate; } /* Inherited from ancestor level 1 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 1 (regular) */ .card-modal-primary { display: grid; gap: 18px; display: grid; row-gap: 18px; column-gap: 18px; } /* Inherited from ancestor level 2 (user-agent) */ div { display: block; } /* Inherited from ancestor level 2 (user-agent) */ address, blockquote, center, div, figure, figcaption, footer, form, header, hr, legend, listing, main, p, plaintext, pre, summary, xmp, article, aside, h1, h2, h3, h4, h5, h6, hgroup, nav, section, search, table, caption, colgroup, col, thead, tbody, tfoot, tr, td, th, dir, dd, dl, dt, menu, ol, ul, li, bdi, output, [dir="ltr" i], [dir="rtl" i], [dir="auto" i] { unicode-bidi: isolate; } /* Inherited from ancestor level 2 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 2 (regular) */ .card-modal-body { grid-column: 2; grid-row: 2; padding: 36px; overflow-y: auto; overflow-x: hidden; display: flex; flex-direction: column; gap: 32px; font-size: 18px; line-height: 1.8; -webkit-overflow-scrolling: touch; scrollbar-width: thin; scrollbar-color: rgba(33, 64, 152, 0.3) transparent; background: var(--paper); grid-column-start: 2; grid-column-end: auto; grid-row-start: 2; grid-row-end: auto; padding-top: 36px; padding-right: 36px; padding-bottom: 36px; padding-left: 36px; overflow-y: auto; overflow-x: hidden; display: flex; flex-direction: column; row-gap: 32px; column-gap: 32px; font-size: 18px; line-height: 1.8; scrollbar-width: thin; scrollbar-color: rgba(33, 64, 152, 0.3) transparent; } /* Inherited from ancestor level 3 (user-agent) */ div { display: block; } /* Inherited from ancestor level 3 (user-agent) */ address, blockquote, center, div, figure, figcaption, footer, form, header, hr, legend, listing, main, p, plaintext, pre, summary, xmp, article, aside, h1, h2, h3, h4, h5, h6, hgroup, nav, section, search, table, caption, colgroup, col, thead, tbody, tfoot, tr, td, th, dir, dd, dl, dt, menu, ol, ul, li, bdi, output, [dir="ltr" i], [dir="rtl" i], [dir="auto" i] { unicode-bidi: isolate; } /* Inherited from ancestor level 3 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 3 (regular) */ .card-modal { background: var(--paper); border-radius: var(--radius-lg); box-shadow: 0 50px 100px rgba(15, 33, 84, 0.4); width: min(1000px, 96vw); max-height: min(92vh, 1200px); display: grid; grid-template-columns: 420px 1fr; grid-template-rows: auto 1fr; gap: 0; transform: scale(0.94) translateY(30px); transition: transform 400ms cubic-bezier(0.34, 1.56, 0.64, 1); border: 1px solid var(--border-strong); overflow: hidden; box-shadow: rgba(15, 33, 84, 0.4) 0px 50px 100px; width: min(1000px, 96vw); max-height: min(92vh, 1200px); display: grid; grid-template-columns: 420px 1fr; grid-template-rows: auto 1fr; row-gap: 0px; column-gap: 0px; transform: scale(0.94) translateY(30px); transition-behavior: normal; transition-duration: 400ms; transition-timing-function: cubic-bezier(0.34, 1.56, 0.64, 1); transition-delay: 0s; transition-property: transform; overflow-x: hidden; overflow-y: hidden; } /* Inherited from ancestor level 3 (regular) */ .card-modal-overlay.is-visible .card-modal { transform: scale(1) translateY(0); transform: scale(1) translateY(0px); } /* Inherited from ancestor level 4 (user-agent) */ div { display: block; } /* Inherited from ancestor level 4 (user-agent) */ address, blockquote, center, div, figure, figcaption, footer, form, header, hr, legend, listing, main, p, plaintext, pre, summary, xmp, article, aside, h1, h2, h3, h4, h5, h6, hgroup, nav, section, search, table, caption, colgroup, col, thead, tbody, tfoot, tr, td, th, dir, dd, dl, dt, menu, ol, ul, li, bdi, output, [dir="ltr" i], [dir="rtl" i], [dir="auto" i] { unicode-bidi: isolate; } /* Inherited from ancestor level 4 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 4 (regular) */ .card-modal-overlay { position: fixed; inset: 0; background: rgba(15, 33, 84, 0.75); backdrop-filter: blur(4px); z-index: 1600; display: flex; align-items: center; justify-content: center; padding: 20px; opacity: 0; transition: opacity 300ms ease; position: fixed; top: 0px; right: 0px; bottom: 0px; left: 0px; background-image: initial; background-position-x: initial; background-position-y: initial; background-size: initial; background-repeat: initial; background-attachment: initial; background-origin: initial; background-clip: initial; background-color: rgba(15, 33, 84, 0.75); backdrop-filter: blur(4px); z-index: 1600; display: flex; align-items: center; justify-content: center; padding-top: 20px; padding-right: 20px; padding-bottom: 20px; padding-left: 20px; opacity: 0; transition-behavior: normal; transition-duration: 300ms; transition-timing-function: ease; transition-delay: 0s; transition-property: opacity; } /* Inherited from ancestor level 4 (regular) */ .card-modal-overlay.is-visible { opacity: 1; opacity: 1; } /* Inherited from ancestor level 5 (user-agent) */ body { display: block; margin-top: 8px; margin-right: 8px; margin-bottom: 8px; margin-left: 8px; } /* Inherited from ancestor level 5 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 5 (regular) */ body { min-height: 100vh; background-color: #ffffff; color: var(--ink-soft); font-size: 16px; line-height: 1.5; padding: 0 0 80px; position: relative; font-family: var(--font-regular); overflow-x: hidden; overflow-y: auto; -webkit-overflow-scrolling: touch; min-height: 100vh; background-color: rgb(255, 255, 255); color: var(--ink-soft); font-size: 16px; line-height: 1.5; padding-top: 0px; padding-right: 0px; padding-bottom: 80px; padding-left: 0px; position: relative; font-family: var(--font-regular); overflow-x: hidden; overflow-y: auto; } /* Inherited from ancestor level 5 (regular) */ body.no-scroll { overflow: hidden !important; position: fixed; width: 100%; height: 100%; position: fixed; width: 100%; height: 100%; overflow-x: hidden !important; overflow-y: hidden !important; } /* Inherited from ancestor level 6 (user-agent) */ html { display: block; } /* Inherited from ancestor level 6 (user-agent) */ :root { view-transition-name: root; } /* Inherited from ancestor level 6 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 6 (regular) */ html { scroll-behavior: smooth; -webkit-overflow-scrolling: touch; scroll-behavior: smooth; } /* Inherited from ancestor level 6 (regular) */ :root { --brand-blue: #214098; --brand-blue-deep: #0f2154; --brand-gray: #4f515e; --brand-gray-soft: #6b7082; --brand-rose: #ec418c; --brand-gold: #f2be58; --paper: #ffffff; --paper-soft: #fff8f0; --ink: var(--brand-blue); --ink-soft: var(--brand-gray); --sky: rgba(236, 65, 140, 0.18); --sky-mid: var(--brand-rose); --blush: rgba(242, 190, 88, 0.18); --sun: var(--brand-gold); --cloud: #ffffff; --card: rgba(255, 255, 255, 0.98); --frost: rgba(255, 255, 255, 0.7); --border: rgba(33, 64, 152, 0.14); --border-strong: rgba(15, 33, 84, 0.25); --shadow: 0 40px 60px rgba(15, 33, 84, 0.18); --radius-xl: 34px; --radius-lg: 24px; --anim-fast: 180ms; --anim-slow: 420ms; --slate: var(--brand-gray-soft); --font-regular: "SuperGrotesk-Regular", Arial, sans-serif; --font-medium: "SuperGrotesk-Medium", Arial, sans-serif; font-family: var(--font-regular); --brand-blue: #214098; --brand-blue-deep: #0f2154; --brand-gray: #4f515e; --brand-gray-soft: #6b7082; --brand-rose: #ec418c; --brand-gold: #f2be58; --paper: #ffffff; --paper-soft: #fff8f0; --ink: var(--brand-blue); --ink-soft: var(--brand-gray); --sky: rgba(236, 65, 140, 0.18); --sky-mid: var(--brand-rose); --blush: rgba(242, 190, 88, 0.18); --sun: var(--brand-gold); --cloud: #ffffff; --card: rgba(255, 255, 255, 0.98); --frost: rgba(255, 255, 255, 0.7); --border: rgba(33, 64, 152, 0.14); --border-strong: rgba(15, 33, 84, 0.25); --shadow: 0 40px 60px rgba(15, 33, 84, 0.18); --radius-xl: 34px; --radius-lg: 24px; --anim-fast: 180ms; --anim-slow: 420ms; --slate: var(--brand-gray-soft); --font-regular: "SuperGrotesk-Regular", Arial, sans-serif; --font-medium: "SuperGrotesk-Medium", Arial, sans-serif; font-family: var(--font-regular); }
+💰 Upselling
+Combo: "Vuoi abbinarlo a un mini panettone?"
 
-=== FONTE: notes\modal-specs.html ===
-Attached HTML and CSS Context Specifiche Parametri chiave (senza prezzi). Latte 1-4 L intero +. Mix cacao + amido (vedi tabella). Riposo 5 minuti in frigo dopo la miscelazione. Shelf life life 3 giorni dal primo. Ricetta warm-up. /* Matched Rule from user-agent */ article, aside, footer, header, hgroup, main, nav, search, section { display: block; } /* Matched Rule from user-agent */ address, blockquote, center, div, figure, figcaption, footer, form, header, hr, legend, listing, main, p, plaintext, pre, summary, xmp, article, aside, h1, h2, h3, h4, h5, h6, hgroup, nav, section, search, table, caption, colgroup, col, thead, tbody, tfoot, tr, td, th, dir, dd, dl, dt, menu, ol, ul, li, bdi, output, [dir="ltr" i], [dir="rtl" i], [dir="auto" i] { unicode-bidi: isolate; } /* Matched Rule from regular */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Matched Rule from regular */ .modal-specs { border: 1px solid rgba(33, 64, 152, 0.16); border-radius: 18px; background: linear-gradient(135deg, rgba(33, 64, 152, 0.04), rgba(236, 65, 140, 0.03)); padding: 18px; box-shadow: 0 14px 34px rgba(15, 33, 84, 0.10); border-top-width: 1px; border-right-width: 1px; border-bottom-width: 1px; border-left-width: 1px; border-top-style: solid; border-right-style: solid; border-bottom-style: solid; border-left-style: solid; border-top-color: rgba(33, 64, 152, 0.16); border-right-color: rgba(33, 64, 152, 0.16); border-bottom-color: rgba(33, 64, 152, 0.16); border-left-color: rgba(33, 64, 152, 0.16); border-image-source: initial; border-image-slice: initial; border-image-width: initial; border-image-outset: initial; border-image-repeat: initial; border-top-left-radius: 18px; border-top-right-radius: 18px; border-bottom-right-radius: 18px; border-bottom-left-radius: 18px; background-image: linear-gradient(135deg, rgba(33, 64, 152, 0.04), rgba(236, 65, 140, 0.03)); background-position-x: initial; background-position-y: initial; background-size: initial; background-repeat: initial; background-attachment: initial; background-origin: initial; background-clip: initial; background-color: initial; padding-top: 18px; padding-right: 18px; padding-bottom: 18px; padding-left: 18px; box-shadow: rgba(15, 33, 84, 0.1) 0px 14px 34px; } /* Inherited from ancestor level 1 (user-agent) */ div { display: block; } /* Inherited from ancestor level 1 (user-agent) */ address, blockquote, center, div, figure, figcaption, footer, form, header, hr, legend, listing, main, p, plaintext, pre, summary, xmp, article, aside, h1, h2, h3, h4, h5, h6, hgroup, nav, section, search, table, caption, colgroup, col, thead, tbody, tfoot, tr, td, th, dir, dd, dl, dt, menu, ol, ul, li, bdi, output, [dir="ltr" i], [dir="rtl" i], [dir="auto" i] { unicode-bidi: isolate; } /* Inherited from ancestor level 1 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 1 (regular) */ .card-modal-sidebar { grid-column: 1; grid-row: 2; padding: 32px; background: linear-gradient(180deg, rgba(33, 64, 152, 0.02), rgba(236, 65, 140, 0.01)); border-right: 1px solid var(--border); overflow-y: auto; display: flex; flex-direction: column; gap: 24px; grid-column-start: 1; grid-column-end: auto; grid-row-start: 2; grid-row-end: auto; padding-top: 32px; padding-right: 32px; padding-bottom: 32px; padding-left: 32px; background-image: linear-gradient(rgba(33, 64, 152, 0.02), rgba(236, 65, 140, 0.01)); background-position-x: initial; background-position-y: initial; background-size: initial; background-repeat: initial; background-attachment: initial; background-origin: initial; background-clip: initial; background-color: initial; overflow-y: auto; display: flex; flex-direction: column; row-gap: 24px; column-gap: 24px; } /* Inherited from ancestor level 2 (user-agent) */ div { display: block; } /* Inherited from ancestor level 2 (user-agent) */ address, blockquote, center, div, figure, figcaption, footer, form, header, hr, legend, listing, main, p, plaintext, pre, summary, xmp, article, aside, h1, h2, h3, h4, h5, h6, hgroup, nav, section, search, table, caption, colgroup, col, thead, tbody, tfoot, tr, td, th, dir, dd, dl, dt, menu, ol, ul, li, bdi, output, [dir="ltr" i], [dir="rtl" i], [dir="auto" i] { unicode-bidi: isolate; } /* Inherited from ancestor level 2 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 2 (regular) */ .card-modal { background: var(--paper); border-radius: var(--radius-lg); box-shadow: 0 50px 100px rgba(15, 33, 84, 0.4); width: min(1000px, 96vw); max-height: min(92vh, 1200px); display: grid; grid-template-columns: 420px 1fr; grid-template-rows: auto 1fr; gap: 0; transform: scale(0.94) translateY(30px); transition: transform 400ms cubic-bezier(0.34, 1.56, 0.64, 1); border: 1px solid var(--border-strong); overflow: hidden; box-shadow: rgba(15, 33, 84, 0.4) 0px 50px 100px; width: min(1000px, 96vw); max-height: min(92vh, 1200px); display: grid; grid-template-columns: 420px 1fr; grid-template-rows: auto 1fr; row-gap: 0px; column-gap: 0px; transform: scale(0.94) translateY(30px); transition-behavior: normal; transition-duration: 400ms; transition-timing-function: cubic-bezier(0.34, 1.56, 0.64, 1); transition-delay: 0s; transition-property: transform; overflow-x: hidden; overflow-y: hidden; } /* Inherited from ancestor level 2 (regular) */ .card-modal-overlay.is-visible .card-modal { transform: scale(1) translateY(0); transform: scale(1) translateY(0px); } /* Inherited from ancestor level 3 (user-agent) */ div { display: block; } /* Inherited from ancestor level 3 (user-agent) */ address, blockquote, center, div, figure, figcaption, footer, form, header, hr, legend, listing, main, p, plaintext, pre, summary, xmp, article, aside, h1, h2, h3, h4, h5, h6, hgroup, nav, section, search, table, caption, colgroup, col, thead, tbody, tfoot, tr, td, th, dir, dd, dl, dt, menu, ol, ul, li, bdi, output, [dir="ltr" i], [dir="rtl" i], [dir="auto" i] { unicode-bidi: isolate; } /* Inherited from ancestor level 3 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 3 (regular) */ .card-modal-overlay { position: fixed; inset: 0; background: rgba(15, 33, 84, 0.75); backdrop-filter: blur(4px); z-index: 1600; display: flex; align-items: center; justify-content: center; padding: 20px; opacity: 0; transition: opacity 300ms ease; position: fixed; top: 0px; right: 0px; bottom: 0px; left: 0px; background-image: initial; background-position-x: initial; background-position-y: initial; background-size: initial; background-repeat: initial; background-attachment: initial; background-origin: initial; background-clip: initial; background-color: rgba(15, 33, 84, 0.75); backdrop-filter: blur(4px); z-index: 1600; display: flex; align-items: center; justify-content: center; padding-top: 20px; padding-right: 20px; padding-bottom: 20px; padding-left: 20px; opacity: 0; transition-behavior: normal; transition-duration: 300ms; transition-timing-function: ease; transition-delay: 0s; transition-property: opacity; } /* Inherited from ancestor level 3 (regular) */ .card-modal-overlay.is-visible { opacity: 1; opacity: 1; } /* Inherited from ancestor level 4 (user-agent) */ body { display: block; margin-top: 8px; margin-right: 8px; margin-bottom: 8px; margin-left: 8px; } /* Inherited from ancestor level 4 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 4 (regular) */ body { min-height: 100vh; background-color: #ffffff; color: var(--ink-soft); font-size: 16px; line-height: 1.5; padding: 0 0 80px; position: relative; font-family: var(--font-regular); overflow-x: hidden; overflow-y: auto; -webkit-overflow-scrolling: touch; min-height: 100vh; background-color: rgb(255, 255, 255); color: var(--ink-soft); font-size: 16px; line-height: 1.5; padding-top: 0px; padding-right: 0px; padding-bottom: 80px; padding-left: 0px; position: relative; font-family: var(--font-regular); overflow-x: hidden; overflow-y: auto; } /* Inherited from ancestor level 4 (regular) */ body.no-scroll { overflow: hidden !important; position: fixed; width: 100%; height: 100%; position: fixed; width: 100%; height: 100%; overflow-x: hidden !important; overflow-y: hidden !important; } /* Inherited from ancestor level 5 (user-agent) */ html { display: block; } /* Inherited from ancestor level 5 (user-agent) */ :root { view-transition-name: root; } /* Inherited from ancestor level 5 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 5 (regular) */ html { scroll-behavior: smooth; -webkit-overflow-scrolling: touch; scroll-behavior: smooth; } /* Inherited from ancestor level 5 (regular) */ :root { --brand-blue: #214098; --brand-blue-deep: #0f2154; --brand-gray: #4f515e; --brand-gray-soft: #6b7082; --brand-rose: #ec418c; --brand-gold: #f2be58; --paper: #ffffff; --paper-soft: #fff8f0; --ink: var(--brand-blue); --ink-soft: var(--brand-gray); --sky: rgba(236, 65, 140, 0.18); --sky-mid: var(--brand-rose); --blush: rgba(242, 190, 88, 0.18); --sun: var(--brand-gold); --cloud: #ffffff; --card: rgba(255, 255, 255, 0.98); --frost: rgba(255, 255, 255, 0.7); --border: rgba(33, 64, 152, 0.14); --border-strong: rgba(15, 33, 84, 0.25); --shadow: 0 40px 60px rgba(15, 33, 84, 0.18); --radius-xl: 34px; --radius-lg: 24px; --anim-fast: 180ms; --anim-slow: 420ms; --slate: var(--brand-gray-soft); --font-regular: "SuperGrotesk-Regular", Arial, sans-serif; --font-medium: "SuperGrotesk-Medium", Arial, sans-serif; font-family: var(--font-regular); --brand-blue: #214098; --brand-blue-deep: #0f2154; --brand-gray: #4f515e; --brand-gray-soft: #6b7082; --brand-rose: #ec418c; --brand-gold: #f2be58; --paper: #ffffff; --paper-soft: #fff8f0; --ink: var(--brand-blue); --ink-soft: var(--brand-gray); --sky: rgba(236, 65, 140, 0.18); --sky-mid: var(--brand-rose); --blush: rgba(242, 190, 88, 0.18); --sun: var(--brand-gold); --cloud: #ffffff; --card: rgba(255, 255, 255, 0.98); --frost: rgba(255, 255, 255, 0.7); --border: rgba(33, 64, 152, 0.14); --border-strong: rgba(15, 33, 84, 0.25); --shadow: 0 40px 60px rgba(15, 33, 84, 0.18); --radius-xl: 34px; --radius-lg: 24px; --anim-fast: 180ms; --anim-slow: 420ms; --slate: var(--brand-gray-soft); --font-regular: "SuperGrotesk-Regular", Arial, sans-serif; --font-medium: "SuperGrotesk-Medium", Arial, sans-serif; font-family: var(--font-regular); }
+Extra: "Aggiungiamo una salsa a parte per il dolce?"
 
-=== FONTE: notes\nav-tokens.html ===
-Attached HTML and CSS Context ★ Stelline 45 Progressi 45/65 Ogni scheda aperta vale 1 stellina. Al raggiungimento di tre stelline sblocchi lo slot quiz. Test me 3 stelline = quiz slot. Se lo sbagli riparti da zero. Regole complete 🍨 Gelati 1 Tre quiz perfetti = un gelato reale da riscattare con il trainer. Il timer ti impedisce gli sprint consecutivi. Cooldown 06:14:08 Gelato di ieri! Torna tra 6h 15m Vedi regolamento ⚡ Bonus 0 65 stelline azzerano il loop e assegnano +5 punti bonus convertibili in cash o prodotti Badiani. Come si sblocca /* Matched Rule from user-agent */ div { display: block; } /* Matched Rule from user-agent */ address, blockquote, center, div, figure, figcaption, footer, form, header, hr, legend, listing, main, p, plaintext, pre, summary, xmp, article, aside, h1, h2, h3, h4, h5, h6, hgroup, nav, section, search, table, caption, colgroup, col, thead, tbody, tfoot, tr, td, th, dir, dd, dl, dt, menu, ol, ul, li, bdi, output, [dir="ltr" i], [dir="rtl" i], [dir="auto" i] { unicode-bidi: isolate; } /* Matched Rule from regular */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Matched Rule from regular */ .nav-token-shell { flex: 1 1 auto; display: inline-flex; align-items: center; gap: 10px; padding: 8px 18px; border-radius: 999px; background: rgba(33, 64, 152, 0.05); border: 1px solid rgba(33, 64, 152, 0.12); box-shadow: 0 18px 40px rgba(15, 33, 84, 0.12); transition: padding var(--anim-slow) ease, gap var(--anim-slow) ease; flex-grow: 1; flex-shrink: 1; flex-basis: auto; display: inline-flex; align-items: center; row-gap: 10px; column-gap: 10px; padding-top: 8px; padding-right: 18px; padding-bottom: 8px; padding-left: 18px; border-top-left-radius: 999px; border-top-right-radius: 999px; border-bottom-right-radius: 999px; border-bottom-left-radius: 999px; background-image: initial; background-position-x: initial; background-position-y: initial; background-size: initial; background-repeat: initial; background-attachment: initial; background-origin: initial; background-clip: initial; background-color: rgba(33, 64, 152, 0.05); border-top-width: 1px; border-right-width: 1px; border-bottom-width: 1px; border-left-width: 1px; border-top-style: solid; border-right-style: solid; border-bottom-style: solid; border-left-style: solid; border-top-color: rgba(33, 64, 152, 0.12); border-right-color: rgba(33, 64, 152, 0.12); border-bottom-color: rgba(33, 64, 152, 0.12); border-left-color: rgba(33, 64, 152, 0.12); border-image-source: initial; border-image-slice: initial; border-image-width: initial; border-image-outset: initial; border-image-repeat: initial; box-shadow: rgba(15, 33, 84, 0.12) 0px 18px 40px; } /* Inherited from ancestor level 1 (user-agent) */ article, aside, footer, header, hgroup, main, nav, search, section { display: block; } /* Inherited from ancestor level 1 (user-agent) */ address, blockquote, center, div, figure, figcaption, footer, form, header, hr, legend, listing, main, p, plaintext, pre, summary, xmp, article, aside, h1, h2, h3, h4, h5, h6, hgroup, nav, section, search, table, caption, colgroup, col, thead, tbody, tfoot, tr, td, th, dir, dd, dl, dt, menu, ol, ul, li, bdi, output, [dir="ltr" i], [dir="rtl" i], [dir="auto" i] { unicode-bidi: isolate; } /* Inherited from ancestor level 1 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 1 (regular) */ .nav-shell { display: flex; justify-content: space-between; align-items: center; gap: 18px; flex-wrap: wrap; padding: 32px 0 18px; border-bottom: 1px solid var(--border); position: sticky; top: 0; z-index: 900; background: rgba(255, 255, 255, 0.95); backdrop-filter: blur(8px); transition: padding var(--anim-slow) ease, box-shadow var(--anim-slow) ease; display: flex; justify-content: space-between; align-items: center; row-gap: 18px; column-gap: 18px; flex-wrap: wrap; padding-top: 32px; padding-right: 0px; padding-bottom: 18px; padding-left: 0px; position: sticky; top: 0px; z-index: 900; background-image: initial; background-position-x: initial; background-position-y: initial; background-size: initial; background-repeat: initial; background-attachment: initial; background-origin: initial; background-clip: initial; background-color: rgba(255, 255, 255, 0.95); backdrop-filter: blur(8px); } /* Inherited from ancestor level 2 (user-agent) */ article, aside, footer, header, hgroup, main, nav, search, section { display: block; } /* Inherited from ancestor level 2 (user-agent) */ address, blockquote, center, div, figure, figcaption, footer, form, header, hr, legend, listing, main, p, plaintext, pre, summary, xmp, article, aside, h1, h2, h3, h4, h5, h6, hgroup, nav, section, search, table, caption, colgroup, col, thead, tbody, tfoot, tr, td, th, dir, dd, dl, dt, menu, ol, ul, li, bdi, output, [dir="ltr" i], [dir="rtl" i], [dir="auto" i] { unicode-bidi: isolate; } /* Inherited from ancestor level 2 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 2 (regular) */ main { width: min(1200px, 92vw); margin: 0 auto; position: relative; width: min(1200px, 92vw); margin-top: 0px; margin-right: auto; margin-bottom: 0px; margin-left: auto; position: relative; } /* Inherited from ancestor level 3 (user-agent) */ body { display: block; margin-top: 8px; margin-right: 8px; margin-bottom: 8px; margin-left: 8px; } /* Inherited from ancestor level 3 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 3 (regular) */ body { min-height: 100vh; background-color: #ffffff; color: var(--ink-soft); font-size: 16px; line-height: 1.5; padding: 0 0 80px; position: relative; font-family: var(--font-regular); min-height: 100vh; background-color: rgb(255, 255, 255); color: var(--ink-soft); font-size: 16px; line-height: 1.5; padding-top: 0px; padding-right: 0px; padding-bottom: 80px; padding-left: 0px; position: relative; font-family: var(--font-regular); } /* Inherited from ancestor level 4 (user-agent) */ html { display: block; } /* Inherited from ancestor level 4 (user-agent) */ :root { view-transition-name: root; } /* Inherited from ancestor level 4 (regular) */ * { box-sizing: border-box; margin: 0; box-sizing: border-box; margin-top: 0px; margin-right: 0px; margin-bottom: 0px; margin-left: 0px; } /* Inherited from ancestor level 4 (regular) */ :root { --brand-blue: #214098; --brand-blue-deep: #0f2154; --brand-gray: #4f515e; --brand-gray-soft: #6b7082; --brand-rose: #ec418c; --brand-gold: #f2be58; --paper: #ffffff; --paper-soft: #fff8f0; --ink: var(--brand-blue); --ink-soft: var(--brand-gray); --sky: rgba(236, 65, 140, 0.18); --sky-mid: var(--brand-rose); --blush: rgba(242, 190, 88, 0.18); --sun: var(--brand-gold); --cloud: #ffffff; --card: rgba(255, 255, 255, 0.98); --frost: rgba(255, 255, 255, 0.7); --border: rgba(33, 64, 152, 0.14); --border-strong: rgba(15, 33, 84, 0.25); --shadow: 0 40px 60px rgba(15, 33, 84, 0.18); --radius-xl: 34px; --radius-lg: 24px; --anim-fast: 180ms; --anim-slow: 420ms; --slate: var(--brand-gray-soft); --font-regular: "SuperGrotesk-Regular", Arial, sans-serif; --font-medium: "SuperGrotesk-Medium", Arial, sans-serif; font-family: var(--font-regular); --brand-blue: #214098; --brand-blue-deep: #0f2154; --brand-gray: #4f515e; --brand-gray-soft: #6b7082; --brand-rose: #ec418c; --brand-gold: #f2be58; --paper: #ffffff; --paper-soft: #fff8f0; --ink: var(--brand-blue); --ink-soft: var(--brand-gray); --sky: rgba(236, 65, 140, 0.18); --sky-mid: var(--brand-rose); --blush: rgba(242, 190, 88, 0.18); --sun: var(--brand-gold); --cloud: #ffffff; --card: rgba(255, 255, 255, 0.98); --frost: rgba(255, 255, 255, 0.7); --border: rgba(33, 64, 152, 0.14); --border-strong: rgba(15, 33, 84, 0.25); --shadow: 0 40px 60px rgba(15, 33, 84, 0.18); --radius-xl: 34px; --radius-lg: 24px; --anim-fast: 180ms; --anim-slow: 420ms; --slate: var(--brand-gray-soft); --font-regular: "SuperGrotesk-Regular", Arial, sans-serif; --font-medium: "SuperGrotesk-Medium", Arial, sans-serif; font-family: var(--font-regular); }`;
+Premium: "Shot opzionale (secondo listino locale)"
+Warm slice
+
+10" x lato
+No oil
+Servizio Caldo (Pandoro)
+
+Chiedi sempre se la fetta la vuole tiepida. Tosta 10 secondi per lato sulla piastra crepe (senza olio) e servi immediatamente.
+
+Piastra crepe: pulita e asciutta (mai olio)
+Timing: 10 secondi per lato
+
+Servizio immediato: impiatta subito per mantenere volume e calore
+[+ operations.html]
+
+Checklist
+1 · Chiedi preferenza calda/fredda.
+2 · Tosta 10" + 10" (no oil).
+
+3 · Impiatta e proponi pairing (gelato/sauce).
+La fetta tiepida profuma e “vende” anche ai clienti vicini.
+
+Operazioni &amp; Conservazione
+Setup · Dati tecnici · Storage · Shelf life · Chiusura
+
+Setup
+Vin Brulé
+600 ml
+Setup macchina Vin Brulé
+
+Setup corretto: outer tank con ~600 ml di acqua (senza raggiungere il max) e inner container inserito bene (non deve galleggiare).
+
+Outer tank: ~600 ml acqua, non oltre max
+
+Inner container: inserire correttamente (non float)
+Lid: sempre in posizione durante il mantenimento
+
+Procedura
+1 · Acqua nel tank esterno (~600 ml, no max).
+
+2 · Inserisci il contenitore interno e chiudi con lid.
+
+3 · Versa il mix nel tank argento quando pronto a scaldare.
+
+Setting
+Level 10
+25/30 min
+Warm-up &amp; mantenimento (Vin Brulé)
+
+Warm-up e mantenimento: livello 10 per 25–30 minuti, poi livello 6–7.
+
+Versare 500/1000 ml (meglio meno che troppo, in base alle vendite)
+
+Warm-up: livello 10 per 25–30 min
+Hold: livello 6–7
+
+Checklist
+1 · Versa il mix e porta a livello 10 (25–30 min).
+
+2 · Quando è caldo, setta 6–7 per mantenimento.
+
+3 · Lid sempre: riduce evaporazione e mantiene aromi.
+
+Conservazione
+Night
+Frigo
+Come conservarlo di notte
+Fine servizio: travasa in una jug, lascia raffreddare, copri con cling film e conserva in frigo con label.
+
+Jug: travaso a fine servizio
+Cool down: prima di coprire
+
+Frigo + shelf life label
+Procedura
+1 · Travasa in jug e lascia raffreddare.
+
+2 · Cling film una volta freddo.
+3 · Frigo + label (data/ora).
+
+Dati tecnici
+Shelf life
+3 / 30
+Shelf life Vin Brulé (quick)
+
+Regola shelf life: in macchina 3 giorni dal primo warm-up; in box 30 giorni dal primo opening. Label obbligatoria.
+
+In macchina (warm): 3 giorni dal primo warm-up
+
+In box (mix): 30 giorni dal primo opening
+
+Label obbligatoria per entrambi
+Note
+1 · Segna la data del primo warm-up.
+
+2 · Applica label visibile in frigo.
+3 · Se oltre shelf life: elimina.
+
+Chiusura
+Pulizia
+Soap + hot water
+Pulizia macchina (fine giornata)
+
+Dopo il travaso: lava inner container + lid con sapone e acqua calda, svuota/asciuga il tank acqua e pulisci l'esterno con panno umido.
+
+Inner container + lid: lavare con sapone e acqua calda
+
+Tank acqua: svuotare e asciugare
+Esterno: panno umido
+
+Checklist
+1 · Lava e asciuga i pezzi interni.
+
+2 · Svuota e asciuga il tank esterno.
+
+3 · Rimonta e lascia la macchina pulita per l'apertura.
+
+Packaging
+Delivery
+Freezer hold
+Packaging mini panettone (delivery)
+
+Delivery standard: sauce pot 3/4 (1 pot per 2), panettoni agli angoli del treat box, lid + tape e freezer fino al ritiro rider.
+
+Sauce pot: 3/4 (quantità per due)
+Posizionamento: panettoni ai quattro angoli, sauce al centro
+
+Freezer: conserva in bag fino al pick-up driver
+
+Procedura
+1 · Sauce pot 3/4 e posiziona al centro.
+
+2 · Mini panettoni agli angoli del box, chiudi lid + tape.
+
+3 · Bag in freezer fino al ritiro del driver.
+
+🎉
+Linea Festiva
+Tradizione e calore nelle feste
+
+6
+Prodotti
+4
+Procedure
+Nov-Gen
+Stagione
+
+=== FONTE: gelato-lab.html ===
+Gelato Lab - Badiani
+Training
+Menu
+Categorie
+Brilla: i dettagli fanno la differenza.
+
+Lingua
+Italiano
+Italiano
+English
+Español
+Français
+Linea gelato
+
+⭐ Stelle: 8/8
+Gelato Lab
+Manuale per il banco gelato: porzioni, servizio take me home, coppe scenografiche e manutenzione della vetrina
+
+a -14/-15 °C.
+Gelato Lab
+Linea gelato
+Cups
+
+Piccolo 100g
+Coppette
+Coppette in tre misure: Piccolo (1 gusto, 100 g), Medio (1-2 gusti, 140 g), Grande (1-3 gusti, 180 g).
+
+La chiave è dosare correttamente il gelato e compattarlo bene per eliminare bolle d'aria e dare una presentazione uniforme.
+
+Pesatura: Piccolo 100-120g, Medio 160-200g, Grande 200-240g (controlla sempre)
+
+Tecnica scoop: lineare + ball per look professionale
+
+Compattamento: spingi il gelato sul lato della coppetta eliminando aria
+
+Ammorbidimento spatola: scaldala passandola sul gelato per facilitare il prelievo
+
+Completamento: offri sempre wafer e panna (upselling)
+Temperatura ideale gelato: -14/-15°C (se più caldo è difficile da dosare)
+
+Procedura
+1 · Scalda spatola passando sul gusto per ammorbidirlo.
+
+2 · Spingi gelato sul lato della coppetta eliminando aria.
+
+3 · Offri wafer/panna e sorridi.
+Bambini possono scegliere due gusti anche sul piccolo.
+
+💰 Upselling
+Opzione 1: "Vuoi passare al medio? Aggiungi un altro gusto e panna"
+
+Opzione 2: "Ti aggiungo panna montata e wafer croccante?"
+
+Opzione 3: "Con salsa al pistacchio diventa ancora più goloso"
+
+🛠️ Pro tip: Pesa sempre le coppette per rispettare range grammi. Usa tecnica "scoop lineare + ball" per look professionale. Temperatura gelato ideale: -14/-15°C.
+
+Coni
+GF & Choco
+Coni classici
+Coni in tre varianti: Classico (1 gusto), Cioccolato o Gluten Free (1-2 gusti). Ogni cono va avvolto con tissue per grip e presentazione.
+
+Mantieni l'area dei coni sempre pulita per evitare contaminazioni di sapori.
+
+Avvolgimento: tissue sempre, per grip e look
+Dosaggio: 1 ball per cono piccolo, 1-2 ball per coni speciali (choco/GF)
+
+Posizionamento: appoggia la ball ruotando il cono per stabilità
+
+Pulizia area: ogni 30 minuti elimina briciole (assorbono umidità)
+
+Stock rotation: FIFO rigoroso (i coni assorbono umidità, usa quelli meno freschi prima)
+
+Upgrade upsell: cono cioccolato (ricoperto dentro e fuori), panna montata
+
+Procedura
+1 · Avvolgi cono con tissue.
+2 · Prepara ball e appoggiala ruotando.
+
+3 · Proponi upgrade al cono choco o panna montata.
+
+Mantieni l'area dei coni pulita eliminando briciole.
+💰 Upselling
+
+Opzione 1: "Upgrade al cono cioccolato? è ricoperto dentro e fuori"
+
+Opzione 2: "Cono gluten-free disponibile (se presente)"
+Opzione 3: "Vuoi panna montata sopra per look Instagram?"
+
+🛠️ Pro tip: Pulisci area coni ogni 30 minuti per eliminare briciole. Rotazione stock: i coni assorbono umidità, usa FIFO rigoroso. Avvolgi sempre con tissue per grip.
+
+Box
+500-1000 ml
+Gelato Boxes
+Gelato da asporto in box termici da 500/750/1000 ml. Ogni box mantiene il gelato al giusto stato per circa 1 ora se messo nella borsa termica.
+
+Comunica sempre al cliente di mettere subito in freezer a casa: il gelato cambia di consistenza quando si scongela.
+
+Piccolo: 500 ml (1-3 gusti)
+Medio: 750 ml (1-4 gusti)
+
+Grande: 1000 ml (1-5 gusti)
+Ordine inserimento: inizia dai gusti più morbidi (sorbet prima) per evitare contaminazione sapori
+
+Compattamento: elimina bene le bolle d'aria, pulisci bordi con spatola prima di sigillare
+
+Sigillatura: film + nastro Badiani, consegna in borsa termica
+
+Autonomia: 1 ora in borsa termica; comunica sempre il freezer a casa per mantenere qualità
+
+Procedura
+1 · Inserisci gusti iniziando dai più morbidi (sorbet prima per evitare contaminazioni).
+
+2 · Compatta eliminando bolle d'aria e pulisci bordi.
+
+3 · Sigilla con film + nastro Badiani, consegna in borsa.
+
+Upsell box più grande + pack 10 waffle o coni.
+
+💰 Upselling
+Opzione 1: "Il box grande da 1L ti fa provare più gusti diversi"
+
+Opzione 2: "Aggiungiamo pack di coni per servire a casa?"
+
+Opzione 3: "Con borsa termica mantieni tutto perfetto fino a 2 ore"
+
+🛠️ Pro tip: Compatta bene eliminando aria per evitare cristalli. Pulisci bordi prima di sigillare. Autonomia: 1h in borsa termica, comunica sempre al cliente di mettere subito in freezer.
+
+Coppa gelato
+Whipped cream
+Coppa Gelato
+Tre boules di gelato in coppa di vetro, completate con panna montata, una salsa a scelta, mini cono e wafer Badiani.
+
+È la proposta “wow”: va costruita con ordine e servita subito per mantenere texture e pulizia del topping.
+
+Base: coppa in vetro
+Porzione: 3 scoops con scooper tondo (anche 3 gusti diversi)
+
+Top: panna montata + swirl di sauce scelta
+
+Finitura: mini cono + wafer Badiani
+Servizio: cucchiaio in acciaio, consegna immediata
+
+Procedura
+1 · Prendi una coppa di vetro e prepara i gusti con lo scooper tondo: 3 boules regolari (anche di gusti diversi).
+
+2 · Completa con panna montata e uno swirl della sauce scelta (senza sporcare i bordi).
+
+3 · Aggiungi mini cono + wafer Badiani e servi con cucchiaio in acciaio.
+
+Proponi pairing con Slitti dragée per un dessert completo.
+
+💰 Upselling
+Opzione 1: "Vuoi aggiungere granella di nocciola tostata e dragée Slitti?"
+
+Opzione 2: "Con doppia salsa pistacchio e cioccolato diventa signature"
+
+Opzione 3: "Abbinamento perfetto: Coppa + espresso affogato style"
+
+🛠️ Pro tip: Usa bicchieri in vetro freddi per mantenere temperatura. Monta boules con scooper tondo per estetica uniforme. Servi immediatamente dopo guarnizione per evitare scioglimento panna.
+
+Setup &amp; Conservazione
+Apertura · Setting · Storage · Scampoli · Chiusura
+
+Apertura
+Vetrina gelato
+-14/-15 °C
+Preparazione vetrina (mattino)
+
+Pulisci, lucida e prepara la vetrina prima di esporre. Esponi solo quando la macchina arriva a -14/-15 °C.
+
+Pulizia: panno umido con acqua calda + sanitiser giallo sulle macchie gelato
+
+Metalli: blue spray + blue roll per far “shine” le superfici
+
+Setup: inserisci barre porta-vaschette, accendi, posiziona vaschette e sliding doors
+
+Esposizione: quando arriva a -14/-15 °C, carica i gusti e chiudi le sliding doors
+
+Checklist
+1 · Pulisci e lucida (soprattutto metalli e sliding doors).
+
+2 · Accendi e posiziona barre + vaschette.
+
+3 · A -14/-15°C: esponi gelato e chiudi le porte scorrevoli.
+
+Controlla prima lo scampoli freezer: se un gusto è recuperabile, usalo correttamente.
+
+Setting
+Sliding doors
+HACCP
+Temperatura &amp; porte (standard)
+
+Standard chiave: vetrina a -14/-15 °C. Se lo store non è busy, le sliding doors devono essere in posizione
+
+per preservare la temperatura.
+Target: -14/-15 °C (registra su log HACCP se previsto in store)
+
+Porte: in posizione quando non c'è servizio attivo
+
+Utensili: le spatole usate per pulire vanno lavate e asciugate prima di passare ad altri gusti
+
+Regole
+1 · Controlla temperatura e annota secondo standard locale.
+
+2 · Mantieni le sliding doors chiuse tra un servizio e l'altro.
+
+3 · Lava/asciuga gli utensili dopo ogni uso di pulizia per evitare contaminazioni.
+
+Conservazione
+Treat freezer
+Shelf life
+Shelf life treats (dopo esposizione)
+
+Tabella rapida: giorni massimi dopo esposizione nella vetrina treats.
+
+Cakes / Pinguinos / Mini semifreddo: 35 giorni
+
+Mini cakes / Mini cones: 21 giorni
+Cookies: 14 giorni
+
+Tabella
+Shelf life una volta esposti
+Cakes / Pinguinos / Mini semifreddo: 35 giorni
+
+Setting
+Treat freezer
+-14 °C
+Gestione treat freezer
+
+Vetrina verticale a -14 °C, defrost weekly, tutto esposto con guanti.
+
+Disporre cakes su shelf alto, cookies/pinguini su quello basso (eye level kids)
+
+Shelf life dopo esposizione: cakes/pinguini 35 giorni, mini semifreddi 35, mini cakes 21, mini cones 21, cookies 14
+
+Routine
+1 · Massimizza spazio, FIFO.
+2 · Ricorda ai clienti che sono prodotti gelato.
+
+3 · Usa box termico (autonomia 1h) per take away.
+
+Pulizia ghiaccio weekly per mantenere visibilità impeccabile.
+💰 Upselling
+
+Tecnica 1: "Posiziona treats a eye-level bambini per vendite impulse"
+
+Tecnica 2: "Box misto pinguini/cookies per feste (secondo listino locale)"
+
+Tecnica 3: "Mini semifreddi perfetti per dessert last-minute a casa"
+
+🛠️ Pro tip: Mantieni freezer a -14°C costanti. Rimuovi ghiaccio settimanale con spatola plastica per non graffiare. Usa guanti sempre per manipolazione igienica.
+
+Dati tecnici
+Scampoli
+5–7 cm
+Regola Scampolo (1/4 pan)
+
+Quando un gusto ha meno di 1/4 di vaschetta è uno scampolo e va sostituito. Puoi integrarlo poco alla volta nella vaschetta nuova, senza superare 5–7 cm.
+
+Definizione: &lt; 1/4 pan = scampolo
+Aggiunta: circa 100 g alla volta (lato di uno scoop)
+
+Limite: massimo 5–7 cm di scampolo totale
+Procedura
+
+1 · Prendi lo scampolo dallo scampoli freezer.
+
+2 · Aggiungi piccoli quantitativi e livella (non deve “sembrare aggiunto”).
+
+3 · Non superare 5–7 cm di scampolo complessivo.
+
+Scampolo = controllo sprechi, ma sempre rispettando lo standard visivo.
+
+Chiusura
+Deep clean
+Weekly
+Chiusura &amp; deep clean vetrina
+
+Routine: vetrina OFF ogni notte. Deep clean completo una volta a settimana, inclusa la pulizia filtri.
+
+Ogni sera: switch off + pulizia ordinaria
+Weekly: deep clean completo + cleaning filtri
+
+Focus: rimuovere nuts/crumbs e sanificare tutte le superfici
+
+Deep clean steps
+1 · Rimuovi pannelli bottom e pulisci macchie gelato.
+
+2 · Elimina nuts/crumbs; sanitising spray + panno su tutte le superfici.
+
+3 · Blue spray + blue roll per lucidare; deep clean label stands; rimonta e riaccendi.
+
+Porte scorrevoli: se non busy, devono essere in posizione per preservare temperatura.
+
+🍦
+Gelato Lab
+L'arte del gelato fiorentino
+-14°C
+
+Temp. Ideale
+1932
+Heritage
+
+=== FONTE: index.html ===
+Badiani Training Orbit
+Caricamento in corso...
+Training
+Profilo
+
+Menu
+Orbit
+Hub
+Story Orbit
+Operations &amp; Setup
+
+Beverage & Treats
+Bar & Drinks
+Sweet Treat Atelier
+
+Pastry Lab
+Gelato & Speciali
+Slitti & Yo-Yo
+
+Gelato Lab
+Festive & Churros
+Lingua
+Italiano
+Italiano
+
+English
+Español
+Français
+Training Orbit
+Hub operativo · aggiornato ogni giorno
+
+Playbook operativo Badiani 1932
+Tradizione fiorentina, rituali di boutique e procedure digitalizzate in un'unica plancia: consulta, ripassa e chiudi i quiz per riscattare gelati reali.
+
+Apri categorie
+Regolamento
+Orbit cockpit
+Panoramica live
+Scorri le schede e resta sempre sul pezzo.
+
+Training
+📅
+Training quotidiano
+Caricamento...
+Guadagna stelline extra.
+
+Oggi
+0
+Stelle
+Gelati
+0
+Quiz OK
+0
+
+Storico
+0
+Gelati Totali
+Stelle Tot
+0
+Bonus
+
+0
+Errori
+0
+Recenti
+Vedi tutti
+Giorni
+📊
+
+Storico
+Attivit ultimi 14 giorni
+Profilo
+👤
+—
+
+—
+Modifica
+Cambia
+Parla con BERNY
+Assistente
+Categorie
+
+Français
+
+=== FONTE: operations.html ===
+Operations &amp; Setup · Badiani
+Training
+Menu
+Categorie
+
+Brilla: i dettagli fanno la differenza.
+Hub
+Operations &amp; Setup
+
+Story Orbit
+Bar &amp; Drinks
+Sweet Treat Atelier
+
+Pastry Lab
+Slitti &amp; Yo-Yo
+Gelato Lab
+Festive &amp; Churros
+[+ story-orbit.html, sweet-treats.html]
+
+Français
+Playbook operativo
+⭐ Stelle: 0/6
+Operations &amp; Setup
+
+Una sezione dedicata a tutte le schede che non sono “prodotti”: apertura, set-up vetrine, packaging,
+
+procedure di servizio e chiusura. Qui trovi gli standard che tengono il banco pulito, veloce e coerente.
+
+Standard operativi
+Apertura · Setup · Service · Chiusura
+
+Prep mattino
+-14 °C
+HACCP
+Routine apertura
+Controllo temperature, pulizia vetri, riordino vaschette (FIFO) e verifica etichette.
+
+La vetrina è il primo biglietto da visita: deve essere impeccabile e ordinata.
+
+Temperature: -14/-15°C (registra su log HACCP)
+Pulizia: vetri interni/esterni con prodotto specifico
+
+Vaschette: riordina per colore/gusto, pulisci bordi vaschetta
+Etichette: tutte presenti, dritte e pulite
+
+Utensili: spatole pulite e in acqua corrente (se sistema a flusso continuo) o cambi frequenti
+
+Checklist
+1 · Registra temperature su log HACCP.
+
+2 · Pulisci vetri e bordi vaschette.
+3 · Verifica etichette e utensili pronti.
+
+Se una vaschetta è quasi vuota, sostituiscila subito (non raschiare il fondo davanti al cliente).
+
+Display
+FIFO
+Visual
+Set-up giornaliero
+Cake stand con slice mancante, croissant su tray dedicati, brownies/puddings allineati.
+
+Vetrina deve sembrare sempre piena
+Label accanto al prodotto
+
+Prima fetta di loaf esposta
+Checklist
+1 - Posiziona cakes sui cake stand e rimuovi una fetta per mostrare l'interno.
+
+2 - Disponi croissant in base ai gusti disponibili mantenendo le file pulite.
+
+3 - Aggiorna etichette, verifica shelf life e riempi all'occorrenza.
+
+Fotografa il set-up ideale e condividilo nel gruppo store per mantenere coerenza.
+
+Warm slice
+10'' x lato
+Service
+Servizio Caldo (Pandoro)
+
+Pandoro scaldato: stessa tecnica del panettone. 10 secondi per lato sulla piastra crepe (senza olio). Toasta leggero per ravvivare la struttura.
+
+Servi immediatamente con pairing consigliato (crema mascarpone tiepida, gelato, sauce).
+
+Chiedi preferenza al cliente: "Vuoi la versione tiepida?"
+
+Piastra crepe: pulita e asciutta, no olio
+Timing: 10 secondi per lato (non di piu')
+
+Campioni: tieni piccoli triangoli per assaggiare durante le ore di punta (storytelling)
+
+Abbinamenti tiepidi: crema mascarpone calda, gelato freddo (contrasto), salsa cioccolato
+
+Checklist
+1 - Chiedi preferenza al cliente.
+2 - Tosta e impiatta rapidamente per non perdere volume.
+
+3 - Servi con pairing consigliato.
+Campiona piccoli triangoli per raccontare prodotto nelle ore di traffico.
+
+💰 Upselling
+Opzione 1: "Vuoi la versione calda con gelato? Esperienza premium"
+
+Opzione 2: "Aggiungiamo crema mascarpone tiepida?"
+Opzione 3: "Chiedi SEMPRE preferenza calda/fredda per guidare upsell"
+
+🛠️ Pro tip: 10 secondi per lato esatti, no di piu' o si secca. Impiatta veloce per non perdere volume soffice. Campiona triangolini nelle ore punta per stimolare ordini.
+
+Delivery
+Treat box
+Take away
+Packaging take away
+
+Per due panettoni: una sauce pot riempita 3/4, quattro angoli del treat box.
+
+Procedura
+1 - Inserisci sauce pot al centro, blocca i panettoni agli angoli.
+
+2 - Chiudi con lid + tape, etichetta shelf life.
+
+3 - Conserva in freezer finche' il rider arriva.
+
+Comunica al cliente autonomia termica e modalita' di servizio.
+
+💰 Upselling
+Opzione 1: "Box da 4 mini invece di 2? Perfetto per famiglia"
+
+Opzione 2: "Aggiungiamo doppia salsa per variare gusti?"
+
+Opzione 3: "Con biglietto auguri brandizzato diventa regalo perfetto"
+
+🛠️ Pro tip: Sauce pot al centro per stabilita'. Blocca mini negli angoli. Etichetta shelf life e istruzioni servizio. Conserva in freezer fino consegna rider per mantenere qualita'.
+
+Setup
+Vin Brulé
+Tank
+Allestimento macchina
+Macchina Vin Brulé: riempire tank esterno con 600 ml d'acqua senza superare il max, inserire contenitore interno.
+
+Procedura
+1 - Versa 500/1000 ml di mix nel tank argento.
+
+2 - Porta temperatura a livello 10 per 25-30 min; poi mantieni a 6-7.
+
+3 - Usa il coperchio durante il mantenimento per evitare evaporazione.
+
+Meglio scaldare piccoli lotti per garantire freschezza e aromi.
+
+💰 Upselling
+Visual appeal: "Setup macchina in area visibile per attirare ordini"
+
+Sampling: "Offri mini assaggi nelle ore punta per conversione"
+
+Bundle: "Mulled wine + mini panettone = combo festiva perfetta"
+
+🛠️ Pro tip: Tank esterno: 600ml acqua max. Livello 10 per 25-30 min riscaldamento, poi 6-7 mantenimento. Piccoli batch = freschezza. Coperchio evita evaporazione aromi.
+
+Servizio
+Vin Brulé
+Chiusura
+Service & chiusura
+Vin Brulé: servi con mestolo, fetta d'arancia e controllo shelf life.
+
+Procedura
+1 - Riempire cup con mestolo, aggiungere fetta d'arancia.
+
+2 - A fine giornata travasa nel bricco, lascia raffreddare e copri con pellicola.
+
+3 - Frigo + label (3 giorni dal primo warm-up; 30 giorni per mix non aperto).
+
+Pulire tank, contenitore e esterno macchina ogni sera con acqua calda e detergente.
+
+💰 Upselling
+Opzione 1: "Vuoi aggiungere shot di rum per versione adulta?"
+
+Opzione 2: "Fetta d'arancia fresca + cannella stick = presentazione Instagram"
+
+Opzione 3: "Racconta spezie natalizie e tradizione per valore percepito"
+
+🛠️ Pro tip: Servi con mestolo dedicato. Fetta arancia fresca sempre. Shelf life: 3 giorni da primo riscaldamento, 30 giorni mix chiuso. Pulizia tank ogni sera con acqua calda.
+
+Dati tecnici &amp; Conservazione
+Quick reference · Temperature · Shelf life · FIFO
+
+Setting
+Temperature
+Quick ref
+Temperature chiave (quick map)
+
+Temperature chiave da tenere a mente per evitare prodotti fuori standard.
+
+Gelato vetrina: -14/-15 °C (target)
+Display freezer treats: almeno -14 e senza ghiaccio (defrost weekly)
+
+Thermal storage box (gelato take-away): autonomia max 1 ora prima di tornare in freezer
+
+Uso
+1 · Se la temperatura è fuori range: avvisa subito e non “compensare” con service tricks.
+
+2 · Sliding doors in posizione quando non busy per preservare -14/-15.
+
+3 · Defrost e pulizia programmata = stabilità temperature.
+
+Conservazione
+FIFO
+Label
+FIFO &amp; etichette (regola d'oro)
+
+Ogni modulo “storage” in questo training ha un punto comune: FIFO + label chiare.
+
+Etichetta sempre: data preparazione/apertura + scadenza
+First in, first out: usa prima ciò che scade prima
+
+Se manca la label: non servire (chiedi al manager)
+
+Checklist
+1 · Controllo label a inizio turno.
+
+2 · Controllo FIFO durante i refill.
+3 · Controllo scadenze in chiusura.
+
+Shelf life
+Prep
+Frigo
+Shelf life rapidi (mix &amp; premade)
+
+Promemoria shelf life per controlli veloci durante apertura, refill e chiusura.
+
+Crepe mix: 3 giorni (frigo) + riposo minimo 2 ore
+
+Waffle mix (pre-packed): 2 giorni
+Premade matcha: 1 giorno (incluso giorno di preparazione) → frigo
+
+Mulled wine: 3 giorni dal primo warm-up (mix in macchina)
+
+Regole
+1 · Prepara batch “quanto serve”: meno sprechi, più qualità.
+
+2 · Label sempre (data/ora).
+3 · Oltre shelf life: elimina e rifai.
+
+Packaging
+Take away
+1h
+Take-away: autonomia termica
+La thermal storage box ha autonomia massima di 1 ora: poi il prodotto deve tornare in freezer.
+
+Comunicalo sempre al cliente (qualità e sicurezza)
+Consiglia freezer appena possibile
+
+Evita soste “lunghe” fuori controllo (rider/attese)
+Script
+1 · “Questa box tiene circa 1 ora: poi freezer.”
+
+2 · Offri bag termica se prevista dallo store.
+
+3 · Per delivery: conserva in freezer fino al ritiro.
+
+Chiusura
+Weekly
+Routine
+Schedule pulizie (giorno / settimana)
+
+Chiusura e manutenzione programmata = performance costanti e meno imprevisti in servizio.
+
+Gelato vetrina: OFF ogni notte
+Gelato vetrina: deep clean weekly
+
+Filtri: cleaning weekly
+Display freezer treats: defrost weekly (free of ice)
+
+Checklist
+1 · Segna la giornata di deep clean (non improvvisare).
+
+2 · Pulisci prima che si accumuli: è più veloce.
+
+3 · Dopo la pulizia: rimonta, sanitizza e lucida.
+
+🧩
+Operations &amp; Setup
+Standard che rendono il servizio semplice
+
+6
+Schede
+Daily
+Uso
+Setup
+Focus
+
+=== FONTE: pastries.html ===
+Pastry Lab · Badiani
+Training
+Menu
+Categorie
+Brilla: i dettagli fanno la differenza.
+
+Lingua
+Italiano
+Italiano
+English
+Español
+Français
+Pasticceria da banco
+
+⭐ Stelle: 6/6
+Pastry Lab
+Tutte le referenze servite al banco: cakes, brownies, loaf, croissant farciti e scones con scoop di Buontalenti.
+
+Ogni scheda include shelf life, porzioni e script di upselling.
+
+Pastry Lab
+Pasticceria da banco
+14 fette
+Shelf 2-3 giorni
+
+Cakes
+Chocolate (3g), Carrot (2g), Walnut (3g) rispettando 14 fette per torta.
+
+Usa il cake slicer come guida
+Servi su piatto con posate
+
+Upsell scoop Buontalenti + sauce
+Step & tips
+
+1 → Posiziona il cutter e incidi le 14 porzioni.
+
+2 → Servi la fetta su piatto e racconta pairing con gelato.
+
+3 → Se upsell riuscito, aggiungi scoop con milkshake scooper e drizzle sulla fetta.
+
+Ricorda al team: tazza di cioccolata calda + cake crea combo premium.
+
+💫 Upselling
+Opzione 1: "Vuoi arricchire la fetta con uno scoop di Buontalenti?"
+
+Opzione 2: "Aggiungiamo un drizzle di salsa pistacchio o caramello?"
+
+Opzione 3: "La combo perfetta? Cake + cioccolata calda"
+
+✨ Pro tip: Conserva le cakes coperte con film tra un taglio e l'altro per evitare secchezza. Temperature ambiente: max 2 ore fuori frigo.
+
+Brownie
+Shelf 4 giorni
+Brownie Tray
+Taglio 4x3 (12 pezzi) e servizio su piatto con cutlery.
+
+Display su tray dedicato
+Upsell gelato + sauce
+
+Comunicare shelf life
+Step & tips
+1 - Taglia 12 pezzi uguali, esponi su vassoio.
+
+2 - All'ordine, impiatta e offri scoop Buontalenti.
+
+3 - Servi con drizzle sul brownie e sul gelato.
+
+Ricorda di usare il round scooper per mantenere porzione perfetta.
+
+Loaf 10 slice
+Shelf 4 giorni
+Banana / altri loaf
+
+Ogni loaf deve fornire 10 fette. Servizio e upsell identici alle cakes.
+
+Taglia spessori costanti
+Servi con posate
+Proponi sauce preferita
+
+Step & tips
+1 - Taglia 10 slice uguali, esponi la prima.
+
+2 - Aggiungi scoop + sauce se il cliente accetta.
+
+3 - Mantieni il loaf avvolto quando non in uso.
+
+Comunica shelf life sul label per facilitare i controlli HACCP.
+
+Croissant
+Shelf 2 giorni
+Croissant farciti
+Croissant gia' sfogliato, da farcire con la sauce richiesta dal cliente. Apri lateralmente, riempi e completa la presentazione su piatto con forchetta e coltello.
+
+Ricordati di riscaldare leggermente i croissant del giorno prima per ravvivare la fragranza.
+
+Shelf life: 2 giorni dal defrost (controlla data)
+
+Incisione: usa coltello seghettato, apri il lato in orizzontale
+
+Riempimento: sac a poche per uniformita' e precisione
+
+Presentazione: sauce inside + drizzle sopra, piatto pulito, posate sempre
+
+Riscaldamento (se necessario): 8-10 secondi solo; mai oltre 15s (la farcitura si scioglie)
+
+Step & tips
+1 - Incidi lato con coltello seghettato.
+
+2 - Riempie interno e topping esterno con la stessa sauce.
+
+3 - Impiatta, aggiungi posate e servi.
+Comunica shelf life e rotazione: 2 giorni dal defrost.
+
+Scones
+Gelato 70 g
+Scone con Buontalenti
+Scalda 15 s nel gelato burger machine, farcisci con scoop Buontalenti e sauce.
+
+Taglia orizzontalmente
+Usa milkshake scooper
+Finitura pistacchio o cioccolato
+
+Step & tips
+1 - Riscalda 15 s.
+
+2 - Taglia, inserisci scoop e richiudi.
+3 - Sauce top, impiatta con posate.
+
+Ricorda ai clienti la doppia consistenza caldo/freddo per valorizzare l'upsell.
+
+Setup &amp; Conservazione
+Apertura · Dati tecnici · Shelf life · FIFO · Chiusura
+
+Apertura
+Display
+FIFO
+Set-up vetrina (look &amp; ordine)
+
+Obiettivo apertura: vetrina piena, ordinata e leggibile. Label sempre accanto al tray corretto; le cakes sui cake stand con una fetta rimossa per mostrare l'interno.
+
+CAKES: cake stands + rimuovi 1 slice (visual interno)
+
+CROISSANTS: su tray dedicati (file pulite)
+BROWNIES/PUDDING/TARTS/SCONES: su tray, allineati
+
+LOAF: taglia e mostra la prima fetta sul tray
+
+Checklist
+1 · Ripristina vetrina “full look” (senza buchi visivi).
+
+2 · Metti le label accanto al tray giusto (mai generiche).
+
+3 · Verifica FIFO e shelf life prima del primo servizio.
+
+Coerenza visiva = vendite. Il banco “pieno” invita all'acquisto.
+
+Dati tecnici
+Taglio
+Porzioni
+Tagli standard (porzionatura)
+Porzioni costanti = qualità costante. Usa sempre gli stessi tagli per controllo food cost e per lavorare “in squadra”.
+
+Cake: usa il cake slicer guida 14 fette
+
+Brownie tray: taglio 4×3 = 12 pezzi
+Loaf: ricava 10 fette dalla forma intera
+
+Note
+1 · Usa sempre lo stesso strumento guida (slicer / righello visivo).
+
+2 · Se una porzione è fuori standard, correggi subito il taglio successivo.
+
+3 · Mantieni le lame pulite: taglio netto = presentazione premium.
+
+Shelf life
+Etichette
+Controllo
+Shelf life (quick list)
+
+Lista shelf life per controlli quotidiani, rotazione e label corrette.
+
+Chocolate Cake: 3 giorni
+Carrot Cake: 2 giorni
+
+Walnut Cake: 3 giorni
+Brownie: 4 giorni
+Banana Loaf: 4 giorni
+
+Croissants: 2 giorni
+Scones: 2 giorni
+Regole
+1 · Etichetta sempre: data defrost/apertura + scadenza.
+
+2 · FIFO rigoroso (first in, first out).
+
+3 · In dubbio: non servire (chiedi al manager).
+
+Conservazione
+Vetrina piena
+Label
+Come mantenerla “sempre piena”
+
+Regola vetrina: deve apparire sempre piena e ordinata. Le label stanno accanto al tray corretto, sempre.
+
+Ridisponi i prodotti per chiudere vuoti (senza mescolare referenze)
+
+Allinea fronti: brownie/loaf/croissant sempre “in squadra”
+Controlla che le label siano leggibili e coerenti con il tray
+
+Checklist
+1 · Riempi e riallinea dopo ogni rush.
+
+2 · Aggiorna le label quando cambia il tray (mai lasciare “vecchie”).
+
+3 · Verifica scadenze durante i refill.
+Visual merchandising = training: è una skill, non un dettaglio.
+
+Chiusura
+Pulizia
+FIFO
+Chiusura vetrina (routine)
+Obiettivo: ripristinare ordine e preparare una partenza veloce domani, senza perdere controllo su shelf life.
+
+Rimuovi briciole e residui dai tray (prima che diventino “incollati”)
+
+Raggruppa per referenza e verifica scadenze (FIFO)
+Controlla che tutte le label siano presenti e corrette
+
+Checklist
+1 · Riordina per categoria, controlla date e scarta ciò che è oltre shelf life.
+
+2 · Pulisci superfici e tray; asciuga prima di richiudere.
+
+3 · Prepara il banco “apertura-ready”: label e layout già impostati.
+
+🥐
+Pastry Lab
+Colazione & Merenda
+Daily
+Frequenza
+
+Fresh
+Qualità
+
+=== FONTE: quiz-solution.html ===
+Soluzione quiz · Badiani
+Quiz · Soluzione
+Rivedi la risposta corretta
+
+Caricamento domanda...
+Caricamento risposta corretta...
+Spiegazione:
+Suggerimento:
+📚 Berny consiglia di rivedere:
+
+⬅ Torna all'hub
+📖 Apri specifiche
+↩ Torna indietro
+
+=== FONTE: slitti-yoyo.html ===
+Slitti & Yo-Yo - Badiani
+Training
+Menu
+Categorie
+
+Français
+Cioccolato & snack
+⭐ Stelle: 7/7
+Slitti & Yo-Yo
+
+Storytelling sul brand toscano Slitti, gamma premium (tavolette, mini cakes, praline, dragée, creme) e la
+
+procedura Yo-Yo per servire il biscotto farcito con gelato.
+
+Slitti & Yo-Yo
+Cioccolato & snack
+Montecatini Terme
+
+Since 1969
+Timeline essenziale
+Luciano Slitti apre come torrefazione nel 1969. Nel 1990 Andrea introduce il cioccolato e, insieme al fratello
+
+Daniele, conquista premi internazionali (Grand Prix 1994, Eurochocolate 1996, miglior chocolatier italiano 2008).
+
+Key message
+1. Valorizza la selezione rigorosa di materie prime.
+
+2. Racconta premi e heritage toscano per giustificare il posizionamento premium.
+
+3. Invita il cliente ad assaggiare abbinando caffè o gelato.
+
+Usa la palette blu/pink per creare piccole schede storytelling accanto all'esposizione.
+
+Tavolette
+Gran Cacao
+Tavolette LatteNero & Gran Cacao
+
+Tavolette Slitti in diversi profili di cacao (45%, 51%, 73%, 82%, 100%) + Caffè Latte aromatizzata con arabica tostata.
+
+Spiega il blend: cacao + cacao butter per morbidezza, equilibrio tra zuccheri e latte (nei profili più dolci).
+
+Profili disponibili: LatteNero (45%, 51%, 73%, 82%, 100%), Caffè Latte con arabica
+
+Composizione: cacao selezionato + cacao butter + latte (nei profili LatteNero)
+
+Conservazione: 16-18°C, lontano da luce diretta e odori forti
+
+Pitch
+1. Chiedi preferenza cliente (latte/dark).
+2. Suggerisci pairing con espresso o cappuccino.
+
+3. Ricorda la confezione regalo e shelf life lunga.
+
+Esporre sample aperto per mostrare pattern; mantieni stock FIFO.
+
+Mini cakes
+Hazelnut / Almond
+Minicake
+Mini cake Slitti con materie prime d'eccellenza: nocciole Tonda Gentile (Langhe) e mandorle Avola (Sicilia).
+
+Tre varianti: latte nocciole, fondente mix fruit, fondente mandorle. Servi a temperatura ambiente o leggermente tiepida.
+
+Varianti: latte nocciole Langhe, fondente mix fruit, fondente mandorle Avola
+
+Materie prime: Tonda Gentile Langhe DOP, mandorla Avola DOP (comunica origine)
+
+Servizio: temperatura ambiente oppure 10 secondi microonde per esaltare profumi
+
+Notes
+1. Spiega differenza ingredienti (Tonda Gentile, mandorla Avola).
+
+2. Servi a temperatura ambiente o leggermente tiepida.
+
+3. Consiglia accompagnamento con crema spalmabile Slittosa.
+Praline
+
+Dragée
+Praline & Dragée
+Praline Origin e Irish Coffee (0,9% alc) + dragée su base di pistacchio, mandorla, nocciola, cranberry, arachidi caramel, amarene e arabica.
+
+Ogni dragée racconta la propria provenienza: Bronte, Avola, Langhe. Mantieni sempre temperatura fresca e luce bassa.
+
+Praline: Origin, Irish Coffee (0,9% alcol), Passion Fruit
+
+Dragée: pistacchio Bronte, mandorla Avola DOP, nocciola Langhe, cranberry, arachidi caramel, amarene, arabica, zenzero
+
+Provenienza: evidenzia su lavagnette (Bronte, Avola, Langhe) per valore
+
+Display tips
+1 · Mantieni temperatura fresca e luce bassa.
+
+2 · Offri assaggio se apri una confezione campione.
+
+3 · Pairing suggeriti: pistacchi con Pistachio Hot, ginger con chai.
+
+Spalmabili
+37-57% nocciole
+Creme Slittosa / Riccosa / Gianera
+
+Solo nocciole Tonda Gentile + cacao selezionato. Nocciola %: 37 (Slittosa), 51 (Riccosa), 57 (Gianera).
+
+Composizione: solo nocciole Tonda Gentile + cacao (zero olio di palma)
+
+Profili: Slittosa 37% (dolce), Riccosa 51% (equilibrio), Gianera 57% (intensa)
+
+Display: mostra texture con spatola monouso per igiene
+
+Vendita
+1 · Mostra texture con spatola monouso per igiene.
+
+2 · Suggerisci su crepe, waffle, panettone o gelato.
+
+3 · Posizionamento strategico vicino cassa per impulse buy.
+
+Yo-Yo
+Gelato Sandwich
+Yo-Yo
+Due biscotti morbidi che racchiudono uno strato di gelato. Disponibile in vari gusti.
+
+Conservazione: -18°C (freezer)
+Servizio: Tovagliolino o piattino
+Varianti: Classico, Pistacchio, Cioccolato
+
+Step & tips
+1 · Preleva dal freezer al momento dell'ordine.
+
+2 · Servi immediatamente per evitare che il gelato si sciolga.
+
+3 · Suggerisci come snack veloce o dessert da passeggio.
+
+Setup &amp; Conservazione
+Apertura · Display · Dati tecnici · Storage · Chiusura
+
+Apertura
+Display
+Yo-Yo
+Allestimento Yo-Yo (banco)
+Yo‑Yo al centro sopra la vetrina: area sempre pulita e rifornita (mai vuoto visivo).
+
+Posizionamento: centrale, sopra la gelato vetrina
+Hygiene: superficie sempre free of crumbles
+
+Replenish: riempi/rifornisci ogni volta (mai “vuoto” visivo)
+Checklist
+
+1 · Pulisci l'area (zero briciole).
+2 · Posiziona la stazione Yo-Yo in punto visibile e centrale.
+
+3 · Prepara wafer/tool e guanti monouso per il servizio.
+
+Il Yo-Yo vende anche “con gli occhi”: non lasciarlo mai disordinato.
+
+Setting
+Tool
+Gloves
+Stazione e strumenti (standard)
+Stazione pronta = servizio veloce e pulito: guanti, tool e wafer già a portata.
+
+Guanti: indossali prima di maneggiare wafer/Yo-Yo tool
+Tool: appoggia Yo-Yo tool su un piatto con 2 wafer pronti
+
+Flow: prepara wafer → gelato → chiusura, senza “giri” inutili
+
+Procedura
+1 · Guanti on.
+2 · Wafer sul tool, una base pronta.
+
+3 · Chiudi subito dopo porzionatura per evitare overflow.
+
+Ordine fisso = velocità e costanza tra team.
+
+Dati tecnici
+80/90 g
+Precisione
+Porzionatura gelato Yo-Yo
+
+Porzione 80–90 g: gelato dentro i wafer, bordo pulito (zero overflow).
+
+Porzione target: 80–90 g
+Scoop: usa il gelato con ice-cream scooper
+
+Controllo: non overflow (è un difetto visivo + sporca la stazione)
+
+Tips
+1 · Posiziona il gelato centralmente.
+2 · Chiudi con il secondo wafer e verifica bordo pulito.
+
+3 · Se sporchi: pulisci subito (non “rimandare”).
+
+Precisione oggi = meno sprechi domani.
+Conservazione
+Pan method
+
+Label
+Pan storage method (etichettatura)
+Pan storage: etichetta sempre (data/contenuto). Label chiare = meno errori.
+
+Etichetta: data + contenuto + responsabile (secondo standard store)
+
+Non miscelare wafer diversi nello stesso contenitore
+Controllo briciole: ogni refill = quick wipe
+
+Checklist
+1 · Applica label sempre prima di mettere in posizione.
+
+2 · Controlla integrità wafer (no rotti in vista).
+
+3 · Refill = anche pulizia: togli crumbles e residui.
+
+Chiusura
+Pulizia
+Riordino
+Chiusura stazione Yo-Yo
+Chiusura: pulisci, riordina e lascia la stazione “apertura‑ready”.
+
+Rimuovi crumbles e residui dalla superficie e dagli strumenti
+
+Riponi wafer e tool secondo procedura (con label se usi pan storage)
+
+Check rapido: stazione “apertura-ready”
+Checklist
+1 · Pulisci e asciuga strumenti e area.
+
+2 · Riponi stock con label corrette.
+3 · Lascia il piano libero e ordinato.
+
+🍫
+Slitti & Yo-Yo
+Cioccolato d'autore & Snack
+
+Premium
+Qualità
+Toscana
+Origine
+
+=== FONTE: story-orbit.html ===
+Story Orbit · Badiani
+Training
+Menu
+Orbit
+Hub
+
+Story Orbit
+Operations &amp; Setup
+Beverage &amp; Treats
+
+Bar & Drinks
+Sweet Treat Atelier
+Pastry Lab
+
+Gelato &amp; Speciali
+Slitti &amp; Yo-Yo
+Gelato Lab
+
+Festive
+Lingua
+Italiano
+Italiano
+English
+Español
+Français
+Categorie
+
+Français
+Brand Book – Heritage
+⭐ Stelle: 0/5
+
+Story Orbit Badiani 1932
+Timeline immersiva per raccontare origine, cultura del Buontalenti e promessa di marca. Materiale estratto dal Brand Book
+
+ufficiale con immagini leggibili, citazioni e rituali da usare nei training.
+
+History
+Gelato culture
+Brand promise
+Click per ingrandire
+
+🏛️
+Tradizione
+Origini 1932 – Firenze
+Heritage
+Tradizione fiorentina
+
+Origini 1932: gelateria artigianale nel cuore di Firenze.
+
+Stile italiano: eleganza, accoglienza, cura del dettaglio.
+Storia di famiglia: passaggi generazionali e know-how.
+
+Pitch da 20 secondi
+"Firenze nel cono, ogni giorno": racconta che la stessa mano artigianale del 1932 vive in ogni laboratorio Badiani.
+
+Cartolina dal Piazzale
+Accoglienza boutique
+Passaggi generazionali
+Firenze
+
+1932
+✨
+Idea Badiani
+Visione e filosofia
+Visione
+
+Idea Badiani
+Innovazione continua su gusti e rituali di servizio.
+
+Esperienza boutique: qualità percepita in ogni touchpoint.
+Team training: storytelling coerente con la brand promise.
+
+Mantra da banco
+"Nuovo e fedele": ogni novità preserva l'equilibrio e la gentilezza del gesto italiano.
+
+Brand promise
+Tono caldo, sicuro
+Curiosità sul menù
+
+Brand book
+Vision
+🍦
+Cultura Gelato
+Buontalenti &amp; spatolatura
+
+Gelato
+Cultura del gelato
+Buontalenti: crema iconica, texture setosa e spatolatura morbida.
+
+Ingredienti: latte fresco, panna, tuorlo, zucchero bilanciato.
+Rituale: primo assaggio consigliato per educare il palato.
+
+Rituale di degustazione
+Offri un micro-assaggio di Buontalenti prima di ogni scelta e spiega che la spatola serve a tenere l'aria fuori e la cremosità dentro.
+
+Prima cucchiaiata guidata
+Texture seta
+Voce da laboratorio
+
+Buontalenti
+Signature
+👑
+Buontalenti
+Signature hero
+Iconic
+Buontalenti signature
+
+Il nostro eroe: crema inventata a Firenze, simbolo del brand.
+
+Racconto al banco: invita all'assaggio e spiega la spatolatura.
+
+Pairing: affogato, coppetta con topping caldo, degustazione guidata.
+
+Hero moment
+Firma l'ordine con un suggerimento: "Provi il Buontalenti con una colata di cioccolato Slitti o in affogato?"
+
+Signature tasting
+Assaggio guidato
+Pairing caldo/freddo
+Signature
+Experience
+
+📖
+Story Orbit
+Heritage Badiani 1932
+4 Moduli
+
+Moduli
+Brand Story
+Brand Story
+Firenze Origine
+Origine
+
+&times;
+
+=== FONTE: sweet-treats.html ===
+Sweet Treat Atelier · Badiani
+Training
+Menu
+Categorie
+
+Français
+Linea Dessert · 2025
+⭐ Stelle: 13/13
+
+Sweet Treat Atelier
+Laboratorio digitale per crepe, waffle, burger di gelato e set da tè. Include grammature, shelf life, ordine di
+
+assemblaggio e scenografia di servizio per stupire in boutique.
+
+Sweet Crepes & Waffles
+Dolci tentazioni
+Base Mix
+
+Sauce Only
+Crepe con Salsa
+Crepe classica servita con una delle nostre salse signature (Pistacchio, Nocciola, Cioccolato).
+
+Base perfetta per ogni aggiunta.
+Shelf life mix: 3 giorni (frigo)
+
+Riposo: almeno 2 ore (frigo)
+Cottura: 20s per lato
+
+Step & tips
+1 · Stendi mix, gira quando dorata.
+
+2 · Spalma la salsa su metà, chiudi a mezzaluna poi a ventaglio.
+
+3 · Impiatta, zucchero a velo e drizzle di salsa sopra.
+
+✨ Pro tip: La piastra deve essere ben calda ma non fumante. Il primo giro è spesso di test.
+
+Best Seller
+Buontalenti
+Signature Buontalenti Crepe
+Il nostro best seller: Crepe con salsa a scelta e uno scoop di Buontalenti on top.
+
+Gelato: 1 scoop Buontalenti (70g)
+Salsa: 30g interna + decorazione
+
+Servizio: Piatto dessert con posate
+Step & tips
+
+1 · Prepara la crepe con salsa come da standard.
+
+2 · Piega a ventaglio e spolvera con zucchero a velo.
+
+3 · Adagia lo scoop di Buontalenti sopra e finisci con salsa.
+
+Aggiungi il gelato solo all'ultimo secondo per evitare che si sciolga sulla crepe calda.
+
+Crunchy
+5 min totali
+Waffles
+Waffle dorato e croccante fuori, soffice dentro. Servito con salse, frutta o gelato.
+
+Cottura: 2.5 min per lato (5 min tot)
+
+Riposo: 45s per croccantezza
+Batter: 1 scoop (177ml)
+
+Step & tips
+1 · Versa il mix nella piastra calda e chiudi.
+
+2 · Cuoci 2.5 min, gira e cuoci altri 2.5 min.
+
+3 · Lascia riposare su griglia 45s prima di decorare.
+
+Il riposo è fondamentale: se servito subito risulta molle.
+
+Stack x3
+Breakfast
+Pancake Stack
+Torre di 3 pancake soffici. Serviti con sciroppo d'acero, frutta fresca o salse Badiani.
+
+Porzione: 3 pezzi
+Cottura: Fino a comparsa bolle
+
+Topping: Generoso
+Step & tips
+1 · Versa 3 dischi di impasto sulla piastra.
+
+2 · Gira quando compaiono le bolle in superficie.
+
+3 · Impila e decora abbondantemente.
+Savory
+Plain Base
+
+Crepe Italiana (Plain)
+Mozzarella, rucola e pomodorini su base classica. Fresca e leggera.
+
+Base: Classica
+Ripieno: Mozzarella, rucola, pomodorini
+Condimento: Olio EVO, sale, origano
+
+Step & tips
+1 · Cuoci la crepe e gira.
+
+2 · Aggiungi mozzarella e fai sciogliere leggermente.
+
+3 · Aggiungi rucola e pomodorini conditi, chiudi a portafoglio.
+
+Savory
+Beetroot Base
+Crepe Italiana (Beetroot)
+La variante colorata: impasto alla barbabietola per un look unico e un tocco dolce-terroso.
+
+Base: Beetroot (Barbabietola)
+Ripieno: Mozzarella, rucola, pomodorini
+Visual: Colore rosso/viola intenso
+
+Step & tips
+1 · Usa il mix beetroot (3g polvere per 250g mix).
+
+2 · Procedi come per la classica Italiana.
+
+3 · Il contrasto di colori è il punto di forza: lascia intravedere il ripieno.
+
+Prosciutto
+Plain Base
+Crepe Prosciutto (Plain)
+Classica con Prosciutto Crudo, mozzarella e rucola.
+
+Base: Classica
+Ripieno: Crudo, mozzarella, rucola
+Servizio: Calda e filante
+
+Step & tips
+1 · Sciogli la mozzarella sulla crepe in cottura.
+
+2 · Aggiungi il prosciutto a fine cottura per non cuocerlo troppo.
+
+3 · Completa con rucola e chiudi.
+Prosciutto
+
+Beetroot Base
+Crepe Prosciutto (Beetroot)
+Prosciutto Crudo su base alla barbabietola. Un twist moderno su un classico.
+
+Base: Beetroot
+Ripieno: Crudo, mozzarella, rucola
+Gusto: Sapido + dolce (impasto)
+
+Step & tips
+1 · Prepara la base beetroot.
+
+2 · Farcisci generosamente.
+3 · Servi tagliata a metà per mostrare gli strati.
+
+Signature
+Brioche
+Gelato Burger
+Una scoop di gelato in una brioche morbida, chiusa a caldo in pochi secondi: effetto “wow” e servizio veloce.
+
+Pane: Brioche bun leggermente scaldato
+Gelato: 1 scoop (circa 70 g) a scelta
+
+Sauce: 1 sola scelta (standard)
+Step & tips
+
+1 · Scalda leggermente la brioche (non tostare troppo).
+
+2 · Inserisci una scoop di gelato (circa 70 g) e rifinisci con una sola salsa a scelta.
+
+3 · Chiudi, servi subito e consiglia di mangiare come un panino.
+
+Apertura
+Crepe / Waffle
+Gelato Burger
+Checklist apertura stazioni
+
+Prima del servizio verifica che le macchine siano pronte e che mix/ingredienti siano in ordine. La Gelato Burger Machine va accesa all'apertura e spenta alla chiusura.
+
+Waffle machine: accendi e attendi entrambe le luci verdi (READY + POWER)
+
+Gelato Burger Machine: ON all'apertura; in genere pronta ~10 min dopo l'accensione
+
+Crepe mix: deve aver riposato in frigo almeno 2 ore prima dell'uso
+
+Checklist
+1 · Accendi macchine e verifica che siano in temperatura/pronte.
+
+2 · Controlla mix e scorte (etichette, FIFO, date).
+
+3 · Prepara blue roll e bottiglie sauce per un banco pulito e veloce.
+
+Obiettivo: zero attese al primo ordine e stazioni già “service ready”.
+
+Setting
+Power 3
+Timer 12s
+Settaggi macchine (standard)
+
+Imposta i parametri base prima del rush: riduce errori, sprechi e prodotti fuori standard.
+
+Waffle: olia leggermente con olio di semi; power livello 3; cottura 2,5 min per lato (tot 5 min)
+
+Waffle: lascia riposare 45s prima di topping/gelato (croccantezza)
+
+Gelato Burger: timer 12 secondi; non serve oliare le piastre
+
+Dettagli
+1 · Waffle: set power 3 e non iniziare finché READY + POWER sono attive.
+
+2 · Gelato Burger: set timer 12s e usa solo blue-roll per eventuali gocce/salse.
+
+3 · Mantieni la superficie sempre pulita: briciole = qualità visiva in caduta.
+
+No oil sulla Gelato Burger machine: le superfici non vanno unte.
+
+Conservazione
+Frigo
+Etichette
+Shelf life &amp; storage rapidi
+
+Questo modulo è “più storage che show”: tieni sempre sotto controllo date e condizioni.
+
+Crepe mix: shelf life 3 giorni (frigo) + riposo minimo 2 ore (frigo)
+
+Waffle mix (pre-packed): shelf life 2 giorni
+Gelato Burger: bun shelf life quando defrosted = 2 giorni
+
+Gelato Croissant: plain croissant shelf life = 2 giorni
+
+Regole
+1 · Applica etichette con data preparazione/apertura e scadenza.
+
+2 · FIFO rigoroso: usa prima ciò che scade prima.
+
+3 · Se fuori range/senza label: non servire.
+
+Lo storage è training: qualità costante = clienti che tornano.
+
+Dati tecnici
+177 ml
+70 g
+Porzionatura &amp; dosi (quick ref)
+
+Una scheda “da banco”: dosi chiave per velocità e standard.
+
+Waffle: 1 scoop intero di batter = 177 ml
+
+Crepe: 1 scoop o 1,5 small ladle scoop di mix
+
+Signature Buontalenti Crepe: Buontalenti 70 g + sauce top ~30 g
+
+Gelato Burger: 1 scoop di gelato = 70 g (uno solo) + una sola scelta sauce
+
+Uso
+1 · Usa scoop dedicati: riduci variazioni tra operatori.
+
+2 · Se il prodotto esce fuori standard, correggi subito (non “compensare” con extra).
+
+3 · Segna gli errori ricorrenti: sono training points.
+
+Chiusura
+Spegnere
+Blue-roll
+Chiusura &amp; pulizia rapida
+A fine giornata riduci residui e rischi: sulla Gelato Burger Machine si usa solo blue-roll per gelato/salsa fuoriusciti e per rimuovere le briciole.
+
+Gelato Burger Machine: OFF a chiusura; superficie senza residui/particelle
+
+Waffle: rimuovi residui e prepara la stazione per il giorno dopo
+
+Mix: riponi in frigo con etichetta (o elimina se oltre shelf life)
+
+Checklist
+1 · Spegni le macchine e lascia raffreddare in sicurezza.
+
+2 · Pulisci con blue-roll: niente olio sulle piastre Gelato Burger.
+
+3 · Frigo + label per mix/ingredienti; smaltisci ciò che supera shelf life.
+
+Pulito e asciutto oggi = apertura più veloce domani.
+
+🥞
+Sweet Treat Atelier
+Crepes, Waffles & More
+
+10+ Varianti
+Menu
+Sweet & Savory
+Gusti
+
+=== FONTE: notes/modal-essentials-component.html ===
+Attached HTML and CSS Context
+In primo piano
+
+Latte 1-4 L intero +. Mix cacao + amido (vedi tabella). Riposo 5 minuti in frigo dopo la miscelazione. Shelf life life 3 giorni dal primo.
+
+/* Matched Rule from user-agent */
+div {
+
+display: block;
+}
+/* Matched Rule from user-agent */
+[+ notes/modal-specs.html]
+
+address, blockquote, center, div, figure, figcaption, footer, form, header, hr, legend, listing, main, p, plaintext, pre, summary, xmp, article, aside, h1, h2, h3, h4, h5, h6, hgroup, nav, section, search, table, caption, colgroup, col, thead, tbody, tfoot, tr, td, th, dir, dd, dl, dt, menu, ol, ul, li, bdi, output, [dir="ltr" i], [dir="rtl" i], [dir="auto" i] {
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+unicode-bidi: isolate;
+}
+/* Matched Rule from regular */
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+* {
+box-sizing: border-box;
+margin: 0;
+box-sizing: border-box;
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+margin-top: 0px;
+margin-right: 0px;
+margin-bottom: 0px;
+margin-left: 0px;
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+}
+/* Matched Rule from regular */
+.card-modal-essentials {
+
+border: 1px solid rgba(33, 64, 152, 0.14);
+border-radius: 14px;
+
+padding: 16px;
+background: rgba(33, 64, 152, 0.03);
+border-top-width: 1px;
+
+border-right-width: 1px;
+border-bottom-width: 1px;
+border-left-width: 1px;
+border-top-style: solid;
+
+border-right-style: solid;
+border-bottom-style: solid;
+border-left-style: solid;
+border-top-color: rgba(33, 64, 152, 0.14);
+
+border-right-color: rgba(33, 64, 152, 0.14);
+border-bottom-color: rgba(33, 64, 152, 0.14);
+
+border-left-color: rgba(33, 64, 152, 0.14);
+border-image-source: initial;
+border-image-slice: initial;
+
+border-image-width: initial;
+border-image-outset: initial;
+border-image-repeat: initial;
+border-top-left-radius: 14px;
+
+border-top-right-radius: 14px;
+border-bottom-right-radius: 14px;
+border-bottom-left-radius: 14px;
+padding-top: 16px;
+
+padding-right: 16px;
+padding-bottom: 16px;
+padding-left: 16px;
+background-image: initial;
+
+background-position-x: initial;
+background-position-y: initial;
+background-size: initial;
+background-repeat: initial;
+[+ notes/modal-specs.html]
+
+background-attachment: initial;
+background-origin: initial;
+background-clip: initial;
+background-color: rgba(33, 64, 152, 0.03);
+
+}
+/* Inherited from ancestor level 1 (user-agent) */
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+div {
+display: block;
+}
+/* Inherited from ancestor level 1 (user-agent) */
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+unicode-bidi: isolate;
+}
+/* Inherited from ancestor level 1 (regular) */
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+}
+/* Inherited from ancestor level 1 (regular) */
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+.card-modal-primary {
+display: grid;
+gap: 18px;
+display: grid;
+
+row-gap: 18px;
+column-gap: 18px;
+}
+/* Inherited from ancestor level 2 (user-agent) */
+
+div {
+display: block;
+}
+/* Inherited from ancestor level 2 (user-agent) */
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+unicode-bidi: isolate;
+}
+/* Inherited from ancestor level 2 (regular) */
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+}
+/* Inherited from ancestor level 2 (regular) */
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+.card-modal-body {
+grid-column: 2;
+grid-row: 2;
+padding: 36px;
+
+overflow-y: auto;
+overflow-x: hidden;
+display: flex;
+flex-direction: column;
+
+gap: 32px;
+font-size: 18px;
+line-height: 1.8;
+-webkit-overflow-scrolling: touch;
+
+scrollbar-width: thin;
+scrollbar-color: rgba(33, 64, 152, 0.3) transparent;
+
+background: var(--paper);
+grid-column-start: 2;
+grid-column-end: auto;
+grid-row-start: 2;
+
+grid-row-end: auto;
+padding-top: 36px;
+padding-right: 36px;
+padding-bottom: 36px;
+
+padding-left: 36px;
+overflow-y: auto;
+overflow-x: hidden;
+display: flex;
+
+flex-direction: column;
+row-gap: 32px;
+column-gap: 32px;
+font-size: 18px;
+
+line-height: 1.8;
+scrollbar-width: thin;
+scrollbar-color: rgba(33, 64, 152, 0.3) transparent;
+
+}
+/* Inherited from ancestor level 3 (user-agent) */
+[+ notes/modal-specs.html]
+
+div {
+display: block;
+}
+/* Inherited from ancestor level 3 (user-agent) */
+[+ notes/modal-specs.html]
+
+unicode-bidi: isolate;
+}
+/* Inherited from ancestor level 3 (regular) */
+[+ notes/modal-specs.html]
+
+}
+/* Inherited from ancestor level 3 (regular) */
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+.card-modal {
+background: var(--paper);
+border-radius: var(--radius-lg);
+box-shadow: 0 50px 100px rgba(15, 33, 84, 0.4);
+[+ notes/modal-specs.html]
+
+width: min(1000px, 96vw);
+max-height: min(92vh, 1200px);
+display: grid;
+[+ notes/modal-specs.html]
+
+grid-template-columns: 420px 1fr;
+grid-template-rows: auto 1fr;
+gap: 0;
+[+ notes/modal-specs.html]
+
+transform: scale(0.94) translateY(30px);
+transition: transform 400ms cubic-bezier(0.34, 1.56, 0.64, 1);
+[+ notes/modal-specs.html]
+
+border: 1px solid var(--border-strong);
+overflow: hidden;
+box-shadow: rgba(15, 33, 84, 0.4) 0px 50px 100px;
+[+ notes/modal-specs.html]
+
+grid-template-columns: 420px 1fr;
+grid-template-rows: auto 1fr;
+row-gap: 0px;
+[+ notes/modal-specs.html]
+
+column-gap: 0px;
+transform: scale(0.94) translateY(30px);
+transition-behavior: normal;
+transition-duration: 400ms;
+[+ notes/modal-specs.html]
+
+transition-timing-function: cubic-bezier(0.34, 1.56, 0.64, 1);
+transition-delay: 0s;
+transition-property: transform;
+[+ notes/modal-specs.html]
+
+overflow-x: hidden;
+overflow-y: hidden;
+}
+/* Inherited from ancestor level 3 (regular) */
+
+.card-modal-overlay.is-visible .card-modal {
+transform: scale(1) translateY(0);
+transform: scale(1) translateY(0px);
+[+ notes/modal-specs.html]
+
+}
+/* Inherited from ancestor level 4 (user-agent) */
+
+div {
+display: block;
+}
+/* Inherited from ancestor level 4 (user-agent) */
+
+unicode-bidi: isolate;
+}
+/* Inherited from ancestor level 4 (regular) */
+
+}
+/* Inherited from ancestor level 4 (regular) */
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+.card-modal-overlay {
+position: fixed;
+inset: 0;
+background: rgba(15, 33, 84, 0.75);
+[+ notes/modal-specs.html]
+
+backdrop-filter: blur(4px);
+z-index: 1600;
+display: flex;
+align-items: center;
+[+ notes/modal-specs.html]
+
+justify-content: center;
+padding: 20px;
+opacity: 0;
+transition: opacity 300ms ease;
+[+ notes/modal-specs.html]
+
+position: fixed;
+top: 0px;
+right: 0px;
+bottom: 0px;
+[+ notes/modal-specs.html]
+
+left: 0px;
+background-image: initial;
+background-position-x: initial;
+background-position-y: initial;
+[+ notes/modal-specs.html]
+
+background-size: initial;
+background-repeat: initial;
+background-attachment: initial;
+background-origin: initial;
+[+ notes/modal-specs.html]
+
+background-clip: initial;
+background-color: rgba(15, 33, 84, 0.75);
+backdrop-filter: blur(4px);
+[+ notes/modal-specs.html]
+
+z-index: 1600;
+display: flex;
+align-items: center;
+justify-content: center;
+[+ notes/modal-specs.html]
+
+padding-top: 20px;
+padding-right: 20px;
+padding-bottom: 20px;
+padding-left: 20px;
+[+ notes/modal-specs.html]
+
+opacity: 0;
+transition-behavior: normal;
+transition-duration: 300ms;
+transition-timing-function: ease;
+[+ notes/modal-specs.html]
+
+transition-delay: 0s;
+transition-property: opacity;
+}
+/* Inherited from ancestor level 4 (regular) */
+
+.card-modal-overlay.is-visible {
+opacity: 1;
+opacity: 1;
+}
+/* Inherited from ancestor level 5 (user-agent) */
+
+body {
+display: block;
+margin-top: 8px;
+margin-right: 8px;
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+margin-bottom: 8px;
+margin-left: 8px;
+}
+/* Inherited from ancestor level 5 (regular) */
+
+}
+/* Inherited from ancestor level 5 (regular) */
+[+ notes/modal-specs.html]
+
+body {
+min-height: 100vh;
+background-color: #ffffff;
+color: var(--ink-soft);
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+font-size: 16px;
+line-height: 1.5;
+padding: 0 0 80px;
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+position: relative;
+font-family: var(--font-regular);
+overflow-x: hidden;
+overflow-y: auto;
+[+ notes/modal-specs.html]
+
+-webkit-overflow-scrolling: touch;
+min-height: 100vh;
+background-color: rgb(255, 255, 255);
+[+ notes/modal-specs.html]
+
+color: var(--ink-soft);
+font-size: 16px;
+line-height: 1.5;
+padding-top: 0px;
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+padding-right: 0px;
+padding-bottom: 80px;
+padding-left: 0px;
+position: relative;
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+font-family: var(--font-regular);
+overflow-x: hidden;
+overflow-y: auto;
+}
+/* Inherited from ancestor level 5 (regular) */
+
+body.no-scroll {
+overflow: hidden !important;
+position: fixed;
+width: 100%;
+[+ notes/modal-specs.html]
+
+height: 100%;
+position: fixed;
+width: 100%;
+height: 100%;
+[+ notes/modal-specs.html]
+
+overflow-x: hidden !important;
+overflow-y: hidden !important;
+}
+/* Inherited from ancestor level 6 (user-agent) */
+
+html {
+display: block;
+}
+/* Inherited from ancestor level 6 (user-agent) */
+
+:root {
+view-transition-name: root;
+}
+/* Inherited from ancestor level 6 (regular) */
+
+}
+/* Inherited from ancestor level 6 (regular) */
+
+html {
+scroll-behavior: smooth;
+-webkit-overflow-scrolling: touch;
+scroll-behavior: smooth;
+[+ notes/modal-specs.html]
+
+:root {
+--brand-blue: #214098;
+--brand-blue-deep: #0f2154;
+--brand-gray: #4f515e;
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+--brand-gray-soft: #6b7082;
+--brand-rose: #ec418c;
+--brand-gold: #f2be58;
+--paper: #ffffff;
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+--paper-soft: #fff8f0;
+--ink: var(--brand-blue);
+--ink-soft: var(--brand-gray);
+--sky: rgba(236, 65, 140, 0.18);
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+--sky-mid: var(--brand-rose);
+--blush: rgba(242, 190, 88, 0.18);
+--sun: var(--brand-gold);
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+--cloud: #ffffff;
+--card: rgba(255, 255, 255, 0.98);
+--frost: rgba(255, 255, 255, 0.7);
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+--border: rgba(33, 64, 152, 0.14);
+--border-strong: rgba(15, 33, 84, 0.25);
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+--shadow: 0 40px 60px rgba(15, 33, 84, 0.18);
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+--radius-xl: 34px;
+--radius-lg: 24px;
+--anim-fast: 180ms;
+--anim-slow: 420ms;
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+--slate: var(--brand-gray-soft);
+--font-regular: "SuperGrotesk-Regular", Arial, sans-serif;
+--font-medium: "SuperGrotesk-Medium", Arial, sans-serif;
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+font-family: var(--font-regular);
+--brand-blue: #214098;
+--brand-blue-deep: #0f2154;
+--brand-gray: #4f515e;
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+font-family: var(--font-regular);
+}
+[+ notes/modal-specs.html, notes/nav-tokens.html]
+
+=== FONTE: notes/modal-specs.html ===
+Attached HTML and CSS Context
+Specifiche
+Parametri chiave (senza prezzi).
+
+Latte
+1-4 L intero +.
+Mix
+cacao + amido (vedi tabella).
+
+Riposo
+5 minuti in frigo dopo la miscelazione.
+
+Shelf life
+life 3 giorni dal primo.
+Ricetta
+
+warm-up.
+/* Matched Rule from user-agent */
+article, aside, footer, header, hgroup, main, nav, search, section {
+
+}
+/* Matched Rule from regular */
+.modal-specs {
+
+border: 1px solid rgba(33, 64, 152, 0.16);
+border-radius: 18px;
+
+background: linear-gradient(135deg, rgba(33, 64, 152, 0.04), rgba(236, 65, 140, 0.03));
+
+padding: 18px;
+box-shadow: 0 14px 34px rgba(15, 33, 84, 0.10);
+
+border-top-width: 1px;
+border-right-width: 1px;
+border-bottom-width: 1px;
+border-left-width: 1px;
+[+ notes/nav-tokens.html]
+
+border-top-style: solid;
+border-right-style: solid;
+border-bottom-style: solid;
+border-left-style: solid;
+[+ notes/nav-tokens.html]
+
+border-top-color: rgba(33, 64, 152, 0.16);
+border-right-color: rgba(33, 64, 152, 0.16);
+[+ notes/nav-tokens.html]
+
+border-bottom-color: rgba(33, 64, 152, 0.16);
+border-left-color: rgba(33, 64, 152, 0.16);
+[+ notes/nav-tokens.html]
+
+border-image-source: initial;
+border-image-slice: initial;
+border-image-width: initial;
+border-image-outset: initial;
+[+ notes/nav-tokens.html]
+
+border-image-repeat: initial;
+border-top-left-radius: 18px;
+border-top-right-radius: 18px;
+border-bottom-right-radius: 18px;
+
+border-bottom-left-radius: 18px;
+background-image: linear-gradient(135deg, rgba(33, 64, 152, 0.04), rgba(236, 65, 140, 0.03));
+
+background-attachment: initial;
+background-origin: initial;
+background-clip: initial;
+background-color: initial;
+
+padding-top: 18px;
+padding-right: 18px;
+padding-bottom: 18px;
+padding-left: 18px;
+
+box-shadow: rgba(15, 33, 84, 0.1) 0px 14px 34px;
+
+.card-modal-sidebar {
+grid-column: 1;
+grid-row: 2;
+padding: 32px;
+
+background: linear-gradient(180deg, rgba(33, 64, 152, 0.02), rgba(236, 65, 140, 0.01));
+
+border-right: 1px solid var(--border);
+overflow-y: auto;
+display: flex;
+
+flex-direction: column;
+gap: 24px;
+grid-column-start: 1;
+grid-column-end: auto;
+
+grid-row-start: 2;
+grid-row-end: auto;
+padding-top: 32px;
+padding-right: 32px;
+
+padding-bottom: 32px;
+padding-left: 32px;
+background-image: linear-gradient(rgba(33, 64, 152, 0.02), rgba(236, 65, 140, 0.01));
+
+overflow-y: auto;
+display: flex;
+flex-direction: column;
+row-gap: 24px;
+
+column-gap: 24px;
+}
+/* Inherited from ancestor level 2 (user-agent) */
+
+overflow-x: hidden;
+overflow-y: hidden;
+}
+/* Inherited from ancestor level 2 (regular) */
+
+transition-delay: 0s;
+transition-property: opacity;
+}
+/* Inherited from ancestor level 3 (regular) */
+
+.card-modal-overlay.is-visible {
+opacity: 1;
+opacity: 1;
+}
+/* Inherited from ancestor level 4 (user-agent) */
+
+margin-bottom: 8px;
+margin-left: 8px;
+}
+/* Inherited from ancestor level 4 (regular) */
+
+font-family: var(--font-regular);
+overflow-x: hidden;
+overflow-y: auto;
+}
+/* Inherited from ancestor level 4 (regular) */
+
+overflow-x: hidden !important;
+overflow-y: hidden !important;
+}
+/* Inherited from ancestor level 5 (user-agent) */
+
+html {
+display: block;
+}
+/* Inherited from ancestor level 5 (user-agent) */
+
+:root {
+view-transition-name: root;
+}
+/* Inherited from ancestor level 5 (regular) */
+
+=== FONTE: notes/nav-tokens.html ===
+Attached HTML and CSS Context
+★
+Stelline
+45
+
+Progressi
+45/65
+Ogni scheda aperta vale 1 stellina. Al raggiungimento di tre stelline sblocchi lo slot quiz.
+
+Test me
+3 stelline = quiz slot. Se lo sbagli riparti da zero.
+
+Regole complete
+🍨
+Gelati
+1
+Tre quiz perfetti = un gelato reale da riscattare con il trainer. Il timer ti impedisce gli sprint consecutivi.
+
+Cooldown
+06:14:08
+Gelato di ieri! Torna tra 6h 15m
+
+Vedi regolamento
+⚡
+Bonus
+0
+65 stelline azzerano il loop e assegnano +5 punti bonus convertibili in cash o prodotti Badiani.
+
+Come si sblocca
+/* Matched Rule from user-agent */
+
+div {
+display: block;
+}
+/* Matched Rule from user-agent */
+
+}
+/* Matched Rule from regular */
+.nav-token-shell {
+
+flex: 1 1 auto;
+display: inline-flex;
+align-items: center;
+
+gap: 10px;
+padding: 8px 18px;
+border-radius: 999px;
+background: rgba(33, 64, 152, 0.05);
+
+border: 1px solid rgba(33, 64, 152, 0.12);
+box-shadow: 0 18px 40px rgba(15, 33, 84, 0.12);
+
+transition: padding var(--anim-slow) ease, gap var(--anim-slow) ease;
+flex-grow: 1;
+
+flex-shrink: 1;
+flex-basis: auto;
+display: inline-flex;
+align-items: center;
+
+row-gap: 10px;
+column-gap: 10px;
+padding-top: 8px;
+padding-right: 18px;
+
+padding-bottom: 8px;
+padding-left: 18px;
+border-top-left-radius: 999px;
+border-top-right-radius: 999px;
+
+border-bottom-right-radius: 999px;
+border-bottom-left-radius: 999px;
+background-image: initial;
+background-position-x: initial;
+
+background-position-y: initial;
+background-size: initial;
+background-repeat: initial;
+background-attachment: initial;
+
+background-origin: initial;
+background-clip: initial;
+background-color: rgba(33, 64, 152, 0.05);
+
+border-image-repeat: initial;
+box-shadow: rgba(15, 33, 84, 0.12) 0px 18px 40px;
+
+article, aside, footer, header, hgroup, main, nav, search, section {
+
+.nav-shell {
+display: flex;
+justify-content: space-between;
+align-items: center;
+
+gap: 18px;
+flex-wrap: wrap;
+padding: 32px 0 18px;
+
+border-bottom: 1px solid var(--border);
+position: sticky;
+top: 0;
+
+z-index: 900;
+background: rgba(255, 255, 255, 0.95);
+backdrop-filter: blur(8px);
+
+transition: padding var(--anim-slow) ease, box-shadow var(--anim-slow) ease;
+display: flex;
+
+justify-content: space-between;
+align-items: center;
+row-gap: 18px;
+column-gap: 18px;
+
+flex-wrap: wrap;
+padding-top: 32px;
+padding-right: 0px;
+padding-bottom: 18px;
+
+padding-left: 0px;
+position: sticky;
+top: 0px;
+z-index: 900;
+
+background-image: initial;
+background-position-x: initial;
+background-position-y: initial;
+background-size: initial;
+
+background-repeat: initial;
+background-attachment: initial;
+background-origin: initial;
+background-clip: initial;
+
+background-color: rgba(255, 255, 255, 0.95);
+backdrop-filter: blur(8px);
+}
+
+/* Inherited from ancestor level 2 (user-agent) */
+
+main {
+width: min(1200px, 92vw);
+margin: 0 auto;
+
+position: relative;
+width: min(1200px, 92vw);
+margin-top: 0px;
+margin-right: auto;
+
+margin-bottom: 0px;
+margin-left: auto;
+position: relative;
+}
+/* Inherited from ancestor level 3 (user-agent) */
+
+margin-bottom: 8px;
+margin-left: 8px;
+}
+/* Inherited from ancestor level 3 (regular) */
+
+position: relative;
+font-family: var(--font-regular);
+min-height: 100vh;
+background-color: rgb(255, 255, 255);
+
+font-family: var(--font-regular);
+}
+/* Inherited from ancestor level 4 (user-agent) */
+
+html {
+display: block;
+}
+/* Inherited from ancestor level 4 (user-agent) */
+
+:root {
+view-transition-name: root;
+}
+/* Inherited from ancestor level 4 (regular) */`;
 
 if (typeof window !== 'undefined') {
     window.FULL_APP_CONTEXT = FULL_APP_CONTEXT;
@@ -10,4 +10,10 @@
   // Optional explicit auth base endpoint. If omitted, the client derives it from BERNY_PROXY_ENDPOINT.
   // Example: 'https://<worker>.workers.dev'
   window.BADIANI_AUTH_ENDPOINT = window.BADIANI_AUTH_ENDPOINT || '';
+
+  // Field performance beacon (scripts/site.js, BadianiPerf). If omitted, samples go to
+  // '<worker base>/perf'; 'off' keeps them in localStorage only (BadianiPerf.exportJsonl()).
+  window.BADIANI_PERF_ENDPOINT = window.BADIANI_PERF_ENDPOINT || '';
+  // Share of page loads that report (0..1).
+  window.BADIANI_PERF_SAMPLE_RATE = window.BADIANI_PERF_SAMPLE_RATE ?? 1;
 })();
@@ -0,0 +1,23 @@
+// Auto-generated by audit_deeplinks.py --map - do not edit by hand.
+// ?q= lookup table: normalized cardKey / title (all languages) / Berny alias -> card.
+(function(){
+  'use strict';
+  var MAP = {"v":1,"pages":["caffe.html","festive.html","gelato-lab.html","operations.html","pastries.html","slitti-yoyo.html","sweet-treats.html"],"cards":[[0,"card-espresso-single","espresso-single"],[0,"card-espresso-double","espresso-double"],[0,"card-macchiato-single","macchiato-single"],[0,"card-macchiato-double","macchiato-double"],[0,"card-americano","americano"],[0,"card-cappuccino","cappuccino"],[0,"card-flat-white","flat-white"],[0,"card-mocha","mocha"],[0,"card-hot-chocolate","hot-chocolate"],[0,"card-chai-latte","chai-latte"],[0,"card-tea","tea"],[0,"card-afternoon-tea","afternoon-tea"],[0,"card-affogato","affogato"],[0,"card-whipped-coffee","whipped-coffee"],[0,"card-matcha-latte","matcha-latte"],[0,"card-iced-matcha","iced-matcha"],[0,"card-matcha-affogato","matcha-affogato"],[0,"card-dirty-matcha","dirty-matcha"],[0,"card-iced-americano","iced-americano"],[0,"card-iced-latte","iced-latte"],[0,"card-pistachio-iced-latte","pistachio-iced-latte"],[0,"card-smoothie-giallo-passion","smoothie-giallo-passion"],[0,"card-smoothie-rosso-berry","smoothie-rosso-berry"],[0,"card-smoothie-verde-boost","smoothie-verde-boost"],[0,"card-prep-matcha-premade-una-volta-al-giorno","prep-matcha-premade-una-volta-al-giorno"],[0,"card-setting-iced-matcha-latte-standard","setting-iced-matcha-latte-standard"],[0,"card-smoothies-parametri-di-produzione","smoothies-parametri-di-produzione"],[0,"card-storage-matcha-premade-haccp","storage-matcha-premade-haccp"],[0,"card-chiusura-stazione-matcha-blender","chiusura-stazione-matcha-blender"],[1,"card-churros","churros"],[1,"card-panettone-classico","panettone-classico"],[1,"card-panettone-dark-chocolate","panettone-dark-chocolate"],[1,"card-pandoro-classico","pandoro-classico"],[1,"card-mulled-wine-vin-brul","mulled-wine-vin-brul"],[1,"card-servizio-caldo-pandoro","servizio-caldo-pandoro"],[1,"card-setup-macchina-vin-brul","setup-macchina-vin-brul"],[1,"card-warm-up-mantenimento-vin-brul","warm-up-mantenimento-vin-brul"],[1,"card-come-conservarlo-di-notte","come-conservarlo-di-notte"],[1,"card-shelf-life-vin-brul-quick","shelf-life-vin-brul-quick"],[1,"card-pulizia-macchina-fine-giornata","pulizia-macchina-fine-giornata"],[1,"card-packaging-mini-panettone-delivery","packaging-mini-panettone-delivery"],[2,"card-cups","cups"],[2,"card-cones","cones"],[2,"card-boxes","boxes"],[2,"card-coppa-gelato","coppa-gelato"],[2,"card-gelato-setup","gelato-setup"],[2,"card-temperatura-porte-standard","temperatura-porte-standard"],[2,"card-shelf-life-treats-dopo-esposizione","shelf-life-treats-dopo-esposizione"],[2,"card-gestione-treat-freezer","gestione-treat-freezer"],[2,"card-regola-scampolo-1-4-pan","regola-scampolo-1-4-pan"],[2,"card-chiusura-deep-clean-vetrina","chiusura-deep-clean-vetrina"],[3,"card-ops-opening","ops-opening"],[3,"card-ops-daily-setup","ops-daily-setup"],[3,"card-ops-warm-service","ops-warm-service"],[3,"card-packaging-take-away","packaging-take-away"],[3,"card-allestimento-macchina","allestimento-macchina"],[3,"card-service-chiusura","service-chiusura"],[3,"card-temperature-chiave-quick-map","temperature-chiave-quick-map"],[3,"card-fifo-etichette-regola-d-oro","fifo-etichette-regola-d-oro"],[3,"card-shelf-life-rapidi-mix-premade","shelf-life-rapidi-mix-premade"],[3,"card-take-away-autonomia-termica","take-away-autonomia-termica"],[3,"card-schedule-pulizie-giorno-settimana","schedule-pulizie-giorno-settimana"],[4,"card-cakes","cakes"],[4,"card-brownie","brownie"],[4,"card-loaf","loaf"],[4,"card-croissants","croissants"],[4,"card-scones","scones"],[4,"card-set-up-vetrina-look-ordine","set-up-vetrina-look-ordine"],[4,"card-tagli-standard-porzionatura","tagli-standard-porzionatura"],[4,"card-shelf-life-quick-list","shelf-life-quick-list"],[4,"card-come-mantenerla-sempre-piena","come-mantenerla-sempre-piena"],[4,"card-chiusura-vetrina-routine","chiusura-vetrina-routine"],[5,"card-slitti-timeline","slitti-timeline"],[5,"card-slitti-tablets","slitti-tablets"],[5,"card-slitti-minicake","slitti-minicake"],[5,"card-slitti-pralines","slitti-pralines"],[5,"card-slitti-spreads","slitti-spreads"],[5,"card-yoyo","yoyo"],[5,"card-allestimento-yo-yo-banco","allestimento-yo-yo-banco"],[5,"card-stazione-e-strumenti-standard","stazione-e-strumenti-standard"],[5,"card-porzionatura-gelato-yo-yo","porzionatura-gelato-yo-yo"],[5,"card-pan-storage-method-etichettatura","pan-storage-method-etichettatura"],[5,"card-chiusura-stazione-yo-yo","chiusura-stazione-yo-yo"],[6,"card-crepe-sauce","crepe-sauce"],[6,"card-buontalenti-crepe","buontalenti-crepe"],[6,"card-waffles","waffles"],[6,"card-pancake","pancake"],[6,"card-italiana-plain","italiana-plain"],[6,"card-italiana-beetroot","italiana-beetroot"],[6,"card-prosciutto-plain","prosciutto-plain"],[6,"card-prosciutto-beetroot","prosciutto-beetroot"],[6,"card-gelato-burger","gelato-burger"],[6,"card-checklist-apertura-stazioni","checklist-apertura-stazioni"],[6,"card-settaggi-macchine-standard","settaggi-macchine-standard"],[6,"card-shelf-life-storage-rapidi","shelf-life-storage-rapidi"],[6,"card-porzionatura-dosi-quick-ref","porzionatura-dosi-quick-ref"],[6,"card-chiusura-pulizia-rapida","chiusura-pulizia-rapida"]],"keys":{"affogato":12,"afternoontea":11,"afternoonteaset":11,"ajustesdemaquinasstandard":93,"allestimentomacchina":55,"allestimentoyoyobanco":78,"americano":4,"badianicup":44,"bananaaltriloaf":64,"bananaloaf":64,"boxes":43,"brownie":63,"brownies":63,"brownietray":63,"buontalenticrepe":84,"cakes":62,"cakeschocolatecarrotwalnut":62,"calentamientoymantenimientovinbrule":36,"cappuccino":5,"chailatte":9,"chauffemaintienvinbrule":36,"checklistaperturastazioni":92,"checklistdeaperturaestaciones":92,"checklistouverturestations":92,"chiusuradeepcleanvetrina":50,"chiusurapulizia":71,"chiusurapuliziarapida":96,"chiusurastazionematchablender":28,"chiusurastazioneyoyo":82,"chiusuravetrinaroutine":71,"chocolatchaud":8,"churros":29,"cierreestacionmatchablender":28,"cierreestacionyoyo":82,"cierreylimpieza":71,"cierreylimpiezaprofundavitrina":50,"cierreylimpiezarapida":96,"classiccones":42,"cleaningscheduledailyweekly":61,"closematchablenderstation":28,"closingcleaning":71,"closingdeepcleancabinet":50,"closingquickclean":96,"cloturestationmatchablender":28,"comeconservarlodinotte":37,"comemantenerlasemprepiena":70,"comoconservarloporlanoche":37,"cones":42,"coniclassici":42,"conosclasicos":42,"conservationdenuit":37,"copabadiani":44,"coppabadiani":44,"coppagelato":44,"coppette":41,"cornetsclassiques":42,"coupebadiani":44,"coupelles":41,"cremasslittosariccosagianera":76,"cremeslittosariccosagianera":76,"cremesslittosariccosagianera":76,"crepebuontalenti":84,"crepeconsalsa":83,"crepeitaliana":87,"crepeitalianabeetroot":88,"crepeitalianaplain":87,"crepeprosciutto":89,"crepeprosciuttobeetroot":90,"crepeprosciuttoplain":89,"crepesauce":83,"crepewithsauce":83,"croissantfarciti":65,"croissants":65,"croissantsgarnis":65,"cups":41,"cuttingstandards":68,"dailysetup":52,"dirtymatcha":17,"displayprepmorning":45,"doublemacchiato":3,"espressodouble":1,"espressomacchiato":2,"espressosingle":0,"essentialtimeline":72,"estacionyherramientasstandard":79,"estandaresdecorte":68,"fermeturenettoyage":71,"fermeturenettoyageprofondvitrine":50,"fermeturenettoyagerapide":96,"fermeturestationyoyo":82,"fifoetichetteregoladoro":58,"fifoetiquettesregledor":58,"fifolabelsgoldenrule":58,"fifoyetiquetasregladeoro":58,"flatwhite":6,"gelatoboxes":43,"gelatoburger":91,"gelatosetup":45,"gestionetreatfreezer":48,"gestiontreatfreezer":48,"hotchocolate":8,"icedamericano":18,"icedlatte":19,"icedmatcha":15,"icedmatchalatte":15,"italianabeetroot":88,"italianabetterave":88,"italianaclassique":87,"italianaplain":87,"keytemperaturesquickmap":57,"lattenerograncacaotablets":73,"limpiezademaquinafindedia":39,"loaf":64,"macchiatodouble":3,"macchiatosingle":2,"machinecleaningendofday":39,"machinesettingsstandard":93,"machinesetup":55,"maintainingfulllook":70,"maintienfulllook":70,"mantenimentofulllook":70,"mantenimientofulllook":70,"matchaaffogato":16,"matchalatte":14,"minicake":74,"minicakes":74,"minipanettonepackagingdelivery":40,"mocha":7,"mulledwinevinbrul":33,"mulledwinevinbrule":33,"nettoyagemachinefindejournee":39,"nightstoragehowtostore":37,"openingroutine":51,"openingstationchecklist":92,"opsdailysetup":52,"opsopening":51,"opswarmservice":53,"packagingminipanettonedelivery":40,"packagingtakeaway":54,"pancake":86,"pancakes":86,"pancakestack":86,"pandoroclassic":32,"pandoroclassico":32,"pandoroclassique":32,"panettoneclassic":30,"panettoneclassico":30,"panettoneclassique":30,"panettonedarkchocolate":31,"panstoragemethodetichettatura":81,"panstoragemethodetiquetado":81,"panstoragemethodetiquetage":81,"panstoragemethodlabelling":81,"pastrydisplayopening":67,"pistachioicedlatte":20,"plandelimpiezasdiasemana":61,"planningnettoyagejoursemaine":61,"porcionadogelatoyoyo":80,"porcionadoydosisquickref":95,"portiondosesquickref":95,"portioningdosesquickref":95,"portionnagegelatoyoyo":80,"porzionaturadosiquickref":95,"porzionaturagelatoyoyo":80,"pralinedragee":75,"pralinesdragee":75,"pralinesydragee":75,"preparacionvitrinamanana":45,"prepararmatchapremadeunavezaldia":24,"preparationvitrinematin":45,"preparazionevetrinamattino":45,"preparerlematchapremadeunefoisparjour":24,"prepmatchapremadeunavoltaalgiorno":24,"preppremadematchaonceperday":24,"prosciuttobeetroot":90,"prosciuttobetterave":90,"prosciuttoclassique":89,"prosciuttoplain":89,"puliziamacchinafinegiornata":39,"quickshelflifemixpremade":59,"reglagesmachinesstandard":93,"reglascampolo14pan":49,"reglescampolo14pan":49,"regolascampolo14pan":49,"routineapertura":51,"routinedouverture":51,"rutinadeapertura":51,"scampolorule14pan":49,"schedulepuliziegiornosettimana":61,"sconeaugelato":66,"sconeconbuontalenti":66,"scones":66,"selectiondethes":10,"servicechiusura":56,"serviceclosing":56,"servicefermeture":56,"servicioycierre":56,"serviziocaldopandoro":34,"settaggimacchinestandard":93,"settingicedmatchalatteestandar":25,"settingicedmatchalattestandard":25,"setupdemaquina":55,"setupdiario":52,"setupgiornaliero":52,"setupmacchinavinbrul":35,"setupmacchinavinbrule":35,"setupmachine":55,"setupmachinevinbrule":35,"setupmaquinavinbrule":35,"setupquotidien":52,"setupvetrinalookordine":67,"shelflifeetiquetage":69,"shelflifelabeling":69,"shelflifequicklist":69,"shelflifequickstorage":94,"shelfliferapidasmixypremade":59,"shelfliferapidesmixpremade":59,"shelfliferapidimixpremade":59,"shelflifestockagerapide":94,"shelflifestoragerapidi":94,"shelflifetreatsapresexposition":47,"shelflifetreatsdopoesposizione":47,"shelflifetreatstrasexposicion":47,"shelflifevinbrulequick":38,"shelflifevinbrulquick":38,"shelflifeyetiquetado":69,"shelflifeystoragerapido":94,"signaturebuontalenticrepe":84,"slittiminicake":74,"slittipralines":75,"slittispreads":76,"slittitablets":73,"slittitimeline":72,"slittosariccosagianeraspreads":76,"smoothiegiallopassion":21,"smoothierossoberry":22,"smoothiesparametresdeproduction":26,"smoothiesparametridiproduzione":26,"smoothiesparametrosdeproduccion":26,"smoothiesproductionparameters":26,"smoothieverdeboost":23,"standardditaglio":68,"standardsdecoupe":68,"stationoutilsstandard":79,"stationtoolsstandard":79,"stazioneestrumentistandard":79,"storagematchapremadehaccp":27,"storagepremadematchahaccp":27,"tabletaslattenerograncacao":73,"tabletteslattenerograncacao":73,"taglistandardporzionatura":68,"takeawayautonomiatermica":60,"takeawayautonomiethermique":60,"takeawaypackaging":54,"takeawaythermalhold":60,"tavolettelattenerograncacao":73,"tea":10,"teaselection":10,"temperaturaportestandard":46,"temperaturasclavequickmap":57,"temperaturaypuertasstandard":46,"temperaturechiavequickmap":57,"temperaturedoorsstandard":46,"temperatureportesstandard":46,"temperaturesclesquickmap":57,"timelineesencial":72,"timelineessentielle":72,"timelineessenziale":72,"treatfreezermanagement":48,"treatsshelflifeafterdisplay":47,"vasitos":41,"vetrinapastryapertura":67,"vinbrulemachinesetup":35,"vinbruleshelflifequick":38,"vinchaudvinbrule":33,"vinocalientevinbrule":33,"vitrinapastryapertura":67,"vitrinepastryouverture":67,"waffles":85,"warmupholdingvinbrule":36,"warmupmantenimentovinbrul":36,"warmupmantenimentovinbrule":36,"whippedcoffee":13,"yoyo":77,"yoyocountersetup":78,"yoyogelatoportioning":80,"yoyostationclosing":82}};
+
+  function normalize(s) {
+    return String(s || '')
+      .toLowerCase()
+      .normalize('NFD')
+      .replace(/[\u0300-\u036f]/g, '')
+      .replace(/[^a-z0-9]/g, '');
+  }
+
+  function resolve(q) {
+    var idx = MAP.keys[normalize(q)];
+    if (idx === undefined) return null;
+    var card = MAP.cards[idx];
+    return { page: MAP.pages[card[0]], id: card[1], cardKey: card[2] };
+  }
+
+  try { window.BadianiDeepLinkMap = { data: MAP, normalize: normalize, resolve: resolve }; } catch (e) {}
+})();
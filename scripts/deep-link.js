@@ -20,12 +20,30 @@
     const rawQuery = String(query || '').trim();
     const target = normalize(rawQuery);
 
+    // Strategy 0: precomputed map (scripts/deep-link-map.js, built by audit_deeplinks.py --map)
+    // cardKey / title in any language / Berny alias -> page + anchor in one lookup.
+    // A hit on another page is only followed when nothing on this page matches
+    // (the same key can name a card here and a different one elsewhere).
+    let match = null;
+    let elsewhere = null;
+    try {
+      const hit = window.BadianiDeepLinkMap?.resolve?.(rawQuery);
+      if (hit) {
+        const currentPage = (window.location.pathname.split('/').pop() || 'index.html').toLowerCase();
+        if (hit.page && hit.page.toLowerCase() !== currentPage) {
+          elsewhere = hit;
+        } else {
+          match = document.getElementById(hit.id);
+        }
+      }
+    } catch {}
+
     // Find all cards
     const cards = Array.from(document.querySelectorAll('.guide-card'));
-    
+
     // Strategy 1: Exact ID match (checking both raw query and normalized)
     // e.g. query="smoothie-rosso-berry" -> id="card-smoothie-rosso-berry"
-    let match = document.getElementById('card-' + rawQuery) || 
+    if (!match) match = document.getElementById('card-' + rawQuery) ||
           document.getElementById(rawQuery) ||
                 cards.find(c => c.id && normalize(c.id).includes(target) && normalize(c.id).endsWith(target)); // stricter ID check
 
@@ -53,6 +71,13 @@
       });
     }
 
+    if (!match && elsewhere) {
+      // Nothing here: the card lives on another page, go there directly.
+      params.set('q', elsewhere.cardKey);
+      window.location.replace(`${elsewhere.page}?${params.toString()}${window.location.hash || ''}`);
+      return;
+    }
+
     if (match) {
       console.log(`[DeepLink] Found match for "${query}":`, match);
       
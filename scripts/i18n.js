@@ -5,6 +5,10 @@
 */
 
 (() => {
+  // Field timings: site.js (BadianiPerf) reports every 'badiani:*' measure.
+  try { performance.mark('badiani:i18n.start'); } catch {}
+  let firstApplyDone = false;
+
   const STORAGE_KEY = 'badianiUILang.v1';
   const STORAGE_KEY_ALT = 'user-language';
   const SUPPORTED = ['it', 'en', 'es', 'fr'];
@@ -8719,7 +8723,14 @@
       Promise.resolve(maybeLoad)
         .catch(() => {})
         .finally(() => {
+          try { performance.mark('badiani:i18n.apply.start'); } catch {}
           applyTranslations(document);
+          try {
+            performance.measure('badiani:i18n.apply', { start: 'badiani:i18n.apply.start', detail: { first: !firstApplyDone } });
+            // From navigation start to a fully translated page.
+            if (!firstApplyDone) performance.measure('badiani:i18n.ready');
+          } catch {}
+          firstApplyDone = true;
           
           try {
             document.dispatchEvent(new CustomEvent('badiani:lang-changed', { detail: { lang } }));
@@ -8832,6 +8843,8 @@
     applyTranslations,
   };
 
+  try { performance.measure('badiani:i18n.eval', 'badiani:i18n.start'); } catch {}
+
   if (document.readyState === 'loading') {
     document.addEventListener('DOMContentLoaded', init, { once: true });
   } else {
@@ -1,10 +1,13 @@
 (function(){
   'use strict';
+  // Auto-generated by build-tools/python/generate_search_catalog_seed.py - do not edit by hand.
   var KEY = 'badianiSearchCatalog.v2';
   var nowIso = new Date().toISOString();
-  var SEED = { updatedAt: nowIso, pages: {"caffe.html":{href:"caffe.html",category:"Bar & Drinks",updatedAt:nowIso,cards:[{title:"Espresso Single",cardKey:"espresso-single",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Espresso Double",cardKey:"espresso-double",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Espresso Macchiato",cardKey:"espresso-macchiato",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Double Macchiato",cardKey:"double-macchiato",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Americano",cardKey:"americano",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Cappuccino",cardKey:"cappuccino",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Flat White",cardKey:"flat-white",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Mocha",cardKey:"mocha",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Hot Chocolate",cardKey:"hot-chocolate",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Chai Latte",cardKey:"chai-latte",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Tea Selection",cardKey:"tea-selection",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Afternoon Tea Set",cardKey:"afternoon-tea-set",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Affogato",cardKey:"affogato",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Whipped Coffee",cardKey:"whipped-coffee",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Matcha Latte",cardKey:"matcha-latte",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Iced Matcha Latte",cardKey:"iced-matcha-latte",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Matcha Affogato",cardKey:"matcha-affogato",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Dirty Matcha",cardKey:"dirty-matcha",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Iced Americano",cardKey:"iced-americano",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Iced Latte",cardKey:"iced-latte",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Pistachio Iced Latte",cardKey:"pistachio-iced-latte",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Smoothie Giallo Passion",cardKey:"smoothie-giallo-passion",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Smoothie Rosso Berry",cardKey:"smoothie-rosso-berry",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Smoothie Verde Boost",cardKey:"smoothie-verde-boost",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Prep Matcha premade (una volta al giorno)",cardKey:"prep-matcha-premade-una-volta-al-giorno",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Setting Iced Matcha Latte (standard)",cardKey:"setting-iced-matcha-latte-standard",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Smoothies: parametri di produzione",cardKey:"smoothies-parametri-di-produzione",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Storage Matcha premade (HACCP)",cardKey:"storage-matcha-premade-haccp",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Chiusura stazione Matcha / Blender",cardKey:"chiusura-stazione-matcha-blender",signals:{sicurezza:false,chiusura:false,upselling:false}}]},"gelato-lab.html":{href:"gelato-lab.html",category:"Gelato Lab",updatedAt:nowIso,cards:[{title:"Coppette",cardKey:"coppette",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Coni classici",cardKey:"coni-classici",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Gelato Boxes",cardKey:"gelato-boxes",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Coppa Gelato",cardKey:"coppa-gelato",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Preparazione vetrina (mattino)",cardKey:"preparazione-vetrina-mattino",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Temperatura & porte (standard)",cardKey:"temperatura-porte-standard",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Shelf life treats (dopo esposizione)",cardKey:"shelf-life-treats-dopo-esposizione",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Gestione treat freezer",cardKey:"gestione-treat-freezer",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Regola Scampolo (1/4 pan)",cardKey:"regola-scampolo-1-4-pan",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Chiusura & deep clean vetrina",cardKey:"chiusura-deep-clean-vetrina",signals:{sicurezza:false,chiusura:false,upselling:false}}]},"operations.html":{href:"operations.html",category:"Operations & Setup",updatedAt:nowIso,cards:[{title:"Routine apertura",cardKey:"routine-apertura",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Set-up giornaliero",cardKey:"set-up-giornaliero",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Servizio Caldo (Pandoro)",cardKey:"servizio-caldo-pandoro",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Packaging take away",cardKey:"packaging-take-away",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Allestimento macchina",cardKey:"allestimento-macchina",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Service & chiusura",cardKey:"service-chiusura",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Temperature chiave (quick map)",cardKey:"temperature-chiave-quick-map",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"FIFO & etichette (regola d'oro)",cardKey:"fifo-etichette-regola-d-oro",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Shelf life rapidi (mix & premade)",cardKey:"shelf-life-rapidi-mix-premade",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Take-away: autonomia termica",cardKey:"take-away-autonomia-termica",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Schedule pulizie (giorno / settimana)",cardKey:"schedule-pulizie-giorno-settimana",signals:{sicurezza:false,chiusura:false,upselling:false}}]},"pastries.html":{href:"pastries.html",category:"Pastry Lab",updatedAt:nowIso,cards:[{title:"Cakes",cardKey:"cakes",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Brownie Tray",cardKey:"brownie-tray",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Banana / altri loaf",cardKey:"banana-altri-loaf",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Croissant farciti",cardKey:"croissant-farciti",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Scone con Buontalenti",cardKey:"scone-con-buontalenti",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Set-up vetrina (look & ordine)",cardKey:"set-up-vetrina-look-ordine",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Tagli standard (porzionatura)",cardKey:"tagli-standard-porzionatura",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Shelf life (quick list)",cardKey:"shelf-life-quick-list",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Come mantenerla “sempre piena”",cardKey:"come-mantenerla-sempre-piena",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Chiusura vetrina (routine)",cardKey:"chiusura-vetrina-routine",signals:{sicurezza:false,chiusura:false,upselling:false}}]},"sweet-treats.html":{href:"sweet-treats.html",category:"Sweet Treat Atelier",updatedAt:nowIso,cards:[{title:"Crepe con Salsa",cardKey:"crepe-con-salsa",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Signature Buontalenti Crepe",cardKey:"signature-buontalenti-crepe",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Waffles",cardKey:"waffles",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Pancake Stack",cardKey:"pancake-stack",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Crepe Italiana (Plain)",cardKey:"crepe-italiana-plain",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Crepe Italiana (Beetroot)",cardKey:"crepe-italiana-beetroot",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Crepe Prosciutto (Plain)",cardKey:"crepe-prosciutto-plain",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Crepe Prosciutto (Beetroot)",cardKey:"crepe-prosciutto-beetroot",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Gelato Burger",cardKey:"gelato-burger",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Checklist apertura stazioni",cardKey:"checklist-apertura-stazioni",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Settaggi macchine (standard)",cardKey:"settaggi-macchine-standard",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Shelf life & storage rapidi",cardKey:"shelf-life-storage-rapidi",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Porzionatura & dosi (quick ref)",cardKey:"porzionatura-dosi-quick-ref",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Chiusura & pulizia rapida",cardKey:"chiusura-pulizia-rapida",signals:{sicurezza:false,chiusura:false,upselling:false}}]},"festive.html":{href:"festive.html",category:"Churros, Panettoni & Vin Brule'",updatedAt:nowIso,cards:[{title:"Churros",cardKey:"churros",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Panettone Classico",cardKey:"panettone-classico",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Panettone Dark Chocolate",cardKey:"panettone-dark-chocolate",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Pandoro Classico",cardKey:"pandoro-classico",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Mulled Wine (Vin Brulé)",cardKey:"mulled-wine-vin-brul",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Servizio Caldo (Pandoro)",cardKey:"servizio-caldo-pandoro",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Setup macchina Vin Brulé",cardKey:"setup-macchina-vin-brul",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Warm-up & mantenimento (Vin Brulé)",cardKey:"warm-up-mantenimento-vin-brul",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Come conservarlo di notte",cardKey:"come-conservarlo-di-notte",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Shelf life Vin Brulé (quick)",cardKey:"shelf-life-vin-brul-quick",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Pulizia macchina (fine giornata)",cardKey:"pulizia-macchina-fine-giornata",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Packaging mini panettone (delivery)",cardKey:"packaging-mini-panettone-delivery",signals:{sicurezza:false,chiusura:false,upselling:false}}]},"slitti-yoyo.html":{href:"slitti-yoyo.html",category:"Slitti & Yo-Yo",updatedAt:nowIso,cards:[{title:"Timeline essenziale",cardKey:"timeline-essenziale",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Tavolette LatteNero & Gran Cacao",cardKey:"tavolette-lattenero-gran-cacao",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Minicake",cardKey:"minicake",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Praline & Dragée",cardKey:"praline-drag-e",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Creme Slittosa / Riccosa / Gianera",cardKey:"creme-slittosa-riccosa-gianera",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Yo-Yo",cardKey:"yo-yo",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Allestimento Yo-Yo (banco)",cardKey:"allestimento-yo-yo-banco",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Stazione e strumenti (standard)",cardKey:"stazione-e-strumenti-standard",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Porzionatura gelato Yo-Yo",cardKey:"porzionatura-gelato-yo-yo",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Pan storage method (etichettatura)",cardKey:"pan-storage-method-etichettatura",signals:{sicurezza:false,chiusura:false,upselling:false}},{title:"Chiusura stazione Yo-Yo",cardKey:"chiusura-stazione-yo-yo",signals:{sicurezza:false,chiusura:false,upselling:false}}]},"story-orbit.html":{href:"story-orbit.html",category:"Story Orbit Badiani 1932",updatedAt:nowIso,cards:[]}} };
+  var SEED = { updatedAt: nowIso, pages: {"caffe.html":{"href":"caffe.html","category":"Bar & Drinks","updatedAt":nowIso,"cards":[{"title":"Espresso Single","cardKey":"espresso-single","titleKey":"caffe.cards.espressoSingle.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Espresso Double","cardKey":"espresso-double","titleKey":"caffe.cards.espressoDouble.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Espresso Macchiato","cardKey":"macchiato-single","titleKey":"caffe.cards.espressoMacchiato.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Double Macchiato","cardKey":"macchiato-double","titleKey":"caffe.cards.doubleMacchiato.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Americano","cardKey":"americano","titleKey":"caffe.cards.americano.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Cappuccino","cardKey":"cappuccino","titleKey":"caffe.cards.cappuccino.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Flat White","cardKey":"flat-white","titleKey":"caffe.cards.flatWhite.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Mocha","cardKey":"mocha","titleKey":"caffe.cards.mocha.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Hot Chocolate","cardKey":"hot-chocolate","titleKey":"caffe.cards.hotChocolate.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Chai Latte","cardKey":"chai-latte","titleKey":"caffe.cards.chaiLatte.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Tea Selection","cardKey":"tea","titleKey":"caffe.cards.teaSelection.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Afternoon Tea Set","cardKey":"afternoon-tea","titleKey":"caffe.cards.afternoonTeaSet.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Affogato","cardKey":"affogato","titleKey":"caffe.cards.affogato.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Whipped Coffee","cardKey":"whipped-coffee","titleKey":"caffe.cards.whippedCoffee.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Matcha Latte","cardKey":"matcha-latte","titleKey":"caffe.cards.matchaLatte.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Iced Matcha Latte","cardKey":"iced-matcha","titleKey":"caffe.cards.icedMatchaLatte.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Matcha Affogato","cardKey":"matcha-affogato","titleKey":"caffe.cards.matchaAffogato.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Dirty Matcha","cardKey":"dirty-matcha","titleKey":"caffe.cards.dirtyMatcha.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Iced Americano","cardKey":"iced-americano","titleKey":"caffe.cards.icedAmericano.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Iced Latte","cardKey":"iced-latte","titleKey":"caffe.cards.icedLatte.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Pistachio Iced Latte","cardKey":"pistachio-iced-latte","titleKey":"caffe.cards.pistachioIcedLatte.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Smoothie Giallo Passion","cardKey":"smoothie-giallo-passion","titleKey":"caffe.cards.smoothieGialloPassion.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Smoothie Rosso Berry","cardKey":"smoothie-rosso-berry","titleKey":"caffe.cards.smoothieRossoBerry.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Smoothie Verde Boost","cardKey":"smoothie-verde-boost","titleKey":"caffe.cards.smoothieVerdeBoost.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Prep Matcha premade (una volta al giorno)","cardKey":"prep-matcha-premade-una-volta-al-giorno","titleKey":"caffe.ops.prepMatchaPremade.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Setting Iced Matcha Latte (standard)","cardKey":"setting-iced-matcha-latte-standard","titleKey":"caffe.ops.settingIcedMatcha.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Smoothies: parametri di produzione","cardKey":"smoothies-parametri-di-produzione","titleKey":"caffe.ops.smoothiesParameters.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Storage Matcha premade (HACCP)","cardKey":"storage-matcha-premade-haccp","titleKey":"caffe.ops.storageMatchaPremade.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Chiusura stazione Matcha / Blender","cardKey":"chiusura-stazione-matcha-blender","titleKey":"caffe.ops.closingMatchaBlender.title","signals":{"sicurezza":false,"chiusura":true,"upselling":false}}]},"festive.html":{"href":"festive.html","category":"Churros, Panettoni & Vin Brule'","updatedAt":nowIso,"cards":[{"title":"Churros","cardKey":"churros","titleKey":"festive.cards.churros.title","signals":{"sicurezza":false,"chiusura":false,"upselling":true}},{"title":"Panettone Classico","cardKey":"panettone-classico","titleKey":"festive.cards.panettoneClassic.title","signals":{"sicurezza":false,"chiusura":false,"upselling":true}},{"title":"Panettone Dark Chocolate","cardKey":"panettone-dark-chocolate","titleKey":"festive.cards.panettoneDark.title","signals":{"sicurezza":false,"chiusura":false,"upselling":true}},{"title":"Pandoro Classico","cardKey":"pandoro-classico","titleKey":"festive.cards.pandoroClassic.title","signals":{"sicurezza":false,"chiusura":false,"upselling":true}},{"title":"Mulled Wine (Vin Brulé)","cardKey":"mulled-wine-vin-brul","titleKey":"festive.cards.mulledWine.title","signals":{"sicurezza":false,"chiusura":true,"upselling":true}},{"title":"Servizio Caldo (Pandoro)","cardKey":"servizio-caldo-pandoro","titleKey":"festive.cards.warmServicePandoro.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Setup macchina Vin Brulé","cardKey":"setup-macchina-vin-brul","titleKey":"festive.ops.setupMachine.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Warm-up & mantenimento (Vin Brulé)","cardKey":"warm-up-mantenimento-vin-brul","titleKey":"festive.ops.warmup.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Come conservarlo di notte","cardKey":"come-conservarlo-di-notte","titleKey":"festive.ops.nightStorage.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Shelf life Vin Brulé (quick)","cardKey":"shelf-life-vin-brul-quick","titleKey":"festive.ops.shelfLife.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Pulizia macchina (fine giornata)","cardKey":"pulizia-macchina-fine-giornata","titleKey":"festive.ops.cleaning.title","signals":{"sicurezza":false,"chiusura":true,"upselling":false}},{"title":"Packaging mini panettone (delivery)","cardKey":"packaging-mini-panettone-delivery","titleKey":"festive.ops.packaging.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}}]},"gelato-lab.html":{"href":"gelato-lab.html","category":"Gelato Lab","updatedAt":nowIso,"cards":[{"title":"Coppette","cardKey":"cups","titleKey":"gelatoLab.cards.cups.title","signals":{"sicurezza":false,"chiusura":false,"upselling":true}},{"title":"Coni classici","cardKey":"cones","titleKey":"gelatoLab.cards.cones.title","signals":{"sicurezza":false,"chiusura":false,"upselling":true}},{"title":"Gelato Boxes","cardKey":"boxes","titleKey":"gelatoLab.cards.boxes.title","signals":{"sicurezza":false,"chiusura":false,"upselling":true}},{"title":"Coppa Gelato","cardKey":"coppa-gelato","titleKey":"gelatoLab.cards.coppa.title","signals":{"sicurezza":false,"chiusura":false,"upselling":true}},{"title":"Preparazione vetrina (mattino)","cardKey":"gelato-setup","titleKey":"gelatoLab.ops.displayPrep.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Temperatura & porte (standard)","cardKey":"temperatura-porte-standard","titleKey":"gelatoLab.ops.tempDoors.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Shelf life treats (dopo esposizione)","cardKey":"shelf-life-treats-dopo-esposizione","titleKey":"gelatoLab.ops.treatsShelfLife.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Gestione treat freezer","cardKey":"gestione-treat-freezer","titleKey":"gelatoLab.ops.treatFreezer.title","signals":{"sicurezza":false,"chiusura":false,"upselling":true}},{"title":"Regola Scampolo (1/4 pan)","cardKey":"regola-scampolo-1-4-pan","titleKey":"gelatoLab.ops.scampolo.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Chiusura & deep clean vetrina","cardKey":"chiusura-deep-clean-vetrina","titleKey":"gelatoLab.ops.closeDeepClean.title","signals":{"sicurezza":false,"chiusura":true,"upselling":false}}]},"operations.html":{"href":"operations.html","category":"Operations & Setup","updatedAt":nowIso,"cards":[{"title":"Routine apertura","cardKey":"ops-opening","titleKey":"operations.cards.openingRoutine.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Set-up giornaliero","cardKey":"ops-daily-setup","titleKey":"operations.cards.dailySetup.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Servizio Caldo (Pandoro)","cardKey":"ops-warm-service","titleKey":"operations.cards.warmPandoro.title","signals":{"sicurezza":false,"chiusura":false,"upselling":true}},{"title":"Packaging take away","cardKey":"packaging-take-away","titleKey":"operations.cards.packagingTakeAway.title","signals":{"sicurezza":false,"chiusura":false,"upselling":true}},{"title":"Allestimento macchina","cardKey":"allestimento-macchina","titleKey":"operations.cards.vinMachineSetup.title","signals":{"sicurezza":false,"chiusura":false,"upselling":true}},{"title":"Service & chiusura","cardKey":"service-chiusura","titleKey":"operations.cards.vinServiceClosing.title","signals":{"sicurezza":false,"chiusura":true,"upselling":true}},{"title":"Temperature chiave (quick map)","cardKey":"temperature-chiave-quick-map","titleKey":"operations.cards.tempKeyMap.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"FIFO & etichette (regola d'oro)","cardKey":"fifo-etichette-regola-d-oro","titleKey":"operations.cards.fifoLabels.title","signals":{"sicurezza":false,"chiusura":true,"upselling":false}},{"title":"Shelf life rapidi (mix & premade)","cardKey":"shelf-life-rapidi-mix-premade","titleKey":"operations.cards.shelfLifeQuick.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Take-away: autonomia termica","cardKey":"take-away-autonomia-termica","titleKey":"operations.cards.takeAwayThermal.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Schedule pulizie (giorno / settimana)","cardKey":"schedule-pulizie-giorno-settimana","titleKey":"operations.cards.cleaningSchedule.title","signals":{"sicurezza":false,"chiusura":true,"upselling":false}}]},"pastries.html":{"href":"pastries.html","category":"Pastry Lab","updatedAt":nowIso,"cards":[{"title":"Cakes","cardKey":"cakes","titleKey":"pastries.cards.cakes.title","signals":{"sicurezza":false,"chiusura":false,"upselling":true}},{"title":"Brownie Tray","cardKey":"brownie","titleKey":"pastries.cards.brownie.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Banana / altri loaf","cardKey":"loaf","titleKey":"pastries.cards.loaf.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Croissant farciti","cardKey":"croissants","titleKey":"pastries.cards.croissants.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Scone con Buontalenti","cardKey":"scones","titleKey":"pastries.cards.scone.title","signals":{"sicurezza":false,"chiusura":false,"upselling":true}},{"title":"Set-up vetrina (look & ordine)","cardKey":"set-up-vetrina-look-ordine","titleKey":"pastries.ops.display.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Tagli standard (porzionatura)","cardKey":"tagli-standard-porzionatura","titleKey":"pastries.ops.cuts.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Shelf life (quick list)","cardKey":"shelf-life-quick-list","titleKey":"pastries.ops.shelf.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Come mantenerla “sempre piena”","cardKey":"come-mantenerla-sempre-piena","titleKey":"pastries.ops.full.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Chiusura vetrina (routine)","cardKey":"chiusura-vetrina-routine","titleKey":"pastries.ops.close.title","signals":{"sicurezza":false,"chiusura":true,"upselling":false}}]},"slitti-yoyo.html":{"href":"slitti-yoyo.html","category":"Slitti & Yo-Yo","updatedAt":nowIso,"cards":[{"title":"Timeline essenziale","cardKey":"slitti-timeline","titleKey":"slittiYoyo.cards.timeline.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Tavolette LatteNero & Gran Cacao","cardKey":"slitti-tablets","titleKey":"slittiYoyo.cards.tablets.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Minicake","cardKey":"slitti-minicake","titleKey":"slittiYoyo.cards.minicake.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Praline & Dragée","cardKey":"slitti-pralines","titleKey":"slittiYoyo.cards.pralines.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Creme Slittosa / Riccosa / Gianera","cardKey":"slitti-spreads","titleKey":"slittiYoyo.cards.spreads.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Yo-Yo","cardKey":"yoyo","titleKey":"slittiYoyo.cards.yoyo.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Allestimento Yo-Yo (banco)","cardKey":"allestimento-yo-yo-banco","titleKey":"slittiYoyo.ops.setupStation.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Stazione e strumenti (standard)","cardKey":"stazione-e-strumenti-standard","titleKey":"slittiYoyo.ops.stationTools.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Porzionatura gelato Yo-Yo","cardKey":"porzionatura-gelato-yo-yo","titleKey":"slittiYoyo.ops.portioning.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Pan storage method (etichettatura)","cardKey":"pan-storage-method-etichettatura","titleKey":"slittiYoyo.ops.panStorage.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Chiusura stazione Yo-Yo","cardKey":"chiusura-stazione-yo-yo","titleKey":"slittiYoyo.ops.closing.title","signals":{"sicurezza":false,"chiusura":true,"upselling":false}}]},"story-orbit.html":{"href":"story-orbit.html","category":"Story Orbit Badiani 1932","updatedAt":nowIso,"cards":[]},"sweet-treats.html":{"href":"sweet-treats.html","category":"Sweet Treat Atelier","updatedAt":nowIso,"cards":[{"title":"Crepe con Salsa","cardKey":"crepe-sauce","titleKey":"sweetTreats.cards.crepeSauce.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Signature Buontalenti Crepe","cardKey":"buontalenti-crepe","titleKey":"sweetTreats.cards.buontalentiCrepe.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Waffles","cardKey":"waffles","titleKey":"sweetTreats.cards.waffles.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Pancake Stack","cardKey":"pancake","titleKey":"sweetTreats.cards.pancake.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Crepe Italiana (Plain)","cardKey":"italiana-plain","titleKey":"sweetTreats.cards.italianaPlain.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Crepe Italiana (Beetroot)","cardKey":"italiana-beetroot","titleKey":"sweetTreats.cards.italianaBeetroot.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Crepe Prosciutto (Plain)","cardKey":"prosciutto-plain","titleKey":"sweetTreats.cards.prosciuttoPlain.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Crepe Prosciutto (Beetroot)","cardKey":"prosciutto-beetroot","titleKey":"sweetTreats.cards.prosciuttoBeetroot.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Gelato Burger","cardKey":"gelato-burger","titleKey":"sweetTreats.cards.gelatoBurger.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Checklist apertura stazioni","cardKey":"checklist-apertura-stazioni","titleKey":"sweetTreats.ops.opening.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Settaggi macchine (standard)","cardKey":"settaggi-macchine-standard","titleKey":"sweetTreats.ops.settings.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Shelf life & storage rapidi","cardKey":"shelf-life-storage-rapidi","titleKey":"sweetTreats.ops.storage.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Porzionatura & dosi (quick ref)","cardKey":"porzionatura-dosi-quick-ref","titleKey":"sweetTreats.ops.portions.title","signals":{"sicurezza":false,"chiusura":false,"upselling":false}},{"title":"Chiusura & pulizia rapida","cardKey":"chiusura-pulizia-rapida","titleKey":"sweetTreats.ops.closing.title","signals":{"sicurezza":true,"chiusura":true,"upselling":false}}]}} };
+  var INDEX = {"v":1,"pages":["caffe.html","festive.html","gelato-lab.html","operations.html","pastries.html","slitti-yoyo.html","story-orbit.html","sweet-treats.html"],"docs":[[0,"espresso-single"],[0,"espresso-double"],[0,"macchiato-single"],[0,"macchiato-double"],[0,"americano"],[0,"cappuccino"],[0,"flat-white"],[0,"mocha"],[0,"hot-chocolate"],[0,"chai-latte"],[0,"tea"],[0,"afternoon-tea"],[0,"affogato"],[0,"whipped-coffee"],[0,"matcha-latte"],[0,"iced-matcha"],[0,"matcha-affogato"],[0,"dirty-matcha"],[0,"iced-americano"],[0,"iced-latte"],[0,"pistachio-iced-latte"],[0,"smoothie-giallo-passion"],[0,"smoothie-rosso-berry"],[0,"smoothie-verde-boost"],[0,"prep-matcha-premade-una-volta-al-giorno"],[0,"setting-iced-matcha-latte-standard"],[0,"smoothies-parametri-di-produzione"],[0,"storage-matcha-premade-haccp"],[0,"chiusura-stazione-matcha-blender"],[1,"churros"],[1,"panettone-classico"],[1,"panettone-dark-chocolate"],[1,"pandoro-classico"],[1,"mulled-wine-vin-brul"],[1,"servizio-caldo-pandoro"],[1,"setup-macchina-vin-brul"],[1,"warm-up-mantenimento-vin-brul"],[1,"come-conservarlo-di-notte"],[1,"shelf-life-vin-brul-quick"],[1,"pulizia-macchina-fine-giornata"],[1,"packaging-mini-panettone-delivery"],[2,"cups"],[2,"cones"],[2,"boxes"],[2,"coppa-gelato"],[2,"gelato-setup"],[2,"temperatura-porte-standard"],[2,"shelf-life-treats-dopo-esposizione"],[2,"gestione-treat-freezer"],[2,"regola-scampolo-1-4-pan"],[2,"chiusura-deep-clean-vetrina"],[3,"ops-opening"],[3,"ops-daily-setup"],[3,"ops-warm-service"],[3,"packaging-take-away"],[3,"allestimento-macchina"],[3,"service-chiusura"],[3,"temperature-chiave-quick-map"],[3,"fifo-etichette-regola-d-oro"],[3,"shelf-life-rapidi-mix-premade"],[3,"take-away-autonomia-termica"],[3,"schedule-pulizie-giorno-settimana"],[4,"cakes"],[4,"brownie"],[4,"loaf"],[4,"croissants"],[4,"scones"],[4,"set-up-vetrina-look-ordine"],[4,"tagli-standard-porzionatura"],[4,"shelf-life-quick-list"],[4,"come-mantenerla-sempre-piena"],[4,"chiusura-vetrina-routine"],[5,"slitti-timeline"],[5,"slitti-tablets"],[5,"slitti-minicake"],[5,"slitti-pralines"],[5,"slitti-spreads"],[5,"yoyo"],[5,"allestimento-yo-yo-banco"],[5,"stazione-e-strumenti-standard"],[5,"porzionatura-gelato-yo-yo"],[5,"pan-storage-method-etichettatura"],[5,"chiusura-stazione-yo-yo"],[7,"crepe-sauce"],[7,"buontalenti-crepe"],[7,"waffles"],[7,"pancake"],[7,"italiana-plain"],[7,"italiana-beetroot"],[7,"prosciutto-plain"],[7,"prosciutto-beetroot"],[7,"gelato-burger"],[7,"checklist-apertura-stazioni"],[7,"settaggi-macchine-standard"],[7,"shelf-life-storage-rapidi"],[7,"porzionatura-dosi-quick-ref"],[7,"chiusura-pulizia-rapida"]],"langs":{"it":{"names":["espresso single bar & drinks","espresso double bar & drinks","espresso macchiato bar & drinks","double macchiato bar & drinks","americano bar & drinks","cappuccino bar & drinks","flat white bar & drinks","mocha bar & drinks","hot chocolate bar & drinks","chai latte bar & drinks","tea selection bar & drinks","afternoon tea set bar & drinks","affogato bar & drinks","whipped coffee bar & drinks","matcha latte bar & drinks","iced matcha latte bar & drinks","matcha affogato bar & drinks","dirty matcha bar & drinks","iced americano bar & drinks","iced latte bar & drinks","pistachio iced latte bar & drinks","smoothie giallo passion bar & drinks","smoothie rosso berry bar & drinks","smoothie verde boost bar & drinks","prep matcha premade (una volta al giorno) bar & drinks","setting iced matcha latte (standard) bar & drinks","smoothies: parametri di produzione bar & drinks","storage matcha premade (haccp) bar & drinks","chiusura stazione matcha / blender bar & drinks chiusura","churros churros, panettoni & vin brule' upselling","panettone classico churros, panettoni & vin brule' upselling","panettone dark chocolate churros, panettoni & vin brule' upselling","pandoro classico churros, panettoni & vin brule' upselling","mulled wine (vin brulé) churros, panettoni & vin brule' chiusura upselling","servizio caldo (pandoro) churros, panettoni & vin brule'","setup macchina vin brulé churros, panettoni & vin brule'","warm-up & mantenimento (vin brulé) churros, panettoni & vin brule'","come conservarlo di notte churros, panettoni & vin brule'","shelf life vin brulé (quick) churros, panettoni & vin brule'","pulizia macchina (fine giornata) churros, panettoni & vin brule' chiusura","packaging mini panettone (delivery) churros, panettoni & vin brule'","coppette gelato lab upselling","coni classici gelato lab upselling","gelato boxes gelato lab upselling","coppa badiani coppa gelato gelato lab upselling","preparazione vetrina (mattino) gelato lab","temperatura & porte (standard) gelato lab","shelf life treats (dopo esposizione) gelato lab","gestione treat freezer gelato lab upselling","regola scampolo (1/4 pan) gelato lab","chiusura & deep clean vetrina gelato lab chiusura","routine apertura operations & setup","set-up giornaliero operations & setup","servizio caldo (pandoro) operations & setup upselling","packaging take away operations & setup upselling","allestimento macchina operations & setup upselling","service & chiusura operations & setup chiusura upselling","temperature chiave (quick map) operations & setup","fifo & etichette (regola d'oro) operations & setup chiusura","shelf life rapidi (mix & premade) operations & setup","take-away: autonomia termica operations & setup","schedule pulizie (giorno / settimana) operations & setup chiusura","cakes pastry lab upselling","brownie tray pastry lab","banana / altri loaf pastry lab","croissant farciti pastry lab","scone con buontalenti pastry lab upselling","vetrina pastry (apertura) set-up vetrina (look & ordine) pastry lab","standard di taglio tagli standard (porzionatura) pastry lab","shelf life & labeling shelf life (quick list) pastry lab","mantenimento \"full look\" come mantenerla “sempre piena” pastry lab","chiusura & pulizia chiusura vetrina (routine) pastry lab chiusura","timeline essenziale slitti & yo-yo","tavolette lattenero & gran cacao slitti & yo-yo","minicake slitti & yo-yo","praline & dragée slitti & yo-yo","creme slittosa / riccosa / gianera slitti & yo-yo","yo-yo slitti & yo-yo","allestimento yo-yo (banco) slitti & yo-yo","stazione e strumenti (standard) slitti & yo-yo","porzionatura gelato yo-yo slitti & yo-yo","pan storage method (etichettatura) slitti & yo-yo","chiusura stazione yo-yo slitti & yo-yo chiusura","crepe con salsa sweet treat atelier","signature buontalenti crepe sweet treat atelier","waffles sweet treat atelier","pancake stack sweet treat atelier","crepe italiana (plain) sweet treat atelier","crepe italiana (beetroot) sweet treat atelier","crepe prosciutto (plain) sweet treat atelier","crepe prosciutto (beetroot) sweet treat atelier","gelato burger sweet treat atelier","checklist apertura stazioni sweet treat atelier","settaggi macchine (standard) sweet treat atelier","shelf life & storage rapidi sweet treat atelier","porzionatura & dosi (quick ref) sweet treat atelier","chiusura & pulizia rapida sweet treat atelier sicurezza chiusura"],"prefix":{"1":"1d","4":"1d","a":"4,7,1,4,2,6,r,3,1,5,4,3,b,5,1,1,1,1,1,1,1,1,1,1,1,1,1","af":"b,1,4","al":"o,v,9,e","am":"4,e","ap":"1f,g,p","at":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","au":"1o","aw":"1i,6","b":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,j,1,2,c,6,4,2,1","ba":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,g,k,e","be":"m,1u,2","bl":"s","bo":"n,k","br":"t,1,1,1,1,1,1,1,1,1,1,1,n","bu":"1u,i,7","c":"5,3,1,4,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,6,3,3,1,1,3,1,3,1,4,1,2,3,6,1,1,3,1,1,1,2,4","ca":"5,t,j,9,b","ch":"8,1,j,1,1,1,1,1,1,1,1,1,1,1,1,a,6,1,1,3,a,b,a,4","cl":"u,2,a,8","co":"d,o,4,1,2,m,4,d","cr":"1t,b,7,1,3,1,1,1","d":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,3,7,3,8,a,7,k","da":"v","de":"14,a","di":"h,9,b,v","do":"1,2,18,1c","dr":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1b","e":"0,1,1,19,b,e,7,2","es":"0,1,1,19,p","et":"1m,n","f":"6,x,9,a,7,5","fa":"1t","fi":"13,j","fl":"6","fr":"1c","fu":"1y","g":"l,3,f,2,1,1,1,1,1,1,1,1,1,2,9,c,3,4,b","ge":"15,1,1,1,1,1,1,1,1,1,u,b","gi":"l,3,f,d,9,f","gr":"21","h":"8,j","ha":"r","ho":"8","i":"f,3,1,1,5,1q,1","ic":"f,3,1,1,5","it":"2f,1","l":"9,5,1,4,1,5,d,3,1,1,1,1,1,1,1,1,1,9,3,1,1,1,1,1,1,1,1,1,2,l","la":"9,5,1,4,1,5,g,1,1,1,1,1,1,1,1,1,c,1,1,1,1,1,1,1,1,1,2","li":"12,9,c,a,p","lo":"1s,3,3","m":"2,1,4,7,1,1,1,7,1,2,1,5,2,1,3,1,5,a,2,2,b,4,7,c","ma":"2,1,b,1,1,1,7,1,2,1,7,1,3,6,a,2,d,n","me":"29","mi":"14,j,f","mo":"7","mu":"x","n":"11","no":"11","o":"1f,1,1,1,1,1,1,1,1,1,1,6","op":"1f,1,1,1,1,1,1,1,1,1,1","or":"1m,9","p":"k,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,1,5,1,3,4,1,5,2,1,1,1,1,1,1,1,1,1,1,4,5,1,5,1,2,1,5,1","pa":"l,5,3,1,1,1,1,1,1,1,1,1,1,1,9,4,1,8,1,1,1,1,1,1,1,1,1,a,5","pi":"k,1e","pl":"2f,2","po":"1a,m,c,f","pr":"o,2,1,i,e,g,e,1","pu":"13,m,a,p","q":"12,j,c,q","qu":"12,j,c,q","r":"m,r,2,7,1,c,5,i,1,1","ra":"1n,z,2","re":"1d,9,11","ri":"24","ro":"m,t,k","s":"0,a,1,a,1,1,2,1,1,1,6,1,3,8,1,2,2,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","sa":"2b","sc":"1d,c,5","se":"a,1,e,9,1,g,1,1,1,1,1,1,1,1,1,1,6,3,n","sh":"12,9,c,a,p","si":"0,2c,c","sl":"20,1,1,1,1,1,1,1,1,1,1","sm":"l,1,1,3","st":"p,2,1,i,m,b,2,1,4,6,1,1","sw":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","t":"a,1,z,1,1,6,3,3,3,5,4,1,a,1,1,1,1,1,1,1,1,1,1,1,1,1","ta":"1i,6,8,5","te":"a,1,z,b,3","ti":"20","tr":"1b,1,f,k,1,1,1,1,1,1,1,1,1,1,1,1,1","u":"o,5,1,1,1,1,3,5,1,1,1,4,4,1,1,1,1,6,4,1","un":"o","up":"t,1,1,1,1,3,5,1,1,1,4,4,1,1,1,1,6,4,1","v":"n,1,5,1,1,1,1,1,1,1,1,1,1,1,5,5,h,4","ve":"n,m,5,h,4","vi":"t,1,1,1,1,1,1,1,1,1,1,1","vo":"o","w":"6,7,k,3,1d","wa":"10,1d","wh":"6,7","wi":"x","y":"20,1,1,1,1,1,1,1,1,1,1","yo":"20,1,1,1,1,1,1,1,1,1,1"},"tri":{" \"f":"1y"," & ":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,4,1,1,1,1,1,1,1,1,1,1,1,6,2,2,1,1,1,1,1,1,1,1,1,1,1,c,1,1"," (1":"1d"," (a":"1v"," (b":"26,a,2"," (d":"14,7"," (e":"29"," (f":"13"," (g":"1p"," (h":"r"," (l":"1v"," (m":"19,e"," (p":"y,j,f,j,2"," (q":"12,j,c,q"," (r":"1m,d"," (s":"p,l,x,e"," (u":"o"," (v":"x,3"," / ":"s,x,3,c"," af":"g"," al":"o,14"," am":"i"," ap":"1f,15"," at":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1"," au":"1o"," aw":"1i"," ba":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,g"," be":"m"," bl":"s"," bo":"n,k"," br":"t,1,1,1,1,1,1,1,1,1,1,1"," bu":"1u,i,7"," ca":"y,j,k"," ch":"8,k,1,1,1,1,1,1,1,1,1,1,1,1,a,6,1,1,3,a,b,e"," cl":"u,2,a,8"," co":"d,o,7,m,4,d"," cr":"2c"," d'":"1m"," da":"v"," de":"1e"," di":"q,b,v"," do":"1,2m"," dr":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1b"," e ":"27"," es":"1b,p"," et":"1m"," fa":"1t"," fr":"1c"," ge":"15,1,1,1,1,1,1,1,1,1,u"," gi":"l,3,f,d,o"," gr":"21"," ic":"k,5"," it":"2f,1"," la":"9,5,1,4,1,5,g,1,1,1,1,1,1,1,1,1,c,1,1,1,1,1,1,1,1,1,2"," li":"12,9,c,a,p"," lo":"1s,6"," ma":"2,1,c,2,7,1,2,1,7,1,3,g,2,d,n"," me":"29"," mi":"14"," no":"11"," op":"1f,1,1,1,1,1,1,1,1,1,1"," or":"1v"," pa":"l,5,3,1,1,1,1,1,1,1,1,1,1,1,9,d,1,1,1,1,1,1,1,1,1"," pi":"1y"," po":"1a"," pr":"o,2,1,w,u,1"," pu":"1p,a,p"," ra":"1n,z,2"," re":"2n"," ri":"24"," ro":"m"," sa":"2b"," sc":"1d"," se":"a,1,14,1,1,1,1,1,1,1,1,1,1,6"," sh":"1x"," si":"0,2o"," sl":"20,1,1,1,1,1,1,1,1,1,1"," st":"s,14,b,2,1,4,6,2"," sw":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1"," ta":"1i,e"," te":"b,1d"," tr":"1b,1,f,k,1,1,1,1,1,1,1,1,1,1,1,1,1"," up":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4"," ve":"n,m,5,h,4"," vi":"t,1,1,1,1,1,1,1,1,1,1,1"," vo":"o"," wh":"6"," wi":"x"," yo":"20,1,1,1,1,1,1,1,1,1,1"," “s":"1y","\" c":"1y","\"fu":"1y","& c":"1k","& d":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,m,p,k","& e":"1m","& g":"21","& l":"1x","& m":"10","& o":"1v","& p":"1a,d,c,p","& s":"1f,1,1,1,1,1,1,1,1,1,1,x","& v":"t,1,1,1,1,1,1,1,1,1,1,1","& y":"20,1,1,1,1,1,1,1,1,1,1","' c":"x,6","' u":"t,1,1,1","'or":"1m","(1/":"1d","(ap":"1v","(ba":"26","(be":"2g,2","(de":"14","(do":"1b","(et":"29","(fi":"13","(gi":"1p","(ha":"r","(lo":"1v","(ma":"19","(mi":"1n","(pa":"y,j","(pl":"2f,2","(po":"1w","(qu":"12,j,c,q","(re":"1m","(ro":"1z","(st":"p,l,x,e","(un":"o","(vi":"x,3",") b":"o,1,2",") c":"x,1,2,2,1,1",") g":"19,1,1,2",") o":"1h,4,1,1,2",") p":"1v,1,1,2",") s":"1v,b,1,2,6,1,1,1,3,2",", p":"t,1,1,1,1,1,1,1,1,1,1,1","-aw":"1o","-up":"10,g,f","-yo":"20,1,1,1,1,1,1,1,1,1,1","/ a":"1s","/ b":"s","/ g":"24","/ r":"24","/ s":"1p","/4 ":"1d","1/4":"1d","4 p":"1d",": a":"1o",": p":"q","a &":"1a,4,l,o,1","a (":"13,6,m,4,g,1","a /":"s,10,c","a a":"g,8","a b":"7,a,r","a c":"1z,p","a d":"1m","a g":"18,6,u","a l":"e,1,a","a m":"13","a o":"1f,4,1,4","a p":"o,3,14","a r":"2o","a s":"a,1,h,l,r,6,1,9,4","a t":"1o","a u":"x,n","a v":"o,b,10","a “":"1y","a) ":"13,m,6,1,d","ab ":"15,1,1,1,4,2,c,4,5","abe":"1x","aca":"21","acc":"2,1,o,8,4,g,12","ach":"k","ack":"14,e,w","ade":"o,3,w","adi":"18","af ":"1s","aff":"c,4,1x","aft":"b","age":"r,1i,d","agg":"2l","agi":"14,e","agl":"1w","agé":"23","ai ":"9","ain":"2f,2","ake":"1i,6,2,c,c","al ":"o","ald":"y,j","ale":"1u,6,c","ali":"1g,n,c,1","all":"l,y,n","als":"2b","alt":"1s","ame":"4,e,8","amp":"1d","an ":"1e,n,8","an)":"1d","ana":"1p,3,n,1","anc":"26,8","and":"p,7,2,c,7,f,b,e","ane":"t,1,1,1,1,1,1,1,1,1,1,1,10","ani":"18","ano":"4,e","ant":"10,t,5","ao ":"21","ap)":"1l","ape":"1f,g,p","api":"1n,z,2","app":"5","ar ":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ara":"q,j","arc":"1t","ard":"p,l,m,b,e","ark":"v","arl":"11","arm":"10","ass":"l,9,2,a","ast":"1q,1,1,1,1,1,1,1,1,1","at ":"6,16,z,1,1,1,1,1,1,1,1,1,1,1,1,1","ata":"13","atc":"e,1,1,1,7,1,2,1","ate":"8,n,1g,1,1,1,1,1,1,1,1,1,1,1,1,1","ati":"1f,1,1,1,1,1,1,1,1,1,1","ato":"2,1,9,4,p,1,1,1,1,1,1,1,1,1,u,b","ats":"1b","att":"9,5,1,4,1,5,k,s","atu":"1a,b,b,c,1,3,b","aut":"1o","ave":"1l","avo":"21","awa":"1i,6","ay ":"1i,9","ay:":"1o","azi":"s,h,y,3,a","a” ":"1y","b c":"1e,l","b u":"15,1,1,1,4,e,4","bad":"18","ban":"1s,e","bar":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","bee":"2g,2","bel":"1x","ber":"m","ble":"1,2,p","boo":"n","box":"17","bro":"1r","bru":"t,1,1,1,1,1,1,1,1,1,1,1","buo":"1u,i","bur":"2j","ca ":"1o","cac":"21","cak":"1q,c,c","cal":"y,j","cam":"1d","can":"4,e","cao":"21","cap":"5","cch":"2,1,w,4,g,12","cci":"5","cco":"24","ccp":"r","ce ":"1k","ced":"f,3,1,1,5","cha":"7,2,5,1,1,1,7,1,2,1","che":"1m,3,k,b","chi":"2,1,h,8,5,2,4,b,5,1,1,1,3,a,b,b,3","cho":"8,n","chu":"t,1,1,1,1,1,1,1,1,1,1,1","ci ":"16","cin":"5","cit":"1t","ciu":"2h,1","ck ":"1l,c,h,9","ck)":"12","cka":"14,e","ckl":"2k","cla":"u,2,a","cle":"1e","co ":"u,2","co)":"26","cof":"d","col":"8,n","com":"11,x","con":"11,5,o,h","cop":"15,3","cos":"24","cp)":"r","cre":"24,7,1,3,1,1,1","cro":"1t","cti":"a","cur":"2o","d (":"1w,d","d a":"i","d c":"d","d d":"1w","d l":"j,1","d m":"f,a","d w":"x","d'o":"1m","d) ":"p,l,x,e","da ":"2o","dar":"p,6,f,m,b,e","de ":"n,1,3","de)":"1n","dee":"1e","del":"14","der":"s","di ":"q,b,m,9,q","dia":"18","din":"1v","dir":"h","do ":"y,j","dop":"1b","dor":"w,2,j","dos":"2n","dou":"1,2","dra":"23","dri":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","dul":"1p","duz":"q","e &":"1k,d,6,j","e (":"o,1,2,6,7,6,b,1,3,8,o","e a":"1f,3","e b":"0,1,5,2,1,4,1,1,4,1,3,3,1m","e c":"u,1,6,k,9,h","e d":"v","e e":"20,7","e g":"l,i,2","e i":"2f,1","e l":"21","e m":"3,o,1,16,b","e p":"1p,9,j,1","e r":"m,11,z","e s":"20,2,1,1,3,5,2","e t":"1b,1,f","e v":"n,f,7","e y":"2a","e' ":"t,1,1,1,1,6","e) ":"1b,c,8,4","e-a":"1o","ea ":"a,1","ean":"1e","eat":"1b,1,z,1,1,1,1,1,1,1,1,1,1,1,1,1","eck":"2k","ect":"a","ed ":"d,2,3,1,1,5,8","edu":"1p","ee ":"d","eep":"1e","eet":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","eez":"1c","ef)":"2n","ego":"1d,9","ela":"15,1,1,1,1,1,1,1,1,1,u,b","ele":"a","elf":"12,9,c,a,p","eli":"14,t,3,b,1,1,1,1,1,1,1,1,1,1,1,1,1","ell":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","ema":"o,3,w","eme":"24","emp":"1a,b,d","ena":"1y","end":"s","ene":"1y,3","eni":"10,y","ent":"10,j,b,4,8,1,5","enz":"20","ep ":"o,q","epa":"19","epe":"2b,1,3,1,1,1","er ":"s,k,17,5","era":"1a,5,1,1,1,1,1,1,1,1,1,1,f","erd":"n","eri":"4,e","erl":"1y","erm":"1o","ern":"b","ero":"1g,l","err":"m","ert":"1f,g,p","erv":"y,3,g,3","ery":"14","es ":"17,j,n","es:":"q","esp":"0,1,1,19","ess":"0,1,1,1y","est":"1c,7,n","et ":"b,20,1,1,1,1,1,1,1,1,1,1,1,1,1","et-":"1g,f","eth":"29","eti":"1m,n","etr":"q,j,5,h,4,h,2","ett":"p,4,1,1,1,1,1,1,1,1,1,1,1,1,h,3,c,8,c","etu":"z,g,1,1,1,1,1,1,1,1,1,1","eze":"1c","ezz":"2o","f l":"12,9,c,a,p","f p":"1s","f) ":"2n","far":"1t","fe ":"12,9,c,a,p","fee":"d","ffe":"d","ffl":"2d","ffo":"c,4","fif":"1m","fin":"13","fla":"6","fle":"2d","fo ":"1m","fog":"c,4","fre":"1c","fte":"b","ful":"1y","g i":"p","g m":"14","g s":"1x","g t":"1i","gat":"c,4","ge ":"r,1i,d","gel":"15,1,1,1,1,1,1,1,1,1,u,b","ger":"2j","ges":"1c","ggi":"2l","gi ":"2l","gia":"l,1j","gin":"14,e","gio":"o,f,d,9","gle":"0","gli":"1w","gna":"2c","gol":"1d,9","gra":"21","gée":"23","ha ":"7,7,1,1,1,7,1,2,1","hac":"r","hai":"9","hec":"2k","hed":"1p","hel":"12,9,c,a,p","het":"1m,n","hia":"2,1,1i","hie":"l,1,1,3","hin":"z,4,g,12","hio":"k","hip":"d","hit":"6","hiu":"s,5,6,b,6,2,3,a,b,e","hoc":"8,n","hod":"29","hot":"8","hur":"t,1,1,1,1,1,1,1,1,1,1,1","i &":"t,1,1,1,1,1,1,1,1,1,1,1,w,1,1,1,1,1,1,1,1,1,1","i (":"1n,k,g","i c":"16,2,14","i d":"q","i g":"16","i l":"9,1j","i m":"2l","i n":"11","i p":"q,e,p,1","i s":"1w,o,2","i t":"1w","ia ":"13,l,b,p","ial":"l,1f","ian":"18,w,b,1","iat":"2,1","iav":"1l","ica":"4,e,16,e","icc":"24","ice":"f,3,1,1,5,v","ich":"1m,n","ici":"16","ick":"12,j,c,q","ico":"u,2","icu":"2o","ida":"2o","idi":"1n,z","ie ":"l,1,1,12,2","ien":"1y","ier":"1g,v,1,1,1,1,1,1,1,1,1,1,1,1,1","ies":"q","ife":"12,9,c,a,p","ifo":"1m","ign":"2c","ima":"1p","ime":"10,j,f,2,6","in ":"t,1,1,1,1,1,1,1,1,1,1,1","in)":"2f,2","ina":"z,4,6,5,5,c,4","ine":"x,6,c,g,4,1,3,i","ing":"0,p,4,1,1,1,1,7,1,1,1,1,4,5,1,1,1,6,4,3","ini":"14,y","ink":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ino":"5,14","io ":"k,e,j,f","ion":"a,b,5,2,h,2,1,3,1,1,1,1,1,1,1,1,1,1,7,b,1,2,a,3","ior":"o,f,d,9","ipp":"d","irt":"h","iss":"1t","ist":"k,1d,n","ita":"2f,1","ite":"6","iti":"1t","itt":"20,1,1,1,1,1,1,1,1,1,1","ius":"s,5,6,b,6,2,3,a,b,e","iut":"2h,1","ive":"14","ix ":"1n","izi":"y,5,8,6,8,a,p","k &":"1v","k c":"v","k l":"1x","k m":"1l","k r":"2n","k s":"2e","k\" ":"1y","k) ":"12","kag":"14,e","ke ":"1i,k,c","ke-":"1o","kes":"1q","kli":"2k","ks ":"s","l g":"o","l l":"1y","la ":"1d,9,c","lab":"15,1,1,1,1,1,1,1,1,1,c,1,1,1,1,1,1,1,1,1","lai":"2f,2","las":"u,2,a","lat":"6,2,1,5,1,4,1,5,6,a,1,1,1,1,1,1,1,1,1,n,7,b","ldo":"y,j","le ":"0,1,2,1m,b","le'":"t,1,1,1,1,1,1,1,1,1,1,1","lea":"1e","lec":"a","led":"x","len":"s,12,i","les":"1j,n,7","let":"21","lf ":"12,9,c,a,p","li ":"1w","lia":"2f,1","lie":"1g,v,1,1,1,1,1,1,1,1,1,1,1,1,1","lif":"12,9,c,a,p","lin":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4,3,3,3","lio":"1w","lis":"1x,n","lit":"20,1,1,1,1,1,1,1,1,1,1","liv":"14","liz":"13,m,a,p","ll ":"1y","lle":"x,m,n","lli":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","llo":"l","lo ":"l,g,c","loa":"1s","loo":"1v,3","lsa":"2b","lta":"o","ltr":"1s","lé ":"z,3","lé)":"x,3","m-u":"10","mac":"2,1,w,4,g,12","mad":"o,3,w","man":"10,p,9","map":"1l","mat":"e,1,1,1,7,1,2,1,h","me ":"11,x,6","mel":"20","men":"10,j,f,8,1","mer":"4,e","met":"q,1j","mia":"1o","mic":"1o","min":"14,y","mix":"1n","moc":"7","moo":"l,1,1,3","mpe":"1a,b","mpo":"1d","mpr":"1y","mul":"x","n b":"a,b,8,1,1,1,1,1,1,1,1,1,1,1,q","n c":"21","n s":"29,2","n t":"b","n v":"1e","n) ":"1d,12,2","na ":"o,b,4,6,5,5,9,3,4,g,1","na)":"1p","nal":"1g","nan":"1s","nat":"13,t,c,4,b","na”":"1y","nca":"2e","nco":"26","nda":"p,l,m,b,e","nde":"s","ndo":"w,2,j","ne ":"q,2,2,1,2,6,1,5,3,3,f,6,3,4,3,b","ne)":"1b,k,4","ner":"1y,3,3","net":"t,1,1,1,1,1,1,1,1,1,1,1","ng ":"p,f,e,f","ngl":"0","ni ":"t,1,1,1,1,1,1,1,1,1,1,1,2,2,1c","nic":"22","nie":"1r","nim":"10,y","nks":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","no ":"4,1,d,17","no)":"o,l","nom":"1o","noo":"b","not":"11","ns ":"1f,1,1,1,1,1,1,1,1,1,1","nse":"11","nt ":"1t","nta":"1u,i","nte":"10,y","nti":"1u,d,5","nto":"10,j,f,8","nzi":"20","o \"":"1y","o &":"1m,f","o (":"y,2,d,4,p,b,1","o /":"1p","o b":"2,1,1,1,7,4,2,4,l,1c","o c":"u,2,2,j,t","o d":"1,10","o e":"1b","o g":"18","o i":"k","o l":"15,1,1,1,1,1,1,1,1,1","o m":"2,1h","o o":"1g","o p":"l","o s":"0,21,4,3,2","o t":"1w","o y":"26,2","o) ":"o,a,b,8,5,k","o-y":"20,1,1,1,1,1,1,1,1,1,1","oaf":"1s","och":"7","oco":"8,n","od ":"29","odu":"q","off":"d","oga":"c,4","ois":"1t","ok ":"1v","ok\"":"1y","ola":"8,n,i,9","ole":"21","olo":"1d","olt":"o","ome":"11,x","omi":"1o","on ":"a,1,a,19,h","ona":"1w,c,f","one":"q,2,2,1,9,5,2,1,i,d,3","oni":"t,1,1,1,1,1,1,1,1,1,1,1,2,1e","ono":"1o","ons":"11,e,1,1,1,1,1,1,1,1,1,1","ont":"1u,i","ook":"1v,3","oon":"b","oos":"n","oot":"l,1,1,3,1q,2","ope":"1f,1,1,1,1,1,1,1,1,1,1","opo":"1b","opp":"15,3","ora":"r,1i,d","ord":"1v","orn":"o,f,d,9","oro":"w,2,j,5","ort":"1a","orz":"1w,c,f","os ":"t","os,":"t,1,1,1,1,1,1,1,1,1,1,1","osa":"24","osc":"2h,1","osi":"1b,1c","oss":"m","ost":"n","ot ":"8","ot)":"2g,2","oth":"l,1,1,3","ott":"11","oub":"1,2","out":"1f,k","own":"1r","oxe":"17","p &":"10","p c":"1e,6,2,3","p g":"1g","p m":"o,b","p u":"1h,1,1","p v":"1v","p) ":"r,u","pa ":"18","pac":"14,e","pan":"t,1,1,1,1,1,1,1,1,1,1,1,9,4,s,5","par":"q,j","pas":"l,15,1,1,1,1,1,1,1,1,1","pe ":"2b,1,3,1,1,1","ped":"d","per":"1a,5,1,1,1,1,1,1,1,1,1,1,6,p","pet":"15","pid":"1n,z,2","pie":"1y","pis":"k","pla":"2f,2","po ":"1b","pol":"1d","por":"1a,m,c,f","pos":"1b","ppa":"18","ppe":"d,s","ppu":"5","pra":"23","pre":"0,1,1,m,3,i,e,b","pro":"q,1r,1","pse":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","puc":"5","pul":"13,m,a,p","qui":"12,j,c,q","r &":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","r b":"s","r g":"1c","r s":"2j,5","ra ":"s,5,d,4,1,5,f,5,4,2,a,3,1","ra)":"1v,1,d","rag":"r,1c,6,d","ral":"23","ram":"q","ran":"21","rap":"1n,z,2","rat":"1a,5,1,1,1,1,1,1,1,1,1,1","ray":"1r","raz":"19","rci":"1t","rd ":"1w","rd)":"p,l,x,e","rde":"n","rdi":"1v","re ":"1l,d,e","rea":"1b,1,z,1,1,1,1,1,1,1,1,1,1,1,1,1","ree":"1c","ref":"2n","reg":"1d,9","rem":"o,3,w,h","rep":"o,l,12,1,3,1,1,1","res":"0,1,1","rez":"2o","rge":"2j","ri ":"q,12","ric":"4,e,1m","rin":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,h,5,h,4","rk ":"v","rla":"1y","rlo":"11","rm-":"10","rmi":"1o","rna":"13,d","rno":"b,d,11","ro ":"w,k,l","ro)":"y,j,5","rod":"q","roi":"1t","roo":"2g,2","ros":"m,7,1,1,1,1,1,1,1,1,1,1,1,1d,1","rou":"1f,k","row":"1r","rro":"t,1,1,1,1,1,1,1,1,1,1,1","rry":"m","rte":"1a","rtu":"1f,g,p","rty":"h","rul":"t,1,1,1,1,1,1,1,1,1,1,1","rum":"27","rva":"11","rvi":"y,j,3","ry ":"m,14,1,1,1,1,1,1,1,1,1","ry)":"14","rzi":"1w,c,f","s &":"1f,1,1,1,1,1,1,1,1,1,1","s (":"1b","s c":"s,1","s g":"17","s p":"1q","s s":"2d","s, ":"t,1,1,1,1,1,1,1,1,1,1,1","s: ":"q","sa ":"24,7","sal":"2b","san":"1t","sca":"1d","sch":"1p","sci":"2h,1","sco":"1u","sel":"a,j,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","sem":"1y","sen":"20","ser":"y,3,g,3","set":"b,e,a,g,1,1,1,1,1,1,1,1,1,1,6,q","she":"12,9,c,a,p","si ":"2n","sic":"u,2,a,1i","sig":"2c","sin":"0","sio":"l","siz":"1b","sli":"20,1,1,1,1,1,1,1,1,1,1","smo":"l,1,1,3","so ":"0,1,1,k","spo":"1b","spr":"0,1,1","ssa":"1t","sse":"20","ssi":"l,9,2,a","sso":"0,1,1,k","st ":"n,1x","st)":"1x","sta":"k,5,3,i,m,b,3,4,6,1","sti":"1c,7,n","sto":"r,1i,d","str":"1q,1,1,1,1,1,1,1,1,1,8","sur":"s,5,6,b,6,2,3,a,b,e","swe":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","t a":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","t b":"b,c","t c":"8","t f":"1c,h","t t":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","t w":"6","t) ":"1x,j,2","t-u":"1g,f","ta ":"o","ta)":"13","tac":"k,1u","tag":"1w,p","tak":"1i,6","tal":"1u,i,3,1","tan":"p,l,m,b,e","tat":"29","tav":"21","taz":"s,1f,3,a","tch":"e,1,1,1,7,1,2,1","te ":"6,2,1,5,1,4,1,5,6,6,4,5,c,f","tea":"a,1","tel":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","tem":"1a,b","ten":"10,y,3","ter":"b,1d","thi":"l,1,1,3","tho":"29","ti ":"1t,1,6,1,1,1,1,1,1,1,1,1,1,2","tic":"1m,n","tim":"1j,6,b,6","tin":"p,k,6,k","tio":"a,12,3,1,1,1,1,1,1,1,1,1,1","to ":"2,1,9,4,k,5,1,1,1,1,1,1,1,1,1,5,f,8,2,9,1,1","ton":"t,1,1,1,1,1,1,1,1,1,1,1,k","tor":"r,1i,d","tos":"24","tra":"1r","tre":"1b,1,z,1,1,1,1,1,1,1,1,1,1,1,1,1","tri":"q,j,5,e,3,4","tro":"2g,2","tru":"27","try":"1q,1,1,1,1,1,1,1,1,1","ts ":"1b","tta":"29,c","tte":"9,5,1,4,1,5,c,4,h,f","tti":"p,k,g,b,1,1,1,1,1,1,1,1,1,1","tto":"t,1,1,1,1,1,1,1,1,1,1,1,10,d,1","tup":"z,g,1,1,1,1,1,1,1,1,1,1","tur":"1a,5,6,a,1,c,1,3,8,3","ty ":"h","ubl":"1,2","ucc":"5","uic":"12,j,c,q","ule":"t,1,1,1,1,1,1,1,1,1,1,1,l","uli":"13,m,a,p","ull":"x,11","ulé":"x,2,1,2","ume":"27","una":"o","uon":"1u,i","up ":"z,1,g,1,1,1,1,2,3,6","ups":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","ura":"s,5,6,7,4,1,5,2,3,6,1,3,9,1,1,a,3,1","ure":"1l,r,c","urg":"2j","urr":"t,1,1,1,1,1,1,1,1,1,1,1","usu":"s,5,6,b,6,2,3,a,b,e","uti":"1f,k","uto":"1o","utt":"2h,1","uzi":"q","var":"11","ve ":"1l","ver":"n,h","vet":"19,5,h,4","vic":"1k","vin":"t,1,1,1,1,1,1,1,1,1,1,1","viz":"y,j","vol":"o,1d","waf":"2d","war":"10","way":"1i,6","wee":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","whi":"6,7","win":"x","wni":"1r","x &":"1n","xes":"17","y (":"1v","y b":"m","y l":"1q,1,1,1,1,1,1,1,1,1","y m":"h","y o":"1i","y p":"1r","y) ":"14","y: ":"1o","yo ":"25,1,2,2","yo-":"20,1,1,1,1,1,1,1,1,1,1","za ":"2o","zer":"1c","zia":"13,w,1,o","zie":"1p","zio":"q,2,6,b,2,6,f,b,1,2,a,3","zza":"2o","é (":"12","é c":"z","é) ":"x,3","ée ":"23","“se":"1y","” p":"1y"}},"en":{"names":["espresso single bar & drinks","espresso double bar & drinks","espresso macchiato bar & drinks","double macchiato bar & drinks","americano bar & drinks","cappuccino bar & drinks","flat white bar & drinks","mocha bar & drinks","hot chocolate bar & drinks","chai latte bar & drinks","tea selection bar & drinks","afternoon tea set bar & drinks","affogato bar & drinks","whipped coffee bar & drinks","matcha latte bar & drinks","iced matcha latte bar & drinks","matcha affogato bar & drinks","dirty matcha bar & drinks","iced americano bar & drinks","iced latte bar & drinks","pistachio iced latte bar & drinks","smoothie giallo passion bar & drinks","smoothie rosso berry bar & drinks","smoothie verde boost bar & drinks","prep premade matcha (once per day) prep matcha premade (una volta al giorno) bar & drinks","setting iced matcha latte (standard) bar & drinks","smoothies: production parameters smoothies: parametri di produzione bar & drinks","storage premade matcha (haccp) storage matcha premade (haccp) bar & drinks","close matcha / blender station chiusura stazione matcha / blender bar & drinks chiusura","churros churros, panettoni & vin brule' churros, panettone & mulled wine upselling","panettone classico churros, panettoni & vin brule' churros, panettone & mulled wine upselling","panettone dark chocolate churros, panettoni & vin brule' churros, panettone & mulled wine upselling","pandoro classico churros, panettoni & vin brule' churros, panettone & mulled wine upselling","mulled wine (vin brulé) churros, panettoni & vin brule' churros, panettone & mulled wine chiusura upselling","warm service (pandoro) servizio caldo (pandoro) churros, panettoni & vin brule' churros, panettone & mulled wine","vin brulé machine setup setup macchina vin brulé churros, panettoni & vin brule' churros, panettone & mulled wine","warm-up & holding (vin brulé) warm-up & mantenimento (vin brulé) churros, panettoni & vin brule' churros, panettone & mulled wine","night storage (how to store) come conservarlo di notte churros, panettoni & vin brule' churros, panettone & mulled wine","vin brulé shelf life (quick) shelf life vin brulé (quick) churros, panettoni & vin brule' churros, panettone & mulled wine","machine cleaning (end of day) pulizia macchina (fine giornata) churros, panettoni & vin brule' churros, panettone & mulled wine chiusura","mini panettone packaging (delivery) packaging mini panettone (delivery) churros, panettoni & vin brule' churros, panettone & mulled wine","cups coppette gelato lab upselling","classic cones coni classici gelato lab upselling","gelato boxes gelato lab upselling","badiani cup coppa gelato gelato lab upselling","display prep (morning) preparazione vetrina (mattino) gelato lab","temperature & doors (standard) temperatura & porte (standard) gelato lab","treats shelf life (after display) shelf life treats (dopo esposizione) gelato lab","treat freezer management gestione treat freezer gelato lab upselling","scampolo rule (1/4 pan) regola scampolo (1/4 pan) gelato lab","closing & deep clean (cabinet) chiusura & deep clean vetrina gelato lab chiusura","opening routine routine apertura operations & setup","daily set-up set-up giornaliero operations & setup","warm service (pandoro) servizio caldo (pandoro) operations & setup upselling","take-away packaging packaging take away operations & setup upselling","machine set-up allestimento macchina operations & setup upselling","service & closing service & chiusura operations & setup chiusura upselling","key temperatures (quick map) temperature chiave (quick map) operations & setup","fifo & labels (golden rule) fifo & etichette (regola d'oro) operations & setup chiusura","quick shelf life (mix & premade) shelf life rapidi (mix & premade) operations & setup","take-away: thermal hold take-away: autonomia termica operations & setup","cleaning schedule (daily / weekly) schedule pulizie (giorno / settimana) operations & setup chiusura","cakes pastry lab upselling","brownies brownie tray pastry lab","loaf banana / altri loaf pastry lab","croissants croissant farciti pastry lab","scones scone con buontalenti pastry lab upselling","pastry display (opening) set-up vetrina (look & ordine) pastry lab","cutting standards tagli standard (porzionatura) pastry lab","shelf life & labeling shelf life (quick list) pastry lab","maintaining \"full look\" come mantenerla “sempre piena” pastry lab","closing & cleaning chiusura vetrina (routine) pastry lab chiusura","essential timeline timeline essenziale slitti & yo-yo","lattenero & gran cacao tablets tavolette lattenero & gran cacao slitti & yo-yo","mini cakes minicake slitti & yo-yo","pralines & dragée praline & dragée slitti & yo-yo","slittosa / riccosa / gianera spreads creme slittosa / riccosa / gianera slitti & yo-yo","yo-yo slitti & yo-yo","yo-yo counter set-up allestimento yo-yo (banco) slitti & yo-yo","station & tools (standard) stazione e strumenti (standard) slitti & yo-yo","yo-yo gelato portioning porzionatura gelato yo-yo slitti & yo-yo","pan storage method (labelling) pan storage method (etichettatura) slitti & yo-yo","yo-yo station closing chiusura stazione yo-yo slitti & yo-yo chiusura","crepe with sauce crepe con salsa sweet treat atelier","signature buontalenti crepe sweet treat atelier","waffles sweet treat atelier","pancake stack sweet treat atelier","crepe italiana (plain) sweet treat atelier","crepe italiana (beetroot) sweet treat atelier","crepe prosciutto (plain) sweet treat atelier","crepe prosciutto (beetroot) sweet treat atelier","gelato burger sweet treat atelier","opening station checklist checklist apertura stazioni sweet treat atelier","machine settings (standard) settaggi macchine (standard) sweet treat atelier","shelf life & quick storage shelf life & storage rapidi sweet treat atelier","portioning & doses (quick ref) porzionatura & dosi (quick ref) sweet treat atelier","closing & quick clean chiusura & pulizia rapida sweet treat atelier sicurezza chiusura"],"prefix":{"1":"1d","4":"1d","a":"4,7,1,4,2,6,n,4,3,1,5,4,e,5,1,1,1,1,1,1,1,1,1,1,1,1,1","af":"b,1,4,v","al":"o,v,9,e","am":"4,e","ap":"1f,15","at":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","au":"1o","aw":"1i,6","b":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,j,1,2,c,6,4,2,1","ba":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,g,k,e","be":"m,1u,2","bl":"s","bo":"n,k","br":"t,1,1,1,1,1,1,1,1,1,1,1,n","bu":"1u,i,7","c":"5,3,1,4,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,6,3,3,1,1,3,1,3,1,2,2,1,2,1,2,2,4,1,1,3,1,1,1,2,4","ca":"5,t,g,3,9,b,1","ch":"8,1,j,1,1,1,1,1,1,1,1,1,1,1,1,a,6,1,1,3,a,b,a,4","cl":"s,2,2,7,3,8,6,5,a,b,e","co":"d,o,4,1,2,m,4,8,5","cr":"1t,b,7,1,3,1,1,1","cu":"15,3,o","d":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,2,1,5,1,1,3,2,6,3,6,8,k","da":"o,7,8,d,9","de":"14,a","di":"h,9,b,8,2,k","do":"1,2,17,1,1c","dr":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1b","e":"0,1,1,11,8,b,e,7,2","en":"13","es":"0,1,1,19,p","et":"1m,n","f":"6,x,9,a,7,5","fa":"1t","fi":"13,j","fl":"6","fr":"1c","fu":"1y","g":"l,3,f,2,1,1,1,1,1,1,1,1,1,2,6,3,c,3,4,b","ge":"15,1,1,1,1,1,1,1,1,1,u,b","gi":"l,3,f,d,9,f","go":"1m","gr":"21","h":"8,j,9,1,n","ha":"r","ho":"8,s,1,n","i":"f,3,1,1,5,1q,1","ic":"f,3,1,1,5","it":"2f,1","k":"1l","ke":"1l","l":"9,5,1,4,1,5,d,3,1,1,1,1,1,1,1,1,1,8,1,3,1,1,1,1,1,1,1,1,1,2,8,d","la":"9,5,1,4,1,5,g,1,1,1,1,1,1,1,1,1,8,4,1,1,1,1,1,1,1,1,1,2,8","li":"12,9,c,a,p","lo":"1s,3,3","m":"2,1,4,7,1,1,1,7,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,5,3,7,2,2,b,4,7,c","ma":"2,1,b,1,1,1,7,1,2,1,7,1,3,6,3,7,2,d,n","me":"29","mi":"14,j,f","mo":"7,12","mu":"t,1,1,1,1,1,1,1,1,1,1,1","n":"11","ni":"11","no":"11","o":"o,f,c,1,1,1,1,1,1,1,1,1,1,6,p","of":"13","on":"o","op":"1f,1,1,1,1,1,1,1,1,1,1,6,p","or":"1m,9","p":"k,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,1,5,1,3,4,1,5,2,1,1,1,1,1,1,1,1,1,1,4,5,1,5,1,2,1,5,1","pa":"l,5,3,1,1,1,1,1,1,1,1,1,1,1,9,4,1,8,1,1,1,1,1,1,1,1,1,a,5","pe":"o","pi":"k,1e","pl":"2f,2","po":"1a,m,c,f","pr":"o,2,1,i,e,g,e,1","pu":"13,m,z","q":"12,j,2,a,p,1,1","qu":"12,j,2,a,p,1,1","r":"m,r,2,7,1,c,5,i,1,1","ra":"1n,z,2","re":"1d,9,11","ri":"24","ro":"m,t,k","ru":"1d,9","s":"0,a,1,a,1,1,2,1,1,1,6,1,2,1,8,1,2,2,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","sa":"2b","sc":"1d,c,5","se":"a,1,e,9,1,g,1,1,1,1,1,1,1,1,1,1,6,3,8,f","sh":"12,9,c,a,p","si":"0,2c,c","sl":"20,1,1,1,1,1,1,1,1,1,1","sm":"l,1,1,3","sp":"24","st":"p,2,1,9,9,m,b,2,1,4,6,1,1","sw":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","t":"a,1,q,9,1,1,6,3,3,3,5,4,1,6,4,1,1,1,1,1,1,1,1,1,1,1,1,1","ta":"1i,6,8,5","te":"a,1,z,b,3","th":"1o","ti":"20","to":"11,16","tr":"1b,1,f,k,1,1,1,1,1,1,1,1,1,1,1,1,1","u":"o,5,1,1,1,1,3,5,1,1,1,4,4,1,1,1,1,6,4,1,b","un":"o","up":"t,1,1,1,1,3,5,1,1,1,4,4,1,1,1,1,6,4,1,b","v":"n,1,5,1,1,1,1,1,1,1,1,1,1,1,5,5,h,4","ve":"n,m,5,h,4","vi":"t,1,1,1,1,1,1,1,1,1,1,1","vo":"o","w":"6,7,g,1,1,1,1,1,1,1,1,1,1,1,d,8,m,2","wa":"y,2,h,w","we":"1p","wh":"6,7","wi":"t,1,1,1,1,1,1,1,1,1,1,1,17","y":"20,1,1,1,1,1,1,1,1,1,1","yo":"20,1,1,1,1,1,1,1,1,1,1"},"tri":{" \"f":"1y"," & ":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,4,1,1,1,1,1,1,1,1,1,1,1,6,2,2,1,1,1,1,1,1,1,1,1,1,1,c,1,1"," (1":"1d"," (a":"1b"," (b":"26,a,2"," (c":"1e"," (d":"14,7,e"," (e":"13,16"," (f":"13"," (g":"1m,3"," (h":"r,a"," (l":"1v,e"," (m":"19,e"," (o":"o,17"," (p":"y,j,f,j,2"," (q":"12,j,c,q"," (r":"1m,d"," (s":"p,l,x,e"," (u":"o"," (v":"x,3"," / ":"s,x,3,c"," af":"g"," al":"o,v,9,e"," am":"i"," ap":"1f,15"," at":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1"," au":"1o"," aw":"1i"," ba":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,10"," be":"m"," bl":"s"," bo":"n,k"," br":"t,1,1,1,1,1,1,1,1,1,1,1,n"," bu":"1u,i,7"," ca":"y,j,k,1"," ch":"8,k,1,1,1,1,1,1,1,1,1,1,1,1,a,6,1,1,3,a,b,a,4"," cl":"u,2,7,3,8,6,f,b,e"," co":"d,o,4,1,2,m,4,8,5"," cr":"1t,b,7,1"," cu":"18"," d'":"1m"," da":"o,7,8"," de":"1e"," di":"q,b,a,k"," do":"1,19,1d"," dr":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1b"," e ":"27"," es":"1b,p"," et":"1m"," fa":"1t"," fi":"1m"," fr":"1c"," ge":"15,1,1,1,1,1,1,1,1,1,u"," gi":"l,3,f,d,o"," gr":"21"," ho":"10,o"," ic":"k,5"," it":"2f,1"," la":"9,5,1,4,1,5,g,1,1,1,1,1,1,1,1,1,8,4,1,1,1,1,1,1,1,1,1,2"," li":"12,9,c,a,p"," lo":"1s,6"," ma":"2,1,c,2,7,1,2,1,7,1,3,9,7,2,d,n"," me":"29"," mi":"14,y"," mu":"t,1,1,1,1,1,1,1,1,1,1,1"," no":"11"," of":"13"," op":"1f,1,1,1,1,1,1,1,1,1,1"," or":"1v"," pa":"l,5,3,1,1,1,1,1,1,1,1,1,1,1,9,5,8,1,1,1,1,1,1,1,1,1,a"," pe":"o"," pi":"1y"," po":"1a,y,f"," pr":"o,2,1,i,e,g,e,1"," pu":"13,m,z"," qu":"2m,2"," ra":"1n,z,2"," re":"1d,1a"," ri":"24"," ro":"m,t"," ru":"1d,9"," sa":"2b"," sc":"1d,c,5"," se":"a,1,n,1,g,1,1,1,1,1,1,1,1,1,1,6,b,f"," sh":"12,9,c,a,p"," si":"0,2o"," sl":"20,1,1,1,1,1,1,1,1,1,1"," sm":"q"," sp":"24"," st":"r,1,9,v,b,2,1,4,6,2"," sw":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1"," ta":"1i,6,8,5"," te":"b,z,b,3"," th":"1o"," ti":"20"," to":"11,16"," tr":"1b,1,f,k,1,1,1,1,1,1,1,1,1,1,1,1,1"," up":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4"," ve":"n,m,5,h,4"," vi":"t,1,1,1,1,1,1,1,1,1,1,1"," vo":"o"," wa":"10"," we":"1p"," wh":"6"," wi":"t,1,1,1,1,1,1,1,1,1,1,1,17"," yo":"20,1,1,1,1,1,1,1,1,1,1"," “s":"1y","\" c":"1y","\"fu":"1y","& c":"1k,f","& d":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,i,4,p,k","& e":"1m","& g":"21","& h":"10","& l":"1m,b","& m":"t,1,1,1,1,1,1,1,1,1,1,1","& o":"1v","& p":"1a,d,11","& q":"2m,2","& s":"1f,1,1,1,1,1,1,1,1,1,1,x","& t":"27","& v":"t,1,1,1,1,1,1,1,1,1,1,1","& y":"20,1,1,1,1,1,1,1,1,1,1","' c":"t,1,1,1,1,1,1,1,1,1,1,1","'or":"1m","(1/":"1d","(af":"1b","(ba":"26","(be":"2g,2","(ca":"1e","(da":"1p","(de":"14","(do":"1b","(en":"13","(et":"29","(fi":"13","(gi":"1p","(go":"1m","(ha":"r","(ho":"11","(la":"29","(lo":"1v","(ma":"19","(mi":"1n","(mo":"19","(on":"o","(op":"1v","(pa":"y,j","(pl":"2f,2","(po":"1w","(qu":"12,j,c,q","(re":"1m","(ro":"1z","(st":"p,l,x,e","(un":"o","(vi":"x,3",") b":"o,1,2",") c":"x,1,2,1,1,1,1,a",") f":"1m",") g":"19,1,1,2",") o":"1h,4,1,1,2",") p":"o,f,1,5,m,1,1,2,a,e",") r":"1d",") s":"r,7,4,9,6,6,2,6,b,1,2,6,1,1,1,3,2",") t":"1a,b",") w":"10",", p":"t,1,1,1,1,1,1,1,1,1,1,1","-aw":"1i,6","-up":"10,g,3,c,b","-yo":"20,1,1,1,1,1,1,1,1,1,1","/ a":"1s","/ b":"s","/ g":"24","/ r":"24","/ s":"1p","/ w":"1p","/4 ":"1d","1/4":"1d","4 p":"1d",": a":"1o",": p":"q",": t":"1o","a &":"1a,4,19,1","a (":"o,3,c,6,m,4,g,1","a /":"s,10,c","a a":"g,8","a b":"7,a","a c":"2o","a d":"1m","a g":"18,6,u","a l":"e,1,a","a m":"13","a o":"1f,4,1,4","a p":"o,3","a r":"2o","a s":"a,1,h,l,r,6,1,9,4","a t":"1o","a u":"x,n","a v":"o,b,10","a “":"1y","a) ":"13,m,7,d","ab ":"15,1,1,1,4,2,c,4,5","abe":"1m,b,c","abi":"1e","abl":"21","aca":"21","acc":"2,1,o,8,4,g,12","ach":"k,f,4,g,12","ack":"14,e,w","ade":"o,3,w","adi":"18","ads":"24","af ":"1s","aff":"c,4,1x","aft":"b,10","age":"r,a,b,x,d","agg":"2l","agi":"14,e","agl":"1w","agé":"23","ai ":"9","ail":"1g,9","ain":"1y,h,2","ake":"1i,6,2,c,c","al ":"o,10,c","ald":"y,j","ale":"1u,6,c","ali":"1g,n,c,1","all":"l,y,n","als":"2b","alt":"1s","ame":"4,e,8","amp":"1d","an ":"1e,n,8,f","an)":"1d","ana":"1c,d,3,n,1","anc":"26,8","and":"p,7,2,c,7,f,b,e","ane":"t,1,1,1,1,1,1,1,1,1,1,1,10","ani":"13,5,h,a","ano":"4,e","ant":"10,t,5","ao ":"21","ap)":"1l","ape":"1f,15","api":"1n,z,2","app":"5","ar ":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ara":"q,j","arc":"1t","ard":"p,l,m,b,e","ark":"v","arl":"11","arm":"y,2,h","ass":"l,9,2,a","ast":"1q,1,1,1,1,1,1,1,1,1","at ":"6,16,z,1,1,1,1,1,1,1,1,1,1,1,1,1","ata":"13","atc":"e,1,1,1,7,1,2,1","ate":"8,n,1g,1,1,1,1,1,1,1,1,1,1,1,1,1","ati":"s,n,1,1,1,1,1,1,1,1,1,1,i,3,a","ato":"2,1,9,4,p,1,1,1,1,1,1,1,1,1,u,b","ats":"1b","att":"9,5,1,4,1,5,k,s","atu":"1a,b,b,c,1,3,b","auc":"2b","aut":"1o","ave":"1l","avo":"21","awa":"1i,6","ay ":"19,9,9,4","ay)":"o,f,8","ay:":"1o","azi":"s,h,y,3,a","a” ":"1y","b c":"1e,l","b u":"15,1,1,1,4,e,4","bad":"18","ban":"1s,e","bar":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","bee":"2g,2","bel":"1m,b,c","ber":"m","bin":"1e","ble":"1,2,p,19","boo":"n","box":"17","bro":"1r","bru":"t,1,1,1,1,1,1,1,1,1,1,1","buo":"1u,i","bur":"2j","c c":"16","ca ":"1o","cab":"1e","cac":"21","cak":"1q,c,c","cal":"y,j","cam":"1d","can":"4,e","cao":"21","cap":"5","cch":"2,1,w,4,g,12","cci":"5","cco":"24","ccp":"r","ce ":"o,a,j,3,r","ced":"f,3,1,1,5","cha":"7,2,5,1,1,1,7,1,2,1","che":"1m,3,k,b","chi":"2,1,h,8,5,2,4,b,5,1,1,1,3,a,b,b,3","cho":"8,n","chu":"t,1,1,1,1,1,1,1,1,1,1,1","ci ":"16","cin":"5","cit":"1t","ciu":"2h,1","ck ":"1l,2,a,h,8,1,1","ck)":"12","cka":"14,e","ckl":"2k","cla":"u,2,a","cle":"13,b,b,a,p","clo":"s,m,6,f,b,e","co ":"u,2","co)":"26","cof":"d","col":"8,n","com":"11,x","con":"11,5,o,h","cop":"15,3","cos":"24","cou":"26","cp)":"r","cre":"24,7,1,3,1,1,1","cro":"1t","cti":"a,g","cup":"15,3","cur":"2o","cut":"1w","d (":"1w,d","d a":"i","d c":"d","d l":"j,1","d m":"f,a","d o":"13","d t":"1o","d w":"t,1,1,1,1,1,1,1,1,1,1,1","d'o":"1m","d) ":"p,l,x,e","da ":"2o","dai":"1g,9","dar":"p,6,f,m,b,e","day":"o,f","de ":"n,1,3","de)":"1n","dee":"1e","del":"14","den":"1m","der":"s","di ":"q,b,m,z","dia":"18","din":"10,v","dir":"h","dis":"19,2,k","do ":"y,j","doo":"1a","dop":"1b","dor":"w,2,j","dos":"2n","dou":"1,2","dra":"23","dri":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ds ":"1w,8","duc":"q","dul":"1p","duz":"q","e &":"t,1,1,1,1,1,1,1,1,1,1,1,6,a,d,6,j","e (":"o,1,2,6,1,3,1,2,6,1,2,4,4,1,1,2,8,o","e a":"1f,3","e b":"0,1,5,2,1,4,1,1,4,1,3,3,1m","e c":"u,1,2,4,2,i,9,h","e d":"v","e e":"20,7","e g":"l,i,2","e i":"2f,1","e l":"21","e m":"3,l,3,1,16,b","e p":"o,3,d,l,9,5,e,1","e r":"m,t,8,z","e s":"z,k,h,2,1,1,3,5,2,7,1","e t":"1b,1,f,9","e u":"t,1,1,1","e v":"n,f,7","e w":"2b","e y":"2a","e' ":"t,1,1,1,1,1,1,1,1,1,1,1","e) ":"11,a,b,1,8,4","e-a":"1i,6","ea ":"a,1","ead":"24","ean":"13,b,b,a,p","eat":"1b,1,z,1,1,1,1,1,1,1,1,1,1,1,1,1","eck":"2k","ect":"a","ed ":"d,2,3,1,1,5,4,1,1,1,1,1,1,1,1,1,1,1","edu":"1p","ee ":"d","eek":"1p","eep":"1e","eet":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","eez":"1c","ef)":"2n","ego":"1d,9","ekl":"1p","ela":"15,1,1,1,1,1,1,1,1,1,u,b","ele":"a","elf":"12,9,c,a,p","eli":"14,t,3,b,1,1,1,1,1,1,1,1,1,1,1,1,1","ell":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4,f","els":"1m","ema":"o,3,w","eme":"1c,s","emp":"1a,b,d","en ":"1m","ena":"1y","end":"s,b","ene":"1y,3","eni":"10,f,g,p","ent":"10,c,7,b,6,6,1,5","enz":"20","ep ":"o,l,5","epa":"19","epe":"2b,1,3,1,1,1","er ":"o,4,j,1,u,d,5","era":"1a,5,1,1,1,1,1,1,1,1,1,1,f","erd":"n","eri":"4,e","erl":"1y","erm":"1o","ern":"b","ero":"1g,l","err":"m","ers":"q","ert":"1f,15","erv":"y,3,g,3","ery":"14","es ":"16,1,e,5,1,3,8,1,a,a","es:":"q","esp":"0,1,1,19","ess":"0,1,1,1y","est":"1c,7,n","et ":"b,20,1,1,1,1,1,1,1,1,1,1,1,1,1","et)":"1e","et-":"1g,3,c,b","ete":"q","eth":"29","eti":"1m,n","etr":"q,j,5,h,4,h,2","ets":"21","ett":"p,4,1,1,1,1,1,1,1,1,1,1,1,1,h,3,c,8,c","etu":"z,g,1,1,1,1,1,1,1,1,1,1","ey ":"1l","eze":"1c","ezz":"2o","f b":"1s","f d":"13","f l":"12,9,c,a,p","f p":"1s","f) ":"2n","far":"1t","fe ":"12,9,c,a,p","fee":"d","ffe":"d","ffl":"2d","ffo":"c,4","fif":"1m","fin":"13","fla":"6","fle":"2d","fo ":"1m","fog":"c,4","fre":"1c","fte":"b,10","ful":"1y","g \"":"1y","g &":"1e,l,o,1","g (":"10,3,1","g c":"1z,b","g i":"p","g m":"14","g p":"1i,q","g r":"1f","g s":"1k,5,7,1,n","g t":"1i","g) ":"19,m,e","gat":"c,4","ge ":"r,a,18,d","gel":"15,1,1,1,1,1,1,1,1,1,u,b","gem":"1c","ger":"2j","ges":"1c","ggi":"2l","ght":"11","gi ":"2l","gia":"l,1j","gin":"14,e","gio":"o,f,d,9","gle":"0","gli":"1w","gna":"2c","gol":"1d,9","gra":"21","gs ":"2l","gée":"23","h s":"2b","ha ":"7,7,1,1,1,7,1,2,1","hac":"r","hai":"9","hec":"2k","hed":"1p","hel":"12,9,c,a,p","her":"1o","het":"1m,n","hia":"2,1,1i","hie":"l,1,1,3","hin":"z,4,g,12","hio":"k","hip":"d","hit":"6","hiu":"s,5,6,b,6,2,3,a,b,e","hoc":"8,n","hod":"29","hol":"10,o","hot":"8","how":"11","ht ":"11","hur":"t,1,1,1,1,1,1,1,1,1,1,1","i &":"t,1,1,1,1,1,1,1,1,1,1,1,w,1,1,1,1,1,1,1,1,1,1","i (":"1n,k,g","i c":"16,2,u,a","i d":"q","i g":"16","i l":"9,1j","i m":"2l","i n":"11","i p":"q,e,p,1","i s":"1w,o,2","ia ":"13,l,10","ial":"l,1f","ian":"18,w,b,1","iat":"2,1","iav":"1l","ic ":"16","ica":"4,e,16,e","icc":"24","ice":"f,3,1,1,5,9,j,3","ich":"1m,n","ici":"16","ick":"12,j,2,a,p,1,1","ico":"u,2","icu":"2o","ida":"2o","idi":"1n,z","ie ":"l,1,1,12,2","ien":"1y","ier":"1g,v,1,1,1,1,1,1,1,1,1,1,1,1,1","ies":"q,11","ife":"12,9,c,a,p","ifo":"1m","igh":"11","ign":"2c","ily":"1g,9","ima":"1p","ime":"10,j,h,6","in ":"t,1,1,1,1,1,1,1,1,1,1,1","in)":"2f,2","ina":"z,4,6,5,5,c,4","ine":"t,1,1,1,1,1,1,1,1,1,1,1,a,1,4,c,4,1,3,i","ing":"0,p,4,1,1,1,1,3,3,1,1,1,1,1,1,3,2,1,2,1,1,1,5,1,4,1,1,1,1,1,9,1,1,a,1,2,1","ini":"14,u,4","ink":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ino":"5,14","int":"1y","io ":"k,e,j","ion":"a,b,5,2,h,2,1,3,1,1,1,1,1,1,1,1,1,1,7,b,1,2,a,3","ior":"o,f,d,9","ipp":"d","irt":"h","isp":"19,2,k","iss":"1t","ist":"k,1d,n","ita":"2f,1","ite":"6","ith":"2b","iti":"1t","itt":"20,1,1,1,1,1,1,1,1,1,1","ius":"s,5,6,b,6,2,3,a,b,e","iut":"2h,1","ive":"14","ix ":"1n","izi":"y,5,8,6,8,z","k &":"1v","k c":"v,1t","k l":"1x","k m":"1l","k r":"2n","k s":"1n,r,8","k\" ":"1y","k) ":"12","kag":"14,e","ke ":"1i,k,c","ke-":"1i,6","kes":"1q,c","key":"1l","kli":"2k","kly":"1p","ks ":"s","l g":"o","l h":"1o","l l":"1y","l t":"20","la ":"1d,9,c","lab":"15,1,1,1,1,1,1,1,1,1,8,4,1,1,1,1,1,1,1,1,1,a","lai":"2f,2","las":"u,2,a","lat":"6,2,1,5,1,4,1,5,6,a,1,1,1,1,1,1,1,1,1,n,7,b","lay":"19,2,k","ld ":"1o","lde":"1m","ldi":"10","ldo":"y,j","le ":"0,1,2,1a,c,b","le'":"t,1,1,1,1,1,1,1,1,1,1,1","le)":"1m","lea":"13,b,b,a,p","lec":"a","led":"t,1,1,1,1,1,1,1,1,1,1,1","len":"s,12,i","les":"1j,n,7","let":"21","lf ":"12,9,c,a,p","li ":"1w","lia":"2f,1","lie":"1g,v,1,1,1,1,1,1,1,1,1,1,1,1,1","lif":"12,9,c,a,p","lin":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4,3,3,3,6","lis":"1x,n","lit":"20,1,1,1,1,1,1,1,1,1,1","liv":"14","liz":"13,m,z","ll ":"1y","lle":"t,1,1,1,1,1,1,1,1,1,1,1,f,n","lli":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4,f","llo":"l","lo ":"l,g,c","loa":"1s","loo":"1v,3","los":"s,m,6,f,b,e","ls ":"1m,l","lsa":"2b","lta":"o","ltr":"1s","ly ":"1g,9","ly)":"1p","lé ":"z,3","lé)":"x,3","m s":"y,j","m-u":"10","mac":"2,1,w,4,g,12","mad":"o,3,w","mai":"1y","mal":"1o","man":"10,c,d,9","map":"1l","mat":"e,1,1,1,7,1,2,1,h","me ":"11,x,6","mel":"20","men":"10,c,7,n,1","mer":"4,e","met":"q,1j","mia":"1o","mic":"1o","min":"14,y","mix":"1n","moc":"7","moo":"l,1,1,3","mor":"19","mpe":"1a,b","mpo":"1d","mpr":"1y","mul":"t,1,1,1,1,1,1,1,1,1,1,1","n &":"27","n (":"1e","n b":"a,b,8,1,1,1,1,1,1,1,1,1,1,1,q","n c":"s,19,9,a,4","n p":"q","n r":"1m","n s":"29,2","n t":"b","n v":"1e","n) ":"1d,12,2","na ":"o,b,4,6,5,5,9,3,4,g,1","na)":"1p","nag":"1c","nal":"1g","nan":"1s","nat":"13,t,c,4,b","na”":"1y","nca":"2e","nce":"o","nco":"26","nd ":"13","nda":"p,l,m,b,e","nde":"s","ndo":"w,2,j","ne ":"q,2,1,1,1,1,1,1,1,1,1,1,1,1,5,3,3,4,b,6,3,4,3,b","ne)":"1b,k,4","ner":"1y,3,3","nes":"16,o,9","net":"t,1,1,1,1,1,1,1,1,1,1,1,a","ng ":"p,b,3,1,a,1,3,2,5,7,1,1,1,9,2,a,3,1","ng)":"19,m,e","ngl":"0","ngs":"2l","ni ":"t,1,1,1,1,1,1,1,1,1,1,1,2,2,u,i","nic":"22","nie":"1r","nig":"11","nim":"10","nin":"13,6,6,a,6,3,1,9,c,3","nks":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","no ":"4,1,d,17","no)":"o,l","nom":"1o","noo":"b","not":"11","ns ":"1f,1,1,1,1,1,1,1,1,1,1","nse":"11","nt ":"1c,h","nta":"1u,4,e","nte":"10,y,8","nti":"1u,6,7,5","nto":"10,j,n","nts":"1t","nzi":"20","o &":"1m,f","o (":"y,2,d,4,p,b,1","o /":"1p","o b":"2,1,1,1,7,4,2,4,l,1c","o c":"u,2,2,j,p,4","o d":"1,10","o e":"1b","o g":"18,10","o i":"k","o l":"15,1,1,1,1,1,1,1,1,1","o m":"2,1h","o o":"1g","o p":"l,1n","o r":"1d","o s":"0,11,10,4,3,2","o t":"21","o y":"26,2","o) ":"o,a,b,8,5,k","o-y":"20,1,1,1,1,1,1,1,1,1,1","oaf":"1s","och":"7","oco":"8,n","od ":"29","odu":"q","of ":"13","off":"d","oga":"c,4","ois":"1t","ok ":"1v","ok\"":"1y","ola":"8,n,i,9","old":"10,m,2","ole":"21","olo":"1d","ols":"27","olt":"o","ome":"11,x","omi":"1o","on ":"a,1,a,5,2,12,d,3,1,9","ona":"1w,c,f","onc":"o","one":"q,2,1,1,1,1,1,1,1,1,1,1,1,1,2,3,2,1,i,d,3","oni":"t,1,1,1,1,1,1,1,1,1,1,1,2,12,c,3","ono":"1o","ons":"11,e,1,1,1,1,1,1,1,1,1,1","ont":"1u,i","ook":"1v,3","ool":"27","oon":"b","oor":"1a","oos":"n","oot":"l,1,1,3,1q,2","ope":"1f,1,1,1,1,1,1,1,1,1,1,6,p","opo":"1b","opp":"15,3","ora":"r,a,18,d","ord":"1v","ore":"11","orn":"o,f,6,7,9","oro":"w,2,j,5","ors":"1a","ort":"1a,y,f","orz":"1w,c,f","os ":"t","os,":"t,1,1,1,1,1,1,1,1,1,1,1","osa":"24","osc":"2h,1","ose":"s,1v","osi":"1b,3,6,f,b,d,1","oss":"m","ost":"n","ot ":"8","ot)":"2g,2","oth":"l,1,1,3","ott":"11","oub":"1,2","oun":"26","out":"1f,k","ow ":"11","own":"1r","oxe":"17","p &":"10","p (":"19","p a":"1j,n","p c":"18,6,6,2,3","p g":"1g","p m":"o,b","p p":"o","p s":"z,h","p u":"1h,1,1","p v":"1v","p) ":"r,u","pa ":"18","pac":"14,e","pan":"t,1,1,1,1,1,1,1,1,1,1,1,9,4,s,5","par":"q,j","pas":"l,15,1,1,1,1,1,1,1,1,1","pe ":"2b,1,3,1,1,1","ped":"d","pen":"1f,g,p","per":"o,m,5,1,1,1,1,1,1,1,1,1,1,v","pet":"15","pid":"1n,z,2","pie":"1y","pis":"k","pla":"19,2,k,k,2","po ":"1b","pol":"1d","por":"1a,m,c,f","pos":"1b","ppa":"18","ppe":"d,s","ppu":"5","pra":"23","pre":"0,1,1,m,3,i,e,b,6","pro":"q,1r,1","ps ":"15","pse":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","puc":"5","pul":"13,m,z","qui":"12,j,2,a,p,1,1","r &":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","r b":"s","r d":"o,n","r g":"1c","r m":"1c","r s":"s,1e,d,5","ra ":"s,5,d,4,1,5,f,5,4,2,a,3,1","ra)":"1w,d","rag":"r,a,12,6,d","ral":"23","ram":"q","ran":"21","rap":"1n,z,2","rat":"1a,5,1,1,1,1,1,1,1,1,1,1","ray":"1r","raz":"19","rci":"1t","rd ":"1w","rd)":"p,l,x,e","rde":"n","rdi":"1v","rds":"1w","re ":"1a,b,d,e","re)":"11","rea":"1b,1,s,7,1,1,1,1,1,1,1,1,1,1,1,1,1","ree":"1c","ref":"2n","reg":"1d,9","rem":"o,3,w,h","rep":"o,l,12,1,3,1,1,1","res":"0,1,1,1j","rez":"2o","rge":"2j","ri ":"q,12","ric":"4,e,1m","rin":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,h,5,h,4","rk ":"v","rla":"1y","rlo":"11","rm ":"y,j","rm-":"10","rma":"1o","rmi":"1o","rna":"13,d","rni":"19","rno":"b,d,11","ro ":"w,k,l","ro)":"y,j,5","rod":"q","roi":"1t","roo":"2g,2","ros":"m,7,1,1,1,1,1,1,1,1,1,1,1,1d,1","rou":"1f,k","row":"1r","rro":"t,1,1,1,1,1,1,1,1,1,1,1","rry":"m","rs ":"q,k","rte":"1a","rti":"28,f","rtu":"1f,15","rty":"h","rul":"t,1,1,1,1,1,1,1,1,1,1,1,9,9","rum":"27","rva":"11","rvi":"y,j,3","ry ":"m,14,1,1,1,1,1,1,1,1,1","ry)":"14","rzi":"1w,c,f","s &":"1f,1,1,1,1,1,1,1,1,1,1,e","s (":"1a,1,a,1,l,e,2","s b":"1r","s c":"s,1,c,1,n,b","s g":"17","s m":"22","s p":"1q","s s":"q,l,j,j","s t":"1w,5","s, ":"t,1,1,1,1,1,1,1,1,1,1,1","s: ":"q","sa ":"24,7","sal":"2b","san":"1t","sau":"2b","sca":"1d","sch":"1p","sci":"2h,1","sco":"1u","se ":"s","sel":"a,j,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","sem":"1y","sen":"20","ser":"y,3,g,3","ses":"2n","set":"b,e,a,g,1,1,1,1,1,1,1,1,1,1,6,b,f","she":"12,9,c,a,p","si ":"2n","sic":"u,2,a,1i","sig":"2c","sin":"0,1e,6,f,b,e","sio":"l","siz":"1b","sli":"20,1,1,1,1,1,1,1,1,1,1","smo":"l,1,1,3","so ":"0,1,1,k","spl":"19,2,k","spo":"1b","spr":"0,1,1,22","ssa":"1t","sse":"20","ssi":"l,9,2,a","sso":"0,1,1,k","st ":"n,1x","st)":"1x","sta":"k,5,3,i,m,b,3,4,6,1","sti":"1c,7,n","sto":"r,a,18,d","str":"1q,1,1,1,1,1,1,1,1,1,8","sur":"s,5,6,b,6,2,3,a,b,e","swe":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","t a":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","t b":"b,c","t c":"8,2c","t f":"1c,h","t g":"1c","t s":"11","t t":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","t w":"6","t) ":"1e,j,j,2","t-u":"1g,3,c,b","ta ":"o","ta)":"13","tab":"21","tac":"k,1u","tag":"1w,p","tai":"1y","tak":"1i,6","tal":"1u,i,3,1","tan":"p,l,m,b,e","tat":"s,1f,2,1,a","tav":"21","taz":"s,1f,3,a","tch":"e,1,1,1,7,1,2,1","te ":"6,2,1,5,1,4,1,5,6,6,4,5,c,f","tea":"a,1","tel":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","tem":"1a,b","ten":"10,y,3","ter":"b,f,l,d,i","th ":"2b","the":"1o","thi":"l,1,1,3","tho":"29","ti ":"1t,1,6,1,1,1,1,1,1,1,1,1,1,2","tia":"20","tic":"1m,n","tim":"1j,6,b,6","tin":"p,k,6,h,3,m","tio":"a,g,2,k,3,1,1,1,1,1,1,1,1,1,1,i,1,2,a,3","to ":"2,1,9,4,k,1,4,1,1,1,1,1,1,1,1,1,5,n,2,9,1,1","ton":"t,1,1,1,1,1,1,1,1,1,1,1,k","too":"27","tor":"r,a,18,d","tos":"24","tra":"1r","tre":"1b,1,z,1,1,1,1,1,1,1,1,1,1,1,1,1","tri":"q,j,5,e,3,4","tro":"2g,2","tru":"27","try":"1q,1,1,1,1,1,1,1,1,1","ts ":"1b,i,8","tta":"29,c","tte":"9,5,1,4,1,5,c,4,h,f","tti":"p,k,g,7,4,1,1,1,1,1,1,1,1,1,1,b","tto":"t,1,1,1,1,1,1,1,1,1,1,1,10,d,1","tup":"z,g,1,1,1,1,1,1,1,1,1,1","tur":"1a,5,6,b,c,1,3,8,3","ty ":"h","ubl":"1,2","ucc":"5","uce":"2b","uct":"q","uic":"12,j,2,a,p,1,1","ule":"t,1,1,1,1,1,1,1,1,1,1,1,9,9,3","uli":"13,m,z","ull":"t,1,1,1,1,1,1,1,1,1,1,1,u","ulé":"x,2,1,2","ume":"27","una":"o","unt":"26","uon":"1u,i","up ":"z,1,8,8,1,1,1,1,2,3,6,b","ups":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","ura":"s,5,6,7,4,1,5,2,3,7,3,9,1,1,a,3,1","ure":"1a,b,r,c","urg":"2j","urr":"t,1,1,1,1,1,1,1,1,1,1,1","usu":"s,5,6,b,6,2,3,a,b,e","uti":"1f,k","uto":"1o","utt":"1w,l,1","uzi":"q","var":"11","ve ":"1l","ver":"n,h","vet":"19,5,h,4","vic":"y,j,3","vin":"t,1,1,1,1,1,1,1,1,1,1,1","viz":"y,j","vol":"o,1d","w t":"11","waf":"2d","war":"y,2,h","way":"1i,6","wee":"1p,m,1,1,1,1,1,1,1,1,1,1,1,1,1","whi":"6,7","win":"t,1,1,1,1,1,1,1,1,1,1,1","wit":"2b","wni":"1r","x &":"1n","xes":"17","y (":"1v","y /":"1p","y b":"m","y d":"1v","y l":"1q,1,1,1,1,1,1,1,1,1","y m":"h","y o":"1i","y p":"19,9,9","y s":"1g","y t":"1l","y) ":"o,f,1,7,e","y: ":"1o","yo ":"25,1,2,2","yo-":"20,1,1,1,1,1,1,1,1,1,1","za ":"2o","zer":"1c","zia":"13,x,o","zie":"1p","zio":"q,2,6,b,2,6,f,b,1,2,a,3","zza":"2o","é (":"12","é c":"z","é m":"z","é s":"12","é) ":"x,3","ée ":"23","“se":"1y","” p":"1y"}},"es":{"names":["espresso single bar & drinks","espresso double bar & drinks","espresso macchiato bar & drinks","double macchiato bar & drinks","americano bar & drinks","cappuccino bar & drinks","flat white bar & drinks","mocha bar & drinks","hot chocolate bar & drinks","chai latte bar & drinks","tea selection bar & drinks","afternoon tea set bar & drinks","affogato bar & drinks","whipped coffee bar & drinks","matcha latte bar & drinks","iced matcha latte bar & drinks","matcha affogato bar & drinks","dirty matcha bar & drinks","iced americano bar & drinks","iced latte bar & drinks","pistachio iced latte bar & drinks","smoothie giallo passion bar & drinks","smoothie rosso berry bar & drinks","smoothie verde boost bar & drinks","preparar matcha premade (una vez al día) prep matcha premade (una volta al giorno) bar & drinks","setting iced matcha latte (estándar) setting iced matcha latte (standard) bar & drinks","smoothies: parámetros de producción smoothies: parametri di produzione bar & drinks","storage matcha premade (haccp) bar & drinks","cierre estación matcha / blender chiusura stazione matcha / blender bar & drinks chiusura","churros churros, panettoni & vin brule' churros, panettone & vino caliente upselling","panettone classic panettone classico churros, panettoni & vin brule' churros, panettone & vino caliente upselling","panettone dark chocolate churros, panettoni & vin brule' churros, panettone & vino caliente upselling","pandoro classic pandoro classico churros, panettoni & vin brule' churros, panettone & vino caliente upselling","vino caliente (vin brulé) mulled wine (vin brulé) churros, panettoni & vin brule' churros, panettone & vino caliente chiusura upselling","servicio templado (pandoro) servizio caldo (pandoro) churros, panettoni & vin brule' churros, panettone & vino caliente","setup máquina vin brulé setup macchina vin brulé churros, panettoni & vin brule' churros, panettone & vino caliente","calentamiento y mantenimiento (vin brulé) warm-up & mantenimento (vin brulé) churros, panettoni & vin brule' churros, panettone & vino caliente","cómo conservarlo por la noche come conservarlo di notte churros, panettoni & vin brule' churros, panettone & vino caliente","shelf life vin brulé (quick) churros, panettoni & vin brule' churros, panettone & vino caliente","limpieza de máquina (fin de día) pulizia macchina (fine giornata) churros, panettoni & vin brule' churros, panettone & vino caliente chiusura","packaging mini panettone (delivery) churros, panettoni & vin brule' churros, panettone & vino caliente","vasitos coppette gelato lab upselling","conos clásicos coni classici gelato lab upselling","gelato boxes gelato lab upselling","copa badiani coppa gelato gelato lab upselling","preparación vitrina (mañana) preparazione vetrina (mattino) gelato lab","temperatura y puertas (standard) temperatura & porte (standard) gelato lab","shelf life treats (tras exposición) shelf life treats (dopo esposizione) gelato lab","gestión treat freezer gestione treat freezer gelato lab upselling","regla scampolo (1/4 pan) regola scampolo (1/4 pan) gelato lab","cierre y limpieza profunda (vitrina) chiusura & deep clean vetrina gelato lab chiusura","rutina de apertura routine apertura operations & setup","set-up diario set-up giornaliero operations & setup","servicio templado (pandoro) servizio caldo (pandoro) operations & setup upselling","packaging take away operations & setup upselling","set-up de máquina allestimento macchina operations & setup upselling","servicio y cierre service & chiusura operations & setup chiusura upselling","temperaturas clave (quick map) temperature chiave (quick map) operations & setup","fifo y etiquetas (regla de oro) fifo & etichette (regola d'oro) operations & setup chiusura","shelf life rápidas (mix y premade) shelf life rapidi (mix & premade) operations & setup","take-away: autonomía térmica take-away: autonomia termica operations & setup","plan de limpiezas (día / semana) schedule pulizie (giorno / settimana) operations & setup chiusura","cakes pastry lab upselling","brownies brownie tray pastry lab","loaf banana / altri loaf pastry lab","croissants croissant farciti pastry lab","scones scone con buontalenti pastry lab upselling","vitrina pastry (apertura) set-up vetrina (look & ordine) pastry lab","estándares de corte tagli standard (porzionatura) pastry lab","shelf life y etiquetado shelf life (quick list) pastry lab","mantenimiento \"full look\" come mantenerla “sempre piena” pastry lab","cierre y limpieza chiusura vetrina (routine) pastry lab chiusura","timeline esencial timeline essenziale slitti & yo-yo","tabletas lattenero & gran cacao tavolette lattenero & gran cacao slitti & yo-yo","mini cakes minicake slitti & yo-yo","pralines y dragée praline & dragée slitti & yo-yo","cremas slittosa / riccosa / gianera creme slittosa / riccosa / gianera slitti & yo-yo","yo-yo slitti & yo-yo","allestimento yo-yo (banco) slitti & yo-yo","estación y herramientas (standard) stazione e strumenti (standard) slitti & yo-yo","porcionado gelato yo-yo porzionatura gelato yo-yo slitti & yo-yo","pan storage method (etiquetado) pan storage method (etichettatura) slitti & yo-yo","cierre estación yo-yo chiusura stazione yo-yo slitti & yo-yo chiusura","crepe con salsa sweet treat atelier","signature buontalenti crepe sweet treat atelier","waffles sweet treat atelier","pancakes pancake stack sweet treat atelier","crepe italiana crepe italiana (plain) sweet treat atelier","crepe italiana beetroot crepe italiana (beetroot) sweet treat atelier","crepe prosciutto crepe prosciutto (plain) sweet treat atelier","crepe prosciutto beetroot crepe prosciutto (beetroot) sweet treat atelier","gelato burger sweet treat atelier","checklist de apertura (estaciones) checklist apertura stazioni sweet treat atelier","ajustes de máquinas (standard) settaggi macchine (standard) sweet treat atelier","shelf life y storage rápido shelf life & storage rapidi sweet treat atelier","porcionado y dosis (quick ref) porzionatura & dosi (quick ref) sweet treat atelier","cierre y limpieza rápida chiusura & pulizia rapida sweet treat atelier sicurezza chiusura"],"prefix":{"1":"1d","4":"1d","a":"4,7,1,4,2,6,r,3,1,5,4,3,b,5,1,1,1,1,1,1,1,1,1,1,1,1,1","af":"b,1,4","aj":"2l","al":"o,v,9,e","am":"4,e","ap":"1f,g,p","at":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","au":"1o","aw":"1i,6","b":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,j,1,2,c,6,4,2,1","ba":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,g,k,e","be":"m,1u,2","bl":"s","bo":"n,k","br":"t,1,1,1,1,1,1,1,1,1,1,1,n","bu":"1u,i,7","c":"5,3,1,4,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,6,3,3,1,1,3,1,3,1,2,2,1,2,1,2,6,1,1,3,1,1,1,2,4","ca":"5,o,1,1,1,1,1,1,1,1,1,1,1,d,9,b,1","ch":"8,1,j,1,1,1,1,1,1,1,1,1,1,1,1,a,6,1,1,3,a,b,a,4","ci":"s,m,6,f,b,e","cl":"u,2,a,8,7","co":"d,o,4,1,2,m,2,2,d","cr":"1t,b,7,1,3,1,1,1","có":"11","d":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,2,1,7,3,1,1,3,3,3,7,7,h,1,2","da":"v","de":"q,d,1,a,1,4,3,3,7,o,1","di":"h,9,b,f","do":"1,2,18,1c","dr":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1b","dí":"o,f,m","e":"0,1,1,n,3,j,b,a,1,3,7,2,1,a","es":"0,1,1,n,3,j,l,4,7,3,a","et":"1m,b,c","ex":"1b","f":"6,x,9,a,7,5","fa":"1t","fi":"13,j","fl":"6","fr":"1c","fu":"1y","g":"l,3,f,2,1,1,1,1,1,1,1,1,1,2,9,c,3,4,b","ge":"15,1,1,1,1,1,1,1,1,1,u,b","gi":"l,3,f,d,9,f","gr":"21","h":"8,j,1g","ha":"r","he":"27","ho":"8","i":"f,3,1,1,5,1q,1","ic":"f,3,1,1,5","it":"2f,1","l":"9,5,1,4,1,5,c,1,1,2,1,1,1,1,1,1,1,1,1,9,2,1,1,1,1,1,1,1,1,1,1,2,l,2","la":"9,5,1,4,1,5,c,4,1,1,1,1,1,1,1,1,1,c,1,1,1,1,1,1,1,1,1,2","li":"12,1,8,3,9,2,8,2,n,2","lo":"1s,3,3","m":"2,1,4,7,1,1,1,7,1,2,1,5,2,1,3,1,5,a,2,2,b,4,7,c","ma":"2,1,b,1,1,1,7,1,2,1,7,1,3,6,a,2,d,n","me":"29","mi":"14,j,f","mo":"7","mu":"x","má":"z,4,g,12","n":"11","no":"11","o":"1f,1,1,1,1,1,1,1,1,1,1,6","op":"1f,1,1,1,1,1,1,1,1,1,1","or":"1m,9","p":"k,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,1,5,1,3,1,3,1,5,2,1,1,1,1,1,1,1,1,1,1,4,5,1,5,1,2,1,5,1","pa":"l,5,3,1,1,1,1,1,1,1,1,1,1,1,9,4,1,8,1,1,1,1,1,1,1,1,1,a,5","pi":"k,1e","pl":"1p,q,2","po":"11,9,m,c,f","pr":"o,2,1,i,5,9,g,e,1","pu":"13,7,f,z","q":"12,j,c,q","qu":"12,j,c,q","r":"m,r,2,7,1,c,5,i,1,1","ra":"1n,z,2","re":"1d,9,11","ri":"24","ro":"m,t,k","ru":"1f","rá":"1n,z,2","s":"0,a,1,a,1,1,2,1,1,1,6,1,3,8,1,2,2,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","sa":"2b","sc":"1d,c,5","se":"a,1,e,9,1,g,1,1,1,1,1,1,1,1,1,1,6,3,n","sh":"12,9,c,a,p","si":"0,2c,c","sl":"20,1,1,1,1,1,1,1,1,1,1","sm":"l,1,1,3","st":"p,2,1,i,m,b,2,1,4,6,1,1","sw":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","t":"a,1,n,c,1,1,5,1,3,3,3,5,4,1,a,1,1,1,1,1,1,1,1,1,1,1,1,1","ta":"1i,6,8,5","te":"a,1,n,c,7,4,3","ti":"20","tr":"1b,1,f,k,1,1,1,1,1,1,1,1,1,1,1,1,1","té":"1o","u":"o,5,1,1,1,1,3,5,1,1,1,4,4,1,1,1,1,6,4,1","un":"o","up":"t,1,1,1,1,3,5,1,1,1,4,4,1,1,1,1,6,4,1","v":"n,1,5,1,1,1,1,1,1,1,1,1,1,1,1,4,5,h,4","va":"15","ve":"n,1,l,5,h,4","vi":"t,1,1,1,1,1,1,1,1,1,1,1,5,5,h","vo":"o","w":"6,7,k,3,1d","wa":"10,1d","wh":"6,7","wi":"x","y":"10,a,4,6,2,1,a,2,1,1,1,1,1,1,1,1,1,1,1,c,1,1","yo":"20,1,1,1,1,1,1,1,1,1,1"},"tri":{" \"f":"1y"," & ":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,4,1,1,1,1,1,1,1,1,1,1,1,6,5,1,1,1,1,1,1,1,1,1,1,c,1,1"," (1":"1d"," (a":"1v"," (b":"26,a,2"," (d":"14,7,e"," (e":"p,1k,b"," (f":"13"," (g":"1p"," (h":"r"," (l":"1v"," (m":"19,e"," (p":"y,j,f,j,2"," (q":"12,j,c,q"," (r":"1m,d"," (s":"p,l,x,e"," (t":"1b"," (u":"o"," (v":"x,3,e"," / ":"s,x,3,c"," af":"g"," al":"o,v,9"," am":"i"," ap":"1f,15"," at":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1"," au":"1o"," aw":"1i"," ba":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,g,k"," be":"m,1u,2"," bl":"s"," bo":"n,k"," br":"t,1,1,1,1,1,1,1,1,1,1,1,n"," bu":"1u,i,7"," ca":"t,1,1,1,1,1,1,1,1,1,1,1,d,k,1"," ch":"8,k,1,1,1,1,1,1,1,1,1,1,1,1,a,6,1,1,3,a,b,a,4"," ci":"1k"," cl":"u,2,a,8,7"," co":"d,o,4,1,2,m,2,2,d"," cr":"1t,b,8,3,1,1,1"," d'":"1m"," da":"v"," de":"q,d,b,1,4,3,3,7,o,1"," di":"q,b,f"," do":"1,2m"," dr":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1b"," dí":"o,f"," e ":"27"," es":"s,j,p,a"," et":"1m,b"," ex":"1b"," fa":"1t"," fi":"1m"," fr":"1c"," ge":"15,1,1,1,1,1,1,1,1,1,u"," gi":"l,3,f,d,o"," gr":"21"," he":"27"," ic":"k,5"," it":"2f,1"," la":"9,5,1,4,1,5,c,4,1,1,1,1,1,1,1,1,1,c,1,1,1,1,1,1,1,1,1,2"," li":"12,9,3,9,2,8,2,n,2"," lo":"1s,6"," ma":"2,1,c,2,7,1,2,1,7,1,3,g,2,d,n"," me":"29"," mi":"14,y"," mu":"x"," má":"z,4,g,12"," no":"11"," op":"1f,1,1,1,1,1,1,1,1,1,1"," or":"1m,9"," pa":"l,5,3,1,1,1,1,1,1,1,1,1,1,1,9,d,1,1,1,1,1,1,1,1,1,a,5"," pi":"1y"," po":"11,9,y,f"," pr":"o,2,1,i,5,9,g,e,1"," pu":"13,7,f,z"," ra":"1n,z,2"," re":"1d,1a"," ri":"24"," ro":"m,t"," rá":"1n,z,2"," sa":"2b"," sc":"1d,c,5"," se":"a,1,e,9,1,g,1,1,1,1,1,1,1,1,1,1,6,q"," sh":"1b,c,a,p"," si":"0,2o"," sl":"20,1,1,1,1,1,1,1,1,1,1"," sm":"q"," st":"s,14,b,2,1,4,6,2"," sw":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1"," ta":"1i,6,8,5"," te":"b,n,c,7,4,3"," ti":"20"," tr":"1b,1,f,k,1,1,1,1,1,1,1,1,1,1,1,1,1"," té":"1o"," up":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4"," ve":"n,1,l,5,h,4"," vi":"t,1,1,1,1,1,1,1,1,1,1,1,5"," vo":"o"," wa":"10"," wh":"6"," wi":"x"," y ":"10,a,4,6,2,1,a,2,4,4,f,1,1"," yo":"20,1,1,1,1,1,1,1,1,1,1"," “s":"1y","\" c":"1y","\"fu":"1y","& c":"1k","& d":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,m,p,k","& e":"1m","& g":"21","& m":"10","& o":"1v","& p":"1a,d,11","& s":"1f,1,1,1,1,1,1,1,1,1,1,x","& v":"t,1,1,1,1,1,1,1,1,1,1,1","& y":"20,1,1,1,1,1,1,1,1,1,1","' c":"t,1,1,1,1,1,1,1,1,1,1,1","'or":"1m","(1/":"1d","(ap":"1v","(ba":"26","(be":"2g,2","(de":"14","(do":"1b","(dí":"1p","(es":"p,1v","(et":"29","(fi":"13","(gi":"1p","(ha":"r","(lo":"1v","(ma":"19","(mi":"1n","(pa":"y,j","(pl":"2f,2","(po":"1w","(qu":"12,j,c,q","(re":"1m","(ro":"1z","(st":"p,l,x,e","(tr":"1b","(un":"o","(vi":"x,3,e",") b":"o,1,2",") c":"x,1,2,2,1,1,a,16",") f":"1m",") g":"19,1,1,2",") m":"x",") o":"1h,4,1,1,2",") p":"o,f,6,m,1,1,2,a,e",") r":"1d",") s":"p,9,d,6,6,2,6,b,1,2,6,1,1,1,3,2",") t":"1a,b",") w":"10",", p":"t,1,1,1,1,1,1,1,1,1,1,1","-aw":"1o","-up":"10,g,3,c","-yo":"20,1,1,1,1,1,1,1,1,1,1","/ a":"1s","/ b":"s","/ g":"24","/ r":"24","/ s":"1p","/4 ":"1d","1/4":"1d","4 p":"1d",": a":"1o",": p":"q","a &":"1a,4,19,1","a (":"13,6,5,h,4,g,1,4","a /":"s,x,3,c","a a":"g,8,v","a b":"7,a,r,18","a c":"1z,5,b,9","a d":"13,c,7","a g":"18,6,u","a l":"e,1,a","a m":"13","a n":"11","a o":"1f,4,1,4","a p":"o,3,n,h","a r":"1f,19","a s":"a,1,h,l,r,6,1,9,4","a t":"1o","a u":"x,n","a v":"o,b,10","a y":"1a","a “":"1y","a) ":"o,f,6,5,b,6,1,d","ab ":"15,1,1,1,4,2,c,4,5","abl":"21","aca":"21","acc":"2,1,o,8,4,g,12","ach":"k","aci":"s,h,y,3,a","ack":"14,e,w","ade":"o,3,w","adi":"18","ado":"y,j,g,b,1,e","af ":"1s","aff":"c,4,1x","aft":"b","age":"r,1i,d","agg":"2l","agi":"14,e","agl":"1w","agé":"23","ai ":"9","ain":"2f,2","aju":"2l","ake":"1i,6,2,c,c","al ":"o,1c","ald":"y,j","ale":"10,u,6,c","ali":"t,1,1,1,1,1,1,1,1,1,1,1,c,n,c,1","all":"l,y,n","als":"2b","alt":"1s","ame":"4,e,8","ami":"10,17","amp":"1d","an ":"1e,b,c,8","an)":"1d","ana":"19,g,3,n,1","anc":"26,8","and":"p,7,2,c,7,f,b,e","ane":"t,1,1,1,1,1,1,1,1,1,1,1,10","ani":"18","ano":"4,e","ant":"10,t,5","ao ":"21","ap)":"1l","ape":"1f,g,p","api":"1n,z,2","app":"5","ar ":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ar)":"p","ara":"o,2,j","arc":"1t","ard":"p,l,m,b,e","are":"1w","ari":"1g","ark":"v","arl":"11","arm":"10","ará":"q","as ":"1a,1,a,1,1,2,c,3,3,e","asi":"15","ass":"l,9,2,a","ast":"1q,1,1,1,1,1,1,1,1,1","at ":"6,16,z,1,1,1,1,1,1,1,1,1,1,1,1,1","ata":"13","atc":"e,1,1,1,7,1,2,1","ate":"8,n,1g,1,1,1,1,1,1,1,1,1,1,1,1,1","ati":"1f,1,1,1,1,1,1,1,1,1,1","ato":"2,1,9,4,p,1,1,1,1,1,1,1,1,1,u,b","ats":"1b","att":"9,5,1,4,1,5,k,s","atu":"1a,b,b,c,1,3,b","aut":"1o","ave":"1l","avo":"21","awa":"1i,6","ay ":"1i,9","ay:":"1o","azi":"s,h,y,3,a","aña":"19","a” ":"1y","b c":"1e,l","b u":"15,1,1,1,4,e,4","bad":"18","ban":"1s,e","bar":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","bee":"2g,2","ber":"m","ble":"1,2,p,19","boo":"n","box":"17","bro":"1r","bru":"t,1,1,1,1,1,1,1,1,1,1,1","buo":"1u,i","bur":"2j","c p":"u,2","ca ":"1o","cac":"21","cak":"1q,c,c","cal":"t,1,1,1,1,1,1,1,1,1,1,1,d","cam":"1d","can":"4,e","cao":"21","cap":"5","cch":"2,1,w,4,g,12","cci":"5,l","cco":"24","ccp":"r","ce ":"1k","ced":"f,3,1,1,5","cha":"7,2,5,1,1,1,7,1,2,1","che":"11,l,3,k,b","chi":"2,1,h,8,5,2,4,b,5,1,1,1,3,a,b,b,3","cho":"8,n","chu":"t,1,1,1,1,1,1,1,1,1,1,1","ci ":"16","cia":"20","cie":"s,m,6,f,b,e","cin":"5","cio":"y,j,3,o,c,3","cit":"1t","ciu":"2h,1","ció":"q,2,h,2,w,3","ck ":"1l,c,h,9","ck)":"12","cka":"14,e","ckl":"2k","cla":"u,2,a,f","cle":"1e","clá":"16","co ":"u,2","co)":"26","cof":"d","col":"8,n","com":"11,x","con":"11,5,o,h","cop":"15,3","cor":"1w","cos":"16,y","cp)":"r","cre":"24,7,1,3,1,1,1","cro":"1t","cti":"a","cur":"2o","cóm":"11","d (":"1w,d","d a":"i","d c":"d","d l":"j,1","d m":"f,a","d w":"x","d'o":"1m","d) ":"p,l,x,e","da ":"1e,1a","dar":"p,6,f,m,b,e","das":"1n","de ":"n,1,2,1,c,c,4,3,3,7,o,1","de)":"1n","dee":"1e","del":"14","der":"s","di ":"q,b,m,z","dia":"18,8","din":"1v","dir":"h","do ":"y,j,g,b,e,1","do)":"29","dop":"1b","dor":"w,2,j","dos":"2n","dou":"1,2","dra":"23","dri":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","duc":"q","dul":"1p","duz":"q","día":"o,f,m","e &":"t,1,1,1,1,1,1,1,1,1,1,1,g,j,j","e (":"o,1,2,6,7,6,b,1,3,8,o","e a":"1f,3,12","e b":"0,1,5,2,1,4,1,1,4,1,3,3,1m","e c":"u,1,2,4,2,i,9,2,f","e d":"v,8","e e":"s,18,7,3","e g":"l,i,2","e i":"2f,1","e l":"1p,c","e m":"3,o,1,b,g,f,b,c","e o":"1m","e p":"q,z,9,5,e,1","e r":"m,11,z","e s":"1k,g,2,1,1,3,5,2","e t":"1b,1,f,5","e u":"t,1,1,1","e v":"n,f,7","e y":"1e,j,2,b,c,2","e' ":"t,1,1,1,1,1,1,1,1,1,1,1","e) ":"1b,c,8,4","e-a":"1o","ea ":"a,1","ean":"1e","eat":"1b,1,z,1,1,1,1,1,1,1,1,1,1,1,1,1","eck":"2k","ect":"a","ed ":"d,2,3,1,1,5,8","edu":"1p","ee ":"d","eep":"1e","eet":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","eez":"1c","ef)":"2n","egl":"1d,9","ego":"1d,9","ela":"15,1,1,1,1,1,1,1,1,1,u,b","ele":"a","elf":"12,9,c,a,p","eli":"14,w,b,1,1,1,1,1,1,1,1,1,1,1,1,1","ell":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","ema":"o,3,w,2,f","eme":"24","emp":"y,c,7,4,d","ena":"1y","enc":"20","end":"s","ene":"1y,3","eni":"10,y","ent":"t,1,1,1,1,1,1,1,1,1,1,1,f,b,4,8,1,5","enz":"20","ep ":"o,q","epa":"o,l","epe":"2b,1,3,1,1,1","er ":"s,k,17,5","era":"1a,5,1,1,1,1,1,1,1,1,1,1,f","erd":"n","eri":"4,e","erl":"1y","erm":"1o","ern":"b","ero":"1g,l","err":"m,6,m,6,f,8,3,e","ert":"1a,5,g,p","erv":"y,3,g,3","ery":"14","es ":"17,j,1,3,2,6,1,a,1,7","es)":"2k","es:":"q","ese":"20","esp":"0,1,1,19","ess":"0,1,1,1y","est":"p,3,k,7,d,a,1,3,a","et ":"b,20,1,1,1,1,1,1,1,1,1,1,1,1,1","et-":"1g,3,c","eta":"1m,b,4,8","eth":"29","eti":"1m,b,c","etr":"q,j,5,h,4,h,2","ett":"p,4,1,1,1,1,1,1,1,1,1,1,1,1,h,3,c,8,c","etu":"z,g,1,1,1,1,1,1,1,1,1,1","exp":"1b","ez ":"o","eza":"13,b,b,a,p","eze":"1c","ezz":"2o","f b":"1s","f l":"12,9,c,a,p","f p":"1s","f) ":"2n","far":"1t","fe ":"12,9,c,a,p","fee":"d","ffe":"d","ffl":"2d","ffo":"c,4","fif":"1m","fin":"13","fla":"6","fle":"2d","fo ":"1m","fog":"c,4","fre":"1c","fte":"b","ful":"1y","fun":"1e","g i":"p","g m":"14","g t":"1i","gat":"c,4","ge ":"r,1i,d","gel":"15,1,1,1,1,1,1,1,1,1,u,b","ger":"2j","ges":"1c","ggi":"2l","gi ":"2l","gia":"l,1j","gin":"14,e","gio":"o,f,d,9","gla":"1d,9","gle":"0","gli":"1w","gna":"2c","gol":"1d,9","gra":"21","gée":"23","ha ":"7,7,1,1,1,7,1,2,1","hac":"r","hai":"9","he ":"11","hec":"2k","hed":"1p","hel":"12,9,c,a,p","her":"27","het":"1m,n","hia":"2,1,1i","hie":"l,1,1,3","hin":"z,4,g,12","hio":"k","hip":"d","hit":"6","hiu":"s,5,6,b,6,2,3,a,b,e","hoc":"8,n","hod":"29","hot":"8","hur":"t,1,1,1,1,1,1,1,1,1,1,1","i &":"t,1,1,1,1,1,1,1,1,1,1,1,w,1,1,1,1,1,1,1,1,1,1","i (":"1n,k,g","i c":"16,2,u,a","i d":"q","i g":"16","i l":"9,1j","i m":"2l","i n":"11","i p":"q,e,p,1","i s":"1w,o,2","ia ":"13,l,10","ial":"l,1f","ian":"18,w,b,1","iar":"1g","iat":"2,1","iav":"1l","ic ":"u,2","ica":"4,e,16,e","icc":"24","ice":"f,3,1,1,5,v","ich":"1m,n","ici":"y,8,5,6,3","ick":"12,j,c,q","ico":"u,2,a","icu":"2o","ida":"1n,11","idi":"1n,z","ido":"2m","ie ":"l,1,1,12,2","ien":"t,1,1,1,1,1,1,1,1,1,1,1,u,9","ier":"s,m,2,4,f,b,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ies":"q,11","iez":"13,b,b,a,p","ife":"12,9,c,a,p","ifo":"1m","ign":"2c","ima":"1p","ime":"10,j,h,6","imi":"10,y","imp":"13,b,b,a,p","in ":"t,1,1,1,1,1,1,1,1,1,1,1","in)":"2f,2","ina":"z,4,6,5,1,4,c,4,m","ine":"x,6,c,g,4,1,3,i","ing":"0,p,4,1,1,1,1,7,1,1,1,1,4,5,1,1,1,6,4","ini":"14,y","ink":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ino":"5,o,1,1,1,1,1,1,1,1,1,1,1,5","io ":"k,e,i,1,3","ion":"a,b,5,2,h,2,1,3,1,1,1,1,1,1,1,1,1,1,7,b,1,2,a,3","ior":"o,f,d,9","ipp":"d","iqu":"1m,b,c","irt":"h","is ":"2n","iss":"1t","ist":"k,1d,n","ita":"2f,1","ite":"6","iti":"1t","ito":"15","itr":"19,5,h","itt":"20,1,1,1,1,1,1,1,1,1,1","ius":"s,5,6,b,6,2,3,a,b,e","iut":"2h,1","ive":"14","ix ":"1n","izi":"y,5,8,6,8,z","ión":"q,2,h,2,1,v,3","jus":"2l","k &":"1v","k c":"v","k l":"1x","k m":"1l","k r":"2n","k s":"2e","k\" ":"1y","k) ":"12","kag":"14,e","ke ":"1i,k,c","ke-":"1o","kes":"1q,c,c","kli":"2k","ks ":"s","l d":"o","l g":"o","l l":"1y","l t":"20","la ":"11,c,9,c","lab":"15,1,1,1,1,1,1,1,1,1,c,1,1,1,1,1,1,1,1,1","lad":"y,j","lai":"2f,2","lan":"1p","las":"u,2,a","lat":"6,2,1,5,1,4,1,5,6,a,1,1,1,1,1,1,1,1,1,n,7,b","lav":"1l","ldo":"y,j","le ":"0,1,2,1m,b","le'":"t,1,1,1,1,1,1,1,1,1,1,1","lea":"1e","lec":"a","led":"x","len":"s,8,u,i","les":"1j,n,7","let":"21","lf ":"12,9,c,a,p","li ":"1w","lia":"2f,1","lie":"t,1,1,1,1,1,1,1,1,1,1,1,c,v,1,1,1,1,1,1,1,1,1,1,1,1,1","lif":"12,9,c,a,p","lim":"13,b,b,a,p","lin":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4,6,3","lis":"1x,n","lit":"20,1,1,1,1,1,1,1,1,1,1","liv":"14","liz":"13,m,z","ll ":"1y","lle":"x,m,n","lli":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","llo":"l","lo ":"l,g,c","loa":"1s","loo":"1v,3","lsa":"2b","lta":"o","ltr":"1s","lás":"16","lé ":"z,3","lé)":"x,3","m-u":"10","mac":"2,1,w,4,g,12","mad":"o,3,w","man":"10,p,9","map":"1l","mas":"24","mat":"e,1,1,1,7,1,2,1,h","mañ":"19","me ":"11,x,6","mel":"20","men":"10,j,n,1","mer":"4,e","met":"q,1j","mia":"1o","mic":"1o","mie":"10,y,9","min":"14,y","mix":"1n","mo ":"11","moc":"7","moo":"l,1,1,3","mpe":"1a,b","mpi":"13,b,b,a,p","mpl":"y,j","mpo":"1d","mpr":"1y","mul":"x","máq":"z,4,g,12","mía":"1o","n b":"a,b,8,1,1,1,1,1,1,1,1,1,1,1,q","n c":"21","n d":"13,m","n m":"s","n s":"q,1j,2","n t":"b,11","n v":"19,5","n y":"27,3","n) ":"1b,2,12,2","na ":"o,b,4,6,5,1,4,9,3,4,g,1","na)":"19,5,b","nad":"28,f","nal":"1g","nan":"1s","nas":"2l","nat":"13,t,c,4,b","na”":"1y","nca":"2e","nci":"20","nco":"26","nda":"p,l,4,i,b,e","nde":"s","ndo":"w,2,j","ne ":"q,2,1,1,1,1,1,1,1,1,1,1,1,1,5,3,3,f,6,3,4,3,b","ne)":"1b,k,4","ner":"1y,3,3","nes":"1u,9,h","net":"t,1,1,1,1,1,1,1,1,1,1,1","ng ":"p,f,e","ngl":"0","ni ":"t,1,1,1,1,1,1,1,1,1,1,1,2,2,u,i","nic":"22","nie":"1r","nim":"10,y","nks":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","no ":"4,1,d,b,1,1,1,1,1,1,1,1,1,1,1,l","no)":"o,l","noc":"11","nom":"1o","noo":"b","nos":"16","not":"11","ns ":"1f,1,1,1,1,1,1,1,1,1,1","nse":"11","nt ":"1t","nta":"10,u,d,5","nte":"t,1,1,1,1,1,1,1,1,1,1,1,u","nti":"1u,d,5","nto":"10,j,f,8","nts":"1t","nzi":"20","o \"":"1y","o &":"1m,f","o (":"y,2,d,4,p,b,1","o /":"1p","o b":"2,1,1,1,7,4,2,4,l,1b,1","o c":"t,1,1,1,1,1,1,1,1,1,1,1,d,t,7","o d":"1,10","o e":"1b","o g":"18,10","o i":"k","o l":"15,1,1,1,1,1,1,1,1,1","o m":"2,1h","o o":"1g","o p":"l,g,17","o s":"0,1g,h,4,4,3,2,c","o t":"y,j,k","o y":"10,k,2,k,2,f","o) ":"o,a,b,8,5,k,3","o-y":"20,1,1,1,1,1,1,1,1,1,1","oaf":"1s","och":"7,u","oco":"8,n","od ":"29","odu":"q","off":"d","ofu":"1e","oga":"c,4","ois":"1t","ok ":"1v","ok\"":"1y","ola":"8,n,i,9","ole":"21","olo":"1d","olt":"o","ome":"11,x","omi":"1o","omí":"1o","on ":"a,1,a,19,h","ona":"1w,c,f","one":"q,2,1,1,1,1,1,1,1,1,1,1,1,1,5,2,1,i,d,3,a","oni":"t,1,1,1,1,1,1,1,1,1,1,1,2,1e","ono":"16,i","ons":"11,e,1,1,1,1,1,1,1,1,1,1","ont":"1u,i","ook":"1v,3","oon":"b","oos":"n","oot":"l,1,1,3,1q,2","opa":"18","ope":"1f,1,1,1,1,1,1,1,1,1,1","opo":"1b","opp":"15,3","or ":"11","ora":"r,1i,d","orc":"28,f","ord":"1v","orn":"o,f,d,9","oro":"w,2,j,5","ort":"1a,m","orz":"1w,c,f","os ":"q,3,c,1","os,":"t,1,1,1,1,1,1,1,1,1,1,1","osa":"24","osc":"2h,1","osi":"1b,1c","oss":"m","ost":"n","ot ":"8,28,2","ot)":"2g,2","oth":"l,1,1,3","ott":"11","oub":"1,2","out":"1f,k","own":"1r","oxe":"17","p &":"10","p c":"1e,6,2,3","p d":"1g,3","p g":"1g","p m":"o,b","p u":"1h,1,1","p v":"1v","p) ":"r,u","pa ":"18","pac":"14,e","pan":"t,1,1,1,1,1,1,1,1,1,1,1,9,4,s,5","par":"o,2,j","pas":"l,15,1,1,1,1,1,1,1,1,1","pe ":"2b,1,3,1,1,1","ped":"d","per":"1a,5,1,1,1,1,1,1,1,1,1,1,6,p","pet":"15","pid":"1n,z,2","pie":"13,b,b,9,1,p","pis":"k","pla":"y,j,8,q,2","po ":"1b","pol":"1d","por":"11,9,m,c,f","pos":"1b","ppa":"18","ppe":"d,s","ppu":"5","pra":"23","pre":"0,1,1,m,3,i,e,b","pro":"q,o,13,1","pse":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","puc":"5","pue":"1a","pul":"13,m,z","que":"1m,b,c","qui":"z,3,1,g,2,c,o,2","r &":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","r b":"s","r c":"s","r g":"1c","r l":"11","r m":"o","r s":"2j,5","r) ":"p","ra ":"s,5,d,4,1,5,f,5,4,2,a,3,1","ra)":"1v,1,d","rac":"19","rag":"r,1c,6,d","ral":"23","ram":"q,1h","ran":"21","rap":"1n,z,2","rar":"o","ras":"1b,a","rat":"1a,5,1,1,1,1,1,1,1,1,1,1","ray":"1r","raz":"19","rci":"1t,f,f","rd ":"1w","rd)":"p,l,x,e","rde":"n","rdi":"1v","re ":"s,m,6,1,d,1,b,2,c","rea":"1b,1,z,1,1,1,1,1,1,1,1,1,1,1,1,1","ree":"1c","ref":"2n","reg":"1d,9","rem":"o,3,w,h","rep":"o,l,12,1,3,1,1,1","res":"0,1,1,1u","rez":"2o","rge":"2j","ri ":"q,12","ric":"4,e,1m","rin":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,h,5,h,4","rio":"1g","rk ":"v","rla":"1y","rlo":"11","rm-":"10","rmi":"1o","rna":"13,d","rno":"b,d,11","ro ":"w,k,l","ro)":"y,j,5","rod":"q","rof":"1e","roi":"1t","roo":"2g,2","ros":"m,4,3,1,1,1,1,1,1,1,1,1,1,1,1d,1","rou":"1f,k","row":"1r","rra":"27","rre":"s,m,6,f,b,e","rro":"t,1,1,1,1,1,1,1,1,1,1,1","rry":"m","rta":"1a","rte":"1a,m","rtu":"1f,g,p","rty":"h","rul":"t,1,1,1,1,1,1,1,1,1,1,1","rum":"27","rut":"1f","rva":"11","rvi":"y,j,3","ry ":"m,14,1,1,1,1,1,1,1,1,1","ry)":"14","rzi":"1w,c,f","rám":"q","ráp":"1n,z,2","s &":"1f,1,1,1,1,1,1,1,1,1,1","s (":"1a,1,b,1,2,i,e,2","s b":"1r","s c":"s,1,c,1,f,8","s d":"q,16,p","s e":"1b","s g":"17","s l":"21","s m":"22","s p":"1q,o","s s":"1u,a,9","s y":"23","s) ":"2k","s, ":"t,1,1,1,1,1,1,1,1,1,1,1","s: ":"q","sa ":"24,7","sal":"2b","san":"1t","sca":"1d","sch":"1p","sci":"2h,1","sco":"1u","sel":"a,j,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","sem":"1p,9","sen":"20","ser":"y,3,g,3","set":"b,e,a,g,1,1,1,1,1,1,1,1,1,1,6,q","she":"12,9,c,a,p","si ":"2n","sic":"u,2,a,5,1d","sig":"2c","sin":"0","sio":"l","sis":"2n","sit":"15","siz":"1b","sli":"20,1,1,1,1,1,1,1,1,1,1","smo":"l,1,1,3","so ":"0,1,1,k","spo":"1b","spr":"0,1,1","ssa":"1t","sse":"20","ssi":"l,9,2,a","sso":"0,1,1,k","st ":"n,1x","st)":"1x","sta":"k,5,3,i,m,b,3,4,6,1","ste":"2l","sti":"1c,7,n","sto":"r,1i,d","str":"1q,1,1,1,1,1,1,1,1,1,8","stá":"p,17","sur":"s,5,6,b,6,2,3,a,b,e","swe":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","t a":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","t b":"b,c","t c":"8,28,2","t d":"2k","t f":"1c,h","t t":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","t w":"6","t) ":"1x,j,2","t-u":"1g,3,c","ta ":"o","ta)":"13","tab":"21","tac":"k,8,1f,3,4,6","tad":"1x,c","tag":"1w,p","tak":"1i,6","tal":"1u,i,3,1","tam":"10","tan":"p,l,m,b,e","tas":"1a,c,f,6","tat":"29","tav":"21","taz":"s,1f,3,a","tch":"e,1,1,1,7,1,2,1","te ":"6,2,1,5,1,4,1,5,4,1,1,1,1,4,2,2,5,c,a,5","tea":"a,1","tel":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","tem":"y,c,7,4","ten":"10,y,3","ter":"b,1d","tes":"2l","thi":"l,1,1,3","tho":"29","ti ":"1t,1,6,1,1,1,1,1,1,1,1,1,1,2","tic":"1m,n","tim":"1j,6,b,6","tin":"p,k,6,k","tio":"a,12,3,1,1,1,1,1,1,1,1,1,1","tiq":"1m,b,c","tió":"1c","to ":"2,1,9,4,k,5,1,1,1,1,1,1,1,1,1,5,f,8,2,9,1,1","ton":"t,1,1,1,1,1,1,1,1,1,1,1,k","tor":"r,1i,d","tos":"15,z","tra":"1b,g","tre":"1b,1,z,1,1,1,1,1,1,1,1,1,1,1,1,1","tri":"q,j,5,e,3,4","tro":"q,1q,2","tru":"27","try":"1q,1,1,1,1,1,1,1,1,1","ts ":"1b,i","tta":"29,c","tte":"9,5,1,4,1,5,c,4,h,f","tti":"p,k,g,b,1,1,1,1,1,1,1,1,1,1","tto":"t,1,1,1,1,1,1,1,1,1,1,1,10,d,1","tup":"z,g,1,1,1,1,1,1,1,1,1,1","tur":"1a,5,6,a,1,c,1,3,8,3","ty ":"h","tán":"p,17","tér":"1o","ubl":"1,2","ucc":"5,l","uer":"1a","uet":"1m,b,c","uic":"12,j,c,q","uin":"z,4,g,12","ule":"t,1,1,1,1,1,1,1,1,1,1,1,l","uli":"13,m,z","ull":"x,11","ulé":"x,2,1,2","ume":"27","una":"o","und":"1e","uon":"1u,i","up ":"z,1,g,1,1,1,1,2,3,6","ups":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","ura":"s,5,6,7,4,1,5,1,1,3,6,1,3,9,1,1,a,3,1","ure":"1l,r,c","urg":"2j","urr":"t,1,1,1,1,1,1,1,1,1,1,1","ust":"2l","usu":"s,5,6,b,6,2,3,a,b,e","uti":"1f,k","uto":"1o","utt":"2h,1","uzi":"q","var":"11","vas":"15","ve ":"1l","ver":"n,h","vet":"19,5,h,4","vez":"o","vic":"y,j,3","vin":"t,1,1,1,1,1,1,1,1,1,1,1","vit":"19,5,h","viz":"y,j","vol":"o,1d","waf":"2d","war":"10","way":"1i,6","wee":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","whi":"6,7","win":"x","wni":"1r","x &":"1n","x y":"1n","xes":"17","xpo":"1b","y (":"1v","y b":"m","y c":"1k","y d":"23,k","y e":"1m,b","y h":"27","y l":"1e,c,1,1,1,1,1,1,1,1,1,p","y m":"h,j","y o":"1i","y p":"1a,d,4","y s":"2m","y) ":"14","y: ":"1o","yo ":"25,1,2,2","yo-":"20,1,1,1,1,1,1,1,1,1,1","z a":"o","za ":"13,b,l,p","zas":"1p","zer":"1c","zia":"13,x,o","zie":"1p","zio":"q,2,6,b,2,6,f,b,1,2,a,3","zza":"2o","áme":"q","ánd":"p,17","ápi":"1n,z,2","áqu":"z,4,g,12","ási":"16","é (":"12","é c":"z","é s":"z","é) ":"x,3","ée ":"23","érm":"1o","ía ":"1o,1","ía)":"o,f","ñan":"19","ómo":"11","ón ":"q,2,h,3,v,3","ón)":"1b","“se":"1y","” p":"1y"}},"fr":{"names":["espresso single bar & drinks","espresso double bar & drinks","espresso macchiato bar & drinks","double macchiato bar & drinks","americano bar & drinks","cappuccino bar & drinks","flat white bar & drinks","mocha bar & drinks","chocolat chaud hot chocolate bar & drinks","chai latte bar & drinks","sélection de thés tea selection bar & drinks","afternoon tea set bar & drinks","affogato bar & drinks","whipped coffee bar & drinks","matcha latte bar & drinks","iced matcha latte bar & drinks","matcha affogato bar & drinks","dirty matcha bar & drinks","iced americano bar & drinks","iced latte bar & drinks","pistachio iced latte bar & drinks","smoothie giallo passion bar & drinks","smoothie rosso berry bar & drinks","smoothie verde boost bar & drinks","préparer le matcha premade (une fois par jour) prep matcha premade (una volta al giorno) bar & drinks","setting iced matcha latte (standard) bar & drinks","smoothies : paramètres de production smoothies: parametri di produzione bar & drinks","storage matcha premade (haccp) bar & drinks","clôture station matcha / blender chiusura stazione matcha / blender bar & drinks chiusura","churros churros, panettoni & vin brule' churros, panettone & vin chaud upselling","panettone classique panettone classico churros, panettoni & vin brule' churros, panettone & vin chaud upselling","panettone dark chocolate churros, panettoni & vin brule' churros, panettone & vin chaud upselling","pandoro classique pandoro classico churros, panettoni & vin brule' churros, panettone & vin chaud upselling","vin chaud (vin brulé) mulled wine (vin brulé) churros, panettoni & vin brule' churros, panettone & vin chaud chiusura upselling","service tiède (pandoro) servizio caldo (pandoro) churros, panettoni & vin brule' churros, panettone & vin chaud","setup machine vin brulé setup macchina vin brulé churros, panettoni & vin brule' churros, panettone & vin chaud","chauffe & maintien (vin brulé) warm-up & mantenimento (vin brulé) churros, panettoni & vin brule' churros, panettone & vin chaud","conservation de nuit come conservarlo di notte churros, panettoni & vin brule' churros, panettone & vin chaud","shelf life vin brulé (quick) churros, panettoni & vin brule' churros, panettone & vin chaud","nettoyage machine (fin de journée) pulizia macchina (fine giornata) churros, panettoni & vin brule' churros, panettone & vin chaud chiusura","packaging mini panettone (delivery) churros, panettoni & vin brule' churros, panettone & vin chaud","coupelles coppette gelato lab upselling","cornets classiques coni classici gelato lab upselling","gelato boxes gelato lab upselling","coupe badiani coppa gelato gelato lab upselling","préparation vitrine (matin) preparazione vetrina (mattino) gelato lab","température & portes (standard) temperatura & porte (standard) gelato lab","shelf life treats (après exposition) shelf life treats (dopo esposizione) gelato lab","gestion treat freezer gestione treat freezer gelato lab upselling","règle scampolo (1/4 pan) regola scampolo (1/4 pan) gelato lab","fermeture & nettoyage profond (vitrine) chiusura & deep clean vetrina gelato lab chiusura","routine d'ouverture routine apertura operations & setup","set-up quotidien set-up giornaliero operations & setup","service tiède (pandoro) servizio caldo (pandoro) operations & setup upselling","packaging take away operations & setup upselling","set-up machine allestimento macchina operations & setup upselling","service & fermeture service & chiusura operations & setup chiusura upselling","températures clés (quick map) temperature chiave (quick map) operations & setup","fifo & étiquettes (règle d'or) fifo & etichette (regola d'oro) operations & setup chiusura","shelf life rapides (mix & premade) shelf life rapidi (mix & premade) operations & setup","take-away : autonomie thermique take-away: autonomia termica operations & setup","planning nettoyage (jour / semaine) schedule pulizie (giorno / settimana) operations & setup chiusura","cakes (chocolate, carrot, walnut) cakes pastry lab upselling","brownies brownie tray pastry lab","banana loaf banana / altri loaf pastry lab","croissants garnis croissant farciti pastry lab","scone au gelato scone con buontalenti pastry lab upselling","vitrine pastry (ouverture) set-up vetrina (look & ordine) pastry lab","standards de coupe tagli standard (porzionatura) pastry lab","shelf life & étiquetage shelf life (quick list) pastry lab","maintien \"full look\" come mantenerla “sempre piena” pastry lab","fermeture & nettoyage chiusura vetrina (routine) pastry lab chiusura","timeline essentielle timeline essenziale slitti & yo-yo","tablettes lattenero & gran cacao tavolette lattenero & gran cacao slitti & yo-yo","mini cakes minicake slitti & yo-yo","pralines & dragée praline & dragée slitti & yo-yo","crèmes slittosa / riccosa / gianera creme slittosa / riccosa / gianera slitti & yo-yo","yo-yo slitti & yo-yo","allestimento yo-yo (banco) slitti & yo-yo","station & outils (standard) stazione e strumenti (standard) slitti & yo-yo","portionnage gelato yo-yo porzionatura gelato yo-yo slitti & yo-yo","pan storage method (étiquetage) pan storage method (etichettatura) slitti & yo-yo","fermeture station yo-yo chiusura stazione yo-yo slitti & yo-yo chiusura","crêpe sauce crepe con salsa sweet treat atelier","crêpe buontalenti signature buontalenti crepe sweet treat atelier","waffles sweet treat atelier","pancakes pancake stack sweet treat atelier","italiana classique crepe italiana (plain) sweet treat atelier","italiana betterave crepe italiana (beetroot) sweet treat atelier","prosciutto classique crepe prosciutto (plain) sweet treat atelier","prosciutto betterave crepe prosciutto (beetroot) sweet treat atelier","gelato burger sweet treat atelier","checklist ouverture (stations) checklist apertura stazioni sweet treat atelier","réglages machines (standard) settaggi macchine (standard) sweet treat atelier","shelf life & stockage rapide shelf life & storage rapidi sweet treat atelier","portion & doses (quick ref) porzionatura & dosi (quick ref) sweet treat atelier","fermeture & nettoyage rapide chiusura & pulizia rapida sweet treat atelier sicurezza chiusura"],"prefix":{"1":"1d","4":"1d","a":"4,7,1,4,2,6,n,4,3,1,5,4,2,c,5,1,1,1,1,1,1,1,1,1,1,1,1,1","af":"b,1,4","al":"o,v,9,e","am":"4,e","ap":"1b,4,15","at":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","au":"1o,6","aw":"1i,6","b":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,j,1,2,c,6,4,2,1","ba":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,g,k,e","be":"m,1u,2","bl":"s","bo":"n,k","br":"t,1,1,1,1,1,1,1,1,1,1,1,n","bu":"1u,i,7","c":"5,3,1,4,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,6,3,3,1,1,3,1,3,1,2,2,1,2,1,2,6,1,1,3,1,1,1,2,4","ca":"5,t,j,9,b,1","ch":"8,1,j,1,1,1,1,1,1,1,1,1,1,1,1,a,6,1,1,3,1,9,b,a,4","cl":"s,2,2,a,8,7,u,2","co":"d,o,4,1,2,m,2,2,d","cr":"1t,b,7,1,3,1,1,1","d":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,6,2,1,7,3,1,7,a,7,k","da":"v","de":"a,g,b,2,1,a,i","di":"h,9,b","do":"1,2,18,1c","dr":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1b","e":"0,1,1,19,b,e,7,2","es":"0,1,1,19,p","et":"1m,n","ex":"1b","f":"6,i,f,9,2,6,2,7,5,1,b,e","fa":"1t","fe":"1e,6,f,b,e","fi":"13,j","fl":"6","fo":"o","fr":"1c","fu":"1y","g":"l,3,f,2,1,1,1,1,1,1,1,1,1,2,9,4,1,7,3,4,b","ga":"1t","ge":"15,1,1,1,1,1,1,1,1,1,g,e,b","gi":"l,3,f,d,9,f","gr":"21","h":"8,j","ha":"r","ho":"8","i":"f,3,1,1,5,1q,1","ic":"f,3,1,1,5","it":"2f,1","j":"o,f,m","jo":"o,f,m","l":"9,5,1,4,1,4,1,d,3,1,1,1,1,1,1,1,1,1,9,3,1,1,1,1,1,1,1,1,1,2,l","la":"9,5,1,4,1,5,g,1,1,1,1,1,1,1,1,1,c,1,1,1,1,1,1,1,1,1,2","le":"o","li":"12,9,c,a,p","lo":"1s,3,3","m":"2,1,4,7,1,1,1,7,1,2,1,5,2,1,3,1,5,a,2,2,b,4,7,c","ma":"2,1,b,1,1,1,7,1,2,1,7,1,3,6,a,2,d,n","me":"29","mi":"14,j,f","mo":"7","mu":"x","n":"11,2,b,b,a,p","ne":"13,b,b,a,p","no":"11","nu":"11","o":"1f,1,1,1,1,1,1,1,1,1,1,6,c,d","op":"1f,1,1,1,1,1,1,1,1,1,1","or":"1m,9","ou":"1f,g,c,d","p":"k,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,1,5,1,3,1,3,1,5,2,1,1,1,1,1,1,1,1,1,1,4,5,1,5,1,2,1,5,1","pa":"l,3,2,3,1,1,1,1,1,1,1,1,1,1,1,9,4,1,8,1,1,1,1,1,1,1,1,1,a,5","pi":"k,1e","pl":"1p,q,2","po":"1a,m,c,f","pr":"o,2,1,i,5,9,g,e,1","pu":"13,m,z","q":"12,e,5,c,q","qu":"12,e,5,c,q","r":"m,r,2,7,1,c,5,h,1,1,1","ra":"1n,z,2","re":"1d,9,11","ri":"24","ro":"m,t,k","rè":"1d,9","ré":"2l","s":"0,a,1,a,1,1,2,1,1,1,6,1,3,8,1,2,2,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","sa":"2b","sc":"1d,c,5","se":"a,1,e,9,1,g,1,1,1,1,1,1,1,1,1,1,6,3,n","sh":"12,9,c,a,p","si":"0,2c,c","sl":"20,1,1,1,1,1,1,1,1,1,1","sm":"l,1,1,3","st":"p,2,1,i,m,b,2,1,4,6,1,1","sw":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","sé":"a","t":"a,1,n,c,1,1,5,1,3,3,3,5,4,1,a,1,1,1,1,1,1,1,1,1,1,1,1,1","ta":"1i,6,8,5","te":"a,1,z,b,3","th":"a,1e","ti":"y,j,j","tr":"1b,1,f,k,1,1,1,1,1,1,1,1,1,1,1,1,1","u":"o,5,1,1,1,1,3,5,1,1,1,4,4,1,1,1,1,6,4,1","un":"o","up":"t,1,1,1,1,3,5,1,1,1,4,4,1,1,1,1,6,4,1","v":"n,1,5,1,1,1,1,1,1,1,1,1,1,1,5,5,h,4","ve":"n,m,5,h,4","vi":"t,1,1,1,1,1,1,1,1,1,1,1,5,5,h","vo":"o","w":"6,7,k,3,q,n","wa":"10,q,n","wh":"6,7","wi":"x","y":"20,1,1,1,1,1,1,1,1,1,1","yo":"20,1,1,1,1,1,1,1,1,1,1","é":"1m,b,c","ét":"1m,b,c"},"tri":{" \"f":"1y"," & ":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,6,4,1,1,1,1,1,1,1,1,1,1,1,6,2,2,1,1,1,1,1,1,1,1,1,1,1,c,1,1"," (1":"1d"," (a":"1b"," (b":"26,a,2"," (c":"1q"," (d":"14,7"," (e":"29"," (f":"13"," (g":"1p"," (h":"r"," (j":"1p"," (l":"1v"," (m":"19,e"," (o":"1v"," (p":"y,j,f,j,2"," (q":"12,j,c,q"," (r":"1m,d"," (s":"p,l,x,d,1"," (u":"o"," (v":"x,3,e"," (é":"29"," / ":"s,x,3,c"," : ":"q,y"," af":"g"," al":"o,v,9"," am":"i"," ap":"1f,15"," at":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1"," au":"1o,6"," aw":"1i"," ba":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,g,k"," be":"m,1u,2"," bl":"s"," bo":"n,k"," br":"t,1,1,1,1,1,1,1,1,1,1,1,n"," bu":"1u,i,7"," ca":"y,j,9,b,1"," ch":"8,k,1,1,1,1,1,1,1,1,1,1,1,1,a,6,1,1,3,a,b,a,4"," cl":"u,2,a,8,7,u,2"," co":"d,o,4,1,2,m,2,2,d"," cr":"1t,b,7,1,3,1,1,1"," d'":"1f,7"," da":"v"," de":"a,g,b,2,b,i"," di":"q,b"," do":"1,2m"," dr":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1b"," e ":"27"," es":"1b,p"," et":"1m"," ex":"1b"," fa":"1t"," fe":"1k"," fi":"1m"," fo":"o"," fr":"1c"," ga":"1t"," ge":"15,1,1,1,1,1,1,1,1,1,g,e"," gi":"l,3,f,d,o"," gr":"21"," ho":"8"," ic":"k,5"," it":"2f,1"," jo":"o,f"," la":"9,5,1,4,1,5,g,1,1,1,1,1,1,1,1,1,c,1,1,1,1,1,1,1,1,1,2"," le":"o"," li":"12,9,c,a,p"," lo":"1s,6"," ma":"2,1,c,2,7,1,2,1,7,1,3,g,2,d,n"," me":"29"," mi":"14,y"," mu":"x"," ne":"1e,b,a,p"," no":"11"," nu":"11"," op":"1f,1,1,1,1,1,1,1,1,1,1"," or":"1v"," ou":"27,d"," pa":"l,3,2,3,1,1,1,1,1,1,1,1,1,1,1,9,d,1,1,1,1,1,1,1,1,1,a,5"," pi":"1y"," po":"1a,y,f"," pr":"o,2,1,i,5,9,g,e,1"," pu":"13,m,z"," qu":"1g"," ra":"1n,z,2"," re":"1d,1a"," ri":"24"," ro":"m,t"," sa":"2b"," sc":"1d,c,5"," se":"a,1,n,1,g,1,1,1,1,1,1,1,1,1,1,6,q"," sh":"1b,c,a,p"," si":"0,2c,c"," sl":"20,1,1,1,1,1,1,1,1,1,1"," sm":"q"," st":"s,14,b,2,1,4,6,2"," sw":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1"," ta":"1i,6,8,5"," te":"a,1,z,b,3"," th":"a,1e"," ti":"y,j,j"," tr":"1b,1,f,k,1,1,1,1,1,1,1,1,1,1,1,1,1"," up":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4"," ve":"n,m,5,h,4"," vi":"t,1,1,1,1,1,1,1,1,1,1,1,5"," vo":"o"," wa":"10,q"," wh":"6"," wi":"x"," yo":"20,1,1,1,1,1,1,1,1,1,1"," ét":"1m,b"," “s":"1y","\" c":"1y","\"fu":"1y","& c":"1k","& d":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,m,p,k","& e":"1m","& f":"1k","& g":"21","& m":"10","& n":"1e,l,p","& o":"1v,c","& p":"1a,d,11","& s":"1f,1,1,1,1,1,1,1,1,1,1,x","& v":"t,1,1,1,1,1,1,1,1,1,1,1","& y":"20,1,1,1,1,1,1,1,1,1,1","& é":"1m,b","' c":"t,1,1,1,1,1,1,1,1,1,1,1","'or":"1m","'ou":"1f","(1/":"1d","(ap":"1b","(ba":"26","(be":"2g,2","(ch":"1q","(de":"14","(do":"1b","(et":"29","(fi":"13","(gi":"1p","(ha":"r","(jo":"1p","(lo":"1v","(ma":"19","(mi":"1n","(ou":"1v","(pa":"y,j","(pl":"2f,2","(po":"1w","(qu":"12,j,c,q","(re":"1m","(ro":"1z","(rè":"1m","(st":"p,l,x,d,1","(un":"o","(vi":"x,3,e","(ét":"29",") b":"o,1,2",") c":"x,1,2,2,1,1,a,c,u",") f":"1m",") g":"19,1,1,2",") m":"x",") o":"1h,4,1,1,2",") p":"o,f,6,m,1,1,2,a,e",") r":"1d",") s":"y,d,6,6,2,6,b,1,2,6,1,1,1,3,2",") t":"1a,b",") w":"10",", c":"1q",", p":"t,1,1,1,1,1,1,1,1,1,1,1",", w":"1q","-aw":"1o","-up":"10,g,3,c","-yo":"20,1,1,1,1,1,1,1,1,1,1","/ a":"1s","/ b":"s","/ g":"24","/ r":"24","/ s":"1p","/4 ":"1d","1/4":"1d","4 p":"1d",": a":"1o",": p":"q","a &":"1a,4,19,1","a (":"13,6,m,4,g,1","a /":"s,10,c","a a":"g,8","a b":"7,a,1z","a c":"24,b,9","a d":"1m","a g":"18,6,u","a l":"e,1,a,13","a m":"13","a o":"1f,4,1,4","a p":"o,3","a r":"2o","a s":"a,1,h,l,r,6,1,9,4","a t":"1o","a u":"x,n","a v":"o,b,10","a “":"1y","a) ":"13,m,7,d","ab ":"15,1,1,1,4,2,c,4,5","abl":"21","aca":"21","acc":"2,1,o,8,4,g,12","ach":"k,f,4,g,12","ack":"14,e,w","ade":"o,3,w","adi":"18","af ":"1s","aff":"c,4,1x","aft":"b","age":"r,c,b,b,8,2,9,1,c,1,2","agg":"2l","agi":"14,e","agl":"1w","agé":"23","ai ":"9","ain":"10,p,9,h,2","ake":"1i,6,2,c,c","al ":"o","ald":"y,j","ale":"1u,6,c","ali":"1g,n,c,1","all":"l,y,n","aln":"1q","als":"2b","alt":"1s","ame":"4,e,8","amp":"1d","amè":"q","an ":"1e,n,8","an)":"1d","ana":"1p,3,n,1","anc":"26,8","and":"p,7,2,c,7,f,b,e","ane":"t,1,1,1,1,1,1,1,1,1,1,1,10","ani":"18","ann":"1p","ano":"4,e","ant":"10,t,5","ao ":"21","ap)":"1l","ape":"1f,15","api":"1n,z,2","app":"5","apr":"1b","ar ":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ara":"q,j","arc":"1t","ard":"p,l,m,b,e","are":"o","ark":"v","arl":"11","arm":"10","arn":"1t","arr":"1q","ass":"l,9,2,a,19,2","ast":"1q,1,1,1,1,1,1,1,1,1","at ":"6,2,14,z,1,1,1,1,1,1,1,1,1,1,1,1,1","ata":"13","atc":"e,1,1,1,7,1,2,1","ate":"8,n,v,l,1,1,1,1,1,1,1,1,1,1,1,1,1","ati":"s,9,8,6,1,1,1,1,1,1,1,1,1,1,i,3,a","ato":"2,1,9,4,p,1,1,1,1,1,1,1,1,1,g,e,b","ats":"1b","att":"9,5,1,4,1,5,k,s","atu":"1a,b,b,c,1,3,b","au ":"1u","auc":"2b","aud":"8,l,1,1,1,1,1,1,1,1,1,1,1","auf":"10","aut":"1o","ave":"1l,v,2","avo":"21","awa":"1i,6","ay ":"1i,6,3","ay:":"1o","azi":"s,h,y,3,a","a” ":"1y","b c":"1e,l","b u":"15,1,1,1,4,e,4","bad":"18","ban":"1s,e","bar":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","bee":"2g,2","ber":"m","bet":"2g,2","ble":"1,2,p,19","boo":"n","box":"17","bro":"1r","bru":"t,1,1,1,1,1,1,1,1,1,1,1","buo":"1u,i","bur":"2j","ca ":"1o","cac":"21","cak":"1q,c,c","cal":"y,j","cam":"1d","can":"4,e","cao":"21","cap":"5","car":"1q","cch":"2,1,w,4,g,12","cci":"5","cco":"24","ccp":"r","ce ":"y,j,3,r","ced":"f,3,1,1,5","cha":"7,1,1,5,1,1,1,7,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1","che":"1m,3,k,b","chi":"2,1,h,8,5,2,4,b,5,1,1,1,3,a,b,b,3","cho":"8,n,v","chu":"t,1,1,1,1,1,1,1,1,1,1,1","ci ":"16","cin":"5","cit":"1t","ciu":"2h,1","ck ":"1l,c,h,9","ck)":"12","cka":"14,e,14","ckl":"2k","cla":"u,2,a,19,2","cle":"1e","clé":"1l","clô":"s","co ":"u,2","co)":"26","cof":"d","col":"8,n,v","com":"11,x","con":"11,5,o,h","cop":"15,3","cor":"16","cos":"24","cou":"15,3,o","cp)":"r","cre":"24,7,1,3,1,1,1","cro":"1t","crè":"24","crê":"2b,1","cti":"a,g","cur":"2o","d (":"x,h,i,d","d a":"i","d c":"d,k,6","d h":"8","d l":"j,1","d m":"f,a","d u":"t,1,1,1","d w":"x","d'o":"1f,7","d) ":"p,l,x,e","da ":"2o","dar":"p,6,f,m,b,e","de ":"a,d,1,2,1,7,3,2,e,f,q,2","de)":"1n","dee":"1e","del":"14","der":"s","des":"1n","di ":"q,b,m,z","dia":"18","die":"1g","din":"1v","dir":"h","do ":"y,j","dop":"1b","dor":"w,2,j","dos":"2n","dou":"1,2","dra":"23","dri":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ds ":"1w","duc":"q","dul":"1p","duz":"q","e &":"t,1,1,1,1,1,1,1,1,1,1,1,6,4,6,d,2,4,j,2","e (":"o,1,2,6,1,5,1,5,1,7,4,1,3,8,n,1","e a":"1f,3,1,b","e b":"0,1,5,2,1,4,1,1,4,1,3,3,i,14","e c":"u,1,6,k,9,2,3,c,4,1,1,1,6","e d":"v,k,7","e e":"20,7","e f":"o","e g":"l,i,2,13","e i":"2f,1","e j":"13","e l":"21","e m":"3,l,3,1,b,v,b","e n":"11","e p":"q,4,2,i,b,6,3,5,e,1","e r":"m,t,8,z,2","e s":"s,l,7,d,3,2,1,1,3,3,1,1,2,8","e t":"a,o,d,1,5,7,3,5,4","e v":"n,c,3,7","e y":"2a","e' ":"t,1,1,1,1,1,1,1,1,1,1,1","e) ":"13,8,3,9,2,6,4,a","e, ":"1q","e-a":"1o","ea ":"a,1","ean":"1e","eat":"1b,1,z,1,1,1,1,1,1,1,1,1,1,1,1,1","eck":"2k","ect":"a","ed ":"d,2,3,1,1,5,8","edu":"1p","ee ":"d","eep":"1e","eet":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","eez":"1c","ef)":"2n","ego":"1d,9","ela":"15,1,1,1,1,1,1,1,1,1,g,e,b","ele":"a","elf":"12,9,c,a,p","eli":"14,w,b,1,1,1,1,1,1,1,1,1,1,1,1,1","ell":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4,6","ema":"o,3,w,2","eme":"24","emp":"1a,b,d","en ":"10,g,i","ena":"1y","end":"s","ene":"1y,3","eni":"10","ent":"10,j,b,6,6,1,5","enz":"20","ep ":"o,q","epa":"19","epe":"2b,1,3,1,1,1","er ":"o,4,k,17,5","era":"1a,5,1,1,1,1,1,1,1,1,1,1,f,c,2","erd":"n","eri":"4,e","erl":"1y","erm":"1e,6,4,b,b,e","ern":"b","ero":"1g,l","err":"m","ert":"1f,g,p","erv":"y,3,g,3","ery":"14","es ":"q,f,1,1,3,b,1,1,3,1,a,1,1,1,9,1,7,2","es:":"q","esp":"0,1,1,19","ess":"0,1,1,1y","est":"1c,7,n","et ":"b,20,1,1,1,1,1,1,1,1,1,1,1,1,1","et-":"1g,3,c","eta":"1x,c","eth":"29","eti":"1m,n","etr":"q,j,5,h,4,h,2","ets":"16","ett":"p,4,1,1,1,1,1,1,1,1,1,1,1,1,9,8,3,a,2,8,7,2,3,3","etu":"z,f,1,1,1,1,1,1,1,1,1,1,1,a,b,e","exp":"1b","eze":"1c","ezz":"2o","f b":"1s","f l":"12,9,c,a,p","f p":"1s","f) ":"2n","far":"1t","fe ":"10,2,9,c,a,p","fee":"d","fer":"1e,6,f,b,e","ffe":"d,n","ffl":"2d","ffo":"c,4","fif":"1m","fin":"13","fla":"6","fle":"2d","fo ":"1m","fog":"c,4","foi":"o","fon":"1e","fre":"1c","fte":"b","ful":"1y","g i":"p","g m":"14","g n":"1p","g t":"1i","gar":"1t","gat":"c,4","ge ":"r,c,b,b,8,2,9,1,d,2","ge)":"29","gel":"15,1,1,1,1,1,1,1,1,1,g,e,b","ger":"2j","ges":"1c,19","ggi":"2l","gi ":"2l","gia":"l,1j","gin":"14,e","gio":"o,f,d,9","gla":"2l","gle":"0,1d,9","gli":"1w","gna":"2c","gol":"1d,9","gra":"21","gée":"23","ha ":"7,7,1,1,1,7,1,2,1","hac":"r","hai":"9","hau":"8,l,1,1,1,1,1,1,1,1,1,1,1","hec":"2k","hed":"1p","hel":"12,9,c,a,p","her":"1o","het":"1m,n","hia":"2,1,1i","hie":"l,1,1,3","hin":"z,4,g,12","hio":"k","hip":"d","hit":"6","hiu":"s,5,6,b,6,2,3,a,b,e","hoc":"8,n,v","hod":"29","hot":"8","hur":"t,1,1,1,1,1,1,1,1,1,1,1","hés":"a","i &":"t,1,1,1,1,1,1,1,1,1,1,1,w,1,1,1,1,1,1,1,1,1,1","i (":"1n,k,g","i c":"16,2,u,a","i d":"q","i g":"16","i l":"9,1j","i m":"2l","i n":"11","i p":"q,e,p,1","i s":"1w,g,8,2","ia ":"13,l,10","ial":"l,1f","ian":"18,w,b,1","iat":"2,1","iav":"1l","ica":"4,e,16,e","icc":"24","ice":"f,3,1,1,5,9,j,3","ich":"1m,n","ici":"16","ick":"12,j,c,q","ico":"u,2","icu":"2o","ida":"2o","ide":"1n,z,2","idi":"1g,7,z","ie ":"l,1,1,11,1,2","iel":"20","ien":"10,g,i","ier":"1g,v,1,1,1,1,1,1,1,1,1,1,1,1,1","ies":"q,11","ife":"12,9,c,a,p","ifo":"1m","ign":"2c","ils":"27","ima":"1p","ime":"10,j,h,6","in ":"t,1,1,1,1,1,1,1,1,1,1,1","in)":"19,16,2","ina":"z,4,6,5,5,c,4","ine":"x,2,4,6,5,1,4,6,6,4,1,3,i","ing":"0,p,4,1,1,1,1,7,1,1,1,1,4,5,1,1,1,5,1,4","ini":"14,y","ink":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","ino":"5,14","int":"10,y","io ":"k,e,j","ion":"a,b,5,2,9,8,2,1,3,1,1,1,1,1,1,1,1,1,1,7,b,1,2,a,3","ior":"o,f,d,9","ipp":"d","iqu":"u,2,a,g,2,9,c,6,2","irt":"h","is ":"o,15","iss":"1t","ist":"k,1d,n","it ":"11","ita":"2f,1","ite":"6","iti":"1b,i","itr":"19,5,h","itt":"20,1,1,1,1,1,1,1,1,1,1","ius":"s,5,6,b,6,2,3,a,b,e","iut":"2h,1","ive":"14","ix ":"1n","izi":"y,5,8,6,8,z","ièd":"y,j","jou":"o,f,m","k &":"1v","k c":"v","k l":"1x","k m":"1l","k r":"2n","k s":"2e","k\" ":"1y","k) ":"12","kag":"14,e,14","ke ":"1i,k,c","ke-":"1o","kes":"1q,c,c","kli":"2k","ks ":"s","l g":"o","l l":"1y","la ":"1d,9,c","lab":"15,1,1,1,1,1,1,1,1,1,c,1,1,1,1,1,1,1,1,1","lag":"2l","lai":"2f,2","lan":"1p","las":"u,2,a,19,2","lat":"6,2,1,5,1,4,1,5,6,a,1,1,1,1,1,1,1,1,1,c,4,7,7,b","ldo":"y,j","le ":"0,1,2,l,p,9,3,b","le'":"t,1,1,1,1,1,1,1,1,1,1,1","lea":"1e","lec":"a","led":"x","len":"s,12,i","les":"15,e,n,7","let":"21","lf ":"12,9,c,a,p","li ":"1w","lia":"2f,1","lie":"1g,v,1,1,1,1,1,1,1,1,1,1,1,1,1","lif":"12,9,c,a,p","lin":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4,6,3","lis":"1x,n","lit":"20,1,1,1,1,1,1,1,1,1,1","liv":"14","liz":"13,m,z","ll ":"1y","lle":"x,8,e,h,6","lli":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","llo":"l","lnu":"1q","lo ":"l,g,c","loa":"1s","loo":"1v,3","ls ":"27","lsa":"2b","lta":"o","ltr":"1s","lé ":"z,3","lé)":"x,3","lés":"1l","lôt":"s","m-u":"10","mac":"2,1,w,4,g,12","mad":"o,3,w","mai":"10,p,9","man":"10,p,9","map":"1l","mat":"e,1,1,1,7,1,2,1,h","me ":"11,x,6","mel":"20","men":"10,j,n,1","mer":"4,e","mes":"24","met":"q,o,6,f,a,1,e","mia":"1o","mic":"1o","mie":"1o","min":"14,y","miq":"1o","mix":"1n","moc":"7","moo":"l,1,1,3","mpe":"1a,b","mpo":"1d","mpr":"1y","mpé":"1a,b","mul":"x","mèt":"q","n \"":"1y","n &":"27,g","n (":"10","n b":"a,b,8,1,1,1,1,1,1,1,1,1,1,1,q","n c":"t,1,1,1,1,1,1,1,1,1,1,1,x","n d":"a,r,2","n m":"s","n s":"q,q,t,2","n t":"b,11","n v":"19,5","n y":"2a","n) ":"19,2,2,12,2","na ":"o,b,4,6,5,5,9,3,4,g,1","na)":"1p","nag":"28","nal":"1g","nan":"1s","nat":"13,t,c,4,b","na”":"1y","nca":"2e","nco":"26","nd ":"1e","nda":"p,l,m,b,e","nde":"s","ndo":"w,2,j","ne ":"o,2,2,1,1,1,1,1,1,1,1,1,1,1,1,5,3,3,4,b,1,5,3,4,3,b","ne)":"1b,3,b,6,4","ner":"1y,3,3","nes":"23,i","net":"t,1,1,1,1,1,1,1,1,1,1,1,2,8,b,a,p","ng ":"p,f,e,7","ngl":"0","ni ":"t,1,1,1,1,1,1,1,1,1,1,1,2,2,u,i","nic":"22","nie":"1r","nim":"10","nin":"1p","nis":"1t","nks":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","nna":"28","nni":"1p","no ":"4,1,d,17","no)":"o,l","nom":"1o","noo":"b","not":"11","ns ":"1f,1,1,1,1,1,1,1,1,1,1","ns)":"2k","nse":"11","nt ":"1t","nta":"1u,i","nte":"10,y","nti":"10,u,4,2,7,5","nto":"10,j,n","nts":"1t","nui":"11","nut":"1q","nzi":"20","née":"13","o &":"1m,f","o (":"y,2,d,4,p,b,1","o /":"1p","o b":"2,1,1,1,7,4,2,4,l,1b,1","o c":"u,2,2,j,t,7","o d":"1,10","o e":"1b","o g":"18","o i":"k","o l":"15,1,1,1,1,1,1,1,1,1","o m":"2,1h","o o":"1g","o p":"l,1n","o s":"0,1u,7,4,3,2","o t":"21","o y":"26,2","o) ":"o,a,b,8,5,k","o-y":"20,1,1,1,1,1,1,1,1,1,1","oaf":"1s","och":"7","ock":"2m","oco":"8,n,v","od ":"29","odu":"q","off":"d","ofo":"1e","oga":"c,4","ois":"o,15","ok ":"1v","ok\"":"1y","ola":"8,n,i,9,4","ole":"21","olo":"1d","olt":"o","ome":"11,x","omi":"1o","on ":"a,1,a,5,2,9,8,3,i,d,3,1,c","on)":"1b","ona":"1w,c,f","ond":"1e","one":"q,2,1,1,1,1,1,1,1,1,1,1,1,1,5,2,1,i,d,3","oni":"t,1,1,1,1,1,1,1,1,1,1,1,2,1e","onn":"28","ono":"1o","ons":"11,e,1,1,1,1,1,1,1,1,1,1,v","ont":"1u,i","ook":"1v,3","oon":"b","oos":"n","oot":"l,1,1,3,1q,2","ope":"1f,1,1,1,1,1,1,1,1,1,1","opo":"1b","opp":"15,3","or)":"1m","ora":"r,1i,d","ord":"1v","orn":"o,f,3,a,9","oro":"w,2,j,5","ort":"1a,y,f","orz":"1w,c,f","os ":"t","os,":"t,1,1,1,1,1,1,1,1,1,1,1","osa":"24","osc":"2h,1","ose":"2n","osi":"1b,1c","oss":"m","ost":"n","ot ":"8","ot)":"2g,2","ot,":"1q","oth":"l,1,1,3","oti":"1g","ott":"11","oub":"1,2","oup":"15,3,o","our":"o,f,m","out":"1f,k,8","ouv":"1f,g,p","own":"1r","oxe":"17","oya":"13,b,b,a,p","p &":"10","p c":"1e,6,2,3","p g":"1g","p m":"o,b,k","p q":"1g","p u":"1h,1,1","p v":"1v","p) ":"r,u","pa ":"18","pac":"14,e","pan":"t,1,1,1,1,1,1,1,1,1,1,1,9,4,s,5","par":"o,2,j","pas":"l,15,1,1,1,1,1,1,1,1,1","pe ":"18,o,f,1,3,1,1,1","ped":"d","pel":"15","per":"1a,5,1,1,1,1,1,1,1,1,1,1,v","pet":"15","pid":"1n,z,2","pie":"1y","pis":"k","pla":"1p,q,2","po ":"1b","pol":"1d","por":"1a,m,c,f","pos":"1b","ppa":"18","ppe":"d,s","ppu":"5","pra":"23","pre":"0,1,1,m,3,i,e,b","pro":"q,o,13,1","prè":"1b","pré":"o,l","pse":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","puc":"5","pul":"13,m,z","pér":"1a,b","que":"u,2,a,g,2,9,c,6,2","qui":"12,j,c,q","quo":"1g","r &":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1","r /":"1p","r b":"s","r c":"s","r g":"1c","r j":"o","r l":"o","r s":"2j,5","r) ":"o,y","ra ":"s,5,d,4,1,5,f,5,4,2,a,3,1","ra)":"1w,d","rag":"r,1c,6,d","ral":"23","ram":"q","ran":"21","rap":"1n,z,2","rat":"19,1,5,1,1,1,1,1,1,1,1,1,1","rav":"2g,2","ray":"1r","raz":"19","rci":"1t","rd ":"1w","rd)":"p,l,x,e","rde":"n","rdi":"1v","rds":"1w","re ":"s,i,4,1,5,1,d,1,b,2,8,4","re)":"1v","rea":"1b,1,z,1,1,1,1,1,1,1,1,1,1,1,1,1","ree":"1c","ref":"2n","reg":"1d,9","rem":"o,3,w,h","rep":"o,l,12,1,3,1,1,1","rer":"o","res":"0,1,1,o,v","rez":"2o","rge":"2j","ri ":"q,12","ric":"4,e,1m","rin":"0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,h,5,h,4","rk ":"v","rla":"1y","rlo":"11","rm-":"10","rme":"1e,6,f,b,e","rmi":"1o","rna":"13,d","rne":"16","rni":"1t","rno":"b,d,11","rné":"13","ro ":"w,k,l","ro)":"y,j,5","rod":"q","rof":"1e","roi":"1t","roo":"2g,2","ros":"m,7,1,1,1,1,1,1,1,1,1,1,1,1d,1","rot":"1q","rou":"1f,k","row":"1r","rro":"t,1,1,1,1,1,1,1,1,1,1,1,m","rry":"m","rte":"1a","rti":"28,f","rtu":"1f,g,p","rty":"h","rul":"t,1,1,1,1,1,1,1,1,1,1,1","rum":"27","rva":"11","rvi":"y,j,3","ry ":"m,14,1,1,1,1,1,1,1,1,1","ry)":"14","rzi":"1w,c,f","règ":"1d,9","rèm":"24","rès":"1b","rég":"2l","rép":"o,l","rêp":"2b,1","s &":"1f,1,1,1,1,1,1,1,1,1,1,e","s (":"1a,1,a,1,1,3,h,e,2","s :":"q","s b":"1r","s c":"s,1,c,1,f,8","s d":"q,16","s e":"1b","s g":"17,m","s l":"21","s m":"22,j","s p":"o,12,o","s s":"24,9","s t":"a","s) ":"2k","s, ":"t,1,1,1,1,1,1,1,1,1,1,1","s: ":"q","sa ":"24,7","sal":"2b","san":"1t","sau":"2b","sca":"1d","sch":"1p","sci":"2h,1","sco":"1u","sel":"a,j,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","sem":"1p,9","sen":"20","ser":"y,3,g,3","ses":"2n","set":"b,e,a,g,1,1,1,1,1,1,1,1,1,1,6,q","she":"12,9,c,a,p","si ":"2n","sic":"u,2,a,1i","sig":"2c","sin":"0","sio":"l","siq":"u,2,a,19,2","sit":"1b","siz":"1b","sli":"20,1,1,1,1,1,1,1,1,1,1","smo":"l,1,1,3","so ":"0,1,1,k","spo":"1b","spr":"0,1,1","ssa":"1t","sse":"20","ssi":"l,9,2,a,19,2","sso":"0,1,1,k","st ":"n,1x","st)":"1x","sta":"k,5,3,i,m,b,3,4,6,1","sti":"1c,7,n","sto":"r,1i,d","str":"1q,1,1,1,1,1,1,1,1,1,8","sur":"s,5,6,b,6,2,3,a,b,e","swe":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","sél":"a","t a":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","t b":"b,c","t c":"8,t","t f":"1c,h","t o":"2k","t t":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","t w":"6","t) ":"1q,7,j,2","t, ":"1q","t-u":"1g,3,c","ta ":"o","ta)":"13","tab":"21","tac":"k,1u","tag":"1w,1,c,c","tak":"1i,6","tal":"1u,i,3,1","tan":"p,l,m,b,e","tat":"s,1f,2,1,a","tav":"21","taz":"s,1f,3,a","tch":"e,1,1,1,7,1,2,1","te ":"6,2,1,5,1,4,1,5,6,6,4,5,c,f","te,":"1q","tea":"a,1","tel":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","tem":"1a,b","ten":"10,y,3","ter":"b,1d,s,2","tes":"1a,c,f","the":"1o","thi":"l,1,1,3","tho":"29","thé":"a","ti ":"1t,1,6,1,1,1,1,1,1,1,1,1,1,2","tic":"1m,n","tid":"1g","tie":"10,y,2","til":"27","tim":"1j,6,b,6","tin":"p,k,6,k","tio":"a,g,2,9,8,2,1,3,1,1,1,1,1,1,1,1,1,1,i,1,2,a,3","tiq":"1m,b,c","tiè":"y,j","to ":"2,1,9,4,k,5,1,1,1,1,1,1,1,1,1,5,b,c,2,9,1,1","toc":"2m","ton":"t,1,1,1,1,1,1,1,1,1,1,1,k","tor":"r,1i,d","tos":"24","toy":"13,b,b,a,p","tra":"1r","tre":"q,l,1,z,1,1,1,1,1,1,1,1,1,1,1,1,1","tri":"q,j,5,e,3,4","tro":"2g,2","tru":"27","try":"1q,1,1,1,1,1,1,1,1,1","ts ":"16,5,i","tta":"29,c","tte":"9,5,1,4,1,5,c,4,h,f,f,2","tti":"p,k,g,b,1,1,1,1,1,1,1,1,1,1","tto":"t,1,1,1,1,1,1,1,1,1,1,1,a,b,a,5,d,1,6","tup":"z,g,1,1,1,1,1,1,1,1,1,1","tur":"s,i,4,1,5,1,a,1,3,9,1,1,2,8,3,1","ty ":"h","u g":"1u","ubl":"1,2","ucc":"5","uce":"2b","uct":"q","ud ":"8,l,1,1,1,1,6","ue ":"u,2,s,r,2","ues":"16","uet":"1m,b,c","uff":"10","uic":"12,j,c,q","uit":"11","ule":"t,1,1,1,1,1,1,1,1,1,1,1,l","uli":"13,m,z","ull":"x,11","ulé":"x,2,1,2","ume":"27","una":"o","une":"o","uon":"1u,i","uot":"1g","up ":"z,1,g,1,1,1,1,2,3,6","upe":"15,3,o","ups":"t,1,1,1,1,8,1,1,1,4,5,1,1,1,6,4","ur ":"1p","ur)":"o","ura":"s,5,6,7,4,1,5,2,3,7,3,9,1,1,a,3,1","ure":"s,i,4,1,5,1,a,4,b,2,8,4","urg":"2j","urn":"13","urr":"t,1,1,1,1,1,1,1,1,1,1,1","usu":"s,5,6,b,6,2,3,a,b,e","ut)":"1q","uti":"1f,k,8","uto":"1o","utt":"2h,1","uve":"1f,g,p","uzi":"q","var":"11","vat":"11","ve ":"1l,v,2","ver":"n,h,b,g,p","vet":"19,5,h,4","vic":"y,j,3","vin":"t,1,1,1,1,1,1,1,1,1,1,1","vit":"19,5,h","viz":"y,j","vol":"o,1d","waf":"2d","wal":"1q","war":"10","way":"1i,6","wee":"2b,1,1,1,1,1,1,1,1,1,1,1,1,1","whi":"6,7","win":"x","wni":"1r","x &":"1n","xes":"17","xpo":"1b","y (":"1v","y :":"1o","y b":"m","y l":"1q,1,1,1,1,1,1,1,1,1","y m":"h","y o":"1i","y p":"1r","y) ":"14","y: ":"1o","yag":"13,b,b,a,p","yo ":"25,1,2,2","yo-":"20,1,1,1,1,1,1,1,1,1,1","za ":"2o","zer":"1c","zia":"13,x,o","zie":"1p","zio":"q,2,6,b,2,6,f,b,1,2,a,3","zza":"2o","ède":"y,j","ègl":"1d,9","ème":"24","ès ":"1b","ètr":"q","é (":"12","é c":"z","é s":"z","é) ":"x,3","ée ":"23","ée)":"13","égl":"2l","éle":"a","épa":"o,l","éra":"1a,b","és ":"a,1b","éti":"1m,b,c","êpe":"2b,1","ôtu":"s","“se":"1y","” p":"1y"}}}};
 
   try { window.__BADIANI_SEARCH_CATALOG_SEED__ = SEED; } catch (e) {}
+  try { window.__BADIANI_SEARCH_INDEX__ = INDEX; } catch (e) {}
 
   function safeParse(raw) {
     try { return JSON.parse(raw); } catch (e) { return null; }
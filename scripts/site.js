@@ -78,6 +78,205 @@ document.documentElement.classList.add('has-js');
   } catch {}
 })();
 
+// ============================================================
+// GLOBAL: FIELD PERFORMANCE BEACON (real-device timings)
+// - Collects navigation timing plus every `performance.measure('badiani:<metric>', ...)`
+//   made by i18n.js, the quiz and the Berny client, tagged with page / device class / language.
+// - Batches samples and posts them (text/plain, no CORS preflight) to BADIANI_PERF_ENDPOINT,
+//   or `<proxy base>/perf` when only BERNY_PROXY_ENDPOINT is configured.
+// - Without an endpoint samples are kept locally: BadianiPerf.exportJsonl() in the console gives
+//   the JSONL that build-tools/python/perf_beacon_report.py aggregates.
+// ============================================================
+(() => {
+  if (window.BadianiPerf) return;
+
+  const PREFIX = 'badiani:';
+  const LOCAL_KEY = 'badianiPerf.samples.v1';
+  const LOCAL_MAX = 500;
+  const BATCH_SIZE = 20;
+  const FLUSH_DELAY_MS = 15000;
+
+  const perf = window.performance;
+  const noop = { record() {}, flush() {}, exportJsonl: () => '', clearLocal() {} };
+  if (!perf || typeof perf.now !== 'function') {
+    window.BadianiPerf = noop;
+    return;
+  }
+
+  // One decision per page load, so sampled sessions keep all their metrics.
+  const rate = Number(window.BADIANI_PERF_SAMPLE_RATE ?? 1);
+  if (!(Math.random() < (Number.isFinite(rate) ? rate : 1))) {
+    window.BadianiPerf = noop;
+    return;
+  }
+
+  const getEndpoint = () => {
+    try {
+      const explicit = String(window.BADIANI_PERF_ENDPOINT || '').trim();
+      if (explicit) return explicit === 'off' ? '' : explicit;
+      const proxy = String(window.BERNY_PROXY_ENDPOINT || '').trim();
+      if (!proxy) return '';
+      return `${proxy.replace(/\/?berny\/?$/i, '').replace(/\/+$/g, '')}/perf`;
+    } catch {
+      return '';
+    }
+  };
+
+  const getPage = () => {
+    try {
+      const last = (location.pathname || '/').split('/').pop();
+      return decodeURIComponent(last || 'index.html');
+    } catch {
+      return 'unknown';
+    }
+  };
+
+  // Coarse, privacy-friendly device buckets: form factor + capability tier.
+  const getDeviceClass = () => {
+    let form = 'desktop';
+    try {
+      if (window.matchMedia?.('(pointer: coarse)').matches) {
+        form = Math.min(screen.width || 0, screen.height || 0) >= 600 ? 'tablet' : 'mobile';
+      }
+    } catch {}
+    const mem = Number(navigator.deviceMemory || 0);
+    const cores = Number(navigator.hardwareConcurrency || 0);
+    let tier = 'mid';
+    if ((mem && mem <= 2) || (cores && cores <= 4)) tier = 'low';
+    else if (mem >= 8 && cores >= 8) tier = 'high';
+    return `${form}-${tier}`;
+  };
+
+  const getLang = () => {
+    try {
+      return window.BadianiI18n?.getLang?.() || document.documentElement.getAttribute('lang') || 'unknown';
+    } catch {
+      return 'unknown';
+    }
+  };
+
+  const base = {
+    v: 1,
+    sid: Math.random().toString(36).slice(2, 10),
+    page: getPage(),
+    device: getDeviceClass(),
+  };
+  try {
+    const conn = navigator.connection?.effectiveType;
+    if (conn) base.conn = String(conn);
+  } catch {}
+
+  let queue = [];
+  let timer = null;
+
+  const saveLocal = (samples) => {
+    try {
+      const stored = JSON.parse(localStorage.getItem(LOCAL_KEY) || '[]');
+      const next = (Array.isArray(stored) ? stored : []).concat(samples).slice(-LOCAL_MAX);
+      localStorage.setItem(LOCAL_KEY, JSON.stringify(next));
+    } catch {}
+  };
+
+  const flush = () => {
+    if (timer) {
+      clearTimeout(timer);
+      timer = null;
+    }
+    if (!queue.length) return;
+    const samples = queue;
+    queue = [];
+    const endpoint = getEndpoint();
+    if (!endpoint) {
+      saveLocal(samples);
+      return;
+    }
+    const body = JSON.stringify({ samples });
+    try {
+      if (navigator.sendBeacon?.(endpoint, new Blob([body], { type: 'text/plain;charset=UTF-8' }))) return;
+    } catch {}
+    try {
+      fetch(endpoint, { method: 'POST', body, keepalive: true, headers: { 'content-type': 'text/plain;charset=UTF-8' } }).catch(() => {});
+    } catch {}
+  };
+
+  const record = (metric, ms, extra = null) => {
+    const value = Number(ms);
+    if (!metric || !Number.isFinite(value) || value < 0) return;
+    const sample = { ...base, ts: Date.now(), metric: String(metric), ms: Math.round(value * 10) / 10, lang: getLang() };
+    if (extra && typeof extra === 'object') {
+      Object.keys(extra).forEach((k) => {
+        if (!(k in sample)) sample[k] = extra[k];
+      });
+    }
+    queue.push(sample);
+    if (queue.length >= BATCH_SIZE) flush();
+    else if (!timer) timer = setTimeout(flush, FLUSH_DELAY_MS);
+  };
+
+  const takeMeasure = (entry) => {
+    if (!entry || !String(entry.name || '').startsWith(PREFIX)) return;
+    record(entry.name.slice(PREFIX.length), entry.duration, entry.detail);
+  };
+
+  // Measures made before this script ran (i18n.js is evaluated first), then live ones.
+  try { perf.getEntriesByType('measure').forEach(takeMeasure); } catch {}
+  try {
+    new PerformanceObserver((list) => list.getEntries().forEach(takeMeasure)).observe({ type: 'measure' });
+  } catch {}
+
+  const recordNavigation = () => {
+    try {
+      const nav = perf.getEntriesByType('navigation')[0];
+      if (!nav) return;
+      const extra = { type: nav.type };
+      record('nav.ttfb', nav.responseStart, extra);
+      record('nav.dcl', nav.domContentLoadedEventEnd, extra);
+      record('nav.load', nav.loadEventEnd, extra);
+    } catch {}
+    try {
+      const i18nScript = perf.getEntriesByType('resource').find((e) => /\/scripts\/i18n(\.[0-9a-f]{10})?\.js(\?|$)/.test(e.name));
+      if (i18nScript) record('i18n.download', i18nScript.duration, { bytes: i18nScript.transferSize || 0 });
+    } catch {}
+  };
+  if (document.readyState === 'complete') setTimeout(recordNavigation, 0);
+  else window.addEventListener('load', () => setTimeout(recordNavigation, 0), { once: true });
+
+  let lcp = 0;
+  try {
+    new PerformanceObserver((list) => {
+      list.getEntries().forEach((e) => { lcp = e.startTime; });
+    }).observe({ type: 'largest-contentful-paint', buffered: true });
+  } catch {}
+
+  const onHidden = () => {
+    if (lcp) {
+      record('nav.lcp', lcp);
+      lcp = 0;
+    }
+    flush();
+  };
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') onHidden();
+  });
+  window.addEventListener('pagehide', onHidden);
+
+  window.BadianiPerf = {
+    record,
+    flush,
+    exportJsonl: () => {
+      try {
+        const stored = JSON.parse(localStorage.getItem(LOCAL_KEY) || '[]');
+        return (Array.isArray(stored) ? stored : []).concat(queue).map((s) => JSON.stringify(s)).join('\n');
+      } catch {
+        return '';
+      }
+    },
+    clearLocal: () => {
+      try { localStorage.removeItem(LOCAL_KEY); } catch {}
+    },
+  };
+})();
+
 // ============================================================
 // STORAGE ADAPTER + PROFILE API (stability layer)
 // - Centralizes JSON parsing, safe storage access, and profile consistency.
@@ -2317,6 +2516,68 @@ scrollButtons.forEach((btn) => {
 
   let lastFiltered = [];
 
+  // Precomputed search index (scripts/search-catalog-seed.js, generated by
+  // build-tools/python/generate_search_catalog_seed.py). Cards it covers are found with a
+  // prefix (1-2 chars) or trigram (3+ chars) lookup in the active language; anything it
+  // doesn't cover (hardcoded fallback, cards hydrated after the build) is still scanned.
+  const searchIndex = (() => {
+    const raw = window.__BADIANI_SEARCH_INDEX__;
+    if (!raw || raw.v !== 1 || !Array.isArray(raw.docs) || !raw.langs) return null;
+
+    const docKeys = raw.docs.map(([pageIdx, cardKey]) => `${raw.pages[pageIdx]}::${cardKey}`);
+    const docSet = new Set(docKeys);
+    const byKey = new Map();
+    const unindexed = [];
+    allProducts.forEach((item) => {
+      const k = `${item.categoryHref || ''}::${item.card || ''}`;
+      if (item.card && docSet.has(k) && !byKey.has(k)) byKey.set(k, item);
+      else unindexed.push(item);
+    });
+
+    const decoded = new Map();
+    const postings = (lang, table, gram) => {
+      const cacheKey = `${lang}:${table}:${gram}`;
+      if (decoded.has(cacheKey)) return decoded.get(cacheKey);
+      const enc = raw.langs[lang]?.[table]?.[gram];
+      const ids = [];
+      if (enc) {
+        let prev = 0;
+        enc.split(',').forEach((d) => { prev += parseInt(d, 36); ids.push(prev); });
+      }
+      decoded.set(cacheKey, ids);
+      return ids;
+    };
+
+    // Returns matching products, or null when the query can't be answered by the index.
+    const lookup = (q) => {
+      const uiLang = getUiLang();
+      const lang = raw.langs[uiLang] ? uiLang : 'it';
+      const names = raw.langs[lang]?.names || [];
+      let ids;
+      if (q.length < 3) {
+        if (!/^[\p{L}\p{N}]+$/u.test(q)) return null;
+        ids = postings(lang, 'prefix', q);
+      } else {
+        let candidates = null;
+        for (let i = 0; i + 3 <= q.length; i += 1) {
+          const list = postings(lang, 'tri', q.slice(i, i + 3));
+          if (!list.length) return [];
+          if (!candidates) {
+            candidates = list;
+          } else {
+            const keep = new Set(list);
+            candidates = candidates.filter((id) => keep.has(id));
+          }
+          if (!candidates.length) return [];
+        }
+        ids = (candidates || []).filter((id) => String(names[id] || '').includes(q));
+      }
+      return ids.map((id) => byKey.get(docKeys[id])).filter(Boolean);
+    };
+
+    return { lookup, unindexed };
+  })();
+
   const ensureAssistantUI = () => {
     if (!searchRoot) return null;
     const existing = searchRoot.querySelector('[data-menu-assistant]');
@@ -3003,7 +3264,13 @@ scrollButtons.forEach((btn) => {
       return false;
     };
 
-    const productMatches = allProducts.filter((item) => matchesQuery(item.name) || matchesQuery(item.category));
+    const indexedHits = searchIndex ? [q, qAlt].filter(Boolean).map((v) => searchIndex.lookup(v)) : [];
+    const productMatches = (searchIndex && indexedHits.every(Boolean))
+      ? [
+          ...new Set(indexedHits.flat()),
+          ...searchIndex.unindexed.filter((item) => matchesQuery(item.name) || matchesQuery(item.category)),
+        ]
+      : allProducts.filter((item) => matchesQuery(item.name) || matchesQuery(item.category));
     const categoryMatches = menuItems.filter((cat) => matchesQuery(cat.name) || matchesQuery(cat.label));
     lastFiltered = [...categoryMatches, ...productMatches].slice(0, 10);
   };
@@ -9713,6 +9980,21 @@ const gamification = (() => {
     };
 
     renderStep();
+    measureQuizStart(modeKey);
+  }
+
+  // Field timing (BadianiPerf): tap on a quiz entry point -> first question on screen,
+  // including Berny question generation when the mini quiz uses it.
+  function markQuizRequested() {
+    try { performance.mark('badiani:quiz.requested'); } catch {}
+  }
+
+  function measureQuizStart(modeKey) {
+    try {
+      if (!performance.getEntriesByName('badiani:quiz.requested', 'mark').length) return;
+      performance.measure('badiani:quiz.start', { start: 'badiani:quiz.requested', detail: { mode: String(modeKey || '') } });
+      performance.clearMarks('badiani:quiz.requested');
+    } catch {}
   }
 
   function applyMiniQuizPenalty() {
@@ -9729,6 +10011,7 @@ const gamification = (() => {
     closeActivePopover();
     ensureDailyState();
     if (state.quizTokens < STARS_FOR_QUIZ) return;
+    markQuizRequested();
 
     // Mostra un loading mentre Berny genera la domanda
     const loadingContainer = document.createElement('div');
@@ -9961,6 +10244,7 @@ const gamification = (() => {
     saveState();
     updateUI();
 
+    markQuizRequested();
     const restoreCredit = () => {
       state.testMeCredits = Math.max(0, (state.testMeCredits || 0) + 1);
       saveState();